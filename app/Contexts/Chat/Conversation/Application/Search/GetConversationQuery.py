@@ -1,8 +1,16 @@
-from app.Contexts.Shared.Application.Bus.Query.Query import Query
+from collections.abc import Hashable
 
+from app.Contexts.Shared.Application.Bus.Query.CacheableQuery import CacheableQuery
 
-class GetConversationQuery(Query):
+
+class GetConversationQuery(CacheableQuery):
     """Query para obtener metadatos de una conversación sin mensajes"""
 
     def __init__(self, conversation_id: str) -> None:
         self.conversation_id = conversation_id
+
+    def cache_key(self) -> Hashable | None:
+        return self.conversation_id
+
+    def cache_tags(self) -> list[str]:
+        return [f"conversation:{self.conversation_id}"]
@@ -34,7 +34,7 @@ class GetConversationQueryHandler(QueryHandler):
         IMPORTANTE: NO consulta mensajes para cumplir con AC5 (rendimiento)
         """
         conversation_id = ConversationId(query.conversation_id)
-        conversation = self._conversation_repository.find_by_id(conversation_id)
+        conversation = await self._conversation_repository.load(conversation_id)
 
         if not conversation:
             return None
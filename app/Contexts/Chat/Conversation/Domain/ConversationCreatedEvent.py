@@ -13,7 +13,7 @@ class ConversationCreatedEvent(DomainEvent):
             "conversation_id": conversation_id,
             "owner": owner,
         }
-        super().__init__(payload)
+        super().__init__(payload, aggregate_id=conversation_id)
 
     @classmethod
     def event_name(cls) -> str:
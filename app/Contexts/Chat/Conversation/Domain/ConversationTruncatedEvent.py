@@ -13,7 +13,7 @@ class ConversationTruncatedEvent(DomainEvent):
             "conversation_id": conversation_id,
             "from_message_id": from_message_id,
         }
-        super().__init__(payload)
+        super().__init__(payload, aggregate_id=conversation_id)
 
     @classmethod
     def event_name(cls) -> str:
@@ -6,9 +6,7 @@ from injector import inject
 from app.Contexts.Chat.Conversation.Application.Search.GetConversationQuery import (
     GetConversationQuery,
 )
-from app.Contexts.Chat.Conversation.Application.Search.GetConversationQueryHandler import (
-    GetConversationQueryHandler,
-)
+from app.Contexts.Shared.Application.Bus.Query.QueryBus import QueryBus
 from app.Contexts.Shared.Infrastructure.Http.Controller import Controller
 
 
@@ -16,8 +14,8 @@ class GetConversationController(Controller):
     """Controlador HTTP para obtener metadatos de conversación"""
 
     @inject
-    def __init__(self, query_handler: GetConversationQueryHandler) -> None:
-        self._query_handler = query_handler
+    def __init__(self, query_bus: QueryBus) -> None:
+        self._query_bus = query_bus
 
     async def get_conversation(self, conversation_id: str) -> Response:
         """
@@ -26,7 +24,7 @@ class GetConversationController(Controller):
         """
         try:
             query = GetConversationQuery(conversation_id)
-            result = await self._query_handler.handle(query)
+            result = await self._query_bus.ask(query)
 
             if result is None:
                 # Conversación no encontrada
@@ -2,16 +2,35 @@ from abc import ABC, abstractmethod
 
 from app.Contexts.Chat.Conversation.Domain.Conversation import Conversation
 from app.Contexts.Chat.Conversation.Domain.ConversationId import ConversationId
+from app.Contexts.Shared.Infrastructure.Repository.BatchLoader import BatchLoader
 
 
 class ConversationRepository(ABC):
     """Interfaz del repositorio de conversaciones"""
 
+    _loader: BatchLoader[ConversationId, Conversation] | None = None
+
     @abstractmethod
     def find_by_id(self, conversation_id: ConversationId) -> Conversation | None:
         """Busca una conversación por su ID"""
         pass
 
+    @abstractmethod
+    def find_by_ids(
+        self, conversation_ids: list[ConversationId]
+    ) -> dict[ConversationId, Conversation]:
+        """Busca varias conversaciones en una sola consulta; omite las que no existen"""
+        pass
+
+    async def load(self, conversation_id: ConversationId) -> Conversation | None:
+        """
+        Como find_by_id, pero las búsquedas del mismo tick del event loop se
+        resuelven con un único find_by_ids
+        """
+        if self._loader is None:
+            self._loader = BatchLoader(self.find_by_ids)
+        return await self._loader.load(conversation_id)
+
     @abstractmethod
     def save(self, conversation: Conversation) -> None:
         """Guarda una conversación"""
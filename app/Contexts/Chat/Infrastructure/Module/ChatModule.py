@@ -12,6 +12,12 @@ from app.Contexts.Chat.Conversation.Application.Search.GetConversationQuery impo
 from app.Contexts.Chat.Conversation.Application.Search.GetConversationQueryHandler import (
     GetConversationQueryHandler,
 )
+from app.Contexts.Chat.Conversation.Domain.ConversationCreatedEvent import (
+    ConversationCreatedEvent,
+)
+from app.Contexts.Chat.Conversation.Domain.ConversationTruncatedEvent import (
+    ConversationTruncatedEvent,
+)
 from app.Contexts.Chat.Conversation.Infrastructure.Http.GetConversationController import (
     GetConversationController,
 )
@@ -39,6 +45,8 @@ from app.Contexts.Chat.Message.Application.Search.PaginateMessagesQueryHandler i
 from app.Contexts.Chat.Message.Domain.MessageChronologyChecker import (
     MessageChronologyChecker,
 )
+from app.Contexts.Chat.Message.Domain.MessageCreatedEvent import MessageCreatedEvent
+from app.Contexts.Chat.Message.Domain.MessageUpdatedEvent import MessageUpdatedEvent
 from app.Contexts.Chat.Message.Infrastructure.Http.PaginateMessagesController import (
     PaginateMessagesController,
 )
@@ -48,6 +56,8 @@ from app.Contexts.Chat.Message.Infrastructure.Http.UpsertMessageController impor
 from app.Contexts.Chat.Message.Infrastructure.Repository.MessageRepository import (
     MessageRepository,
 )
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Bus.BulkheadLimits import BulkheadLimits
 from app.Contexts.Shared.Infrastructure.Module.ApplicationModule import (
     ApplicationModule,
 )
@@ -95,6 +105,27 @@ class ChatModule(ApplicationModule, Module):
             (PaginateMessagesQuery, PaginateMessagesQueryHandler),
         ]
 
+    def map_bulkheads(self) -> list[tuple[type[Any], BulkheadLimits]]:
+        """Map commands and queries to their own concurrency limits"""
+        # La paginación es la lectura más cara: con menos turnos, una avalancha
+        # de lecturas se rechaza antes de competir con los upserts
+        return [
+            (PaginateMessagesQuery, BulkheadLimits(32, 64, 500)),
+        ]
+
+    def map_query_cache_invalidations(self) -> list[tuple[type[Any], Any]]:
+        """Map events to the cached query tags they invalidate"""
+        return [
+            (ConversationCreatedEvent, self._conversation_tags),
+            (ConversationTruncatedEvent, self._conversation_tags),
+            (MessageCreatedEvent, self._conversation_tags),
+            (MessageUpdatedEvent, self._conversation_tags),
+        ]
+
+    @staticmethod
+    def _conversation_tags(event: DomainEvent) -> list[str]:
+        return [f"conversation:{event.payload['conversation_id']}"]
+
     def map_events(self) -> list[tuple[type[Any], type[Any]]]:
         """Map events to their listeners"""
         # No event listeners implemented yet
@@ -19,6 +19,16 @@ class InMemoryConversationRepository(ConversationRepository):
         """Busca una conversación por su ID"""
         return self._conversations.get(str(conversation_id))
 
+    def find_by_ids(
+        self, conversation_ids: list[ConversationId]
+    ) -> dict[ConversationId, Conversation]:
+        """Busca varias conversaciones por sus IDs"""
+        return {
+            conversation_id: self._conversations[str(conversation_id)]
+            for conversation_id in conversation_ids
+            if str(conversation_id) in self._conversations
+        }
+
     def save(self, conversation: Conversation) -> None:
         """Guarda una conversación"""
         self._conversations[str(conversation.id)] = conversation
@@ -20,6 +20,14 @@ class InMemoryMessageRepository(MessageRepository):
         """Busca un mensaje por su ID"""
         return self._messages.get(str(message_id))
 
+    def find_by_ids(self, message_ids: list[MessageId]) -> dict[MessageId, Message]:
+        """Busca varios mensajes por sus IDs"""
+        return {
+            message_id: self._messages[str(message_id)]
+            for message_id in message_ids
+            if str(message_id) in self._messages
+        }
+
     def save(self, message: Message) -> None:
         """Guarda un mensaje"""
         self._messages[str(message.id)] = message
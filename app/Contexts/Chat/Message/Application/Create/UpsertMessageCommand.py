@@ -1,7 +1,11 @@
-from app.Contexts.Shared.Application.Bus.Command.Command import Command
+from collections.abc import Hashable
 
+from app.Contexts.Shared.Application.Bus.Command.SerializedCommand import (
+    SerializedCommand,
+)
 
-class UpsertMessageCommand(Command):
+
+class UpsertMessageCommand(SerializedCommand):
     """Comando para crear o actualizar un mensaje en una conversación"""
 
     def __init__(
@@ -11,3 +15,8 @@ class UpsertMessageCommand(Command):
         self.message_id = message_id
         self.content = content
         self.owner = owner
+
+    def mailbox_key(self) -> Hashable:
+        # El último mensaje y el truncado de la conversación no admiten
+        # escrituras intercaladas
+        return f"conversation:{self.conversation_id}"
@@ -56,10 +56,10 @@ class UpsertMessageCommandHandler(CommandHandler):
         owner = ConversationOwner(command.owner)
 
         # 1. Obtener o crear conversación
-        conversation = self._get_or_create_conversation(conversation_id, owner)
+        conversation = await self._get_or_create_conversation(conversation_id, owner)
 
         # 2. Obtener mensaje existente si existe
-        existing_message = self._message_repository.find_by_id(message_id)
+        existing_message = await self._message_repository.load(message_id)
 
         # 3. Validar consistencia de IDs si el mensaje existe
         if existing_message and existing_message.id != message_id:
@@ -99,11 +99,11 @@ class UpsertMessageCommandHandler(CommandHandler):
         await self._publish_events(conversation)
         await self._publish_events(message)
 
-    def _get_or_create_conversation(
+    async def _get_or_create_conversation(
         self, conversation_id: ConversationId, owner: ConversationOwner
     ) -> Conversation:
         """Obtiene una conversación existente o crea una nueva"""
-        existing_conversation = self._conversation_repository.find_by_id(
+        existing_conversation = await self._conversation_repository.load(
             conversation_id
         )
         if existing_conversation:
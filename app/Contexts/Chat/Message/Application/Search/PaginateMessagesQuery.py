@@ -1,7 +1,9 @@
-from app.Contexts.Shared.Application.Bus.Query.Query import Query
+from collections.abc import Hashable
 
+from app.Contexts.Shared.Application.Bus.Query.CacheableQuery import CacheableQuery
 
-class PaginateMessagesQuery(Query):
+
+class PaginateMessagesQuery(CacheableQuery):
     """Query para paginar mensajes de una conversación con cursor"""
 
     MAX_LIMIT = 100
@@ -17,3 +19,12 @@ class PaginateMessagesQuery(Query):
             self.limit = self.DEFAULT_LIMIT
         else:
             self.limit = min(limit, self.MAX_LIMIT)
+
+    def cache_key(self) -> Hashable | None:
+        # Solo la primera página se lee con la frecuencia suficiente para cachearla
+        if self.cursor is not None:
+            return None
+        return (self.conversation_id, self.limit)
+
+    def cache_tags(self) -> list[str]:
+        return [f"conversation:{self.conversation_id}"]
@@ -14,7 +14,12 @@ class MessageUpdatedEvent(DomainEvent):
             "conversation_id": conversation_id,
             "new_content": new_content,
         }
-        super().__init__(payload)
+        super().__init__(payload, aggregate_id=message_id)
+
+    @property
+    def partition_key(self) -> str | None:
+        # Los mensajes de una conversación se entregan en orden
+        return str(self.payload["conversation_id"])
 
     @classmethod
     def event_name(cls) -> str:
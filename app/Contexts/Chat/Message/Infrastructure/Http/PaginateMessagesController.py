@@ -6,8 +6,12 @@ from injector import inject
 from app.Contexts.Chat.Message.Application.Search.PaginateMessagesQuery import (
     PaginateMessagesQuery,
 )
-from app.Contexts.Chat.Message.Application.Search.PaginateMessagesQueryHandler import (
-    PaginateMessagesQueryHandler,
+from app.Contexts.Shared.Application.Bus.BulkheadRejectedError import (
+    BulkheadRejectedError,
+)
+from app.Contexts.Shared.Application.Bus.Query.QueryBus import QueryBus
+from app.Contexts.Shared.Infrastructure.Http.Context.DeadlineExceededError import (
+    DeadlineExceededError,
 )
 from app.Contexts.Shared.Infrastructure.Http.Controller import Controller
 
@@ -16,8 +20,8 @@ class PaginateMessagesController(Controller):
     """Controlador HTTP para paginar mensajes en conversaciones"""
 
     @inject
-    def __init__(self, query_handler: PaginateMessagesQueryHandler) -> None:
-        self._query_handler = query_handler
+    def __init__(self, query_bus: QueryBus) -> None:
+        self._query_bus = query_bus
 
     async def paginate_messages(
         self,
@@ -38,7 +42,7 @@ class PaginateMessagesController(Controller):
             )
 
             # Ejecutar query
-            result = await self._query_handler.handle(query)
+            result = await self._query_bus.ask(query)
 
             # Retornar respuesta con paginación
             response_body = json.dumps(result)
@@ -48,6 +52,9 @@ class PaginateMessagesController(Controller):
                 media_type="application/json",
             )
 
+        except (BulkheadRejectedError, DeadlineExceededError):
+            # Sobrecarga o plazo vencido: la aplicación responde 429/503/504
+            raise
         except Exception:
             # Error interno del servidor
             error_body = json.dumps({"error": "Internal server error"})
@@ -7,8 +7,12 @@ from injector import inject
 from app.Contexts.Chat.Message.Application.Create.UpsertMessageCommand import (
     UpsertMessageCommand,
 )
-from app.Contexts.Chat.Message.Application.Create.UpsertMessageCommandHandler import (
-    UpsertMessageCommandHandler,
+from app.Contexts.Shared.Application.Bus.BulkheadRejectedError import (
+    BulkheadRejectedError,
+)
+from app.Contexts.Shared.Application.Bus.Command.CommandBus import CommandBus
+from app.Contexts.Shared.Infrastructure.Http.Context.DeadlineExceededError import (
+    DeadlineExceededError,
 )
 from app.Contexts.Shared.Infrastructure.Http.Controller import Controller
 
@@ -17,8 +21,8 @@ class UpsertMessageController(Controller):
     """Controlador HTTP para crear/actualizar mensajes en conversaciones"""
 
     @inject
-    def __init__(self, command_handler: UpsertMessageCommandHandler) -> None:
-        self._command_handler = command_handler
+    def __init__(self, command_bus: CommandBus) -> None:
+        self._command_bus = command_bus
 
     async def upsert_message(
         self, conversation_id: str, message_id: str, request_body: dict[str, Any]
@@ -52,7 +56,7 @@ class UpsertMessageController(Controller):
                 owner=owner,
             )
 
-            await self._command_handler.handle(command)
+            await self._command_bus.dispatch(command)
 
             # AC1 & AC8: Respuesta exitosa (idempotente)
             response_body = json.dumps({"message": "Message upserted successfully"})
@@ -70,6 +74,9 @@ class UpsertMessageController(Controller):
                 status_code=status.HTTP_400_BAD_REQUEST,
                 media_type="application/json",
             )
+        except (BulkheadRejectedError, DeadlineExceededError):
+            # Sobrecarga o plazo vencido: la aplicación responde 429/503/504
+            raise
         except Exception:
             # Error interno del servidor
             error_body = json.dumps({"error": "Internal server error"})
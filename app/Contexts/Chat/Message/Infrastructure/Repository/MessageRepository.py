@@ -3,16 +3,33 @@ from abc import ABC, abstractmethod
 from app.Contexts.Chat.Conversation.Domain.ConversationId import ConversationId
 from app.Contexts.Chat.Message.Domain.Message import Message
 from app.Contexts.Chat.Message.Domain.MessageId import MessageId
+from app.Contexts.Shared.Infrastructure.Repository.BatchLoader import BatchLoader
 
 
 class MessageRepository(ABC):
     """Interfaz del repositorio de mensajes"""
 
+    _loader: BatchLoader[MessageId, Message] | None = None
+
     @abstractmethod
     def find_by_id(self, message_id: MessageId) -> Message | None:
         """Busca un mensaje por su ID"""
         pass
 
+    @abstractmethod
+    def find_by_ids(self, message_ids: list[MessageId]) -> dict[MessageId, Message]:
+        """Busca varios mensajes en una sola consulta; omite los que no existen"""
+        pass
+
+    async def load(self, message_id: MessageId) -> Message | None:
+        """
+        Como find_by_id, pero las búsquedas del mismo tick del event loop se
+        resuelven con un único find_by_ids
+        """
+        if self._loader is None:
+            self._loader = BatchLoader(self.find_by_ids)
+        return await self._loader.load(message_id)
+
     @abstractmethod
     def save(self, message: Message) -> None:
         """Guarda un mensaje"""
@@ -0,0 +1,13 @@
+class BulkheadRejectedError(Exception):
+    """
+    El bus rechaza un comando o query porque su bulkhead está saturado.
+
+    `queue_full` distingue una cola llena, rechazada al instante, de una
+    espera que agotó su plazo sin conseguir turno.
+    """
+
+    def __init__(self, message_name: str, queue_full: bool) -> None:
+        reason = "cola llena" if queue_full else "tiempo de espera agotado"
+        super().__init__(f"Bulkhead de {message_name} saturado: {reason}")
+        self.message_name = message_name
+        self.queue_full = queue_full
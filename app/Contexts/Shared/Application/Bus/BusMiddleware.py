@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+
+class BusMiddleware(ABC):
+    """
+    Envuelve el despacho de comandos o queries con lógica transversal
+    (tiempos, caché, reintentos, transacciones) sin tocar los handlers.
+
+    El bus compila la cadena una vez por tipo de mensaje: los middlewares que
+    no aplican a un tipo no se llaman en su despacho.
+    """
+
+    def applies_to(self, message: type[Any]) -> bool:
+        """Indica si el middleware envuelve los mensajes de este tipo"""
+        return True
+
+    @abstractmethod
+    async def handle(
+        self, message: Any, next_handler: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        """Procesa el mensaje y delega en `next_handler` para continuar la cadena"""
+        pass
+
+    async def handle_many(
+        self,
+        messages: Sequence[Any],
+        next_handler: Callable[[Sequence[Any]], Awaitable[Any]],
+    ) -> Any:
+        """
+        Envuelve un lote de mensajes del mismo tipo que el handler procesa en
+        una sola llamada. Por defecto el lote pasa una vez por `handle`, como
+        su primer mensaje; los middlewares que dependen de cada mensaje lo
+        redefinen.
+        """
+        return await self.handle(messages[0], lambda _: next_handler(messages))
@@ -0,0 +1,21 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+
+from app.Contexts.Shared.Application.Bus.Command.Command import Command
+from app.Contexts.Shared.Application.Bus.Command.CommandHandler import CommandHandler
+
+
+class BatchCommandHandler(CommandHandler):
+    """
+    CommandHandler que además sabe procesar varios comandos en una sola
+    llamada, p. ej. con una única escritura en el repositorio.
+
+    `CommandBus.dispatch_many` le entrega juntos, en orden de llegada, todos
+    los comandos de su tipo. El lote recorre una vez la cadena de middlewares
+    del bus con su `handle_many`.
+    """
+
+    @abstractmethod
+    async def handle_many(self, commands: Sequence[Command]) -> None:
+        """Procesa los comandos en el orden recibido"""
+        pass
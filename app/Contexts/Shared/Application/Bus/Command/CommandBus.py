@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
+from app.Contexts.Shared.Application.Bus.BusMiddleware import BusMiddleware
 from app.Contexts.Shared.Application.Bus.Command.Command import Command
 from app.Contexts.Shared.Application.Bus.Command.CommandHandler import CommandHandler
 
@@ -9,6 +11,25 @@ class CommandBus(ABC):
     async def dispatch(self, command: Command) -> None:
         pass
 
+    @abstractmethod
+    async def dispatch_many(self, commands: Sequence[Command]) -> None:
+        """
+        Despacha un lote: agrupa por tipo, entrega cada grupo de una vez a los
+        BatchCommandHandler y ejecuta el resto con concurrencia acotada,
+        respetando el orden entre comandos con la misma clave de buzón
+        """
+        pass
+
     @abstractmethod
     def register(self, command: type[Command], handler: type[CommandHandler]) -> None:
         pass
+
+    @abstractmethod
+    def use(self, middleware: BusMiddleware) -> None:
+        """Añade un middleware al final de la cadena; antes de freeze()"""
+        pass
+
+    @abstractmethod
+    def freeze(self) -> None:
+        """Cierra el registro y compila la tabla de despacho tras el arranque"""
+        pass
@@ -0,0 +1,18 @@
+from abc import abstractmethod
+from collections.abc import Hashable
+
+from app.Contexts.Shared.Application.Bus.Command.Command import Command
+
+
+class SerializedCommand(Command):
+    """
+    Comando que el CommandBus ejecuta en orden respecto a los demás con la
+    misma clave de buzón, p. ej. todos los de una conversación.
+
+    Los comandos con claves distintas se ejecutan en paralelo.
+    """
+
+    @abstractmethod
+    def mailbox_key(self) -> Hashable | None:
+        """Recurso que el comando modifica; None para no serializarlo"""
+        pass
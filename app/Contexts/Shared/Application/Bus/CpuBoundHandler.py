@@ -0,0 +1,29 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class CpuBoundHandler(ABC):
+    """
+    Marca un CommandHandler o QueryHandler de cálculo intensivo: el bus
+    ejecuta su `compute` en un pool de procesos y el event loop sigue libre.
+
+    `compute` solo recibe el mensaje, que viaja serializado con pickle al
+    proceso worker; no tiene acceso a las dependencias inyectadas en el
+    handler. Lo que necesite del exterior debe ir en el mensaje y su
+    resultado debe poder serializarse igual.
+
+    Se hereda antes que CommandHandler o QueryHandler para que su `handle`
+    cubra el abstracto: `class X(CpuBoundHandler, QueryHandler)`.
+    """
+
+    @classmethod
+    @abstractmethod
+    def compute(cls, message: Any) -> Any:
+        """Cálculo puro del handler; se ejecuta en otro proceso"""
+        pass
+
+    def handle(self, message: Any) -> Any:
+        # Fuera del bus (tests, scripts) el cálculo se hace en un hilo de este
+        # proceso; devuelve un awaitable como el resto de handlers
+        return asyncio.to_thread(type(self).compute, message)
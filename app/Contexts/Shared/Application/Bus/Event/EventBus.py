@@ -18,3 +18,13 @@ class EventBus(ABC):
     @abstractmethod
     def subscribe(self, event: type[DomainEvent], listener: EventListener) -> None:
         pass
+
+    @abstractmethod
+    def subscribe_local(
+        self, event: type[DomainEvent], listener: EventListener
+    ) -> None:
+        """
+        Suscribe un listener que se ejecuta en este proceso al publicar, antes de
+        que `publish` retorne. Solo recibe los eventos publicados aquí.
+        """
+        pass
@@ -0,0 +1,27 @@
+from abc import abstractmethod
+from collections.abc import Hashable
+
+from app.Contexts.Shared.Application.Bus.Query.Query import Query
+
+
+class CacheableQuery(Query):
+    """
+    Query cuyo resultado puede cachear el QueryBus.
+
+    Las etiquetas agrupan las entradas que invalida un mismo evento de dominio,
+    p. ej. todas las queries de una conversación. El resultado cacheado se
+    devuelve tal cual a cada llamada y no debe modificarse.
+    """
+
+    # TTL propio de la query; None usa el de QueryCacheSettings
+    cache_ttl_ms: int | None = None
+
+    @abstractmethod
+    def cache_key(self) -> Hashable | None:
+        """Parámetros que identifican el resultado; None para no cachearlo"""
+        pass
+
+    @abstractmethod
+    def cache_tags(self) -> list[str]:
+        """Etiquetas por las que los eventos invalidan el resultado"""
+        pass
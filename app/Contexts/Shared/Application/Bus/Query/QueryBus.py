@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from app.Contexts.Shared.Application.Bus.BusMiddleware import BusMiddleware
 from app.Contexts.Shared.Application.Bus.Query.Query import Query
 from app.Contexts.Shared.Application.Bus.Query.QueryHandler import QueryHandler
 
@@ -13,3 +14,13 @@ class QueryBus(ABC):
     @abstractmethod
     def register(self, query: type[Query], handler: type[QueryHandler]) -> None:
         pass
+
+    @abstractmethod
+    def use(self, middleware: BusMiddleware) -> None:
+        """Añade un middleware al final de la cadena; antes de freeze()"""
+        pass
+
+    @abstractmethod
+    def freeze(self) -> None:
+        """Cierra el registro y compila la tabla de despacho tras el arranque"""
+        pass
@@ -3,17 +3,23 @@ from __future__ import annotations
 import uuid
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Self
 
 
 class DomainEvent(ABC):
-    __slots__ = ("_id", "_name", "_payload", "_occurred_on")
+    __slots__ = ("_id", "_name", "_payload", "_occurred_on", "_aggregate_id")
 
-    def __init__(self, payload: dict[str, Any], occurred_on: datetime | None = None):
+    def __init__(
+        self,
+        payload: dict[str, Any],
+        occurred_on: datetime | None = None,
+        aggregate_id: str | None = None,
+    ):
         self._id = str(uuid.uuid4())
         self._name = self.__class__.event_name()
         self._payload = payload
         self._occurred_on = occurred_on or datetime.now(tz=UTC)
+        self._aggregate_id = aggregate_id
 
     @property
     def id(self) -> str:
@@ -31,12 +37,50 @@ class DomainEvent(ABC):
     def occurred_on(self) -> datetime:
         return self._occurred_on
 
+    @property
+    def aggregate_id(self) -> str | None:
+        """Id del agregado que ha emitido el evento"""
+        return self._aggregate_id
+
+    @property
+    def partition_key(self) -> str | None:
+        """
+        Clave que ordena el evento respecto a otros: los eventos con la misma
+        clave se entregan en orden. Por defecto es el id del agregado.
+        """
+        return self._aggregate_id
+
     def __eq__(self, other: object) -> bool:
         return isinstance(other, DomainEvent) and self._id == other._id
 
     def __hash__(self) -> int:
         return hash(self._id)
 
+    @classmethod
+    def from_primitives(
+        cls,
+        event_id: str,
+        payload: dict[str, Any],
+        occurred_on: datetime,
+        aggregate_id: str | None = None,
+    ) -> Self:
+        """
+        Reconstruye un evento ya publicado conservando su id y su fecha, sin pasar
+        por el constructor de la subclase.
+        """
+        event = cls.__new__(cls)
+        event._id = event_id
+        event._name = cls.event_name()
+        event._payload = payload
+        event._occurred_on = occurred_on
+        event._aggregate_id = aggregate_id
+        return event
+
     @classmethod
     @abstractmethod
     def event_name(cls) -> str: ...
+
+    @classmethod
+    def schema_version(cls) -> int:
+        """Versión del esquema del payload, a incrementar en cambios incompatibles"""
+        return 1
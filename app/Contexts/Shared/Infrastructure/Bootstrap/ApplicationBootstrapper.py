@@ -3,41 +3,45 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from injector import Injector, Module
 
-from app.Contexts.Shared.Application.Bus.Command.CommandBus import CommandBus
-from app.Contexts.Shared.Application.Bus.Event.EventBus import EventBus
-from app.Contexts.Shared.Application.Bus.Query.QueryBus import QueryBus
+from app.Contexts.Shared.Application.Bus.BulkheadRejectedError import (
+    BulkheadRejectedError,
+)
 from app.Contexts.Shared.Domain.ExceptionHandling.ExceptionHandler import (
     ExceptionHandler,
 )
+from app.Contexts.Shared.Infrastructure.Bootstrap.Bootstrapper import Bootstrapper
 from app.Contexts.Shared.Infrastructure.Bootstrap.ClassFinder import ClassFinder
 from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBusManager import (
     KafkaEventBusManager,
 )
+from app.Contexts.Shared.Infrastructure.Bus.HandlerProcessPool import (
+    HandlerProcessPool,
+)
+from app.Contexts.Shared.Infrastructure.Http.BulkheadRejectionResponder import (
+    BulkheadRejectionResponder,
+)
+from app.Contexts.Shared.Infrastructure.Http.Context.DeadlineExceededError import (
+    DeadlineExceededError,
+)
 from app.Contexts.Shared.Infrastructure.Http.Controller import Controller
-from app.Contexts.Shared.Infrastructure.Http.Middleware.Middleware import Middleware
-from app.Contexts.Shared.Infrastructure.Logging.LoggerConfig import configure_logging
-from app.Contexts.Shared.Infrastructure.Module.ApplicationModule import (
-    ApplicationModule,
+from app.Contexts.Shared.Infrastructure.Http.DeadlineExceededResponder import (
+    DeadlineExceededResponder,
 )
-
-# Configurar logging al inicio
-configure_logging()
+from app.Contexts.Shared.Infrastructure.Http.Middleware.Middleware import Middleware
 
 
-class ApplicationBootstrapper:
+class ApplicationBootstrapper(Bootstrapper):
     _logger: logging.Logger = logging.getLogger(__name__)
-    _modules: list[type[ApplicationModule]] | None = None
     _app: FastAPI | None = None
-    _injector: Injector | None = None
     _initialized: bool = False
 
     def __init__(self) -> None:
         if not self._initialized:
-            self._modules = ClassFinder.find(Module, "Module")  # type: ignore[arg-type]
+            self._initialize_modules()
             self._initialize_injector()
             self._initialize_app()
+            self._initialize_exception_responders()
             self._initialize_middlewares()
             self._initialize_commands()
             self._initialize_queries()
@@ -45,50 +49,6 @@ class ApplicationBootstrapper:
             self._initialize_controllers()
             self._initialized = True
 
-    def _initialize_injector(self) -> None:
-        if not self._injector:
-            self._logger.info("Initializing container")
-            self._injector = Injector(modules=self._modules)
-
-    def _initialize_commands(self) -> None:
-        self._logger.info("Initializing commands")
-
-        if not self._injector or not self._modules:
-            raise RuntimeError("Injector or modules not initialized")
-
-        bus = self._injector.get(CommandBus)  # type: ignore
-
-        for module_class in self._modules:
-            module: ApplicationModule = self._injector.get(module_class)  # type: ignore
-            for command, handler in module.map_commands():
-                bus.register(command, handler)
-
-    def _initialize_queries(self) -> None:
-        self._logger.info("Initializing queries")
-
-        if not self._injector or not self._modules:
-            raise RuntimeError("Injector or modules not initialized")
-
-        bus = self._injector.get(QueryBus)  # type: ignore
-
-        for module_class in self._modules:
-            module: ApplicationModule = self._injector.get(module_class)  # type: ignore
-            for query, handler in module.map_queries():
-                bus.register(query, handler)
-
-    def _initialize_events(self) -> None:
-        self._logger.info("Initializing events")
-
-        if not self._injector or not self._modules:
-            raise RuntimeError("Injector or modules not initialized")
-
-        event_bus = self._injector.get(EventBus)  # type: ignore
-
-        for module_class in self._modules:
-            module: ApplicationModule = self._injector.get(module_class)  # type: ignore
-            for event, listener in module.map_events():
-                event_bus.register(event, listener)
-
     def _initialize_app(self) -> None:
         if not self._app:
             self._app = FastAPI(
@@ -110,6 +70,19 @@ class ApplicationBootstrapper:
         for middleware_class in middlewares:
             self._app.add_middleware(middleware_class)  # type: ignore
 
+    def _initialize_exception_responders(self) -> None:
+        # Se registran antes de servir: Starlette fija sus handlers de
+        # excepción al construir la pila de middlewares en la primera llamada
+        if not self._app:
+            raise RuntimeError("FastAPI app not initialized")
+
+        self._app.add_exception_handler(
+            BulkheadRejectedError, BulkheadRejectionResponder.handle
+        )
+        self._app.add_exception_handler(
+            DeadlineExceededError, DeadlineExceededResponder.handle
+        )
+
     def _initialize_controllers(self) -> None:
         self._logger.info("Initializing controllers")
         if not self._app or not self._injector:
@@ -141,12 +114,16 @@ class ApplicationBootstrapper:
         kafka_manager = self._injector.get(KafkaEventBusManager)  # type: ignore
         await kafka_manager.start()
 
+        process_pool = self._injector.get(HandlerProcessPool)  # type: ignore
+        await process_pool.start_if_needed()
+
         yield
 
         # Shutdown
         self._logger.info("Shutting down application")
         kafka_manager = self._injector.get(KafkaEventBusManager)  # type: ignore
         await kafka_manager.stop()
+        await process_pool.stop()
 
     async def start_application(self) -> None:
         self._logger.info("Initializing FastAPI app")
@@ -0,0 +1,177 @@
+import logging
+from typing import Any
+
+from injector import Injector, Module
+
+from app.Contexts.Shared.Application.Bus.Command.CommandBus import CommandBus
+from app.Contexts.Shared.Application.Bus.Event.EventBus import EventBus
+from app.Contexts.Shared.Application.Bus.Query.QueryBus import QueryBus
+from app.Contexts.Shared.Infrastructure.Bootstrap.ClassFinder import ClassFinder
+from app.Contexts.Shared.Infrastructure.Bus.BulkheadMiddleware import (
+    BulkheadMiddleware,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Command.CommandMailboxMiddleware import (
+    CommandMailboxMiddleware,
+)
+from app.Contexts.Shared.Infrastructure.Bus.DeadlineMiddleware import (
+    DeadlineMiddleware,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Query.QueryCache import QueryCache
+from app.Contexts.Shared.Infrastructure.Bus.Query.QueryCacheInvalidator import (
+    QueryCacheInvalidator,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Query.QueryCacheMiddleware import (
+    QueryCacheMiddleware,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Query.QuerySingleFlightMiddleware import (
+    QuerySingleFlightMiddleware,
+)
+from app.Contexts.Shared.Infrastructure.Logging.LoggerConfig import configure_logging
+from app.Contexts.Shared.Infrastructure.Module.ApplicationModule import (
+    ApplicationModule,
+)
+from app.Contexts.Shared.Infrastructure.Settings.BulkheadSettings import (
+    BulkheadSettings,
+)
+from app.Contexts.Shared.Infrastructure.Settings.CommandBusSettings import (
+    CommandBusSettings,
+)
+from app.Contexts.Shared.Infrastructure.Settings.QueryCacheSettings import (
+    QueryCacheSettings,
+)
+
+# Configurar logging al inicio
+configure_logging()
+
+
+class Bootstrapper:
+    """Construye el contenedor y registra los comandos, queries y eventos de los módulos"""
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+    _modules: list[type[ApplicationModule]] | None = None
+    _injector: Injector | None = None
+
+    def _initialize_modules(self) -> None:
+        if not self._modules:
+            self._modules = ClassFinder.find(Module, "Module")  # type: ignore[arg-type]
+
+    def _initialize_injector(self) -> None:
+        if not self._injector:
+            self._logger.info("Initializing container")
+            self._injector = Injector(modules=self._modules)
+
+    def _initialize_commands(self) -> None:
+        self._logger.info("Initializing commands")
+
+        if not self._injector or not self._modules:
+            raise RuntimeError("Injector or modules not initialized")
+
+        bus = self._injector.get(CommandBus)  # type: ignore
+
+        if self._injector.get(CommandBusSettings).mailboxes:
+            bus.use(self._injector.get(CommandMailboxMiddleware))
+
+        commands: list[type[Any]] = []
+        for module_class in self._modules:
+            module: ApplicationModule = self._injector.get(module_class)  # type: ignore
+            for command, handler in module.map_commands():
+                bus.register(command, handler)
+                commands.append(command)
+            for middleware in module.map_command_middlewares():
+                bus.use(self._injector.get(middleware))
+
+        self._use_bulkheads(bus, commands)
+        bus.use(self._injector.get(DeadlineMiddleware))
+        bus.freeze()
+
+    def _initialize_queries(self) -> None:
+        self._logger.info("Initializing queries")
+
+        if not self._injector or not self._modules:
+            raise RuntimeError("Injector or modules not initialized")
+
+        bus = self._injector.get(QueryBus)  # type: ignore
+
+        # La caché envuelve al resto de middlewares: un acierto no los ejecuta.
+        # Tras un fallo, el single-flight agrupa las peticiones idénticas.
+        query_cache_settings = self._injector.get(QueryCacheSettings)
+        if query_cache_settings.enabled:
+            bus.use(self._injector.get(QueryCacheMiddleware))
+        if query_cache_settings.single_flight:
+            bus.use(self._injector.get(QuerySingleFlightMiddleware))
+
+        queries: list[type[Any]] = []
+        for module_class in self._modules:
+            module: ApplicationModule = self._injector.get(module_class)  # type: ignore
+            for query, handler in module.map_queries():
+                bus.register(query, handler)
+                queries.append(query)
+            for middleware in module.map_query_middlewares():
+                bus.use(self._injector.get(middleware))
+
+        self._use_bulkheads(bus, queries)
+        bus.use(self._injector.get(DeadlineMiddleware))
+        bus.freeze()
+
+    def _use_bulkheads(
+        self, bus: CommandBus | QueryBus, messages: list[type[Any]]
+    ) -> None:
+        if not self._injector or not self._modules:
+            raise RuntimeError("Injector or modules not initialized")
+
+        if not self._injector.get(BulkheadSettings).enabled:
+            return
+
+        # El bulkhead va detrás de los demás middlewares y solo por delante
+        # del de plazos: cuenta las ejecuciones reales y no lo que ya
+        # resolvieron la caché, el single-flight o los buzones
+        bulkhead = self._injector.get(BulkheadMiddleware)
+        for module_class in self._modules:
+            module: ApplicationModule = self._injector.get(module_class)  # type: ignore
+            for message, limits in module.map_bulkheads():
+                bulkhead.configure(message, limits)
+        bulkhead.prepare(messages)
+        bus.use(bulkhead)
+
+    def _initialize_events(self) -> None:
+        self._logger.info("Initializing events")
+
+        if not self._injector or not self._modules:
+            raise RuntimeError("Injector or modules not initialized")
+
+        event_bus = self._injector.get(EventBus)  # type: ignore
+
+        for module_class in self._modules:
+            module: ApplicationModule = self._injector.get(module_class)  # type: ignore
+            for event, listener in module.map_events():
+                event_bus.register(event, listener)
+
+        if self._injector.get(QueryCacheSettings).enabled:
+            self._initialize_query_cache_invalidations(event_bus)
+
+    def _initialize_query_cache_invalidations(self, event_bus: EventBus) -> None:
+        if not self._injector or not self._modules:
+            raise RuntimeError("Injector or modules not initialized")
+
+        cache = self._injector.get(QueryCache)
+        for module_class in self._modules:
+            module: ApplicationModule = self._injector.get(module_class)  # type: ignore
+            for event, tags in module.map_query_cache_invalidations():
+                cache.invalidate_on(event, tags)
+
+        invalidator = self._injector.get(QueryCacheInvalidator)
+        for event in cache.invalidated_events():
+            # Lo publicado en este proceso invalida antes de que `publish`
+            # retorne: el siguiente request ya lee su propia escritura
+            event_bus.subscribe_local(event, invalidator)
+            # Lo publicado en otros procesos llega por el bus. Con Kafka el
+            # consumer group es compartido y solo lo recibe una réplica: en el
+            # resto la entrada dura como mucho `QueryCacheSettings.ttl_ms`
+            event_bus.subscribe(event, invalidator)
+
+    @property
+    def injector(self) -> Injector:
+        if not self._injector:
+            raise RuntimeError("Injector not initialized")
+
+        return self._injector
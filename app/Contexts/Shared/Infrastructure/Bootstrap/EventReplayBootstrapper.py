@@ -0,0 +1,66 @@
+import logging
+from typing import Any
+
+from aiokafka import TopicPartition
+
+from app.Contexts.Shared.Application.Bus.Event.EventBus import EventBus
+from app.Contexts.Shared.Infrastructure.Bootstrap.Bootstrapper import Bootstrapper
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaClientFactory import (
+    KafkaClientFactory,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBus import KafkaEventBus
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventReplayer import (
+    KafkaEventReplayer,
+    ReplayProgressCallback,
+)
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+
+class EventReplayBootstrapper(Bootstrapper):
+    """
+    Reprocesa eventos ya publicados con los listeners de la aplicación.
+
+    El EventBus no se arranca: los eventos que publiquen los listeners durante
+    el replay no se envían, de modo que reconstruir una proyección no repite
+    efectos secundarios.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self) -> None:
+        self._initialize_modules()
+        self._initialize_injector()
+        self._initialize_commands()
+        self._initialize_queries()
+        self._initialize_events()
+
+    async def run(
+        self,
+        name: str = "default",
+        events: list[str] | None = None,
+        from_beginning: bool = False,
+        from_timestamp_ms: int | None = None,
+        from_offsets: dict[TopicPartition, int] | None = None,
+        target_listener: str | None = None,
+        on_progress: ReplayProgressCallback | None = None,
+    ) -> dict[str, Any]:
+        settings = self.injector.get(KafkaSettings)
+        event_bus = self.injector.get(EventBus)  # type: ignore[type-abstract]
+        if not settings.enabled or not isinstance(event_bus, KafkaEventBus):
+            raise RuntimeError("El replay de eventos necesita KAFKA_ENABLED")
+
+        replayer = KafkaEventReplayer(
+            event_bus,
+            settings,
+            self.injector.get(KafkaClientFactory),
+            name=name,
+        )
+        self._logger.info(f"Starting event replay {replayer.group_id}")
+        return await replayer.run(
+            events=events,
+            from_beginning=from_beginning,
+            from_timestamp_ms=from_timestamp_ms,
+            from_offsets=from_offsets,
+            target_listener=target_listener,
+            on_progress=on_progress,
+        )
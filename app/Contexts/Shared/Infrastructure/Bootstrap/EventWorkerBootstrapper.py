@@ -0,0 +1,58 @@
+import asyncio
+import logging
+import signal
+
+from app.Contexts.Shared.Infrastructure.Bootstrap.Bootstrapper import Bootstrapper
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBusManager import (
+    KafkaEventBusManager,
+)
+from app.Contexts.Shared.Infrastructure.Bus.HandlerProcessPool import (
+    HandlerProcessPool,
+)
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+
+class EventWorkerBootstrapper(Bootstrapper):
+    """
+    Arranca solo los consumers de eventos, sin aplicación FastAPI.
+
+    Carga los mismos módulos que la API para que los listeners puedan usar
+    comandos, queries y repositorios. Varios procesos con este bootstrapper
+    comparten el consumer group y Kafka les reparte las particiones.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self) -> None:
+        self._initialize_modules()
+        self._initialize_injector()
+        self._initialize_commands()
+        self._initialize_queries()
+        self._initialize_events()
+
+    async def run(self, stop: asyncio.Event | None = None) -> None:
+        """Consume eventos hasta que se active `stop` o se reciba SIGINT/SIGTERM"""
+        settings = self.injector.get(KafkaSettings)
+        if not settings.enabled or not settings.consumer_enabled:
+            raise RuntimeError(
+                "El worker de eventos necesita KAFKA_ENABLED y KAFKA_CONSUMER_ENABLED"
+            )
+
+        if stop is None:
+            stop = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(signum, stop.set)
+
+        kafka_manager = self.injector.get(KafkaEventBusManager)
+        self._logger.info("Starting event worker")
+        await kafka_manager.start()
+        process_pool = self.injector.get(HandlerProcessPool)
+        await process_pool.start_if_needed()
+
+        try:
+            await stop.wait()
+        finally:
+            self._logger.info("Shutting down event worker")
+            await kafka_manager.stop()
+            await process_pool.stop()
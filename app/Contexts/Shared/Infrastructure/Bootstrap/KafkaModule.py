@@ -3,6 +3,18 @@ import logging
 from injector import Binder, singleton
 
 from app.Contexts.Shared.Application.Bus.Event.EventBus import EventBus
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryEventBus import (
+    InMemoryEventBus,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaBroker import (
+    InMemoryKafkaBroker,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaClientFactory import (
+    InMemoryKafkaClientFactory,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaClientFactory import (
+    KafkaClientFactory,
+)
 from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBus import KafkaEventBus
 from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBusManager import (
     KafkaEventBusManager,
@@ -10,6 +22,9 @@ from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBusManager import (
 from app.Contexts.Shared.Infrastructure.Module.ApplicationModule import (
     ApplicationModule,
 )
+from app.Contexts.Shared.Infrastructure.Settings.EventBusSettings import (
+    EventBusSettings,
+)
 from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
 
 
@@ -21,10 +36,26 @@ class KafkaModule(ApplicationModule):
         super().configure(binder)
 
         # Configuración de Kafka
-        binder.bind(KafkaSettings, to=KafkaSettings.from_env(), scope=singleton)
-
-        # EventBus - registrar interfaz con implementación de Kafka
-        binder.bind(EventBus, to=KafkaEventBus, scope=singleton)  # type: ignore
+        kafka_settings = KafkaSettings.from_env()
+        binder.bind(KafkaSettings, to=kafka_settings, scope=singleton)
+
+        # Clientes de Kafka: broker real o broker en memoria
+        if kafka_settings.transport == "memory":
+            binder.bind(InMemoryKafkaBroker, to=InMemoryKafkaBroker(), scope=singleton)
+            binder.bind(
+                KafkaClientFactory, to=InMemoryKafkaClientFactory, scope=singleton
+            )
+        else:
+            binder.bind(KafkaClientFactory, to=KafkaClientFactory, scope=singleton)
+
+        # EventBus - Kafka, o en memoria para un solo nodo si Kafka está deshabilitado
+        if kafka_settings.enabled:
+            binder.bind(EventBus, to=KafkaEventBus, scope=singleton)  # type: ignore
+        else:
+            binder.bind(
+                EventBusSettings, to=EventBusSettings.from_env(), scope=singleton
+            )
+            binder.bind(EventBus, to=InMemoryEventBus, scope=singleton)  # type: ignore
 
         # Registrar manager como singleton
         binder.bind(KafkaEventBusManager, scope=singleton)
@@ -0,0 +1,61 @@
+import asyncio
+from typing import Any
+
+from app.Contexts.Shared.Application.Bus.BulkheadRejectedError import (
+    BulkheadRejectedError,
+)
+from app.Contexts.Shared.Infrastructure.Bus.BulkheadLimits import BulkheadLimits
+
+
+class Bulkhead:
+    """
+    Limita las ejecuciones simultáneas de un tipo de mensaje y la cola de los
+    que esperan turno; lo que no cabe se rechaza con BulkheadRejectedError
+    """
+
+    def __init__(self, name: str, limits: BulkheadLimits) -> None:
+        self.name = name
+        self.limits = limits
+        self._slots = asyncio.Semaphore(max(1, limits.max_concurrent))
+        self._active = 0
+        self._queued = 0
+        self._admitted = 0
+        self._rejected_full = 0
+        self._rejected_timeout = 0
+
+    async def acquire(self) -> None:
+        """Espera un turno o lanza BulkheadRejectedError"""
+        if not self._slots.locked():
+            await self._slots.acquire()
+        elif self._queued >= self.limits.max_queued:
+            self._rejected_full += 1
+            raise BulkheadRejectedError(self.name, queue_full=True)
+        else:
+            self._queued += 1
+            try:
+                await asyncio.wait_for(
+                    self._slots.acquire(), timeout=self.limits.max_wait_ms / 1000
+                )
+            except TimeoutError:
+                self._rejected_timeout += 1
+                raise BulkheadRejectedError(self.name, queue_full=False) from None
+            finally:
+                self._queued -= 1
+
+        self._active += 1
+        self._admitted += 1
+
+    def release(self) -> None:
+        self._active -= 1
+        self._slots.release()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "max_concurrent": self.limits.max_concurrent,
+            "max_queued": self.limits.max_queued,
+            "active": self._active,
+            "queued": self._queued,
+            "admitted": self._admitted,
+            "rejected_full": self._rejected_full,
+            "rejected_timeout": self._rejected_timeout,
+        }
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BulkheadLimits:
+    """Capacidad del bulkhead de un tipo de comando o query"""
+
+    # Ejecuciones simultáneas del handler
+    max_concurrent: int
+    # Peticiones esperando turno; por encima se rechazan al instante
+    max_queued: int
+    # Espera máxima por un turno antes de rechazar la petición
+    max_wait_ms: int
@@ -0,0 +1,81 @@
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+from injector import inject, singleton
+
+from app.Contexts.Shared.Application.Bus.BusMiddleware import BusMiddleware
+from app.Contexts.Shared.Application.Bus.Command.Command import Command
+from app.Contexts.Shared.Infrastructure.Bus.Bulkhead import Bulkhead
+from app.Contexts.Shared.Infrastructure.Bus.BulkheadLimits import BulkheadLimits
+from app.Contexts.Shared.Infrastructure.Settings.BulkheadSettings import (
+    BulkheadSettings,
+)
+
+
+@singleton
+class BulkheadMiddleware(BusMiddleware):
+    """
+    Aísla cada tipo de comando y query en su propio bulkhead.
+
+    Una avalancha de lecturas satura solo el bulkhead de su query y se
+    rechaza rápido, sin acaparar el event loop ni retrasar a los comandos.
+    Se instala tras la caché, el single-flight, los buzones y los
+    middlewares de los módulos, así que los aciertos de caché, las queries
+    agrupadas y los comandos esperando en su buzón no ocupan turno. Solo
+    DeadlineMiddleware queda por dentro, entre el bulkhead y el handler.
+    """
+
+    @inject
+    def __init__(self, settings: BulkheadSettings) -> None:
+        self._settings = settings
+        self._limits: dict[type[Any], BulkheadLimits] = {}
+        self._bulkheads: dict[type[Any], Bulkhead] = {}
+
+    def configure(self, message: type[Any], limits: BulkheadLimits) -> None:
+        """Fija los límites de un tipo de mensaje; antes de congelar el bus"""
+        self._limits[message] = limits
+
+    def prepare(self, messages: Iterable[type[Any]]) -> None:
+        """Crea los bulkheads de los mensajes registrados; antes de congelar el bus"""
+        for message in messages:
+            self._bulkhead_for(message)
+
+    def applies_to(self, message: type[Any]) -> bool:
+        return True
+
+    async def handle(
+        self, message: Any, next_handler: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        bulkhead = self._bulkheads.get(type(message)) or self._bulkhead_for(
+            type(message)
+        )
+        await bulkhead.acquire()
+        try:
+            return await next_handler(message)
+        finally:
+            bulkhead.release()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "enabled": self._settings.enabled,
+            "bulkheads": {
+                bulkhead.name: bulkhead.snapshot()
+                for bulkhead in sorted(
+                    self._bulkheads.values(), key=lambda bulkhead: bulkhead.name
+                )
+            },
+        }
+
+    def _bulkhead_for(self, message: type[Any]) -> Bulkhead:
+        if message not in self._bulkheads:
+            self._bulkheads[message] = Bulkhead(
+                message.__name__, self._limits_for(message)
+            )
+        return self._bulkheads[message]
+
+    def _limits_for(self, message: type[Any]) -> BulkheadLimits:
+        if message in self._limits:
+            return self._limits[message]
+        if issubclass(message, Command):
+            return self._settings.commands
+        return self._settings.queries
@@ -0,0 +1,105 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Sequence
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any
+
+from injector import singleton
+
+from app.Contexts.Shared.Application.Bus.BusMiddleware import BusMiddleware
+from app.Contexts.Shared.Application.Bus.Command.SerializedCommand import (
+    SerializedCommand,
+)
+
+
+class _Mailbox:
+    """Turno de ejecución de una clave y comandos que lo esperan o lo ocupan"""
+
+    __slots__ = ("lock", "pending")
+
+    def __init__(self) -> None:
+        # asyncio.Lock despierta a los que esperan en orden de llegada
+        self.lock = asyncio.Lock()
+        self.pending = 0
+
+
+@singleton
+class CommandMailboxMiddleware(BusMiddleware):
+    """
+    Ejecuta de uno en uno, en orden de llegada, los comandos con la misma
+    clave de buzón; los de claves distintas no se esperan entre sí.
+
+    Cada clave tiene su buzón mientras haya comandos en curso o esperando y
+    se elimina en cuanto queda vacío, así que el número de buzones está
+    acotado por la concurrencia y no por las claves vistas. Solo serializa
+    dentro del proceso: varios workers necesitan además un bloqueo
+    compartido o el particionado por clave de Kafka.
+    """
+
+    def __init__(self) -> None:
+        self._mailboxes: dict[Hashable, _Mailbox] = {}
+        # Los lotes reservan sus buzones de uno en uno sin entrelazarse entre sí
+        self._batch_turn = asyncio.Lock()
+        self._executed = 0
+        self._queued = 0
+        self._max_depth = 0
+
+    def applies_to(self, message: type[Any]) -> bool:
+        return issubclass(message, SerializedCommand)
+
+    async def handle(
+        self, message: Any, next_handler: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        key = message.mailbox_key()
+        if key is None:
+            return await next_handler(message)
+
+        async with self._turn(key):
+            self._executed += 1
+            return await next_handler(message)
+
+    async def handle_many(
+        self,
+        messages: Sequence[Any],
+        next_handler: Callable[[Sequence[Any]], Awaitable[Any]],
+    ) -> Any:
+        """
+        El lote ocupa a la vez el buzón de todas sus claves. Un comando suelto
+        solo espera un buzón, y dos lotes no reservan a la vez, así que no se
+        pueden bloquear mutuamente.
+        """
+        keys = [
+            key for message in messages if (key := message.mailbox_key()) is not None
+        ]
+        async with AsyncExitStack() as turns:
+            async with self._batch_turn:
+                for key in dict.fromkeys(keys):
+                    await turns.enter_async_context(self._turn(key))
+            self._executed += len(keys)
+            return await next_handler(messages)
+
+    @asynccontextmanager
+    async def _turn(self, key: Hashable) -> AsyncIterator[None]:
+        """Espera el turno de una clave en su buzón y lo libera al salir"""
+        mailbox = self._mailboxes.get(key)
+        if mailbox is None:
+            mailbox = self._mailboxes[key] = _Mailbox()
+        mailbox.pending += 1
+        if mailbox.pending > 1:
+            self._queued += 1
+            self._max_depth = max(self._max_depth, mailbox.pending)
+
+        try:
+            async with mailbox.lock:
+                yield
+        finally:
+            mailbox.pending -= 1
+            if mailbox.pending == 0 and self._mailboxes.get(key) is mailbox:
+                del self._mailboxes[key]
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "mailboxes": len(self._mailboxes),
+            "executed": self._executed,
+            "queued": self._queued,
+            "max_depth": self._max_depth,
+        }
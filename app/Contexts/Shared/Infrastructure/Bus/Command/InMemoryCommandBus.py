@@ -1,10 +1,27 @@
+import asyncio
 import logging
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any
 
 from injector import Injector, inject, singleton
 
+from app.Contexts.Shared.Application.Bus.BusMiddleware import BusMiddleware
+from app.Contexts.Shared.Application.Bus.Command.BatchCommandHandler import (
+    BatchCommandHandler,
+)
 from app.Contexts.Shared.Application.Bus.Command.Command import Command
 from app.Contexts.Shared.Application.Bus.Command.CommandBus import CommandBus
 from app.Contexts.Shared.Application.Bus.Command.CommandHandler import CommandHandler
+from app.Contexts.Shared.Application.Bus.Command.SerializedCommand import (
+    SerializedCommand,
+)
+from app.Contexts.Shared.Infrastructure.Bus.HandlerCompiler import HandlerCompiler
+from app.Contexts.Shared.Infrastructure.Settings.CommandBusSettings import (
+    CommandBusSettings,
+)
+
+# Lotes por tipo de comando y carriles por clave de buzón de un tramo
+_Segment = tuple[dict[type[Command], list[Command]], dict[Hashable, list[Command]]]
 
 
 @singleton
@@ -12,15 +29,149 @@ class InMemoryCommandBus(CommandBus):
     _logger: logging.Logger = logging.getLogger(__name__)
 
     @inject
-    def __init__(self, injector: Injector) -> None:
+    def __init__(self, injector: Injector, settings: CommandBusSettings) -> None:
         self._injector = injector
+        self._settings = settings
         self._handlers: dict[type[Command], type[CommandHandler]] = {}
+        self._middlewares: list[BusMiddleware] = []
+        # Tabla de despacho compilada por freeze(); None mientras se registran
+        self._dispatch_table: dict[type[Command], Callable[[Any], Any]] | None = None
+        # Lo mismo para los lotes de los BatchCommandHandler
+        self._batch_table: dict[type[Command], Callable[[Sequence[Any]], Any]] = {}
 
     async def dispatch(self, command: Command) -> None:
+        if self._dispatch_table is not None:
+            await self._dispatch_table[type(command)](command)
+            return
+
         handler = self._handlers[type(command)]
+        await HandlerCompiler.compile(
+            self._injector, type(command), handler, self._middlewares
+        )(command)
+
+    async def dispatch_many(self, commands: Sequence[Command]) -> None:
+        errors: list[Exception] = []
+        # Los tramos van uno detrás de otro; dentro de cada tramo, los lotes y
+        # los carriles se ejecutan a la vez
+        for batches, lanes in self._segments(commands):
+            await asyncio.gather(
+                *(
+                    self._dispatch_batch(command_type, batch, errors)
+                    for command_type, batch in batches.items()
+                ),
+                self._dispatch_lanes(list(lanes.values()), errors),
+            )
+        if errors:
+            raise ExceptionGroup(
+                f"{len(errors)} de {len(commands)} comandos han fallado", errors
+            )
+
+    def _segments(self, commands: Sequence[Command]) -> list[_Segment]:
+        """
+        Reparte los comandos en lotes por tipo y en carriles por clave de buzón.
 
-        handler_instance = self._injector.get(handler)
-        await handler_instance.handle(command)
+        Los comandos con la misma clave de buzón comparten carril y se ejecutan
+        en orden; el resto va cada uno en su propio carril. Si una clave pasa de
+        un lote a un carril, o a un lote de otro tipo, empieza un tramo nuevo
+        para que no se ejecuten a la vez y se respete su orden.
+        """
+        segments: list[_Segment] = []
+        batches: dict[type[Command], list[Command]] = {}
+        lanes: dict[Hashable, list[Command]] = {}
+        # Dónde va cada clave de buzón en el tramo actual: el tipo de su lote o
+        # None si va en un carril
+        owners: dict[Hashable, type[Command] | None] = {}
+        for command in commands:
+            key = (
+                command.mailbox_key()
+                if isinstance(command, SerializedCommand)
+                else None
+            )
+            batched = issubclass(self._handlers[type(command)], BatchCommandHandler)
+            owner = type(command) if batched else None
+            if key is not None and owners.get(key, owner) is not owner:
+                segments.append((batches, lanes))
+                batches, lanes, owners = {}, {}, {}
+            if key is not None:
+                owners[key] = owner
+
+            if batched:
+                batches.setdefault(type(command), []).append(command)
+            else:
+                lanes.setdefault(id(command) if key is None else key, []).append(
+                    command
+                )
+        segments.append((batches, lanes))
+        return segments
 
     def register(self, command: type[Command], handler: type[CommandHandler]) -> None:
+        if self._dispatch_table is not None:
+            raise RuntimeError(
+                f"CommandBus congelado, no se puede registrar {command.__name__}"
+            )
+
         self._handlers[command] = handler
+
+    def use(self, middleware: BusMiddleware) -> None:
+        if self._dispatch_table is not None:
+            raise RuntimeError(
+                f"CommandBus congelado, no se puede añadir {type(middleware).__name__}"
+            )
+
+        self._middlewares.append(middleware)
+
+    async def _dispatch_batch(
+        self,
+        command_type: type[Command],
+        commands: list[Command],
+        errors: list[Exception],
+    ) -> None:
+        call = self._batch_table.get(command_type)
+        if call is None:
+            call = HandlerCompiler.compile_batch(
+                self._injector,
+                command_type,
+                self._handlers[command_type],
+                self._middlewares,
+            )
+        try:
+            await call(commands)
+        except Exception as error:
+            errors.append(error)
+
+    async def _dispatch_lanes(
+        self, lanes: list[list[Command]], errors: list[Exception]
+    ) -> None:
+        pending = iter(lanes)
+
+        async def work() -> None:
+            # Cada worker vacía carriles completos: a lo sumo
+            # `batch_concurrency` comandos en curso y el orden de cada clave
+            # intacto. Un fallo no detiene el resto de su carril.
+            for lane in pending:
+                for command in lane:
+                    try:
+                        await self.dispatch(command)
+                    except Exception as error:
+                        errors.append(error)
+
+        workers = min(len(lanes), max(1, self._settings.batch_concurrency))
+        await asyncio.gather(*(work() for _ in range(workers)))
+
+    def freeze(self) -> None:
+        self._dispatch_table = {
+            command: HandlerCompiler.compile(
+                self._injector, command, handler, self._middlewares
+            )
+            for command, handler in self._handlers.items()
+        }
+        self._batch_table = {
+            command: HandlerCompiler.compile_batch(
+                self._injector, command, handler, self._middlewares
+            )
+            for command, handler in self._handlers.items()
+            if issubclass(handler, BatchCommandHandler)
+        }
+        self._logger.info(
+            f"CommandBus congelado con {len(self._dispatch_table)} comandos"
+        )
@@ -0,0 +1,37 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from injector import singleton
+
+from app.Contexts.Shared.Application.Bus.BusMiddleware import BusMiddleware
+from app.Contexts.Shared.Infrastructure.Http.Context.RequestContext import (
+    RequestContext,
+)
+
+
+@singleton
+class DeadlineMiddleware(BusMiddleware):
+    """
+    Descarta los comandos y queries cuyo request ya ha vencido.
+
+    Va el último de la cadena, justo antes del handler: lo que esperó turno
+    en un buzón o un bulkhead se comprueba tras la espera, que es cuando
+    más probable es que el cliente ya se haya ido. Fuera de un request HTTP
+    no hay plazo y no hace nada.
+    """
+
+    def __init__(self) -> None:
+        self._skipped = 0
+
+    async def handle(
+        self, message: Any, next_handler: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        try:
+            RequestContext.check_deadline(type(message).__name__)
+        except TimeoutError:
+            self._skipped += 1
+            raise
+        return await next_handler(message)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"skipped": self._skipped}
@@ -0,0 +1,199 @@
+import struct
+from datetime import UTC, datetime
+from typing import Any
+
+import orjson
+
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Bus.Event.Codec.EventCodec import EventCodec
+from app.Contexts.Shared.Infrastructure.Bus.Event.Codec.EventSchemaRegistry import (
+    EventSchemaRegistry,
+)
+
+# Cabecera fija: versión del formato, versión del esquema, id y fecha del evento
+_HEADER = struct.Struct(">BH16sq")
+_INT = struct.Struct(">q")
+_FLOAT = struct.Struct(">d")
+
+# Marcas de tipo de cada valor del payload
+_TAG_NONE = 0
+_TAG_STR = 1
+_TAG_INT = 2
+_TAG_FLOAT = 3
+_TAG_TRUE = 4
+_TAG_FALSE = 5
+_TAG_JSON = 6
+# Campo del esquema que no estaba en el payload: distinto de un None explícito
+_TAG_ABSENT = 7
+
+
+class BinaryEventCodec(EventCodec):
+    """
+    Formato binario compacto basado en el esquema de cada evento.
+
+    Los valores del payload se escriben en el orden del esquema registrado, sin
+    nombres de campo, con una marca de tipo y longitudes varint. La fecha viaja
+    como microsegundos desde epoch y el id como los 16 bytes del UUID. Los campos
+    del payload que no estén en el esquema se añaden al final como JSON para no
+    perder información. Un campo del esquema ausente en el payload se marca como
+    tal y el decoder rechaza el registro en lugar de inventarle un None.
+    """
+
+    name = "binary"
+    _FORMAT_VERSION = 1
+
+    def __init__(self, schema_registry: EventSchemaRegistry) -> None:
+        self._schema_registry = schema_registry
+        # Nombre codificado y campos del esquema actual de cada clase de evento
+        self._writers: dict[type[DomainEvent], tuple[bytes, tuple[str, ...]]] = {}
+
+    def encode(self, event: DomainEvent) -> bytes:
+        writer = self._writers.get(type(event))
+        if writer is None:
+            writer = self._writers[type(event)] = (
+                event.__class__.__name__.encode("utf-8"),
+                self._schema_registry.register_event(type(event)),
+            )
+        event_name, fields = writer
+        payload = event.payload
+
+        buffer = bytearray()
+        buffer += _HEADER.pack(
+            self._FORMAT_VERSION,
+            event.schema_version(),
+            bytes.fromhex(event.id.replace("-", "")),
+            round(event.occurred_on.timestamp() * 1_000_000),
+        )
+        _write_bytes(buffer, event_name)
+        _write_value(buffer, event.aggregate_id)
+
+        present = 0
+        for field in fields:
+            if field in payload:
+                _write_value(buffer, payload[field])
+                present += 1
+            else:
+                buffer.append(_TAG_ABSENT)
+
+        if len(payload) > present:
+            extra = {key: value for key, value in payload.items() if key not in fields}
+            _write_bytes(buffer, orjson.dumps(extra))
+        else:
+            buffer.append(0)
+        return bytes(buffer)
+
+    def decode(self, data: bytes) -> dict[str, Any]:
+        view = memoryview(data)
+        format_version, schema_version, event_id, occurred_on = _HEADER.unpack_from(
+            view
+        )
+        if format_version != self._FORMAT_VERSION:
+            raise ValueError(
+                f"Versión de formato binario desconocida: {format_version}"
+            )
+
+        offset = _HEADER.size
+        raw_name, offset = _read_bytes(view, offset)
+        event_name = raw_name.decode("utf-8")
+        aggregate_id, offset = _read_value(view, offset)
+
+        payload: dict[str, Any] = {}
+        for field in self._schema_registry.fields(event_name, schema_version):
+            if offset >= len(view) or view[offset] == _TAG_ABSENT:
+                raise ValueError(
+                    f"Falta el campo {field} del esquema {schema_version} "
+                    f"de {event_name}"
+                )
+            payload[field], offset = _read_value(view, offset)
+
+        extra, offset = _read_bytes(view, offset)
+        if extra:
+            payload.update(orjson.loads(extra))
+
+        return {
+            "event_name": event_name,
+            "event_id": _format_uuid(event_id.hex()),
+            "schema_version": schema_version,
+            "aggregate_id": aggregate_id,
+            "occurred_on": datetime.fromtimestamp(
+                occurred_on / 1_000_000, UTC
+            ).isoformat(),
+            "payload": payload,
+        }
+
+
+def _format_uuid(digits: str) -> str:
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(view: memoryview, offset: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = view[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _write_bytes(buffer: bytearray, value: bytes) -> None:
+    _write_varint(buffer, len(value))
+    buffer += value
+
+
+def _read_bytes(view: memoryview, offset: int) -> tuple[bytes, int]:
+    length, offset = _read_varint(view, offset)
+    end = offset + length
+    return bytes(view[offset:end]), end
+
+
+def _write_value(buffer: bytearray, value: Any) -> None:
+    # bool antes que int: True es una instancia de int
+    if value is None:
+        buffer.append(_TAG_NONE)
+    elif value is True:
+        buffer.append(_TAG_TRUE)
+    elif value is False:
+        buffer.append(_TAG_FALSE)
+    elif isinstance(value, str):
+        buffer.append(_TAG_STR)
+        _write_bytes(buffer, value.encode("utf-8"))
+    elif isinstance(value, int) and -(2**63) <= value < 2**63:
+        buffer.append(_TAG_INT)
+        buffer += _INT.pack(value)
+    elif isinstance(value, float):
+        buffer.append(_TAG_FLOAT)
+        buffer += _FLOAT.pack(value)
+    else:
+        buffer.append(_TAG_JSON)
+        _write_bytes(buffer, orjson.dumps(value))
+
+
+def _read_value(view: memoryview, offset: int) -> tuple[Any, int]:
+    tag = view[offset]
+    offset += 1
+    if tag == _TAG_NONE:
+        return None, offset
+    if tag == _TAG_TRUE:
+        return True, offset
+    if tag == _TAG_FALSE:
+        return False, offset
+    if tag == _TAG_STR:
+        raw, offset = _read_bytes(view, offset)
+        return raw.decode("utf-8"), offset
+    if tag == _TAG_INT:
+        return _INT.unpack_from(view, offset)[0], offset + _INT.size
+    if tag == _TAG_FLOAT:
+        return _FLOAT.unpack_from(view, offset)[0], offset + _FLOAT.size
+    if tag == _TAG_JSON:
+        raw, offset = _read_bytes(view, offset)
+        return orjson.loads(raw), offset
+    raise ValueError(f"Marca de tipo desconocida: {tag}")
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+
+
+class EventCodec(ABC):
+    """
+    Formato de los eventos en Kafka.
+
+    `decode` devuelve siempre el mismo diccionario independientemente del formato:
+    `event_name`, `event_id`, `schema_version`, `aggregate_id`, `occurred_on` (ISO
+    8601) y `payload`.
+    """
+
+    # Identificador del formato que viaja en la cabecera de cada registro
+    name: str
+
+    @abstractmethod
+    def encode(self, event: DomainEvent) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> dict[str, Any]:
+        pass
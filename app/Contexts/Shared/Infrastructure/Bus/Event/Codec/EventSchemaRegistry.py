@@ -0,0 +1,55 @@
+import inspect
+
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+
+# Parámetros del constructor que no forman parte del payload
+_NON_PAYLOAD_PARAMETERS = frozenset({"self", "payload", "occurred_on", "aggregate_id"})
+
+
+class EventSchemaRegistry:
+    """
+    Registro local de esquemas de eventos, sustituto de un schema registry externo.
+
+    Un esquema es la lista ordenada de campos del payload de un evento en una
+    versión concreta. El codec binario escribe los valores en ese orden sin los
+    nombres de los campos, así que productor y consumidor deben conocer el mismo
+    esquema. Como ambos comparten código, el esquema de la versión actual se
+    deriva del constructor del evento; las versiones antiguas que sigan en los
+    topics se registran explícitamente con `register`.
+    """
+
+    def __init__(self) -> None:
+        self._schemas: dict[tuple[str, int], tuple[str, ...]] = {}
+
+    def register(self, event_name: str, version: int, fields: tuple[str, ...]) -> None:
+        """Registra los campos de una versión del esquema de un evento"""
+        key = (event_name, version)
+        registered = self._schemas.get(key)
+        if registered is not None and registered != fields:
+            raise ValueError(
+                f"El esquema {version} de {event_name} ya está registrado con "
+                f"otros campos: {registered}"
+            )
+        self._schemas[key] = fields
+
+    def register_event(self, event: type[DomainEvent]) -> tuple[str, ...]:
+        """Registra el esquema actual de una clase de evento y lo devuelve"""
+        key = (event.__name__, event.schema_version())
+        fields = self._schemas.get(key)
+        if fields is None:
+            fields = tuple(
+                name
+                for name in inspect.signature(event.__init__).parameters
+                if name not in _NON_PAYLOAD_PARAMETERS
+            )
+            self._schemas[key] = fields
+        return fields
+
+    def fields(self, event_name: str, version: int) -> tuple[str, ...]:
+        """Campos de una versión del esquema; falla si no se conoce"""
+        fields = self._schemas.get((event_name, version))
+        if fields is None:
+            raise ValueError(
+                f"Esquema desconocido para {event_name} en la versión {version}"
+            )
+        return fields
@@ -0,0 +1,29 @@
+from typing import Any
+
+import orjson
+
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Bus.Event.Codec.EventCodec import EventCodec
+
+
+class JsonEventCodec(EventCodec):
+    """Eventos como documentos JSON autodescriptivos"""
+
+    name = "json"
+
+    def encode(self, event: DomainEvent) -> bytes:
+        event_data: dict[str, Any] = {
+            "event_name": event.__class__.__name__,
+            "event_id": event.id,
+            "schema_version": event.schema_version(),
+            "aggregate_id": event.aggregate_id,
+            "occurred_on": event.occurred_on.isoformat(),
+            "payload": event.payload,
+        }
+        return orjson.dumps(event_data)
+
+    def decode(self, data: bytes) -> dict[str, Any]:
+        event_data: dict[str, Any] = orjson.loads(data)
+        # Los registros anteriores al versionado son de la versión 1
+        event_data.setdefault("schema_version", 1)
+        return event_data
@@ -1 +1,284 @@
+import asyncio
+import contextvars
+import logging
+from typing import Any
 
+from injector import Injector, inject, singleton
+
+from app.Contexts.Shared.Application.Bus.Event.EventBus import EventBus
+from app.Contexts.Shared.Application.Bus.Event.EventListener import EventListener
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Settings.EventBusSettings import (
+    EventBusSettings,
+)
+
+
+class _ListenerQueue:
+    """Cola acotada, workers y contadores de un listener suscrito a un evento"""
+
+    __slots__ = (
+        "event",
+        "listener_class",
+        "listener",
+        "queue",
+        "workers",
+        "enqueued",
+        "processed",
+        "failed",
+        "overflows",
+        "dropped",
+    )
+
+    def __init__(
+        self,
+        event: type[DomainEvent],
+        listener_class: type[EventListener],
+        listener: EventListener | None,
+        queue_size: int,
+    ) -> None:
+        self.event = event
+        self.listener_class = listener_class
+        self.listener = listener
+        self.queue: asyncio.Queue[DomainEvent] = asyncio.Queue(maxsize=queue_size)
+        self.workers: list[asyncio.Task[None]] = []
+        self.enqueued = 0
+        self.processed = 0
+        self.failed = 0
+        # Publicaciones que encontraron la cola llena y eventos descartados por ello
+        self.overflows = 0
+        self.dropped = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "event": self.event.__name__,
+            "listener": self.listener_class.__name__,
+            "queued": self.queue.qsize(),
+            "capacity": self.queue.maxsize,
+            "enqueued": self.enqueued,
+            "processed": self.processed,
+            "failed": self.failed,
+            "overflows": self.overflows,
+            "dropped": self.dropped,
+        }
+
+
+@singleton
+class InMemoryEventBus(EventBus):
+    """
+    EventBus en proceso para despliegues de un solo nodo y tests.
+
+    Publicar solo encola: cada listener tiene su propia cola acotada y sus
+    workers, de modo que un listener lento no retrasa a los demás ni a la
+    petición que publica. Con la cola de un listener llena se espera como
+    mucho `overflow_timeout_ms` y después el evento se descarta para ese
+    listener. Los eventos no sobreviven a un reinicio del proceso.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+
+    @inject
+    def __init__(self, injector: Injector, settings: EventBusSettings) -> None:
+        self._injector = injector
+        self._settings = settings
+        self._queues: dict[type[DomainEvent], list[_ListenerQueue]] = {}
+        self._local_listeners: dict[type[DomainEvent], list[EventListener]] = {}
+        self._is_running = False
+        self._stopped = False
+        self._dropped_after_stop = 0
+
+    async def publish(self, events: list[DomainEvent]) -> None:
+        """Encola cada evento para todos sus listeners"""
+        if self._stopped:
+            # Tras `stop()` no quedan workers: arrancar de nuevo aquí dejaría
+            # tareas vivas después del apagado. Los listeners locales no
+            # necesitan workers y mantienen coherente la caché.
+            await self._notify_local(events)
+            self._dropped_after_stop += len(events)
+            self._logger.warning(
+                f"InMemoryEventBus detenido: descartados {len(events)} eventos"
+            )
+            return
+        if not self._is_running:
+            await self.start()
+
+        await self._notify_local(events)
+        for event in events:
+            for listener_queue in self._queues.get(type(event), ()):
+                await self._enqueue(listener_queue, event)
+
+    def register(self, event: type[DomainEvent], listener: type[EventListener]) -> None:
+        """Registra una clase de listener; se resuelve con el injector al arrancar"""
+        self._add_queue(_ListenerQueue(event, listener, None, self._queue_size()))
+
+    def subscribe(self, event: type[DomainEvent], listener: EventListener) -> None:
+        """Suscribe una instancia de listener ya construida"""
+        self._add_queue(
+            _ListenerQueue(event, type(listener), listener, self._queue_size())
+        )
+
+    def subscribe_local(
+        self, event: type[DomainEvent], listener: EventListener
+    ) -> None:
+        """Ejecuta el listener en `publish`, antes de encolar o enviar el evento"""
+        self._local_listeners.setdefault(event, []).append(listener)
+
+    async def _notify_local(self, events: list[DomainEvent]) -> None:
+        for event in events:
+            for listener in self._local_listeners.get(type(event), ()):
+                try:
+                    await listener.listen(event)
+                except Exception as e:
+                    self._logger.error(
+                        f"Error en {listener.__class__.__name__} local "
+                        f"procesando {event.__class__.__name__} {event.id}: {e}"
+                    )
+
+    async def start(self) -> None:
+        """Resuelve los listeners y arranca sus workers"""
+        if self._is_running:
+            return
+
+        self._is_running = True
+        self._stopped = False
+        for listener_queues in self._queues.values():
+            for listener_queue in listener_queues:
+                self._start_workers(listener_queue)
+        self._logger.info("InMemoryEventBus iniciado")
+
+    async def stop(self) -> None:
+        """Procesa lo que queda en cola, hasta `shutdown_timeout_ms`, y para"""
+        if not self._is_running:
+            return
+
+        self._is_running = False
+        self._stopped = True
+        listener_queues = [
+            listener_queue
+            for listener_queues in self._queues.values()
+            for listener_queue in listener_queues
+        ]
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    *(listener_queue.queue.join() for listener_queue in listener_queues)
+                ),
+                timeout=self._settings.shutdown_timeout_ms / 1000,
+            )
+        except TimeoutError:
+            pending = sum(
+                listener_queue.queue.qsize() for listener_queue in listener_queues
+            )
+            self._logger.warning(
+                f"InMemoryEventBus detenido con {pending} eventos sin procesar"
+            )
+
+        workers = [
+            worker
+            for listener_queue in listener_queues
+            for worker in listener_queue.workers
+        ]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for listener_queue in listener_queues:
+            listener_queue.workers.clear()
+        self._logger.info("InMemoryEventBus detenido")
+
+    def metrics(self) -> dict[str, Any]:
+        """Estado de las colas y eventos procesados, fallidos y descartados"""
+        listeners = [
+            listener_queue.snapshot()
+            for listener_queues in self._queues.values()
+            for listener_queue in listener_queues
+        ]
+        return {
+            "running": self._is_running,
+            "listeners": listeners,
+            "dropped_after_stop": self._dropped_after_stop,
+            **{
+                counter: sum(listener[counter] for listener in listeners)
+                for counter in (
+                    "queued",
+                    "enqueued",
+                    "processed",
+                    "failed",
+                    "overflows",
+                    "dropped",
+                )
+            },
+        }
+
+    def _queue_size(self) -> int:
+        return max(1, self._settings.queue_size)
+
+    def _add_queue(self, listener_queue: _ListenerQueue) -> None:
+        self._queues.setdefault(listener_queue.event, []).append(listener_queue)
+        self._logger.info(
+            f"Listener {listener_queue.listener_class.__name__} registrado "
+            f"para {listener_queue.event.__name__}"
+        )
+        if self._is_running:
+            self._start_workers(listener_queue)
+
+    def _start_workers(self, listener_queue: _ListenerQueue) -> None:
+        if listener_queue.listener is None:
+            listener_queue.listener = self._injector.get(listener_queue.listener_class)
+
+        for _ in range(max(1, self._settings.workers_per_listener)):
+            # Contexto vacío: el bus suele arrancar dentro del primer request y
+            # los workers no deben heredar su trace_id ni su plazo
+            listener_queue.workers.append(
+                asyncio.create_task(
+                    self._work(listener_queue, listener_queue.listener),
+                    context=contextvars.Context(),
+                )
+            )
+
+    async def _enqueue(
+        self, listener_queue: _ListenerQueue, event: DomainEvent
+    ) -> None:
+        try:
+            listener_queue.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            listener_queue.overflows += 1
+            if not await self._wait_for_room(listener_queue, event):
+                listener_queue.dropped += 1
+                self._logger.warning(
+                    f"Cola de {listener_queue.listener_class.__name__} llena, "
+                    f"evento {event.id} ({event.__class__.__name__}) descartado"
+                )
+                return
+
+        listener_queue.enqueued += 1
+
+    async def _wait_for_room(
+        self, listener_queue: _ListenerQueue, event: DomainEvent
+    ) -> bool:
+        if self._settings.overflow_timeout_ms <= 0:
+            return False
+
+        try:
+            await asyncio.wait_for(
+                listener_queue.queue.put(event),
+                timeout=self._settings.overflow_timeout_ms / 1000,
+            )
+        except TimeoutError:
+            return False
+        return True
+
+    async def _work(
+        self, listener_queue: _ListenerQueue, listener: EventListener
+    ) -> None:
+        while True:
+            event = await listener_queue.queue.get()
+            try:
+                await listener.listen(event)
+                listener_queue.processed += 1
+            except Exception:
+                listener_queue.failed += 1
+                self._logger.exception(
+                    f"Error en {listener_queue.listener_class.__name__} "
+                    f"procesando {event.__class__.__name__} {event.id}"
+                )
+            finally:
+                listener_queue.queue.task_done()
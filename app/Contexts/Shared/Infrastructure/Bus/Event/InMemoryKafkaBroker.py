@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+import zlib
+from typing import TYPE_CHECKING, Any
+
+from aiokafka import ConsumerRecord, TopicPartition
+from aiokafka.structs import RecordMetadata
+
+if TYPE_CHECKING:
+    from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaConsumer import (
+        InMemoryKafkaConsumer,
+    )
+
+
+class InMemoryKafkaBroker:
+    """
+    Broker de Kafka en memoria para benchmarks y tests sin red.
+
+    Reproduce lo que el EventBus necesita de Kafka: topics creados al vuelo con
+    un número fijo de particiones, particionado por clave, offsets por partición,
+    consumer groups con reparto round-robin de particiones entre sus miembros y
+    offsets confirmados por grupo. No hay réplicas, retención ni persistencia.
+    """
+
+    def __init__(self, partitions: int = 4) -> None:
+        self._partitions = partitions
+        self._logs: dict[str, list[list[ConsumerRecord[Any, Any]]]] = {}
+        self._round_robin: dict[str, itertools.count[int]] = {}
+        self._committed: dict[str, dict[TopicPartition, int]] = {}
+        self._groups: dict[str, list[InMemoryKafkaConsumer]] = {}
+        self._waiters: set[asyncio.Future[None]] = set()
+
+    def produce(
+        self,
+        topic: str,
+        value: bytes | None,
+        key: bytes | None = None,
+        partition: int | None = None,
+        timestamp_ms: int | None = None,
+        headers: list[tuple[str, bytes]] | None = None,
+    ) -> RecordMetadata:
+        """Añade un registro al final de su partición"""
+        logs = self._topic(topic)
+        if partition is None:
+            partition = (
+                zlib.crc32(key) % len(logs)
+                if key is not None
+                else next(self._round_robin[topic]) % len(logs)
+            )
+        log = logs[partition]
+        timestamp = (
+            timestamp_ms if timestamp_ms is not None else int(time.time() * 1000)
+        )
+        record: ConsumerRecord[Any, Any] = ConsumerRecord(
+            topic=topic,
+            partition=partition,
+            offset=len(log),
+            timestamp=timestamp,
+            timestamp_type=0,
+            key=key,
+            value=value,
+            checksum=None,
+            serialized_key_size=len(key) if key is not None else -1,
+            serialized_value_size=len(value) if value is not None else -1,
+            headers=list(headers or ()),
+        )
+        log.append(record)
+        self.wake_up()
+        return RecordMetadata(
+            topic=topic,
+            partition=partition,
+            topic_partition=TopicPartition(topic, partition),
+            offset=record.offset,
+            timestamp=timestamp,
+            timestamp_type=0,
+            log_start_offset=0,
+        )
+
+    def fetch(
+        self, partition: TopicPartition, offset: int, max_records: int
+    ) -> list[ConsumerRecord[Any, Any]]:
+        return self._topic(partition.topic)[partition.partition][
+            offset : offset + max_records
+        ]
+
+    def end_offset(self, partition: TopicPartition) -> int:
+        return len(self._topic(partition.topic)[partition.partition])
+
+    def topics(self) -> set[str]:
+        return set(self._logs)
+
+    def offset_for_time(self, partition: TopicPartition, timestamp: int) -> int | None:
+        """Primer offset con timestamp igual o posterior al indicado"""
+        for record in self._topic(partition.topic)[partition.partition]:
+            if record.timestamp >= timestamp:
+                return int(record.offset)
+        return None
+
+    def partitions_for(self, topic: str) -> list[TopicPartition]:
+        return [
+            TopicPartition(topic, index) for index in range(len(self._topic(topic)))
+        ]
+
+    def commit(self, group_id: str, offsets: dict[TopicPartition, int]) -> None:
+        self._committed.setdefault(group_id, {}).update(offsets)
+
+    def committed(self, group_id: str, partition: TopicPartition) -> int | None:
+        return self._committed.get(group_id, {}).get(partition)
+
+    def join(self, consumer: InMemoryKafkaConsumer) -> None:
+        self._groups.setdefault(consumer.group_id, []).append(consumer)
+        self.rebalance(consumer.group_id)
+
+    def leave(self, consumer: InMemoryKafkaConsumer) -> None:
+        members = self._groups.get(consumer.group_id, [])
+        if consumer in members:
+            members.remove(consumer)
+            self.rebalance(consumer.group_id)
+
+    def rebalance(self, group_id: str) -> None:
+        """Reparte en round-robin las particiones de cada topic entre sus suscriptores"""
+        members = self._groups.get(group_id, [])
+        assignments: dict[InMemoryKafkaConsumer, set[TopicPartition]] = {
+            member: set() for member in members
+        }
+        topics = sorted({topic for member in members for topic in member.subscription})
+        for topic in topics:
+            subscribers = [member for member in members if topic in member.subscription]
+            for index, partition in enumerate(self.partitions_for(topic)):
+                assignments[subscribers[index % len(subscribers)]].add(partition)
+
+        for member, partitions in assignments.items():
+            member.apply_group_assignment(partitions)
+        self.wake_up()
+
+    async def wait_for_records(self, timeout_s: float) -> None:
+        """Espera hasta que llegue algún registro o cambie un consumer group"""
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.add(waiter)
+        try:
+            await asyncio.wait({waiter}, timeout=timeout_s)
+        finally:
+            self._waiters.discard(waiter)
+
+    def _topic(self, topic: str) -> list[list[ConsumerRecord[Any, Any]]]:
+        logs = self._logs.get(topic)
+        if logs is None:
+            logs = self._logs[topic] = [[] for _ in range(self._partitions)]
+            self._round_robin[topic] = itertools.count()
+        return logs
+
+    def wake_up(self) -> None:
+        """Despierta a los consumers que esperan registros"""
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
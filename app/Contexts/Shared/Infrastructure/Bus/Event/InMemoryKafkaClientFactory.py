@@ -0,0 +1,41 @@
+from injector import inject
+
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaBroker import (
+    InMemoryKafkaBroker,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaConsumer import (
+    InMemoryKafkaConsumer,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaProducer import (
+    InMemoryKafkaProducer,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaClientFactory import (
+    KafkaClientFactory,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaConsumerClient import (
+    KafkaConsumerClient,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaProducerClient import (
+    KafkaProducerClient,
+)
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+
+class InMemoryKafkaClientFactory(KafkaClientFactory):
+    """Crea clientes conectados a un broker en memoria compartido"""
+
+    @inject
+    def __init__(self, broker: InMemoryKafkaBroker) -> None:
+        self._broker = broker
+
+    def create_producer(self, settings: KafkaSettings) -> KafkaProducerClient:
+        return InMemoryKafkaProducer(self._broker)
+
+    def create_consumer(self, settings: KafkaSettings) -> KafkaConsumerClient:
+        return InMemoryKafkaConsumer(
+            self._broker,
+            group_id=settings.consumer_group_id,
+            auto_offset_reset=settings.auto_offset_reset,
+            enable_auto_commit=settings.enable_auto_commit,
+            max_poll_records=settings.max_poll_records,
+        )
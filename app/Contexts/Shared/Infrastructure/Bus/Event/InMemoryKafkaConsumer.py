@@ -0,0 +1,193 @@
+from typing import Any
+
+from aiokafka import ConsumerRebalanceListener, ConsumerRecord, TopicPartition
+from aiokafka.structs import OffsetAndTimestamp
+
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaBroker import (
+    InMemoryKafkaBroker,
+)
+
+
+class InMemoryKafkaConsumer:
+    """
+    Consumer de un InMemoryKafkaBroker con la misma interfaz que AIOKafkaConsumer.
+
+    Los cambios de asignación que decide el broker se aplican en el siguiente
+    `getmany`, igual que en aiokafka, invocando antes al rebalance listener.
+    """
+
+    def __init__(
+        self,
+        broker: InMemoryKafkaBroker,
+        group_id: str,
+        auto_offset_reset: str = "latest",
+        enable_auto_commit: bool = False,
+        max_poll_records: int = 500,
+    ) -> None:
+        self._broker = broker
+        self.group_id = group_id
+        self._auto_offset_reset = auto_offset_reset
+        self._enable_auto_commit = enable_auto_commit
+        self._max_poll_records = max_poll_records
+        self.subscription: list[str] = []
+        self._listener: ConsumerRebalanceListener | None = None
+        self._assignment: set[TopicPartition] = set()
+        self._pending_assignment: set[TopicPartition] | None = None
+        self._positions: dict[TopicPartition, int] = {}
+        self._paused: set[TopicPartition] = set()
+        self._started = False
+
+    def subscribe(
+        self,
+        topics: list[str],
+        listener: ConsumerRebalanceListener | None = None,
+    ) -> None:
+        self.subscription = list(topics)
+        self._listener = listener
+        if self._started:
+            self._broker.rebalance(self.group_id)
+
+    async def start(self) -> None:
+        self._started = True
+        # Con asignación manual no se entra en el grupo
+        if self.subscription:
+            self._broker.join(self)
+
+    async def stop(self) -> None:
+        if self._started:
+            self._started = False
+            self._broker.leave(self)
+
+    def assign(self, partitions: list[TopicPartition]) -> None:
+        """Asignación manual de particiones, sin rebalanceos"""
+        self._pending_assignment = None
+        self._assignment = set(partitions)
+        self._positions = {
+            partition: self._initial_position(partition) for partition in partitions
+        }
+
+    def apply_group_assignment(self, partitions: set[TopicPartition]) -> None:
+        """Nueva asignación decidida por el broker, pendiente de aplicar"""
+        self._pending_assignment = set(partitions)
+
+    async def topics(self) -> set[str]:
+        return self._broker.topics()
+
+    async def getmany(
+        self,
+        *partitions: TopicPartition,
+        timeout_ms: int = 0,
+        max_records: int | None = None,
+    ) -> dict[TopicPartition, list[ConsumerRecord[Any, Any]]]:
+        limit = max_records or self._max_poll_records
+        await self._apply_assignment()
+        records = self._fetch(limit, partitions)
+        if not records and timeout_ms > 0:
+            await self._broker.wait_for_records(timeout_ms / 1000)
+            await self._apply_assignment()
+            records = self._fetch(limit, partitions)
+
+        if self._enable_auto_commit:
+            self._broker.commit(self.group_id, dict(self._positions))
+        return records
+
+    async def commit(self, offsets: dict[TopicPartition, int] | None = None) -> None:
+        self._broker.commit(self.group_id, offsets or dict(self._positions))
+
+    def pause(self, *partitions: TopicPartition) -> None:
+        self._paused.update(partitions)
+
+    def resume(self, *partitions: TopicPartition) -> None:
+        self._paused.difference_update(partitions)
+        # El poll en curso vuelve a leer sin esperar a su timeout
+        self._broker.wake_up()
+
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        self._positions[partition] = offset
+
+    async def position(self, partition: TopicPartition) -> int:
+        return self._positions[partition]
+
+    def partitions_for_topic(self, topic: str) -> set[int] | None:
+        if topic not in self._broker.topics():
+            return None
+        return {partition.partition for partition in self._broker.partitions_for(topic)}
+
+    async def committed(self, partition: TopicPartition) -> int | None:
+        return self._broker.committed(self.group_id, partition)
+
+    async def beginning_offsets(
+        self, partitions: list[TopicPartition]
+    ) -> dict[TopicPartition, int]:
+        return dict.fromkeys(partitions, 0)
+
+    async def end_offsets(
+        self, partitions: list[TopicPartition]
+    ) -> dict[TopicPartition, int]:
+        return {
+            partition: self._broker.end_offset(partition) for partition in partitions
+        }
+
+    async def offsets_for_times(
+        self, timestamps: dict[TopicPartition, int]
+    ) -> dict[TopicPartition, OffsetAndTimestamp | None]:
+        offsets: dict[TopicPartition, OffsetAndTimestamp | None] = {}
+        for partition, timestamp in timestamps.items():
+            offset = self._broker.offset_for_time(partition, timestamp)
+            offsets[partition] = (
+                OffsetAndTimestamp(offset, timestamp) if offset is not None else None
+            )
+        return offsets
+
+    def assignment(self) -> set[TopicPartition]:
+        return set(self._assignment)
+
+    def highwater(self, partition: TopicPartition) -> int | None:
+        if partition not in self._assignment:
+            return None
+        return self._broker.end_offset(partition)
+
+    async def _apply_assignment(self) -> None:
+        target = self._pending_assignment
+        if target is None:
+            return
+        self._pending_assignment = None
+
+        revoked = self._assignment - target
+        if revoked and self._listener:
+            await self._listener.on_partitions_revoked(revoked)
+        for partition in revoked:
+            self._positions.pop(partition, None)
+            self._paused.discard(partition)
+
+        assigned = target - self._assignment
+        self._assignment = target
+        for partition in assigned:
+            self._positions[partition] = self._initial_position(partition)
+        if assigned and self._listener:
+            await self._listener.on_partitions_assigned(assigned)
+
+    def _initial_position(self, partition: TopicPartition) -> int:
+        committed = self._broker.committed(self.group_id, partition)
+        if committed is not None:
+            return committed
+        if self._auto_offset_reset == "earliest":
+            return 0
+        return self._broker.end_offset(partition)
+
+    def _fetch(
+        self, limit: int, only: tuple[TopicPartition, ...] = ()
+    ) -> dict[TopicPartition, list[ConsumerRecord[Any, Any]]]:
+        records: dict[TopicPartition, list[ConsumerRecord[Any, Any]]] = {}
+        partitions = self._assignment.intersection(only) if only else self._assignment
+        for partition in sorted(partitions, key=lambda tp: (tp.topic, tp.partition)):
+            if limit <= 0:
+                break
+            if partition in self._paused:
+                continue
+            fetched = self._broker.fetch(partition, self._positions[partition], limit)
+            if fetched:
+                records[partition] = fetched
+                self._positions[partition] += len(fetched)
+                limit -= len(fetched)
+        return records
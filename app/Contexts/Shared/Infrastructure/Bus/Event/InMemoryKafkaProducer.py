@@ -0,0 +1,47 @@
+import asyncio
+from typing import Any
+
+from aiokafka.structs import RecordMetadata
+
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaBroker import (
+    InMemoryKafkaBroker,
+)
+
+
+class InMemoryKafkaProducer:
+    """Producer de un InMemoryKafkaBroker con la misma interfaz que AIOKafkaProducer"""
+
+    def __init__(self, broker: InMemoryKafkaBroker) -> None:
+        self._broker = broker
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def send(
+        self,
+        topic: str,
+        value: bytes | None = None,
+        key: bytes | None = None,
+        partition: int | None = None,
+        timestamp_ms: int | None = None,
+        headers: list[tuple[str, bytes]] | None = None,
+    ) -> "asyncio.Future[Any]":
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        future.set_result(
+            self._broker.produce(topic, value, key, partition, timestamp_ms, headers)
+        )
+        return future
+
+    async def send_and_wait(
+        self,
+        topic: str,
+        value: bytes | None = None,
+        key: bytes | None = None,
+        partition: int | None = None,
+        timestamp_ms: int | None = None,
+        headers: list[tuple[str, bytes]] | None = None,
+    ) -> RecordMetadata:
+        return self._broker.produce(topic, value, key, partition, timestamp_ms, headers)
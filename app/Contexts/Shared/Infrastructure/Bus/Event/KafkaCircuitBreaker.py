@@ -0,0 +1,81 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+class KafkaCircuitBreaker:
+    """
+    Circuit breaker del producer de Kafka.
+
+    Tras `failure_threshold` fallos seguidos se abre y deja de intentarse la
+    publicación hasta pasados `reset_timeout_ms`. Entonces pasa a semiabierto y
+    permite un único intento de prueba: si tiene éxito se cierra y, si falla,
+    vuelve a abrirse otro periodo completo.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout_ms: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout_ms / 1000
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trips = 0
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    @property
+    def is_closed(self) -> bool:
+        return self._state == self.CLOSED
+
+    def allow_request(self) -> bool:
+        """Indica si se puede intentar publicar ahora"""
+        if self._state == self.CLOSED:
+            return True
+        if (
+            self._state == self.OPEN
+            and self._clock() - self._opened_at >= self._reset_timeout
+        ):
+            # Un único intento de prueba hasta conocer su resultado
+            self._state = self.HALF_OPEN
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._state = self.CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+            self.trip()
+
+    def release_probe(self) -> None:
+        """Devuelve el intento de prueba que no ha llegado a enviar nada"""
+        if self._state == self.HALF_OPEN:
+            self._state = self.OPEN
+
+    def trip(self) -> None:
+        """Abre el circuito inmediatamente"""
+        if self._state != self.OPEN:
+            self._trips += 1
+        self._state = self.OPEN
+        self._opened_at = self._clock()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "state": self._state,
+            "consecutive_failures": self._failures,
+            "trips": self._trips,
+        }
@@ -0,0 +1,36 @@
+from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
+
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaConsumerClient import (
+    KafkaConsumerClient,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaProducerClient import (
+    KafkaProducerClient,
+)
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+
+class KafkaClientFactory:
+    """Crea los clientes de aiokafka que usa el EventBus"""
+
+    def create_producer(self, settings: KafkaSettings) -> KafkaProducerClient:
+        # Sin serializers: los reintentos reenvían los bytes originales. Con
+        # idempotencia los reintentos internos no duplican ni desordenan una
+        # partición
+        producer: KafkaProducerClient = AIOKafkaProducer(
+            bootstrap_servers=settings.bootstrap_servers,
+            linger_ms=settings.producer_linger_ms,
+            enable_idempotence=True,
+        )
+        return producer
+
+    def create_consumer(self, settings: KafkaSettings) -> KafkaConsumerClient:
+        consumer: KafkaConsumerClient = AIOKafkaConsumer(
+            bootstrap_servers=settings.bootstrap_servers,
+            group_id=settings.consumer_group_id,
+            auto_offset_reset=settings.auto_offset_reset,
+            enable_auto_commit=settings.enable_auto_commit,
+            max_poll_records=settings.max_poll_records,
+            session_timeout_ms=settings.session_timeout_ms,
+            heartbeat_interval_ms=settings.heartbeat_interval_ms,
+        )
+        return consumer
@@ -0,0 +1,61 @@
+from typing import Any, Protocol
+
+from aiokafka import ConsumerRebalanceListener, ConsumerRecord, TopicPartition
+from aiokafka.structs import OffsetAndTimestamp
+
+
+class KafkaConsumerClient(Protocol):
+    """Operaciones del consumer que usa el EventBus, comunes a aiokafka y al broker en memoria"""
+
+    def subscribe(
+        self, *, topics: list[str], listener: ConsumerRebalanceListener
+    ) -> None: ...
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    async def getmany(
+        self,
+        *partitions: TopicPartition,
+        timeout_ms: int = 0,
+        max_records: int | None = None,
+    ) -> dict[TopicPartition, list[ConsumerRecord[Any, Any]]]: ...
+
+    async def commit(
+        self, offsets: dict[TopicPartition, int] | None = None
+    ) -> None: ...
+
+    def pause(self, *partitions: TopicPartition) -> None: ...
+
+    def resume(self, *partitions: TopicPartition) -> None: ...
+
+    def assignment(self) -> set[TopicPartition]: ...
+
+    def highwater(self, partition: TopicPartition) -> int | None: ...
+
+    # Asignación manual y posicionamiento, para los replays
+
+    def assign(self, partitions: list[TopicPartition]) -> None: ...
+
+    async def topics(self) -> set[str]: ...
+
+    def partitions_for_topic(self, topic: str) -> set[int] | None: ...
+
+    def seek(self, partition: TopicPartition, offset: int) -> None: ...
+
+    async def position(self, partition: TopicPartition) -> int: ...
+
+    async def committed(self, partition: TopicPartition) -> int | None: ...
+
+    async def beginning_offsets(
+        self, partitions: list[TopicPartition]
+    ) -> dict[TopicPartition, int]: ...
+
+    async def end_offsets(
+        self, partitions: list[TopicPartition]
+    ) -> dict[TopicPartition, int]: ...
+
+    async def offsets_for_times(
+        self, timestamps: dict[TopicPartition, int]
+    ) -> dict[TopicPartition, OffsetAndTimestamp | None]: ...
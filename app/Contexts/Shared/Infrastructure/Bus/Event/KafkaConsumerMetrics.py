@@ -0,0 +1,145 @@
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from aiokafka import TopicPartition
+
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaConsumerClient import (
+    KafkaConsumerClient,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaOffsetCommitManager import (
+    KafkaOffsetCommitManager,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaPartitionDispatcher import (
+    KafkaPartitionDispatcher,
+)
+
+
+class _PartitionMetrics:
+    """Contadores de una partición"""
+
+    __slots__ = ("position", "processed", "rate", "window_start", "window_count")
+
+    def __init__(self, now: float) -> None:
+        self.position: int | None = None
+        self.processed = 0
+        self.rate = 0.0
+        self.window_start = now
+        self.window_count = 0
+
+
+class KafkaConsumerMetrics:
+    """
+    Lag y ritmo de procesamiento por partición del consumer de Kafka.
+
+    El lag se calcula como el end offset (high watermark que devuelve cada fetch,
+    sin peticiones extra al broker) menos el offset confirmado, o la posición de
+    lectura si los offsets se confirman automáticamente. El ritmo es una media
+    móvil exponencial de registros procesados por segundo.
+    """
+
+    # Peso de la última ventana de un segundo en la media móvil
+    _RATE_SMOOTHING = 0.3
+    _RATE_WINDOW_S = 1.0
+
+    def __init__(
+        self,
+        commit_manager: KafkaOffsetCommitManager,
+        dispatcher: KafkaPartitionDispatcher,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._commit_manager = commit_manager
+        self._dispatcher = dispatcher
+        self._clock = clock
+        self._partitions: dict[TopicPartition, _PartitionMetrics] = {}
+        self._consumer: KafkaConsumerClient | None = None
+
+    def attach(self, consumer: KafkaConsumerClient) -> None:
+        """Asocia el consumer del que se leen los end offsets"""
+        self._consumer = consumer
+
+    def record_fetched(self, partition: TopicPartition, last_offset: int) -> None:
+        """Registra el último offset recibido de una partición"""
+        self._partition(partition).position = last_offset + 1
+
+    def record_processed(self, partition: TopicPartition) -> None:
+        """Registra un registro procesado y actualiza el ritmo de la partición"""
+        metrics = self._partition(partition)
+        metrics.processed += 1
+        metrics.window_count += 1
+
+        now = self._clock()
+        elapsed = now - metrics.window_start
+        if elapsed >= self._RATE_WINDOW_S:
+            window_rate = metrics.window_count / elapsed
+            metrics.rate = (
+                self._RATE_SMOOTHING * window_rate
+                + (1 - self._RATE_SMOOTHING) * metrics.rate
+            )
+            metrics.window_start = now
+            metrics.window_count = 0
+
+    def forget(self, partitions: Iterable[TopicPartition]) -> None:
+        """Descarta las métricas de particiones que ya no están asignadas"""
+        for partition in partitions:
+            self._partitions.pop(partition, None)
+
+    def lag(self, partition: TopicPartition) -> int | None:
+        """Registros pendientes de confirmar en una partición, si se conoce el end offset"""
+        end_offset = self._end_offset(partition)
+        consumed = self._consumed_offset(partition)
+        if end_offset is None or consumed is None:
+            return None
+        return max(0, end_offset - consumed)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Estado actual de todas las particiones, apto para serializar a JSON"""
+        partitions: dict[str, dict[str, Any]] = {}
+        total_lag = 0
+
+        for partition, metrics in sorted(
+            self._partitions.items(),
+            key=lambda item: (item[0].topic, item[0].partition),
+        ):
+            lag = self.lag(partition)
+            total_lag += lag or 0
+            partitions[f"{partition.topic}-{partition.partition}"] = {
+                "topic": partition.topic,
+                "partition": partition.partition,
+                "end_offset": self._end_offset(partition),
+                "committed_offset": self._commit_manager.committed_offset(partition),
+                "position": metrics.position,
+                "lag": lag,
+                "in_flight": self._dispatcher.queue_size(partition),
+                "paused": self._dispatcher.is_paused(partition),
+                "processed": metrics.processed,
+                "processing_rate": round(metrics.rate, 2),
+            }
+
+        return {
+            "total_lag": total_lag,
+            "in_flight": self._dispatcher.in_flight(),
+            "paused_partitions": sum(
+                1 for partition in partitions.values() if partition["paused"]
+            ),
+            "partitions": partitions,
+        }
+
+    def _partition(self, partition: TopicPartition) -> _PartitionMetrics:
+        metrics = self._partitions.get(partition)
+        if metrics is None:
+            metrics = self._partitions[partition] = _PartitionMetrics(self._clock())
+        return metrics
+
+    def _end_offset(self, partition: TopicPartition) -> int | None:
+        if not self._consumer or partition not in self._consumer.assignment():
+            return None
+        end_offset: int | None = self._consumer.highwater(partition)
+        return end_offset
+
+    def _consumed_offset(self, partition: TopicPartition) -> int | None:
+        committed = self._commit_manager.committed_offset(partition)
+        if committed is not None:
+            return committed
+        metrics = self._partitions.get(partition)
+        return metrics.position if metrics else None
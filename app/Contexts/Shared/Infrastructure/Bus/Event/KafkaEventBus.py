@@ -1,30 +1,149 @@
 import asyncio
 import logging
+import time
+from datetime import datetime
+from functools import partial
 from typing import Any
 
-import orjson
-from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
+from aiokafka import ConsumerRecord, TopicPartition
 from injector import Injector, inject, singleton
 
 from app.Contexts.Shared.Application.Bus.Event.EventBus import EventBus
 from app.Contexts.Shared.Application.Bus.Event.EventListener import EventListener
 from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Bus.Event.Codec.BinaryEventCodec import (
+    BinaryEventCodec,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.Codec.EventCodec import EventCodec
+from app.Contexts.Shared.Infrastructure.Bus.Event.Codec.EventSchemaRegistry import (
+    EventSchemaRegistry,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.Codec.JsonEventCodec import (
+    JsonEventCodec,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaCircuitBreaker import (
+    KafkaCircuitBreaker,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaClientFactory import (
+    KafkaClientFactory,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaConsumerClient import (
+    KafkaConsumerClient,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaConsumerMetrics import (
+    KafkaConsumerMetrics,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventDeduplicator import (
+    KafkaEventDeduplicator,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventHeaders import (
+    KafkaEventHeaders,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventSpool import (
+    KafkaEventSpool,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaOffsetCommitManager import (
+    KafkaOffsetCommitManager,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaPartitionDispatcher import (
+    KafkaPartitionDispatcher,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaProducerClient import (
+    KafkaProducerClient,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaRebalanceListener import (
+    KafkaRebalanceListener,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaRetryRouter import (
+    KafkaHeaders,
+    KafkaRetryRouter,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaTopicStrategy import (
+    KafkaTopicStrategy,
+)
+from app.Contexts.Shared.Infrastructure.Http.Context.RequestContext import (
+    RequestContext,
+)
+from app.Contexts.Shared.Infrastructure.Http.Middleware.RequestContextMiddleware import (
+    request_context,
+)
 from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
 
 
 @singleton
 class KafkaEventBus(EventBus):
     _logger: logging.Logger = logging.getLogger(__name__)
+    _POLL_TIMEOUT_MS = 1000
+    # Tope de la espera entre reintentos del bucle del consumer
+    _MAX_CONSUMER_BACKOFF_MS = 30000
+    _UNDECODABLE_LISTENER = "*"
 
     @inject
-    def __init__(self, kafka_settings: KafkaSettings, injector: Injector) -> None:
+    def __init__(
+        self,
+        kafka_settings: KafkaSettings,
+        injector: Injector,
+        client_factory: KafkaClientFactory,
+    ) -> None:
         self._settings = kafka_settings
         self._injector = injector
+        self._client_factory = client_factory
         self._listeners: dict[str, list[type[EventListener]]] = {}
         self._subscriber_instances: dict[str, list[EventListener]] = {}
-        self._producer: AIOKafkaProducer | None = None
-        self._consumer: AIOKafkaConsumer | None = None
+        self._local_listeners: dict[type[DomainEvent], list[EventListener]] = {}
+        self._event_classes: dict[str, type[DomainEvent]] = {}
+        # Instancias de listener por evento, resueltas una vez y no por mensaje
+        self._dispatch_table: dict[str, list[tuple[str, EventListener]]] = {}
+        self._producer: KafkaProducerClient | None = None
+        self._consumer: KafkaConsumerClient | None = None
         self._consumer_task: asyncio.Task[None] | None = None
+        self._consumer_errors = 0
+        self._subscription_task: asyncio.Task[None] | None = None
+        self._subscribed_topics: list[str] = []
+        self._commit_manager = KafkaOffsetCommitManager(
+            commit_interval_ms=kafka_settings.commit_interval_ms,
+            commit_batch_size=kafka_settings.commit_batch_size,
+        )
+        self._dispatcher = KafkaPartitionDispatcher(
+            self._handle_message,
+            high_watermark=kafka_settings.in_flight_high_watermark,
+            low_watermark=kafka_settings.in_flight_low_watermark,
+        )
+        self._metrics = KafkaConsumerMetrics(self._commit_manager, self._dispatcher)
+        self._rebalance_listener = KafkaRebalanceListener(
+            self._commit_manager, self._dispatcher, self._metrics
+        )
+        self._retry_router = KafkaRetryRouter(kafka_settings)
+        self._topic_strategy = KafkaTopicStrategy(kafka_settings)
+        self._deduplicator = KafkaEventDeduplicator(
+            capacity=kafka_settings.dedup_capacity,
+            ttl_ms=kafka_settings.dedup_ttl_ms,
+        )
+        self._schema_registry = EventSchemaRegistry()
+        # Se decodifica cualquier formato conocido para poder cambiar de codec en caliente
+        self._codecs: dict[str, EventCodec] = {
+            codec.name: codec
+            for codec in (JsonEventCodec(), BinaryEventCodec(self._schema_registry))
+        }
+        if kafka_settings.event_codec not in self._codecs:
+            raise ValueError(
+                f"Codec de eventos desconocido: {kafka_settings.event_codec}"
+            )
+        self._codec = self._codecs[kafka_settings.event_codec]
+        self._circuit_breaker = KafkaCircuitBreaker(
+            failure_threshold=kafka_settings.circuit_failure_threshold,
+            reset_timeout_ms=kafka_settings.circuit_reset_timeout_ms,
+        )
+        self._spool = KafkaEventSpool(
+            kafka_settings.spool_path, kafka_settings.spool_max_attempts
+        )
+        self._spool_pending = False
+        # Último registro sin resolver de cada clave de partición: True si se
+        # entregó, False si acabó en el spool
+        self._pending_deliveries: dict[bytes, asyncio.Future[bool]] = {}
+        # Envíos lanzados al confirmarse el registro anterior de su clave
+        self._chained_sends: set[asyncio.Future[None]] = set()
+        self._spool_task: asyncio.Task[None] | None = None
         self._is_running = False
 
         # Debug: agregar identificador de instancia
@@ -42,18 +161,11 @@ class KafkaEventBus(EventBus):
         self._logger.info(f"Iniciando KafkaEventBus (instancia {self._instance_id})...")
 
         try:
-            # Inicializar producer
-            self._logger.info(
-                f"Inicializando producer con bootstrap_servers: {self._settings.bootstrap_servers}"
-            )
-            self._producer = AIOKafkaProducer(
-                bootstrap_servers=self._settings.bootstrap_servers,
-                value_serializer=self._serialize_event,
-                key_serializer=lambda x: x.encode("utf-8") if x else None,
-            )
-            self._logger.info("Producer creado, iniciando conexión...")
-            await self._producer.start()
-            self._logger.info("Producer iniciado correctamente")
+            # Inicializar producer. Sin broker se arranca igualmente: los eventos van al spool
+            if not await self._start_producer():
+                self._logger.warning(
+                    "Broker no disponible, los eventos se guardarán en el spool"
+                )
 
             # El consumer se iniciará de forma lazy cuando sea necesario
             self._logger.info(
@@ -65,6 +177,8 @@ class KafkaEventBus(EventBus):
             )
 
             self._is_running = True
+            self._spool_pending = self._spool.has_pending()
+            self._spool_task = asyncio.create_task(self._replay_spool())
 
             # Inicializar consumer si hay listeners registrados
             if self._listeners or self._subscriber_instances:
@@ -78,6 +192,9 @@ class KafkaEventBus(EventBus):
         except Exception as e:
             self._logger.error(f"Error iniciando KafkaEventBus: {e}")
             # Limpiar estado en caso de error
+            self._is_running = False
+            if self._spool_task:
+                self._spool_task.cancel()
             if self._producer:
                 try:
                     await self._producer.stop()
@@ -94,6 +211,11 @@ class KafkaEventBus(EventBus):
         self._logger.info("Deteniendo KafkaEventBus...")
         self._is_running = False
 
+        if self._subscription_task:
+            self._subscription_task.cancel()
+        if self._spool_task:
+            self._spool_task.cancel()
+
         # Detener consumer
         if self._consumer_task:
             self._consumer_task.cancel()
@@ -102,20 +224,41 @@ class KafkaEventBus(EventBus):
             except asyncio.CancelledError:
                 pass
 
+        await self._dispatcher.stop()
+
         if self._consumer:
+            # Confirmar lo ya procesado antes de abandonar el grupo
+            if not self._settings.enable_auto_commit:
+                await self._commit_manager.commit()
             await self._consumer.stop()
 
         # Detener producer
         if self._producer:
             await self._producer.stop()
+        # Los registros que esperaban a otro de su clave salen o van al spool
+        while self._chained_sends:
+            await asyncio.gather(*self._chained_sends, return_exceptions=True)
+        # Lo que se haya llevado al spool al cerrar, ya escrito en disco
+        await self._spool.flush()
 
         self._logger.info("KafkaEventBus detenido correctamente")
 
     async def publish(self, events: list[DomainEvent]) -> None:
-        """Publica eventos a Kafka"""
-        if not self._producer:
+        """
+        Publica eventos a Kafka.
+
+        Si el broker no responde, los eventos se guardan en el spool y se
+        reenvían en orden cuando se recupera, de modo que la petición que publica
+        no falla ni espera a los timeouts del producer. Los que se llevan al
+        spool durante la llamada ya están en disco cuando vuelve.
+        """
+        # Los listeners locales no dependen del broker
+        await self._notify_local(events)
+
+        # Bus sin arrancar: no hay producer ni spool en uso, los eventos se pierden
+        if not self._producer and not self._is_running:
             self._logger.warning(
-                "Producer no inicializado, no se pueden publicar eventos"
+                f"KafkaEventBus no iniciado, se descartan {len(events)} eventos"
             )
             return
 
@@ -123,28 +266,236 @@ class KafkaEventBus(EventBus):
 
         for event in events:
             event_name = event.__class__.__name__
-            topic_name = self._settings.get_topic_name(event_name)
+            topic_name = self._topic_strategy.topic_for(event.__class__)
 
             try:
                 self._logger.info(f"Enviando evento {event_name} a topic {topic_name}")
-                await self._producer.send(
+                # Misma clave, misma partición: orden garantizado por agregado
+                partition_key = event.partition_key
+                await self._send(
                     topic=topic_name,
-                    value=event,
-                    key=(
-                        event.aggregate_id() if hasattr(event, "aggregate_id") else None
+                    value=self._serialize_event(event),
+                    key=partition_key.encode("utf-8") if partition_key else None,
+                    headers=KafkaEventHeaders.build(
+                        event, self._codec.name, RequestContext.get_trace_id()
                     ),
                 )
+                # Si llega al broker o acaba en el spool se sabe después, en
+                # _on_delivery y _spool_record
                 self._logger.info(
-                    f"Evento publicado exitosamente: {event_name} en topic {topic_name}"
+                    f"Evento encolado: {event_name} en topic {topic_name}"
                 )
 
             except Exception as e:
                 self._logger.error(f"Error publicando evento {event_name}: {e}")
                 raise
 
+        # Lo que haya ido al spool debe estar en disco antes de dar por aceptados
+        # los eventos: si el proceso cae con el broker caído no se pierden
+        await self._spool.flush()
+
+    async def _send(
+        self, topic: str, value: bytes, key: bytes | None, headers: KafkaHeaders
+    ) -> None:
+        """Envía un registro o lo guarda en el spool si el broker no está disponible"""
+        settled: asyncio.Future[bool] | None = None
+        if key is not None:
+            previous = self._pending_deliveries.get(key)
+            settled = asyncio.get_running_loop().create_future()
+            self._pending_deliveries[key] = settled
+            if previous is not None:
+                # Un registro no adelanta al anterior de su clave: sale cuando ese
+                # se confirma o va al spool detrás de él, sin esperar aquí al ack
+                previous.add_done_callback(
+                    partial(self._send_after, topic, value, key, headers, settled)
+                )
+                return
+
+        await self._send_now(topic, value, key, headers, settled)
+
+    async def _send_now(
+        self,
+        topic: str,
+        value: bytes,
+        key: bytes | None,
+        headers: KafkaHeaders,
+        settled: "asyncio.Future[bool] | None",
+    ) -> None:
+        # Mientras quede spool se sigue encolando para no adelantar a eventos previos
+        if (
+            self._producer is None
+            or self._spool_pending
+            or not self._circuit_breaker.is_closed
+        ):
+            self._spool_record(topic, value, key, headers, settled)
+            return
+
+        try:
+            delivery = await asyncio.wait_for(
+                self._producer.send(topic=topic, value=value, key=key, headers=headers),
+                timeout=self._settings.publish_timeout_ms / 1000,
+            )
+        except Exception as e:
+            self._logger.warning(f"Error enviando a {topic}, se usa el spool: {e}")
+            self._circuit_breaker.record_failure()
+            self._spool_record(topic, value, key, headers, settled)
+            return
+
+        delivery.add_done_callback(
+            partial(self._on_delivery, topic, value, key, headers, settled)
+        )
+
+    def _send_after(
+        self,
+        topic: str,
+        value: bytes,
+        key: bytes | None,
+        headers: KafkaHeaders,
+        settled: "asyncio.Future[bool]",
+        previous: "asyncio.Future[bool]",
+    ) -> None:
+        """Envía un registro cuando se resuelve el anterior de su clave"""
+        if not previous.result():
+            self._spool_record(topic, value, key, headers, settled)
+            return
+
+        task = asyncio.ensure_future(
+            self._send_now(topic, value, key, headers, settled)
+        )
+        self._chained_sends.add(task)
+        task.add_done_callback(self._chained_sends.discard)
+
+    def _on_delivery(
+        self,
+        topic: str,
+        value: bytes,
+        key: bytes | None,
+        headers: KafkaHeaders,
+        settled: "asyncio.Future[bool] | None",
+        delivery: "asyncio.Future[Any]",
+    ) -> None:
+        """Resultado de un envío ya encolado en el producer"""
+        error = None if delivery.cancelled() else delivery.exception()
+        if not delivery.cancelled() and error is None:
+            self._circuit_breaker.record_success()
+            self._settle(key, settled, True)
+            return
+
+        self._logger.warning(f"Envío a {topic} fallido, se usa el spool: {error}")
+        self._circuit_breaker.record_failure()
+        self._spool_record(topic, value, key, headers, settled)
+
+    def _settle(
+        self,
+        key: bytes | None,
+        settled: "asyncio.Future[bool] | None",
+        delivered: bool,
+    ) -> None:
+        """Resuelve un registro con clave: entregado o guardado en el spool"""
+        if key is None or settled is None:
+            return
+        if self._pending_deliveries.get(key) is settled:
+            del self._pending_deliveries[key]
+        settled.set_result(delivered)
+
+    def _spool_record(
+        self,
+        topic: str,
+        value: bytes,
+        key: bytes | None,
+        headers: KafkaHeaders,
+        settled: "asyncio.Future[bool] | None",
+    ) -> None:
+        self._spool.append(topic, value, key, headers)
+        self._spool_pending = True
+        self._logger.info(f"Evento para {topic} guardado en el spool")
+        # Después de escribirlo: los siguientes de su clave van detrás
+        self._settle(key, settled, False)
+
+    async def _start_producer(self) -> bool:
+        """Crea e inicia el producer; si el broker no responde, abre el circuito"""
+        self._logger.info(
+            f"Inicializando producer con bootstrap_servers: {self._settings.bootstrap_servers}"
+        )
+        producer = self._client_factory.create_producer(self._settings)
+        try:
+            await producer.start()
+        except Exception as e:
+            self._logger.error(f"Error iniciando producer: {e}")
+            self._circuit_breaker.trip()
+            try:
+                await producer.stop()
+            except Exception:
+                pass
+            return False
+
+        self._producer = producer
+        self._circuit_breaker.record_success()
+        self._logger.info("Producer iniciado correctamente")
+        return True
+
+    async def _replay_spool(self) -> None:
+        """Reenvía el spool en segundo plano mientras el bus está en marcha"""
+        while self._is_running:
+            try:
+                sent = await self._drain_spool()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                sent = 0
+                self._circuit_breaker.record_failure()
+                self._logger.warning(f"Reenvío del spool aplazado: {e}")
+
+            # Mientras se reenvía se sigue sin esperas hasta vaciarlo
+            if not sent:
+                await asyncio.sleep(self._settings.spool_replay_interval_ms / 1000)
+
+    async def _drain_spool(self) -> int:
+        """Reenvía en orden los eventos del spool si el circuito lo permite"""
+        if not self._spool.has_pending():
+            self._spool_pending = False
+            return 0
+
+        self._spool_pending = True
+        if not self._circuit_breaker.allow_request():
+            return 0
+        if self._producer is None and not await self._start_producer():
+            return 0
+
+        sent = await self._spool.replay(self._send_spooled, self._dead_letter_spooled)
+        # Sin envíos (otro proceso tiene el spool) el intento no prueba nada
+        if sent:
+            self._circuit_breaker.record_success()
+        else:
+            self._circuit_breaker.release_probe()
+        self._spool_pending = self._spool.has_pending()
+        return sent
+
+    async def _send_spooled(
+        self, topic: str, value: bytes, key: bytes | None, headers: KafkaHeaders
+    ) -> None:
+        assert self._producer is not None
+        await asyncio.wait_for(
+            self._producer.send_and_wait(
+                topic=topic, value=value, key=key, headers=headers
+            ),
+            timeout=self._settings.publish_timeout_ms / 1000,
+        )
+
+    async def _dead_letter_spooled(
+        self, topic: str, value: bytes, key: bytes | None, headers: KafkaHeaders
+    ) -> None:
+        """Aparta en el dead-letter topic un registro del spool que no se puede enviar"""
+        await self._send_spooled(
+            self._settings.get_dead_letter_topic_name(topic), value, key, headers
+        )
+
     def register(self, event: type[DomainEvent], listener: type[EventListener]) -> None:
         """Registra un listener para un tipo de evento específico"""
         event_name = event.__name__
+        self._schema_registry.register_event(event)
+        self._event_classes[event_name] = event
+        self._dispatch_table.pop(event_name, None)
 
         if event_name not in self._listeners:
             self._listeners[event_name] = []
@@ -154,13 +505,16 @@ class KafkaEventBus(EventBus):
             f"Listener {listener.__name__} registrado para evento {event_name} (instancia {self._instance_id})"
         )
 
-        # Inicializar consumer de forma lazy si es necesario
+        # Inicializar consumer o ampliar su suscripción si es necesario
         if self._is_running:
-            asyncio.create_task(self._ensure_consumer_started())
+            self._schedule_subscription_update()
 
     def subscribe(self, event: type[DomainEvent], listener: EventListener) -> None:
         """Suscribe una instancia de listener para un tipo de evento específico"""
         event_name = event.__name__
+        self._schema_registry.register_event(event)
+        self._event_classes[event_name] = event
+        self._dispatch_table.pop(event_name, None)
 
         if event_name not in self._subscriber_instances:
             self._subscriber_instances[event_name] = []
@@ -170,34 +524,79 @@ class KafkaEventBus(EventBus):
             f"Listener instance {listener.__class__.__name__} suscrito para evento {event_name}"
         )
 
-        # Inicializar consumer de forma lazy si es necesario
+        # Inicializar consumer o ampliar su suscripción si es necesario
         if self._is_running:
-            asyncio.create_task(self._ensure_consumer_started())
+            self._schedule_subscription_update()
 
-    async def _start_consumer(self) -> None:
-        """Inicia el consumer de Kafka"""
-        # Obtener todos los topics que necesitamos escuchar
-        topics = [
-            self._settings.get_topic_name(event_name)
-            for event_name in set(
-                list(self._listeners.keys()) + list(self._subscriber_instances.keys())
-            )
+    def subscribe_local(
+        self, event: type[DomainEvent], listener: EventListener
+    ) -> None:
+        """Ejecuta el listener en `publish`, antes de encolar o enviar el evento"""
+        self._local_listeners.setdefault(event, []).append(listener)
+
+    async def _notify_local(self, events: list[DomainEvent]) -> None:
+        for event in events:
+            for listener in self._local_listeners.get(type(event), ()):
+                try:
+                    await listener.listen(event)
+                except Exception as e:
+                    self._logger.error(
+                        f"Error en {listener.__class__.__name__} local "
+                        f"procesando {event.__class__.__name__} {event.id}: {e}"
+                    )
+
+    def _topics(self) -> list[str]:
+        """Topics que necesitamos escuchar según los listeners registrados"""
+        topics = self.topics_for(self.registered_events())
+        # Cada topic principal arrastra sus topics de reintento
+        return topics + [
+            retry_topic
+            for topic in topics
+            for retry_topic in self._retry_router.retry_topics(topic)
         ]
 
+    def _schedule_subscription_update(self) -> None:
+        """
+        Programa la actualización de la suscripción del consumer.
+
+        Los registros que llegan durante la ventana de espera se aplican juntos,
+        con una sola llamada a `subscribe` y por tanto un solo rebalanceo.
+        """
+        if not self._settings.consumer_enabled:
+            return
+        if self._subscription_task is None or self._subscription_task.done():
+            self._subscription_task = asyncio.create_task(self._update_subscription())
+
+    async def _update_subscription(self) -> None:
+        # Se repite si llegan registros mientras se aplicaba el cambio anterior
+        while self._topics() != self._subscribed_topics:
+            await asyncio.sleep(self._settings.subscription_debounce_ms / 1000)
+
+            if self._consumer is None:
+                await self._ensure_consumer_started()
+                if self._consumer is None:
+                    return
+                continue
+
+            # Cambiar la suscripción no reinicia el consumer: solo provoca un rebalanceo
+            topics = self._topics()
+            self._consumer.subscribe(topics=topics, listener=self._rebalance_listener)
+            self._subscribed_topics = topics
+            self._logger.info(f"Suscripción del consumer actualizada: {topics}")
+
+    async def _start_consumer(self) -> None:
+        """Inicia el consumer de Kafka"""
+        topics = self._topics()
         if not topics:
             return
 
-        self._consumer = AIOKafkaConsumer(
-            *topics,
-            bootstrap_servers=self._settings.bootstrap_servers,
-            group_id=self._settings.consumer_group_id,
-            auto_offset_reset=self._settings.auto_offset_reset,
-            enable_auto_commit=self._settings.enable_auto_commit,
-            max_poll_records=self._settings.max_poll_records,
-            session_timeout_ms=self._settings.session_timeout_ms,
-            heartbeat_interval_ms=self._settings.heartbeat_interval_ms,
-            value_deserializer=self._deserialize_event,
-        )
+        self._warm_dispatch_table()
+        self._consumer = self._client_factory.create_consumer(self._settings)
+        self._consumer.subscribe(topics=topics, listener=self._rebalance_listener)
+        self._subscribed_topics = topics
+        self._commit_manager.attach(self._consumer)
+        self._dispatcher.attach(self._consumer)
+        self._metrics.attach(self._consumer)
 
         await self._consumer.start()
         self._consumer_task = asyncio.create_task(self._consume_events())
@@ -208,122 +607,386 @@ class KafkaEventBus(EventBus):
         if not self._consumer:
             return
 
+        manual_commit = not self._settings.enable_auto_commit
+        # Fallos seguidos: un error no deja el consumer parado, se reintenta
+        # con backoff exponencial mientras el bus siga en marcha
+        failures = 0
+
+        while self._is_running:
+            try:
+                batches = await self._consumer.getmany(
+                    timeout_ms=self._POLL_TIMEOUT_MS,
+                    max_records=self._settings.max_poll_records,
+                )
+
+                # El fetch solo encola: cada partición la procesa su propio worker
+                for partition, messages in batches.items():
+                    if manual_commit:
+                        for message in messages:
+                            self._commit_manager.track(partition, message.offset)
+                    self._metrics.record_fetched(partition, messages[-1].offset)
+                    self._dispatcher.submit(partition, messages)
+
+                if manual_commit:
+                    await self._commit_manager.maybe_commit()
+                failures = 0
+
+            except asyncio.CancelledError:
+                self._logger.info("Consumer cancelado")
+                return
+            except Exception as e:
+                failures += 1
+                self._consumer_errors += 1
+                delay_ms = min(
+                    self._settings.get_retry_delay_ms(failures),
+                    self._MAX_CONSUMER_BACKOFF_MS,
+                )
+                self._logger.error(
+                    f"Error en consumer, se reintenta en {delay_ms} ms: {e}"
+                )
+                await asyncio.sleep(delay_ms / 1000)
+
+    async def _handle_message(
+        self, partition: TopicPartition, message: ConsumerRecord[Any, Any]
+    ) -> None:
+        """Procesa un registro en el worker de su partición"""
+        if self._retry_router.is_retry(message):
+            await self._wait_until_due(message)
+
+        # Los eventos sin listeners de un topic compartido no ocupan la ventana
+        # de deduplicación
+        event_name = KafkaEventHeaders.event_name(message)
+        dedup_key = (
+            self._deduplication_key(message)
+            if event_name is None or self._has_listeners(event_name)
+            else None
+        )
+        # Las reentregas tras un rebalanceo no vuelven a ejecutar los listeners
+        if dedup_key is not None and self._deduplicator.seen(dedup_key):
+            self._logger.info(f"Evento duplicado {dedup_key} descartado")
+            processed = True
+        else:
+            try:
+                processed = await self._process_message(message)
+            except Exception as e:
+                self._logger.error(
+                    f"Error procesando registro {message.offset} de {partition}: {e}"
+                )
+                processed = False
+            if processed and dedup_key is not None:
+                self._deduplicator.mark(dedup_key)
+
+        self._metrics.record_processed(partition)
+        if not processed:
+            await self._rewind(partition, message.offset)
+        elif not self._settings.enable_auto_commit:
+            self._commit_manager.complete(partition, message.offset)
+
+    async def _rewind(self, partition: TopicPartition, offset: int) -> None:
+        """
+        Vuelve a leer la partición desde un registro que no se ha podido procesar
+        ni reenviar, en lugar de dejarlo pendiente y bloquear sus commits.
+        """
+        self._logger.warning(
+            f"Registro {offset} de {partition} sin procesar, se volverá a leer"
+        )
+        if not self._settings.enable_auto_commit:
+            self._commit_manager.rewind(partition, offset)
+        await self._dispatcher.rewind(
+            partition, offset, self._settings.retry_backoff_ms
+        )
+
+    def _deduplication_key(self, message: ConsumerRecord[Any, Any]) -> str | None:
+        """
+        Clave de deduplicación de un registro, leída de las cabeceras.
+
+        Un reintento comparte id con el evento original pero solo ejecuta el
+        listener que falló, así que se deduplica por separado.
+        """
+        event_id = KafkaEventHeaders.event_id(message)
+        if event_id is None:
+            return None
+        target_listener = self._retry_router.target_listener(message)
+        return f"{event_id}:{target_listener}" if target_listener else event_id
+
+    async def _process_message(self, message: ConsumerRecord[Any, Any]) -> bool:
+        """
+        Ejecuta los listeners de un mensaje.
+
+        Los listeners que fallan se reenvían a su topic de reintento o al
+        dead-letter topic sin bloquear la partición. Devuelve False solo si no se
+        ha podido reenviar algún fallo, en cuyo caso el offset no se marca como
+        completado y el mensaje se volverá a entregar.
+        """
+        # Se enruta por cabeceras: el payload solo se decodifica si alguien lo escucha
+        event_name = KafkaEventHeaders.event_name(message)
+        if event_name is not None and not self._has_listeners(event_name):
+            self._logger.debug(f"Evento {event_name} sin listeners, se descarta")
+            return True
+
         try:
-            async for message in self._consumer:
-                try:
-                    event_data = message.value
-                    event_name = event_data.get("event_name")
-
-                    self._logger.info(f"Mensaje recibido con event_name: {event_name}")
-
-                    # Procesar listeners registrados (clases)
-                    if event_name in self._listeners:
-                        for listener_class in self._listeners[event_name]:
-                            try:
-                                # Crear instancia del listener usando el injector
-                                listener_instance = self._injector.get(listener_class)  # type: ignore
-
-                                # Reconstruir el evento desde los datos serializados
-                                event = self._reconstruct_event(event_name, event_data)
-
-                                self._logger.info(
-                                    f"Ejecutando listener {listener_class.__name__} para evento {event_name}"
-                                )
-                                await listener_instance.listen(event)
-                                self._logger.info(
-                                    f"Listener {listener_class.__name__} ejecutado exitosamente"
-                                )
-
-                            except Exception as e:
-                                self._logger.error(
-                                    f"Error procesando evento {event_name} con listener {listener_class.__name__}: {e}"
-                                )
-
-                    # Procesar instancias de listeners suscritas
-                    if event_name in self._subscriber_instances:
-                        for listener_instance in self._subscriber_instances[event_name]:
-                            try:
-                                event = self._reconstruct_event(event_name, event_data)
-                                self._logger.info(
-                                    f"Ejecutando listener instance {listener_instance.__class__.__name__} para evento {event_name}"
-                                )
-                                await listener_instance.listen(event)
-                                self._logger.info(
-                                    f"Listener instance {listener_instance.__class__.__name__} ejecutado exitosamente"
-                                )
-
-                            except Exception as e:
-                                self._logger.error(
-                                    f"Error procesando evento {event_name} con listener instance {listener_instance.__class__.__name__}: {e}"
-                                )
-
-                    if (
-                        event_name not in self._listeners
-                        and event_name not in self._subscriber_instances
-                    ):
-                        self._logger.warning(
-                            f"No hay listeners registrados para el evento: {event_name}"
-                        )
+            event_data = self._deserialize_event(message)
+        except Exception as e:
+            # Un mensaje ilegible no se arregla reintentando
+            self._logger.error(f"Error procesando mensaje de Kafka: {e}")
+            return await self._reroute_failures(
+                message, [(self._UNDECODABLE_LISTENER, e)], dead_letter=True
+            )
 
-                except Exception as e:
-                    self._logger.error(f"Error procesando mensaje de Kafka: {e}")
+        failures = await self._dispatch_record(
+            message, event_name, event_data, self._retry_router.target_listener(message)
+        )
+        return await self._reroute_failures(message, failures)
+
+    async def dispatch_record(
+        self, message: ConsumerRecord[Any, Any], target_listener: str | None = None
+    ) -> list[tuple[str, Exception]]:
+        """
+        Ejecuta los listeners de un registro y devuelve los que han fallado, sin
+        reintentos, deduplicación ni commits. Lo usan los replays, que recorren
+        el log por su cuenta. Lanza la excepción si el registro no se puede
+        decodificar.
+        """
+        event_name = KafkaEventHeaders.event_name(message)
+        if event_name is not None and not self._has_listeners(event_name):
+            return []
+        event_data = self._deserialize_event(message)
+        return await self._dispatch_record(
+            message, event_name, event_data, target_listener
+        )
+
+    def topics_for(self, event_names: list[str]) -> list[str]:
+        """Topics principales donde se publican los eventos registrados indicados"""
+        return sorted(
+            {
+                self._topic_strategy.topic_for(self._event_classes[event_name])
+                for event_name in event_names
+                if event_name in self._event_classes
+            }
+        )
+
+    def registered_events(self) -> list[str]:
+        """Nombres de los eventos con algún listener registrado"""
+        return sorted(set(self._listeners) | set(self._subscriber_instances))
+
+    async def _dispatch_record(
+        self,
+        message: ConsumerRecord[Any, Any],
+        event_name: str | None,
+        event_data: dict[str, Any],
+        target_listener: str | None,
+    ) -> list[tuple[str, Exception]]:
+        # Mensajes publicados antes de existir las cabeceras
+        if event_name is None:
+            event_name = event_data.get("event_name")
+        self._logger.debug(f"Mensaje recibido con event_name: {event_name}")
+
+        # Los listeners heredan el trace_id de la petición que publicó el evento
+        trace_id = KafkaEventHeaders.trace_id(message)
+        token = request_context.set({"trace_id": trace_id} if trace_id else {})
+        try:
+            return await self._dispatch(event_name, event_data, target_listener)
+        finally:
+            request_context.reset(token)
+
+    def _has_listeners(self, event_name: str) -> bool:
+        return event_name in self._listeners or event_name in self._subscriber_instances
+
+    async def _dispatch(
+        self,
+        event_name: str | None,
+        event_data: dict[str, Any],
+        target_listener: str | None = None,
+    ) -> list[tuple[str, Exception]]:
+        """
+        Ejecuta los listeners de un evento y devuelve los que han fallado.
+
+        El evento se reconstruye una sola vez y se comparte entre todos sus
+        listeners. En los reintentos solo se ejecuta el listener que falló
+        originalmente.
+        """
+        if event_name is None or not self._has_listeners(event_name):
+            self._logger.warning(
+                f"No hay listeners registrados para el evento: {event_name}"
+            )
+            return []
+
+        try:
+            listeners = [
+                (name, listener)
+                for name, listener in self._resolve_listeners(event_name)
+                if not target_listener or name == target_listener
+            ]
+            if not listeners:
+                return []
+            event = self._reconstruct_event(event_name, event_data)
+        except Exception as e:
+            # Sin evento o sin listeners no se puede ejecutar ninguno
+            self._logger.error(f"Error preparando el evento {event_name}: {e}")
+            return [
+                (name, e)
+                for name in self._listener_names(event_name)
+                if not target_listener or name == target_listener
+            ]
+
+        failures: list[tuple[str, Exception]] = []
+        for name, listener in listeners:
+            try:
+                self._logger.debug(
+                    f"Ejecutando listener {name} para evento {event_name}"
+                )
+                await listener.listen(event)
+            except Exception as e:
+                failures.append((name, e))
+                self._logger.error(
+                    f"Error procesando evento {event_name} con listener {name}: {e}"
+                )
+
+        return failures
+
+    def _resolve_listeners(self, event_name: str) -> list[tuple[str, EventListener]]:
+        """Listeners de un evento con su nombre, resueltos con el injector una vez"""
+        listeners = self._dispatch_table.get(event_name)
+        if listeners is None:
+            listeners = [
+                (listener_class.__name__, self._injector.get(listener_class))  # type: ignore
+                for listener_class in self._listeners.get(event_name, [])
+            ]
+            listeners += [
+                (listener.__class__.__name__, listener)
+                for listener in self._subscriber_instances.get(event_name, [])
+            ]
+            self._dispatch_table[event_name] = listeners
+        return listeners
+
+    def _listener_names(self, event_name: str) -> list[str]:
+        return [
+            listener_class.__name__
+            for listener_class in self._listeners.get(event_name, [])
+        ] + [
+            listener.__class__.__name__
+            for listener in self._subscriber_instances.get(event_name, [])
+        ]
+
+    def _warm_dispatch_table(self) -> None:
+        """Resuelve los listeners de todos los eventos antes de consumir"""
+        for event_name in self.registered_events():
+            try:
+                self._resolve_listeners(event_name)
+            except Exception as e:
+                # Se reintentará, y fallará por mensaje, al despachar el evento
+                self._logger.error(
+                    f"Error resolviendo listeners del evento {event_name}: {e}"
+                )
+
+    async def _reroute_failures(
+        self,
+        message: ConsumerRecord[Any, Any],
+        failures: list[tuple[str, Exception]],
+        dead_letter: bool = False,
+    ) -> bool:
+        """Publica cada fallo en su topic de reintento o en el dead-letter topic"""
+        if not failures:
+            return True
+
+        if not self._producer:
+            self._logger.error(
+                "Producer no inicializado, no se pueden reenviar eventos fallidos"
+            )
+            return False
+
+        now_ms = self._now_ms()
+        try:
+            for listener_name, error in failures:
+                topic, headers = self._retry_router.route(
+                    message, listener_name, error, now_ms, dead_letter=dead_letter
+                )
+                # Se espera la confirmación antes de dar el offset por completado
+                await self._producer.send_and_wait(
+                    topic=topic, value=message.value, key=message.key, headers=headers
+                )
+                self._logger.warning(
+                    f"Evento de {message.topic} reenviado a {topic} para listener {listener_name}"
+                )
+            return True
 
-        except asyncio.CancelledError:
-            self._logger.info("Consumer cancelado")
         except Exception as e:
-            self._logger.error(f"Error en consumer: {e}")
+            self._logger.error(
+                f"Error reenviando evento fallido de {message.topic}: {e}"
+            )
+            return False
+
+    async def _wait_until_due(self, message: ConsumerRecord[Any, Any]) -> None:
+        """
+        Espera a que venza un registro de reintento.
+
+        Los topics de retraso tienen un retraso fijo, así que sus registros vencen
+        en orden: solo espera el worker de esa partición y, si su cola se llena,
+        el backpressure pausa su fetch. El resto de particiones no se ve afectado.
+        """
+        delay_ms = self._retry_router.not_before_ms(message) - self._now_ms()
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+    def metrics(self) -> dict[str, Any]:
+        """Lag, registros en vuelo, ritmo de procesamiento, deduplicación y spool"""
+        return {
+            **self._metrics.snapshot(),
+            "consumer_errors": self._consumer_errors,
+            "deduplication": self._deduplicator.snapshot(),
+            "producer": {
+                "circuit": self._circuit_breaker.snapshot(),
+                "spool_pending_bytes": self._spool.pending_bytes(),
+            },
+        }
+
+    @staticmethod
+    def _now_ms() -> int:
+        return int(time.time() * 1000)
 
     def _reconstruct_event(
         self, event_name: str, event_data: dict[str, Any]
     ) -> DomainEvent:
         """Reconstruye un evento de dominio desde los datos serializados"""
-        # Para simplificar, vamos a crear una instancia básica usando los datos del payload
-        # En una implementación más robusta, esto podría usar un registry de eventos
-
-        from app.Contexts.Chat.Conversation.Domain.ConversationId import ConversationId
-        from app.Contexts.Chat.Message.Domain.MessageCreatedEvent import (
-            MessageCreatedEvent,
+        event_class = self._event_classes.get(event_name)
+        if event_class is None:
+            raise ValueError(f"Tipo de evento desconocido: {event_name}")
+
+        # Se conservan el id y la fecha del evento publicado
+        return event_class.from_primitives(
+            event_id=event_data["event_id"],
+            payload=event_data["payload"],
+            occurred_on=datetime.fromisoformat(event_data["occurred_on"]),
+            aggregate_id=event_data.get("aggregate_id"),
         )
-        from app.Contexts.Chat.Message.Domain.MessageId import MessageId
-
-        if event_name == "MessageCreatedEvent":
-            payload = event_data.get("payload", {})
-            message_id = MessageId(payload.get("message_id"))
-            conversation_id = ConversationId(payload.get("conversation_id"))
-            return MessageCreatedEvent(
-                message_id=message_id, conversation_id=conversation_id
-            )
-
-        # Si no conocemos el evento, lanzar excepción
-        raise ValueError(f"Tipo de evento desconocido: {event_name}")
 
     def _serialize_event(self, event: DomainEvent) -> bytes:
-        """Serializa un evento de dominio a JSON"""
+        """Serializa un evento de dominio con el codec configurado"""
         try:
-            event_data: dict[str, Any] = {
-                "event_name": event.__class__.__name__,
-                "aggregate_id": getattr(event, "aggregate_id", lambda: None)(),
-                "occurred_on": event.occurred_on.isoformat(),
-                "payload": event.payload,
-            }
-            return orjson.dumps(event_data)
+            return self._codec.encode(event)
         except Exception as e:
             self._logger.error(f"Error serializando evento: {e}")
             raise
 
-    def _deserialize_event(self, data: bytes) -> dict[str, Any]:
-        """Deserializa un evento de JSON"""
+    def _deserialize_event(self, message: ConsumerRecord[Any, Any]) -> dict[str, Any]:
+        """Deserializa un evento con el codec indicado en sus cabeceras"""
         try:
-            result: dict[str, Any] = orjson.loads(data)
-            return result
+            # Los registros sin cabecera de codec son JSON
+            codec_name = KafkaEventHeaders.codec(message) or JsonEventCodec.name
+            codec = self._codecs.get(codec_name)
+            if codec is None:
+                raise ValueError(f"Codec de eventos desconocido: {codec_name}")
+            return codec.decode(message.value)
         except Exception as e:
             self._logger.error(f"Error deserializando evento: {e}")
             raise
 
     async def _ensure_consumer_started(self) -> None:
         """Asegura que el consumer esté iniciado (lazy initialization)"""
-        if self._consumer is not None or not (
-            self._listeners or self._subscriber_instances
+        if (
+            self._consumer is not None
+            or not self._settings.consumer_enabled
+            or not (self._listeners or self._subscriber_instances)
         ):
             return
 
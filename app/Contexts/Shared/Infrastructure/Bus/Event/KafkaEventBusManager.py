@@ -1,4 +1,5 @@
 import logging
+from typing import Any
 
 from injector import inject, singleton
 
@@ -9,7 +10,12 @@ from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSetti
 
 @singleton
 class KafkaEventBusManager:
-    """Manager para gestionar el ciclo de vida del EventBus de Kafka"""
+    """
+    Manager para gestionar el ciclo de vida del EventBus.
+
+    Con Kafka deshabilitado el EventBus inyectado es el de memoria, que
+    también se arranca y se para aquí para procesar los eventos en cola.
+    """
 
     _logger: logging.Logger = logging.getLogger(__name__)
 
@@ -26,10 +32,11 @@ class KafkaEventBusManager:
         )
 
     async def start(self) -> None:
-        """Inicia el EventBus de Kafka"""
+        """Inicia el EventBus"""
         if not self._kafka_settings.enabled:
-            self._logger.info("Kafka deshabilitado por configuración")
-            return
+            self._logger.info(
+                "Kafka deshabilitado por configuración, EventBus en memoria"
+            )
 
         if not self._started:
             await self._event_bus.start()
@@ -37,10 +44,7 @@ class KafkaEventBusManager:
             self._logger.info("KafkaEventBusManager iniciado")
 
     async def stop(self) -> None:
-        """Detiene el EventBus de Kafka"""
-        if not self._kafka_settings.enabled:
-            return
-
+        """Detiene el EventBus"""
         if self._started:
             await self._event_bus.stop()
             self._started = False
@@ -48,12 +52,17 @@ class KafkaEventBusManager:
 
     async def publish_events(self, events: list[DomainEvent]) -> None:
         """Publica eventos de dominio"""
-        if not self._kafka_settings.enabled:
-            self._logger.debug("Kafka deshabilitado, eventos no publicados")
-            return
-
         if not self._started:
             self._logger.warning("EventBus no iniciado, iniciando automáticamente...")
             await self.start()
 
         await self._event_bus.publish(events)
+
+    def metrics(self) -> dict[str, Any]:
+        """Métricas del consumer o de las colas en memoria, si el EventBus las expone"""
+        metrics = getattr(self._event_bus, "metrics", None)
+        return {
+            "enabled": self._kafka_settings.enabled,
+            "started": self._started,
+            "consumer": metrics() if metrics else {},
+        }
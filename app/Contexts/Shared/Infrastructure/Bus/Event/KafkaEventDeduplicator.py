@@ -0,0 +1,69 @@
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+
+class KafkaEventDeduplicator:
+    """
+    Ids de eventos ya procesados en una ventana acotada en tamaño y tiempo.
+
+    Un ring buffer guarda los ids por orden de llegada junto a su caducidad y un
+    diccionario permite comprobar en O(1) si un id ya se ha visto. Los ids más
+    antiguos se descartan al caducar o al llenarse el buffer, de modo que la
+    memoria no crece con el tráfico. La ventana es local al proceso: cubre las
+    reentregas que recibe el mismo consumer (reintentos de commit, rebalanceos que
+    le devuelven la partición), no las que van a otra instancia.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        ttl_ms: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._capacity = capacity
+        self._ttl_s = ttl_ms / 1000
+        self._clock = clock
+        self._order: deque[tuple[str, float]] = deque()
+        self._expires_at: dict[str, float] = {}
+        self._checks = 0
+        self._hits = 0
+
+    def seen(self, event_id: str) -> bool:
+        """Indica si el id ya se ha procesado dentro de la ventana"""
+        now = self._clock()
+        self._evict_expired(now)
+        self._checks += 1
+        if event_id in self._expires_at:
+            self._hits += 1
+            return True
+        return False
+
+    def mark(self, event_id: str) -> None:
+        """Registra un id como procesado"""
+        now = self._clock()
+        self._evict_expired(now)
+        expires_at = now + self._ttl_s
+        self._expires_at[event_id] = expires_at
+        self._order.append((event_id, expires_at))
+        while len(self._expires_at) > self._capacity:
+            self._evict_oldest()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "size": len(self._expires_at),
+            "checks": self._checks,
+            "hits": self._hits,
+            "hit_rate": round(self._hits / self._checks, 4) if self._checks else 0.0,
+        }
+
+    def _evict_expired(self, now: float) -> None:
+        while self._order and self._order[0][1] <= now:
+            self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        event_id, expires_at = self._order.popleft()
+        # Un id marcado de nuevo tiene una entrada posterior en el buffer
+        if self._expires_at.get(event_id) == expires_at:
+            del self._expires_at[event_id]
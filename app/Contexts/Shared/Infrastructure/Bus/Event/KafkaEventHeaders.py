@@ -0,0 +1,60 @@
+from typing import Any
+
+from aiokafka import ConsumerRecord
+
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaRetryRouter import (
+    KafkaHeaders,
+    KafkaRetryRouter,
+)
+
+
+class KafkaEventHeaders:
+    """
+    Cabeceras con los metadatos de un evento publicado en Kafka.
+
+    Permiten enrutar un registro sin deserializar su payload: el consumer decide
+    con el nombre del evento si algún listener lo necesita antes de decodificarlo.
+    """
+
+    EVENT_NAME_HEADER = "x-event-name"
+    EVENT_ID_HEADER = "x-event-id"
+    SCHEMA_VERSION_HEADER = "x-schema-version"
+    CODEC_HEADER = "x-event-codec"
+    TRACE_ID_HEADER = "x-trace-id"
+
+    @classmethod
+    def build(
+        cls, event: DomainEvent, codec: str, trace_id: str | None = None
+    ) -> KafkaHeaders:
+        """Cabeceras de un evento a publicar con el codec indicado"""
+        headers = [
+            (cls.EVENT_NAME_HEADER, event.__class__.__name__.encode("utf-8")),
+            (cls.EVENT_ID_HEADER, event.id.encode("utf-8")),
+            (cls.SCHEMA_VERSION_HEADER, str(event.schema_version()).encode("utf-8")),
+            (cls.CODEC_HEADER, codec.encode("utf-8")),
+        ]
+        if trace_id:
+            headers.append((cls.TRACE_ID_HEADER, trace_id.encode("utf-8")))
+        return headers
+
+    @classmethod
+    def event_name(cls, message: ConsumerRecord[Any, Any]) -> str | None:
+        return KafkaRetryRouter.header(message, cls.EVENT_NAME_HEADER)
+
+    @classmethod
+    def event_id(cls, message: ConsumerRecord[Any, Any]) -> str | None:
+        return KafkaRetryRouter.header(message, cls.EVENT_ID_HEADER)
+
+    @classmethod
+    def schema_version(cls, message: ConsumerRecord[Any, Any]) -> int | None:
+        version = KafkaRetryRouter.header(message, cls.SCHEMA_VERSION_HEADER)
+        return int(version) if version else None
+
+    @classmethod
+    def codec(cls, message: ConsumerRecord[Any, Any]) -> str | None:
+        return KafkaRetryRouter.header(message, cls.CODEC_HEADER)
+
+    @classmethod
+    def trace_id(cls, message: ConsumerRecord[Any, Any]) -> str | None:
+        return KafkaRetryRouter.header(message, cls.TRACE_ID_HEADER)
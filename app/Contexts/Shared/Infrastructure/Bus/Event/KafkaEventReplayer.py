@@ -0,0 +1,310 @@
+import asyncio
+import dataclasses
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+from aiokafka import ConsumerRecord, TopicPartition
+
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaClientFactory import (
+    KafkaClientFactory,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaConsumerClient import (
+    KafkaConsumerClient,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBus import KafkaEventBus
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+ReplayProgressCallback = Callable[[dict[str, Any]], None]
+
+
+class KafkaEventReplayer:
+    """
+    Reprocesa eventos ya publicados para reconstruir el estado de lectura.
+
+    Lee los topics principales con un consumer group propio
+    (`<grupo>.replay.<nombre>`) y asignación manual de particiones, así que no
+    interfiere con los consumers en marcha ni provoca rebalanceos. Recorre el log
+    hasta los offsets finales que había al empezar, procesando las particiones
+    en paralelo y cada una en orden, y entrega los eventos a los listeners
+    registrados en el EventBus sin reintentos ni deduplicación.
+
+    El progreso se confirma periódicamente como offsets del grupo de replay: si
+    se interrumpe, la siguiente ejecución con el mismo nombre continúa desde el
+    último checkpoint. Si las particiones dejan de avanzar durante
+    `idle_timeout_ms` antes de llegar a su offset final, el replay termina y se
+    informa como incompleto.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+    _POLL_TIMEOUT_MS = 1000
+
+    def __init__(
+        self,
+        event_bus: KafkaEventBus,
+        kafka_settings: KafkaSettings,
+        client_factory: KafkaClientFactory,
+        name: str = "default",
+        batch_size: int = 5000,
+        checkpoint_interval: int = 10000,
+        progress_interval_ms: int = 5000,
+        idle_timeout_ms: int = 30000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._event_bus = event_bus
+        self._client_factory = client_factory
+        self._name = name
+        self._group_id = f"{kafka_settings.consumer_group_id}.replay.{name}"
+        self._settings = dataclasses.replace(
+            kafka_settings,
+            consumer_group_id=self._group_id,
+            enable_auto_commit=False,
+            auto_offset_reset="earliest",
+            max_poll_records=batch_size,
+        )
+        self._batch_size = batch_size
+        self._checkpoint_interval = checkpoint_interval
+        self._progress_interval = progress_interval_ms / 1000
+        self._idle_timeout = idle_timeout_ms / 1000
+        self._clock = clock
+        self._total = 0
+        self._processed = 0
+        self._failures = 0
+        self._completed = False
+        self._started_at = clock()
+
+    @property
+    def group_id(self) -> str:
+        return self._group_id
+
+    async def run(
+        self,
+        events: list[str] | None = None,
+        from_beginning: bool = False,
+        from_timestamp_ms: int | None = None,
+        from_offsets: dict[TopicPartition, int] | None = None,
+        target_listener: str | None = None,
+        on_progress: ReplayProgressCallback | None = None,
+    ) -> dict[str, Any]:
+        """
+        Reprocesa los eventos indicados por nombre de clase (por defecto, todos
+        los que tienen listeners) y devuelve el progreso final.
+
+        Sin punto de partida explícito se continúa desde el último checkpoint o,
+        si no lo hay, desde el principio. `target_listener` limita el replay a un
+        único listener, p. ej. para reconstruir una sola proyección.
+        """
+        # Con topics por bounded context se leen también otros eventos, que el
+        # EventBus descarta por cabecera sin decodificarlos
+        topics = self._event_bus.topics_for(
+            events or self._event_bus.registered_events()
+        )
+        consumer = self._client_factory.create_consumer(self._settings)
+        await consumer.start()
+        try:
+            partitions = await self._partitions(consumer, topics)
+            if not partitions:
+                self._logger.warning(f"No hay particiones que reprocesar en {topics}")
+                self._completed = True
+                return self.progress()
+
+            consumer.assign(partitions)
+            start = await self._start_offsets(
+                consumer, partitions, from_beginning, from_timestamp_ms, from_offsets
+            )
+            end = await consumer.end_offsets(partitions)
+            for partition in partitions:
+                consumer.seek(partition, start[partition])
+
+            self._total = sum(max(end[p] - start[p], 0) for p in partitions)
+            self._processed = self._failures = 0
+            self._completed = False
+            self._started_at = self._clock()
+            self._logger.info(
+                f"Replay {self._name}: {self._total} eventos en {len(partitions)} particiones"
+            )
+
+            self._completed = await self._replay(
+                consumer, start, end, target_listener, on_progress
+            )
+        finally:
+            await consumer.stop()
+
+        progress = self.progress()
+        if self._completed:
+            self._logger.info(f"Replay {self._name} completado: {progress}")
+        else:
+            self._logger.warning(f"Replay {self._name} incompleto: {progress}")
+        return progress
+
+    def progress(self) -> dict[str, Any]:
+        elapsed = max(self._clock() - self._started_at, 1e-9)
+        rate = self._processed / elapsed
+        remaining = self._total - self._processed
+        return {
+            "name": self._name,
+            "group_id": self._group_id,
+            "processed": self._processed,
+            "total": self._total,
+            "failures": self._failures,
+            "completed": self._completed,
+            "elapsed_s": round(elapsed, 3),
+            "rate": round(rate, 2),
+            "eta_s": round(remaining / rate, 1) if rate and remaining else 0.0,
+        }
+
+    async def _replay(
+        self,
+        consumer: KafkaConsumerClient,
+        start: dict[TopicPartition, int],
+        end: dict[TopicPartition, int],
+        target_listener: str | None,
+        on_progress: ReplayProgressCallback | None,
+    ) -> bool:
+        """Recorre las particiones hasta su offset final; False si se ha atascado"""
+        positions = dict(start)
+        remaining = {p for p in positions if positions[p] < end[p]}
+        since_checkpoint = 0
+        last_report = last_progress = self._clock()
+
+        while remaining:
+            batches = await consumer.getmany(
+                *remaining,
+                timeout_ms=self._POLL_TIMEOUT_MS,
+                max_records=self._batch_size,
+            )
+            batches = {
+                partition: [
+                    record for record in records if record.offset < end[partition]
+                ]
+                for partition, records in batches.items()
+                if partition in remaining
+            }
+            # Cada partición en orden, todas a la vez
+            await asyncio.gather(
+                *(
+                    self._replay_partition(records, target_listener)
+                    for records in batches.values()
+                    if records
+                )
+            )
+
+            for partition, records in batches.items():
+                if records:
+                    positions[partition] = records[-1].offset + 1
+                    since_checkpoint += len(records)
+                    last_progress = self._clock()
+
+            # La posición del consumer también avanza sobre los huecos del log
+            # (compactación, marcadores de transacción) que no devuelven registros
+            for partition in list(remaining):
+                position = min(await consumer.position(partition), end[partition])
+                if position > positions[partition]:
+                    positions[partition] = position
+                    last_progress = self._clock()
+                if positions[partition] >= end[partition]:
+                    remaining.discard(partition)
+
+            stalled = bool(remaining) and (
+                self._clock() - last_progress >= self._idle_timeout
+            )
+            if stalled:
+                self._logger.warning(
+                    f"Replay {self._name}: sin avanzar en {len(remaining)} particiones "
+                    f"durante {self._idle_timeout:.0f}s, se detiene"
+                )
+
+            done = not remaining or stalled
+            if since_checkpoint >= self._checkpoint_interval or done:
+                await consumer.commit(positions)
+                since_checkpoint = 0
+
+            if self._clock() - last_report >= self._progress_interval or done:
+                last_report = self._clock()
+                self._report(on_progress)
+
+            if stalled:
+                return False
+
+        return True
+
+    async def _replay_partition(
+        self, records: list[ConsumerRecord[Any, Any]], target_listener: str | None
+    ) -> None:
+        for record in records:
+            try:
+                failures = await self._event_bus.dispatch_record(
+                    record, target_listener
+                )
+            except Exception as e:
+                self._logger.error(
+                    f"Registro ilegible en {record.topic}:{record.partition}@{record.offset}: {e}"
+                )
+                failures = [("*", e)]
+
+            # Un fallo no detiene la reconstrucción: se informa al final
+            self._failures += len(failures)
+            self._processed += 1
+
+    def _report(self, on_progress: ReplayProgressCallback | None) -> None:
+        progress = self.progress()
+        self._logger.info(
+            f"Replay {self._name}: {progress['processed']}/{progress['total']} eventos "
+            f"({progress['rate']:.0f}/s, ETA {progress['eta_s']:.0f}s, "
+            f"{progress['failures']} fallos)"
+        )
+        if on_progress:
+            on_progress(progress)
+
+    async def _partitions(
+        self, consumer: KafkaConsumerClient, topics: list[str]
+    ) -> list[TopicPartition]:
+        # Fuerza la carga de metadatos antes de preguntar por las particiones
+        await consumer.topics()
+        partitions: list[TopicPartition] = []
+        for topic in topics:
+            topic_partitions = consumer.partitions_for_topic(topic)
+            if topic_partitions is None:
+                self._logger.warning(f"El topic {topic} no existe, se omite")
+                continue
+            partitions.extend(
+                TopicPartition(topic, partition)
+                for partition in sorted(topic_partitions)
+            )
+        return partitions
+
+    async def _start_offsets(
+        self,
+        consumer: KafkaConsumerClient,
+        partitions: list[TopicPartition],
+        from_beginning: bool,
+        from_timestamp_ms: int | None,
+        from_offsets: dict[TopicPartition, int] | None,
+    ) -> dict[TopicPartition, int]:
+        beginning = await consumer.beginning_offsets(partitions)
+
+        if from_offsets is not None:
+            return {p: from_offsets.get(p, beginning[p]) for p in partitions}
+
+        if from_timestamp_ms is not None:
+            end = await consumer.end_offsets(partitions)
+            found = await consumer.offsets_for_times(
+                dict.fromkeys(partitions, from_timestamp_ms)
+            )
+            # Sin registros posteriores a la fecha no hay nada que reprocesar
+            return {
+                p: found[p].offset if found.get(p) is not None else end[p]  # type: ignore[union-attr]
+                for p in partitions
+            }
+
+        if from_beginning:
+            return beginning
+
+        start: dict[TopicPartition, int] = {}
+        for partition in partitions:
+            checkpoint = await consumer.committed(partition)
+            start[partition] = (
+                checkpoint if checkpoint is not None else beginning[partition]
+            )
+        return start
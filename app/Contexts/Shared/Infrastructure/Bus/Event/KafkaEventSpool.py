@@ -0,0 +1,273 @@
+import asyncio
+import base64
+import fcntl
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from typing import Any, BinaryIO
+
+import orjson
+
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaRetryRouter import KafkaHeaders
+
+SpoolSender = Callable[..., Awaitable[Any]]
+
+
+class KafkaEventSpool:
+    """
+    Cola en disco de los registros que no se han podido publicar en Kafka.
+
+    Es un fichero append-only con un registro JSON por línea y un fichero
+    auxiliar con la posición hasta la que ya se ha reenviado. El reenvío respeta
+    el orden de escritura y, cuando se vacía, el fichero se trunca. Varios
+    procesos pueden compartir el spool: las escrituras se serializan con flock y
+    solo un proceso a la vez lo reenvía. Toda la E/S de ficheros se hace en un
+    hilo para no bloquear el event loop.
+
+    Un registro que falla `max_attempts` veces por un error no transitorio
+    (p. ej. demasiado grande o un topic sin permisos) no vuelve a bloquear al
+    resto: se manda al dead-letter y, si tampoco se puede, a `<spool>.dead`.
+
+    `append` no espera a la escritura: hasta que `flush` vuelve, los registros
+    solo están en memoria y se pierden si el proceso cae. `KafkaEventBus.publish`
+    hace `flush` antes de volver; lo que se lleva al spool después, al fallar
+    una entrega ya encolada en el producer, se escribe en segundo plano.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+    _OFFSET_FLUSH_EVERY = 100
+    _READ_CHUNK_LINES = 500
+
+    def __init__(self, path: str, max_attempts: int = 5) -> None:
+        self._path = path
+        self._offset_path = f"{path}.offset"
+        self._lock_path = f"{path}.lock"
+        self._dead_path = f"{path}.dead"
+        self._max_attempts = max(1, max_attempts)
+        # Líneas pendientes de escribir, en orden de llegada, y su escritor
+        self._buffer: list[bytes] = []
+        self._writer: asyncio.Task[None] | None = None
+        # Fallos seguidos del registro en cabeza: (posición, intentos)
+        self._head_failures: tuple[int, int] | None = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def append(
+        self,
+        topic: str,
+        value: bytes,
+        key: bytes | None = None,
+        headers: KafkaHeaders | None = None,
+    ) -> None:
+        """
+        Añade un registro al final del spool. Se escribe en segundo plano y en
+        el mismo orden en que se añade; `flush` espera a que esté en disco.
+        """
+        self._buffer.append(
+            orjson.dumps(
+                {
+                    "topic": topic,
+                    "key": self._encode(key),
+                    "value": self._encode(value),
+                    "headers": [
+                        [name, self._encode(header)] for name, header in headers or ()
+                    ],
+                }
+            )
+            + b"\n"
+        )
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._write_buffer())
+
+    async def flush(self) -> None:
+        """Espera a que los registros añadidos estén escritos en el fichero"""
+        while self._writer is not None and not self._writer.done():
+            await asyncio.shield(self._writer)
+
+    def has_pending(self) -> bool:
+        if self._buffer:
+            return True
+        try:
+            return os.path.getsize(self._path) > self._read_offset()
+        except FileNotFoundError:
+            return False
+
+    def pending_bytes(self) -> int:
+        buffered = sum(len(line) for line in self._buffer)
+        try:
+            return buffered + max(os.path.getsize(self._path) - self._read_offset(), 0)
+        except FileNotFoundError:
+            return buffered
+
+    async def replay(self, send: SpoolSender, dead_letter: SpoolSender) -> int:
+        """
+        Reenvía en orden los registros pendientes con `send(topic=..., value=...,
+        key=..., headers=...)` y devuelve cuántos han llegado al broker.
+
+        Se detiene en el primer fallo propagando la excepción: ese registro y los
+        siguientes quedan pendientes para el próximo intento, salvo que el
+        registro agote sus intentos y se aparte con `dead_letter`. Si otro
+        proceso ya está reenviando el spool, no hace nada.
+        """
+        await self.flush()
+        if not self.has_pending():
+            return 0
+
+        lock = await asyncio.to_thread(self._try_lock)
+        if lock is None:
+            return 0
+
+        try:
+            offset = await asyncio.to_thread(self._read_offset)
+            sent = replayed = 0
+            try:
+                while lines := await asyncio.to_thread(self._read_lines, offset):
+                    for line in lines:
+                        sent += await self._replay_line(line, offset, send, dead_letter)
+                        offset += len(line)
+                        replayed += 1
+                        if replayed % self._OFFSET_FLUSH_EVERY == 0:
+                            await asyncio.to_thread(self._write_offset, offset)
+            finally:
+                await asyncio.to_thread(self._write_offset, offset)
+                await asyncio.to_thread(self._compact)
+        finally:
+            await asyncio.to_thread(self._unlock, lock)
+
+        if sent:
+            self._logger.info(f"Reenviados {sent} eventos desde el spool")
+        return sent
+
+    async def _replay_line(
+        self, line: bytes, offset: int, send: SpoolSender, dead_letter: SpoolSender
+    ) -> int:
+        """Reenvía un registro; devuelve 1 si ha llegado al broker y 0 si no"""
+        record = self._decode(line)
+        try:
+            await send(**record)
+            self._head_failures = None
+            return 1
+        except Exception as e:
+            if self._is_transient(e):
+                raise
+            attempts = (
+                self._head_failures[1] + 1
+                if self._head_failures and self._head_failures[0] == offset
+                else 1
+            )
+            self._head_failures = (offset, attempts)
+            if attempts < self._max_attempts:
+                raise
+            self._logger.error(
+                f"Registro del spool para {record['topic']} descartado tras "
+                f"{attempts} intentos: {e}"
+            )
+
+        self._head_failures = None
+        try:
+            await dead_letter(**record)
+            return 1
+        except Exception as e:
+            self._logger.error(f"Dead-letter no disponible, se guarda aparte: {e}")
+            await asyncio.to_thread(self._append_lines, self._dead_path, [line])
+            return 0
+
+    async def _write_buffer(self) -> None:
+        while self._buffer:
+            lines, self._buffer = self._buffer, []
+            await asyncio.to_thread(self._append_lines, self._path, lines)
+
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        """Errores de conexión o de tiempo, que se arreglan esperando al broker"""
+        return isinstance(error, (TimeoutError, ConnectionError)) or bool(
+            getattr(error, "retriable", False)
+        )
+
+    # E/S bloqueante: se ejecuta siempre con asyncio.to_thread
+
+    @staticmethod
+    def _append_lines(path: str, lines: list[bytes]) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "ab") as spool:
+            fcntl.flock(spool, fcntl.LOCK_EX)
+            try:
+                spool.write(b"".join(lines))
+            finally:
+                fcntl.flock(spool, fcntl.LOCK_UN)
+
+    def _read_lines(self, offset: int) -> list[bytes]:
+        """Siguientes líneas completas desde `offset`"""
+        lines: list[bytes] = []
+        with open(self._path, "rb") as spool:
+            spool.seek(offset)
+            for line in spool:
+                # Una línea sin salto es una escritura a medias
+                if not line.endswith(b"\n"):
+                    break
+                lines.append(line)
+                if len(lines) == self._READ_CHUNK_LINES:
+                    break
+        return lines
+
+    def _compact(self) -> None:
+        """Trunca el spool si ya se ha reenviado entero"""
+        with open(self._path, "ab") as spool:
+            fcntl.flock(spool, fcntl.LOCK_EX)
+            try:
+                if os.fstat(spool.fileno()).st_size <= self._read_offset():
+                    # Primero la posición: si se interrumpe aquí solo se duplica
+                    self._write_offset(0)
+                    spool.truncate(0)
+            finally:
+                fcntl.flock(spool, fcntl.LOCK_UN)
+
+    def _try_lock(self) -> BinaryIO | None:
+        """Bloqueo de reenvío entre procesos; None si otro proceso lo tiene"""
+        lock = open(self._lock_path, "ab")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock.close()
+            return None
+        return lock
+
+    @staticmethod
+    def _unlock(lock: BinaryIO) -> None:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+        finally:
+            lock.close()
+
+    def _read_offset(self) -> int:
+        try:
+            with open(self._offset_path, "rb") as offset_file:
+                return int(offset_file.read() or 0)
+        except FileNotFoundError:
+            return 0
+
+    def _write_offset(self, offset: int) -> None:
+        temporary = f"{self._offset_path}.tmp"
+        with open(temporary, "wb") as offset_file:
+            offset_file.write(str(offset).encode("ascii"))
+        os.replace(temporary, self._offset_path)
+
+    @staticmethod
+    def _encode(data: bytes | None) -> str | None:
+        return base64.b64encode(data).decode("ascii") if data is not None else None
+
+    @staticmethod
+    def _decode(line: bytes) -> dict[str, Any]:
+        record = orjson.loads(line)
+        return {
+            "topic": record["topic"],
+            "value": base64.b64decode(record["value"]),
+            "key": base64.b64decode(record["key"]) if record["key"] else None,
+            "headers": [
+                (name, base64.b64decode(header)) for name, header in record["headers"]
+            ],
+        }
@@ -0,0 +1,147 @@
+import logging
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+
+from aiokafka import TopicPartition
+
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaConsumerClient import (
+    KafkaConsumerClient,
+)
+
+
+class _PartitionOffsets:
+    """Offsets en vuelo y completados de una partición"""
+
+    __slots__ = ("in_flight", "completed", "committable")
+
+    def __init__(self) -> None:
+        self.in_flight: deque[int] = deque()
+        self.completed: set[int] = set()
+        self.committable: int | None = None
+
+
+class KafkaOffsetCommitManager:
+    """
+    Gestiona commits manuales y agrupados de offsets por partición.
+
+    Cada registro recibido se marca con `track` y, cuando todos sus listeners han
+    terminado, con `complete`. Solo se hace commit del offset contiguo más alto
+    completado, de modo que un registro pendiente nunca queda confirmado antes de
+    procesarse (entrega at-least-once). Los commits se agrupan por tiempo o por
+    número de registros completados para evitar un round trip por mensaje.
+
+    Un registro que no se puede procesar no se deja pendiente: se hace `rewind`
+    de su partición para volver a leerla desde él, así que el estado guardado
+    nunca supera los registros recibidos y aún no confirmados.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        commit_interval_ms: int,
+        commit_batch_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._commit_interval = commit_interval_ms / 1000
+        self._commit_batch_size = commit_batch_size
+        self._clock = clock
+        self._partitions: dict[TopicPartition, _PartitionOffsets] = {}
+        self._committed: dict[TopicPartition, int] = {}
+        self._completed_since_commit = 0
+        self._last_commit_at = clock()
+        self._consumer: KafkaConsumerClient | None = None
+
+    def attach(self, consumer: KafkaConsumerClient) -> None:
+        """Asocia el consumer sobre el que se harán los commits"""
+        self._consumer = consumer
+
+    def track(self, partition: TopicPartition, offset: int) -> None:
+        """Registra un offset recibido que todavía no se ha procesado"""
+        state = self._partitions.get(partition)
+        if state is None:
+            state = self._partitions[partition] = _PartitionOffsets()
+        state.in_flight.append(offset)
+
+    def complete(self, partition: TopicPartition, offset: int) -> None:
+        """Marca un offset como procesado y avanza el punto de commit contiguo"""
+        state = self._partitions.get(partition)
+        if state is None:
+            # La partición se revocó mientras el registro estaba en vuelo
+            return
+
+        state.completed.add(offset)
+        while state.in_flight and state.in_flight[0] in state.completed:
+            head = state.in_flight.popleft()
+            state.completed.discard(head)
+            # Kafka espera el offset del siguiente registro a consumir
+            state.committable = head + 1
+
+        self._completed_since_commit += 1
+
+    def rewind(self, partition: TopicPartition, offset: int) -> None:
+        """Descarta el estado desde un offset que se volverá a recibir tras un seek"""
+        state = self._partitions.get(partition)
+        if state is None:
+            return
+
+        while state.in_flight and state.in_flight[-1] >= offset:
+            state.in_flight.pop()
+        state.completed = {
+            completed for completed in state.completed if completed < offset
+        }
+
+    def tracked(self, partition: TopicPartition) -> int:
+        """Offsets recibidos de una partición que aún no se pueden confirmar"""
+        state = self._partitions.get(partition)
+        return len(state.in_flight) if state else 0
+
+    def pending_commits(self) -> dict[TopicPartition, int]:
+        """Offsets listos para commit que aún no se han confirmado"""
+        return {
+            partition: state.committable
+            for partition, state in self._partitions.items()
+            if state.committable is not None
+            and self._committed.get(partition) != state.committable
+        }
+
+    def committed_offset(self, partition: TopicPartition) -> int | None:
+        """Último offset confirmado en Kafka para una partición"""
+        return self._committed.get(partition)
+
+    def should_commit(self) -> bool:
+        """Indica si se ha alcanzado el umbral de tiempo o de número de registros"""
+        if self._completed_since_commit == 0:
+            return False
+        if self._completed_since_commit >= self._commit_batch_size:
+            return True
+        return self._clock() - self._last_commit_at >= self._commit_interval
+
+    async def maybe_commit(self) -> None:
+        """Hace commit solo si se ha superado alguno de los umbrales"""
+        if self.should_commit():
+            await self.commit()
+
+    async def commit(self) -> None:
+        """Hace commit de todos los offsets contiguos completados"""
+        offsets = self.pending_commits()
+        self._last_commit_at = self._clock()
+        self._completed_since_commit = 0
+
+        if not offsets or not self._consumer:
+            return
+
+        try:
+            await self._consumer.commit(offsets)
+            self._committed.update(offsets)
+            self._logger.debug(f"Offsets confirmados: {offsets}")
+        except Exception as e:
+            # Los offsets siguen pendientes y se reintentarán en el próximo commit
+            self._logger.error(f"Error haciendo commit de offsets: {e}")
+
+    def forget(self, partitions: Iterable[TopicPartition]) -> None:
+        """Descarta el estado de particiones que ya no están asignadas"""
+        for partition in partitions:
+            self._partitions.pop(partition, None)
+            self._committed.pop(partition, None)
@@ -0,0 +1,169 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+from aiokafka import ConsumerRecord, TopicPartition
+
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaConsumerClient import (
+    KafkaConsumerClient,
+)
+
+MessageHandler = Callable[[TopicPartition, ConsumerRecord[Any, Any]], Awaitable[None]]
+
+
+class KafkaPartitionDispatcher:
+    """
+    Reparte los registros recibidos en una cola y un worker por partición.
+
+    Cada partición se procesa en orden y en paralelo con las demás. Cuando la
+    cola de una partición alcanza la marca alta se pausa su fetch en el consumer
+    y se reanuda al bajar de la marca baja, de modo que la memoria queda acotada
+    aunque los listeners no den abasto.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+    # Tiempo máximo que se espera a los listeners en curso al revocar particiones
+    _REVOKE_TIMEOUT_S = 5.0
+
+    def __init__(
+        self, handler: MessageHandler, high_watermark: int, low_watermark: int
+    ) -> None:
+        if low_watermark >= high_watermark:
+            raise ValueError("La marca baja debe ser menor que la marca alta")
+        self._handler = handler
+        self._high_watermark = high_watermark
+        self._low_watermark = low_watermark
+        self._queues: dict[
+            TopicPartition, asyncio.Queue[ConsumerRecord[Any, Any] | None]
+        ] = {}
+        self._workers: dict[TopicPartition, asyncio.Task[None]] = {}
+        self._paused: set[TopicPartition] = set()
+        self._consumer: KafkaConsumerClient | None = None
+
+    def attach(self, consumer: KafkaConsumerClient) -> None:
+        """Asocia el consumer cuyas particiones se pausan y reanudan"""
+        self._consumer = consumer
+
+    def submit(
+        self, partition: TopicPartition, messages: Iterable[ConsumerRecord[Any, Any]]
+    ) -> None:
+        """Encola registros de una partición y aplica backpressure si es necesario"""
+        queue = self._queues.get(partition)
+        if queue is None:
+            queue = self._queues[partition] = asyncio.Queue()
+            self._workers[partition] = asyncio.create_task(self._work(partition, queue))
+
+        for message in messages:
+            queue.put_nowait(message)
+
+        if queue.qsize() >= self._high_watermark and partition not in self._paused:
+            self._paused.add(partition)
+            if self._consumer:
+                self._consumer.pause(partition)
+            self._logger.info(
+                f"Partición {partition} pausada con {queue.qsize()} registros en cola"
+            )
+
+    def queue_size(self, partition: TopicPartition) -> int:
+        queue = self._queues.get(partition)
+        return queue.qsize() if queue else 0
+
+    def is_paused(self, partition: TopicPartition) -> bool:
+        return partition in self._paused
+
+    def in_flight(self) -> int:
+        """Registros recibidos pendientes de procesar en todas las particiones"""
+        return sum(queue.qsize() for queue in self._queues.values())
+
+    async def revoke(self, partitions: Iterable[TopicPartition]) -> None:
+        """
+        Descarta los registros en cola de las particiones revocadas y espera a que
+        termine el que se está procesando. Lo descartado no se ha confirmado, así
+        que lo recibirá el nuevo propietario de la partición.
+        """
+        workers: list[asyncio.Task[None]] = []
+        for partition in partitions:
+            self._paused.discard(partition)
+            queue = self._queues.pop(partition, None)
+            worker = self._workers.pop(partition, None)
+            if queue is not None:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+            if worker is not None:
+                workers.append(worker)
+
+        if not workers:
+            return
+
+        _, pending = await asyncio.wait(workers, timeout=self._REVOKE_TIMEOUT_S)
+        for worker in pending:
+            worker.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def rewind(
+        self, partition: TopicPartition, offset: int, backoff_ms: int
+    ) -> None:
+        """
+        Vuelve a leer una partición desde un registro que no se ha podido procesar.
+
+        Se llama desde el worker de la partición: descarta los registros encolados
+        detrás del fallido, que se recibirán de nuevo, y pausa el fetch durante el
+        backoff para no reintentar en bucle mientras dure el fallo.
+        """
+        # Si la partición se ha revocado, sus registros los recibe el nuevo propietario
+        if self._workers.get(partition) is not asyncio.current_task():
+            return
+
+        queue = self._queues[partition]
+        while not queue.empty():
+            queue.get_nowait()
+        if self._consumer is None:
+            return
+
+        self._consumer.pause(partition)
+        await asyncio.sleep(backoff_ms / 1000)
+
+        if partition in self._consumer.assignment():
+            self._consumer.seek(partition, offset)
+            self._paused.discard(partition)
+            self._consumer.resume(partition)
+            self._logger.info(f"Partición {partition} rebobinada al registro {offset}")
+
+    async def stop(self) -> None:
+        """Cancela todos los workers sin esperar a los registros en cola"""
+        workers = list(self._workers.values())
+        self._queues.clear()
+        self._workers.clear()
+        self._paused.clear()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _work(
+        self,
+        partition: TopicPartition,
+        queue: asyncio.Queue[ConsumerRecord[Any, Any] | None],
+    ) -> None:
+        while True:
+            message = await queue.get()
+            if message is None:
+                return
+
+            try:
+                await self._handler(partition, message)
+            except Exception as e:
+                self._logger.error(
+                    f"Error procesando registro {message.offset} de {partition}: {e}"
+                )
+
+            if partition in self._paused and queue.qsize() <= self._low_watermark:
+                self._resume(partition)
+
+    def _resume(self, partition: TopicPartition) -> None:
+        self._paused.discard(partition)
+        # Tras un rebalanceo la partición puede haber dejado de estar asignada
+        if self._consumer and partition in self._consumer.assignment():
+            self._consumer.resume(partition)
+            self._logger.info(f"Partición {partition} reanudada")
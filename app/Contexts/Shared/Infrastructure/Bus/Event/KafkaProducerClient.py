@@ -0,0 +1,32 @@
+import asyncio
+from typing import Any, Protocol
+
+from aiokafka.structs import RecordMetadata
+
+
+class KafkaProducerClient(Protocol):
+    """Operaciones del producer que usa el EventBus, comunes a aiokafka y al broker en memoria"""
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    async def send(
+        self,
+        topic: str,
+        value: bytes | None = None,
+        key: bytes | None = None,
+        partition: int | None = None,
+        timestamp_ms: int | None = None,
+        headers: list[tuple[str, bytes]] | None = None,
+    ) -> "asyncio.Future[Any]": ...
+
+    async def send_and_wait(
+        self,
+        topic: str,
+        value: bytes | None = None,
+        key: bytes | None = None,
+        partition: int | None = None,
+        timestamp_ms: int | None = None,
+        headers: list[tuple[str, bytes]] | None = None,
+    ) -> RecordMetadata: ...
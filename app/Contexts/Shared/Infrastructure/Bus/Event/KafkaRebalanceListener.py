@@ -0,0 +1,40 @@
+import logging
+
+from aiokafka import ConsumerRebalanceListener, TopicPartition
+
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaConsumerMetrics import (
+    KafkaConsumerMetrics,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaOffsetCommitManager import (
+    KafkaOffsetCommitManager,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaPartitionDispatcher import (
+    KafkaPartitionDispatcher,
+)
+
+
+class KafkaRebalanceListener(ConsumerRebalanceListener):  # type: ignore[misc]
+    """Confirma los offsets completados antes de perder la propiedad de una partición"""
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        commit_manager: KafkaOffsetCommitManager,
+        dispatcher: KafkaPartitionDispatcher,
+        metrics: KafkaConsumerMetrics,
+    ) -> None:
+        self._commit_manager = commit_manager
+        self._dispatcher = dispatcher
+        self._metrics = metrics
+
+    async def on_partitions_revoked(self, revoked: set[TopicPartition]) -> None:
+        self._logger.info(f"Particiones revocadas: {sorted(map(str, revoked))}")
+        # Esperar a los registros en curso para confirmar todo lo completado
+        await self._dispatcher.revoke(revoked)
+        await self._commit_manager.commit()
+        self._commit_manager.forget(revoked)
+        self._metrics.forget(revoked)
+
+    async def on_partitions_assigned(self, assigned: set[TopicPartition]) -> None:
+        self._logger.info(f"Particiones asignadas: {sorted(map(str, assigned))}")
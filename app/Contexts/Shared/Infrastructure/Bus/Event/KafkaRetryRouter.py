@@ -0,0 +1,135 @@
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from aiokafka import ConsumerRecord
+
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+KafkaHeaders = list[tuple[str, bytes]]
+
+
+class KafkaRetryRouter:
+    """
+    Decide a qué topic se reenvía un evento cuyo listener ha fallado.
+
+    Cada intento fallido se publica en un topic de retraso propio
+    (`<topic>.retry.<n>`) con backoff exponencial; al superar `max_retries` el
+    evento acaba en el dead-letter topic (`<topic>.dlq`). Los metadatos del fallo
+    viajan en las cabeceras para no tocar el payload original.
+    """
+
+    ATTEMPT_HEADER = "x-retry-attempt"
+    NOT_BEFORE_HEADER = "x-retry-not-before"
+    LISTENER_HEADER = "x-retry-listener"
+    ORIGINAL_TOPIC_HEADER = "x-original-topic"
+    ORIGINAL_PARTITION_HEADER = "x-original-partition"
+    ORIGINAL_OFFSET_HEADER = "x-original-offset"
+    EXCEPTION_TYPE_HEADER = "x-exception-type"
+    EXCEPTION_MESSAGE_HEADER = "x-exception-message"
+    FAILED_AT_HEADER = "x-failed-at"
+
+    _ROUTING_HEADERS = frozenset(
+        {
+            ATTEMPT_HEADER,
+            NOT_BEFORE_HEADER,
+            LISTENER_HEADER,
+            ORIGINAL_TOPIC_HEADER,
+            ORIGINAL_PARTITION_HEADER,
+            ORIGINAL_OFFSET_HEADER,
+            EXCEPTION_TYPE_HEADER,
+            EXCEPTION_MESSAGE_HEADER,
+            FAILED_AT_HEADER,
+        }
+    )
+
+    # Evita cabeceras enormes con trazas o mensajes de error muy largos
+    _MAX_EXCEPTION_MESSAGE_LENGTH = 1024
+
+    def __init__(self, settings: KafkaSettings) -> None:
+        self._settings = settings
+
+    def retry_topics(self, topic: str) -> list[str]:
+        """Topics de retraso asociados a un topic principal"""
+        return [
+            self._settings.get_retry_topic_name(topic, attempt)
+            for attempt in range(1, self._settings.max_retries + 1)
+        ]
+
+    def route(
+        self,
+        message: ConsumerRecord[Any, Any],
+        listener_name: str,
+        error: BaseException,
+        now_ms: int,
+        dead_letter: bool = False,
+    ) -> tuple[str, KafkaHeaders]:
+        """
+        Devuelve el topic destino y las cabeceras del reenvío de un mensaje fallido.
+
+        Con `dead_letter` el mensaje va directamente al dead-letter topic, para
+        fallos que ningún reintento puede resolver.
+        """
+        attempt = self.attempt(message) + 1
+        original_topic = self.original_topic(message)
+
+        routing: dict[str, str] = {
+            self.ATTEMPT_HEADER: str(attempt),
+            self.LISTENER_HEADER: listener_name,
+            self.ORIGINAL_TOPIC_HEADER: original_topic,
+            self.ORIGINAL_PARTITION_HEADER: self.header(
+                message, self.ORIGINAL_PARTITION_HEADER
+            )
+            or str(message.partition),
+            self.ORIGINAL_OFFSET_HEADER: self.header(
+                message, self.ORIGINAL_OFFSET_HEADER
+            )
+            or str(message.offset),
+            self.EXCEPTION_TYPE_HEADER: type(error).__name__,
+            self.EXCEPTION_MESSAGE_HEADER: str(error)[
+                : self._MAX_EXCEPTION_MESSAGE_LENGTH
+            ],
+            self.FAILED_AT_HEADER: datetime.now(UTC).isoformat(),
+        }
+
+        if dead_letter or attempt > self._settings.max_retries:
+            topic = self._settings.get_dead_letter_topic_name(original_topic)
+        else:
+            topic = self._settings.get_retry_topic_name(original_topic, attempt)
+            routing[self.NOT_BEFORE_HEADER] = str(
+                now_ms + self._settings.get_retry_delay_ms(attempt)
+            )
+
+        # Se conservan las cabeceras de negocio del mensaje original
+        passthrough = [
+            (key, value)
+            for key, value in (message.headers or ())
+            if key not in self._ROUTING_HEADERS
+        ]
+        return topic, passthrough + [
+            (key, value.encode("utf-8")) for key, value in routing.items()
+        ]
+
+    def is_retry(self, message: ConsumerRecord[Any, Any]) -> bool:
+        return self.header(message, self.ATTEMPT_HEADER) is not None
+
+    def attempt(self, message: ConsumerRecord[Any, Any]) -> int:
+        return int(self.header(message, self.ATTEMPT_HEADER) or 0)
+
+    def not_before_ms(self, message: ConsumerRecord[Any, Any]) -> int:
+        return int(self.header(message, self.NOT_BEFORE_HEADER) or 0)
+
+    def target_listener(self, message: ConsumerRecord[Any, Any]) -> str | None:
+        return self.header(message, self.LISTENER_HEADER)
+
+    def original_topic(self, message: ConsumerRecord[Any, Any]) -> str:
+        return self.header(message, self.ORIGINAL_TOPIC_HEADER) or message.topic
+
+    @staticmethod
+    def header(message: ConsumerRecord[Any, Any], name: str) -> str | None:
+        """Valor de una cabecera sin decodificar el resto"""
+        headers: Sequence[tuple[str, bytes]] = message.headers or ()
+        for key, value in headers:
+            if key == name:
+                return value.decode("utf-8")
+        return None
@@ -0,0 +1,50 @@
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+
+class KafkaTopicStrategy:
+    """
+    Decide en qué topic se publica cada tipo de evento.
+
+    Con la estrategia "event" cada evento tiene su topic (`yurest.MessageCreatedEvent`).
+    Con "context" todos los eventos de un bounded context comparten uno
+    (`yurest.chat`): hay menos topics y particiones que gestionar y los lotes del
+    producer se llenan mejor. El consumer distingue los eventos de un topic
+    compartido por la cabecera con su nombre, sin decodificar los que no escucha.
+    """
+
+    EVENT = "event"
+    CONTEXT = "context"
+    _CONTEXTS_PACKAGE = "Contexts"
+
+    def __init__(self, kafka_settings: KafkaSettings) -> None:
+        if kafka_settings.topic_strategy not in (self.EVENT, self.CONTEXT):
+            raise ValueError(
+                f"Estrategia de topics desconocida: {kafka_settings.topic_strategy}"
+            )
+        self._settings = kafka_settings
+        self._strategy = kafka_settings.topic_strategy
+        self._topics: dict[type[DomainEvent], str] = {}
+
+    def topic_for(self, event: type[DomainEvent]) -> str:
+        topic = self._topics.get(event)
+        if topic is None:
+            topic = self._topics[event] = self._resolve(event)
+        return topic
+
+    @classmethod
+    def bounded_context(cls, event: type[DomainEvent]) -> str | None:
+        """Bounded context de un evento según su módulo: app.Contexts.<Context>..."""
+        packages = event.__module__.split(".")
+        if cls._CONTEXTS_PACKAGE not in packages:
+            return None
+        index = packages.index(cls._CONTEXTS_PACKAGE) + 1
+        return packages[index] if index < len(packages) - 1 else None
+
+    def _resolve(self, event: type[DomainEvent]) -> str:
+        if self._strategy == self.CONTEXT:
+            context = self.bounded_context(event)
+            # Eventos fuera de un bounded context conservan su propio topic
+            if context is not None:
+                return self._settings.get_context_topic_name(context)
+        return self._settings.get_topic_name(event.__name__)
@@ -0,0 +1,90 @@
+from collections.abc import Callable, Sequence
+from functools import partial
+from typing import Any
+
+from injector import Injector, SingletonScope
+
+from app.Contexts.Shared.Application.Bus.BusMiddleware import BusMiddleware
+from app.Contexts.Shared.Application.Bus.Command.BatchCommandHandler import (
+    BatchCommandHandler,
+)
+from app.Contexts.Shared.Application.Bus.CpuBoundHandler import CpuBoundHandler
+from app.Contexts.Shared.Infrastructure.Bus.HandlerProcessPool import (
+    HandlerProcessPool,
+)
+
+
+class HandlerCompiler:
+    """Convierte una clase de handler en el callable que despachan los buses"""
+
+    @staticmethod
+    def compile(
+        injector: Injector,
+        message: type[Any],
+        handler: type[Any],
+        middlewares: Sequence[BusMiddleware] = (),
+    ) -> Callable[[Any], Any]:
+        """
+        Los handlers singleton se resuelven aquí una sola vez y se devuelve su
+        `handle`, sin pasar por el injector en cada despacho. El resto se
+        resuelve en cada llamada para respetar su scope. Los CpuBoundHandler
+        no se instancian: su `compute` se ejecuta en el HandlerProcessPool.
+
+        Los middlewares que aplican al tipo de mensaje se encadenan alrededor
+        del handler, el primero de la lista por fuera; sin middlewares el
+        callable es el propio `handle`.
+        """
+        binding, _ = injector.binder.get_binding(handler)
+        if issubclass(handler, CpuBoundHandler):
+            pool = injector.get(HandlerProcessPool)
+            pool.register(handler)
+            call: Callable[[Any], Any] = partial(pool.run, handler.compute)
+        elif issubclass(binding.scope, SingletonScope):
+            call = injector.get(handler).handle
+        else:
+
+            def call(message: Any) -> Any:
+                return injector.get(handler).handle(message)
+
+        for middleware in reversed(middlewares):
+            if middleware.applies_to(message):
+                call = partial(middleware.handle, next_handler=call)
+
+        return call
+
+    @staticmethod
+    def compile_batch(
+        injector: Injector,
+        message: type[Any],
+        handler: type[Any],
+        middlewares: Sequence[BusMiddleware] = (),
+    ) -> Callable[[Sequence[Any]], Any]:
+        """
+        Como `compile`, para el `handle_many` de un BatchCommandHandler: el
+        lote recorre la cadena una sola vez con el `handle_many` de cada
+        middleware.
+        """
+        binding, _ = injector.binder.get_binding(handler)
+        if issubclass(binding.scope, SingletonScope):
+            call: Callable[[Sequence[Any]], Any] = HandlerCompiler._batch_handler(
+                injector, handler
+            ).handle_many
+        else:
+
+            def call(messages: Sequence[Any]) -> Any:
+                return HandlerCompiler._batch_handler(injector, handler).handle_many(
+                    messages
+                )
+
+        for middleware in reversed(middlewares):
+            if middleware.applies_to(message):
+                call = partial(middleware.handle_many, next_handler=call)
+
+        return call
+
+    @staticmethod
+    def _batch_handler(injector: Injector, handler: type[Any]) -> BatchCommandHandler:
+        instance = injector.get(handler)
+        if not isinstance(instance, BatchCommandHandler):
+            raise TypeError(f"{handler.__name__} no es un BatchCommandHandler")
+        return instance
@@ -0,0 +1,146 @@
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from injector import inject, singleton
+
+from app.Contexts.Shared.Application.Bus.CpuBoundHandler import CpuBoundHandler
+from app.Contexts.Shared.Infrastructure.Settings.ProcessPoolSettings import (
+    ProcessPoolSettings,
+)
+
+
+def _preload(modules: tuple[str, ...]) -> None:
+    """Inicializador de cada worker: importa los módulos de los handlers"""
+    for module in modules:
+        importlib.import_module(module)
+
+
+@singleton
+class HandlerProcessPool:
+    """
+    Pool de procesos donde los buses ejecutan los CpuBoundHandler.
+
+    Al arrancar crea todos los workers e importa en ellos los módulos de los
+    handlers registrados, para que la primera petición no pague el arranque
+    de un intérprete. Si un worker muere el pool se descarta y se recrea en
+    la siguiente ejecución.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+
+    @inject
+    def __init__(self, settings: ProcessPoolSettings) -> None:
+        self._settings = settings
+        self._modules: set[str] = set()
+        self._executor: ProcessPoolExecutor | None = None
+        self._starting: asyncio.Lock | None = None
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._restarts = 0
+
+    def register(self, handler: type[CpuBoundHandler]) -> None:
+        """Añade el módulo del handler a los que se precargan en los workers"""
+        self._modules.add(handler.__module__)
+
+    async def start(self) -> None:
+        """Crea los workers y espera a que estén listos"""
+        if self._executor is not None:
+            return
+
+        if self._starting is None:
+            self._starting = asyncio.Lock()
+        async with self._starting:
+            if self._executor is not None:
+                return
+
+            workers = max(1, self._settings.workers)
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(self._settings.start_method),
+                initializer=_preload,
+                initargs=(tuple(sorted(self._modules)),),
+            )
+            loop = asyncio.get_running_loop()
+            # Una tarea por worker obliga a crearlos todos ahora
+            await asyncio.gather(
+                *(loop.run_in_executor(executor, os.getpid) for _ in range(workers))
+            )
+            self._executor = executor
+            self._logger.info(f"HandlerProcessPool iniciado con {workers} workers")
+
+    async def start_if_needed(self) -> None:
+        """Arranca el pool solo si algún bus tiene handlers CPU-bound"""
+        if self._modules:
+            await self.start()
+
+    async def stop(self) -> None:
+        """Espera a los cálculos en curso, hasta `shutdown_timeout_ms`, y para"""
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+
+        try:
+            await asyncio.wait_for(
+                asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True),
+                timeout=self._settings.shutdown_timeout_ms / 1000,
+            )
+        except TimeoutError:
+            self._logger.warning("HandlerProcessPool detenido con cálculos en curso")
+        self._logger.info("HandlerProcessPool detenido")
+
+    async def run(self, compute: Callable[[Any], Any], message: Any) -> Any:
+        """Ejecuta `compute(message)` en un worker y devuelve su resultado"""
+        executor = await self._get_executor()
+
+        self._running += 1
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                executor, compute, message
+            )
+        except BrokenProcessPool:
+            self._failed += 1
+            self._restart(executor)
+            raise
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._running -= 1
+
+        self._completed += 1
+        return result
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "started": self._executor is not None,
+            "workers": max(1, self._settings.workers),
+            "handlers": sorted(self._modules),
+            "running": self._running,
+            "completed": self._completed,
+            "failed": self._failed,
+            "restarts": self._restarts,
+        }
+
+    async def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            await self.start()
+        if self._executor is None:
+            raise RuntimeError("HandlerProcessPool no se ha podido iniciar")
+        return self._executor
+
+    def _restart(self, executor: ProcessPoolExecutor) -> None:
+        if self._executor is not executor:
+            return
+
+        self._logger.error("Un worker del HandlerProcessPool ha muerto, se recrea")
+        self._executor = None
+        self._restarts += 1
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -1,11 +1,14 @@
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from injector import Injector, inject, singleton
 
+from app.Contexts.Shared.Application.Bus.BusMiddleware import BusMiddleware
 from app.Contexts.Shared.Application.Bus.Query.Query import Query
 from app.Contexts.Shared.Application.Bus.Query.QueryBus import QueryBus
 from app.Contexts.Shared.Application.Bus.Query.QueryHandler import QueryHandler
+from app.Contexts.Shared.Infrastructure.Bus.HandlerCompiler import HandlerCompiler
 
 
 @singleton
@@ -16,11 +19,40 @@ class InMemoryQueryBus(QueryBus):
     def __init__(self, injector: Injector) -> None:
         self._injector = injector
         self._handlers: dict[type[Query], type[QueryHandler]] = {}
+        self._middlewares: list[BusMiddleware] = []
+        # Tabla de despacho compilada por freeze(); None mientras se registran
+        self._dispatch_table: dict[type[Query], Callable[[Any], Any]] | None = None
 
     def ask(self, query: Query) -> Any:
+        if self._dispatch_table is not None:
+            return self._dispatch_table[type(query)](query)
+
         handler = self._handlers[type(query)]
-        handler_instance = self._injector.get(handler)
-        return handler_instance.handle(query)
+        return HandlerCompiler.compile(
+            self._injector, type(query), handler, self._middlewares
+        )(query)
 
     def register(self, query: type[Query], handler: type[QueryHandler]) -> None:
+        if self._dispatch_table is not None:
+            raise RuntimeError(
+                f"QueryBus congelado, no se puede registrar {query.__name__}"
+            )
+
         self._handlers[query] = handler
+
+    def use(self, middleware: BusMiddleware) -> None:
+        if self._dispatch_table is not None:
+            raise RuntimeError(
+                f"QueryBus congelado, no se puede añadir {type(middleware).__name__}"
+            )
+
+        self._middlewares.append(middleware)
+
+    def freeze(self) -> None:
+        self._dispatch_table = {
+            query: HandlerCompiler.compile(
+                self._injector, query, handler, self._middlewares
+            )
+            for query, handler in self._handlers.items()
+        }
+        self._logger.info(f"QueryBus congelado con {len(self._dispatch_table)} queries")
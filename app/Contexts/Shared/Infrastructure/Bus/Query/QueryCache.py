@@ -0,0 +1,141 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from injector import inject, noninjectable, singleton
+
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Settings.QueryCacheSettings import (
+    QueryCacheSettings,
+)
+
+CacheTagsResolver = Callable[[DomainEvent], list[str]]
+
+
+class _CacheEntry:
+    __slots__ = ("value", "expires_at", "tags")
+
+    def __init__(self, value: Any, expires_at: float, tags: list[str]) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.tags = tags
+
+
+@singleton
+class QueryCache:
+    """
+    Resultados de queries en una LRU acotada en entradas y tiempo.
+
+    Cada entrada se indexa por sus etiquetas para que un evento de dominio
+    invalide todas las queries que dependen del agregado que cambió. Un
+    contador de generación descarta los resultados calculados mientras se
+    producía una invalidación, para no guardar datos ya desactualizados.
+    """
+
+    @inject
+    @noninjectable("clock")
+    def __init__(
+        self,
+        settings: QueryCacheSettings,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._settings = settings
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._keys_by_tag: dict[str, set[Hashable]] = {}
+        self._resolvers: dict[type[DomainEvent], list[CacheTagsResolver]] = {}
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        """Cambia con cada invalidación; se lee antes de calcular un resultado"""
+        return self._generation
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Devuelve (encontrado, valor) y marca la entrada como usada"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return False, None
+
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            self._misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return True, entry.value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        tags: list[str],
+        generation: int,
+        ttl_ms: int | None = None,
+    ) -> None:
+        """Guarda un resultado salvo que haya habido invalidaciones desde `generation`"""
+        if generation != self._generation:
+            return
+
+        self._remove(key)
+        ttl_s = (ttl_ms if ttl_ms is not None else self._settings.ttl_ms) / 1000
+        self._entries[key] = _CacheEntry(value, self._clock() + ttl_s, tags)
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > max(1, self._settings.max_entries):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._evictions += 1
+
+    def invalidate_tags(self, tags: list[str]) -> None:
+        """Elimina las entradas con cualquiera de las etiquetas"""
+        self._generation += 1
+        for tag in tags:
+            for key in list(self._keys_by_tag.get(tag, ())):
+                self._remove(key)
+                self._invalidations += 1
+
+    def invalidate_on(self, event: type[DomainEvent], tags: CacheTagsResolver) -> None:
+        """Registra qué etiquetas invalida un tipo de evento"""
+        self._resolvers.setdefault(event, []).append(tags)
+
+    def invalidated_events(self) -> list[type[DomainEvent]]:
+        return list(self._resolvers)
+
+    def invalidate_event(self, event: DomainEvent) -> None:
+        """Invalida las etiquetas que el evento tiene registradas"""
+        for resolver in self._resolvers.get(type(event), ()):
+            self.invalidate_tags(resolver(event))
+
+    def snapshot(self) -> dict[str, Any]:
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self._settings.max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "evictions": self._evictions,
+            "invalidations": self._invalidations,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_tag[tag]
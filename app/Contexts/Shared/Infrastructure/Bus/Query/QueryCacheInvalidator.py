@@ -0,0 +1,16 @@
+from injector import inject
+
+from app.Contexts.Shared.Application.Bus.Event.EventListener import EventListener
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Bus.Query.QueryCache import QueryCache
+
+
+class QueryCacheInvalidator(EventListener):
+    """Invalida en QueryCache las etiquetas afectadas por cada evento"""
+
+    @inject
+    def __init__(self, cache: QueryCache) -> None:
+        self._cache = cache
+
+    async def listen(self, event: DomainEvent) -> None:
+        self._cache.invalidate_event(event)
@@ -0,0 +1,38 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from injector import inject
+
+from app.Contexts.Shared.Application.Bus.BusMiddleware import BusMiddleware
+from app.Contexts.Shared.Application.Bus.Query.CacheableQuery import CacheableQuery
+from app.Contexts.Shared.Infrastructure.Bus.Query.QueryCache import QueryCache
+
+
+class QueryCacheMiddleware(BusMiddleware):
+    """Sirve desde QueryCache las queries que extienden CacheableQuery"""
+
+    @inject
+    def __init__(self, cache: QueryCache) -> None:
+        self._cache = cache
+
+    def applies_to(self, message: type[Any]) -> bool:
+        return issubclass(message, CacheableQuery)
+
+    async def handle(
+        self, message: Any, next_handler: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        params = message.cache_key()
+        if params is None:
+            return await next_handler(message)
+
+        key = (type(message), params)
+        found, value = self._cache.get(key)
+        if found:
+            return value
+
+        generation = self._cache.generation
+        result = await next_handler(message)
+        self._cache.set(
+            key, result, message.cache_tags(), generation, message.cache_ttl_ms
+        )
+        return result
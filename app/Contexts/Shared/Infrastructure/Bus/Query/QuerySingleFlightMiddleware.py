@@ -0,0 +1,94 @@
+import asyncio
+import contextvars
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from injector import singleton
+
+from app.Contexts.Shared.Application.Bus.BusMiddleware import BusMiddleware
+from app.Contexts.Shared.Application.Bus.Query.CacheableQuery import CacheableQuery
+from app.Contexts.Shared.Infrastructure.Http.Context.DeadlineExceededError import (
+    DeadlineExceededError,
+)
+from app.Contexts.Shared.Infrastructure.Http.Context.RequestContext import (
+    RequestContext,
+)
+from app.Contexts.Shared.Infrastructure.Http.Middleware.RequestContextMiddleware import (
+    request_deadline,
+)
+
+
+@singleton
+class QuerySingleFlightMiddleware(BusMiddleware):
+    """
+    Agrupa las queries idénticas que llegan mientras otra igual está en curso.
+
+    La primera ejecuta el handler y las demás esperan su resultado o su
+    excepción. La ejecución compartida corre en su propia tarea: si se cancela
+    la petición que la inició, el resto sigue esperando el resultado. Dos
+    queries son idénticas si tienen el mismo tipo y `cache_key`.
+
+    La ejecución compartida no hereda el plazo de quien la inicia: cada
+    petición aplica el suyo mientras espera, y vencerlo no afecta al resto.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._executions = 0
+        self._coalesced = 0
+
+    def applies_to(self, message: type[Any]) -> bool:
+        return issubclass(message, CacheableQuery)
+
+    async def handle(
+        self, message: Any, next_handler: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        params = message.cache_key()
+        if params is None:
+            return await next_handler(message)
+
+        key = (type(message), params)
+        flight = self._in_flight.get(key)
+        if flight is None:
+            context = contextvars.copy_context()
+            context.run(request_deadline.set, None)
+            flight = asyncio.get_running_loop().create_task(
+                self._execute(message, next_handler), context=context
+            )
+            self._in_flight[key] = flight
+            flight.add_done_callback(lambda done: self._land(key, done))
+            self._executions += 1
+        else:
+            self._coalesced += 1
+
+        remaining = RequestContext.remaining_time()
+        if remaining is None:
+            return await asyncio.shield(flight)
+        try:
+            return await asyncio.wait_for(asyncio.shield(flight), remaining)
+        except TimeoutError:
+            # Un TimeoutError del propio handler llega con la ejecución terminada
+            if flight.done():
+                raise
+            raise DeadlineExceededError(type(message).__name__) from None
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "in_flight": len(self._in_flight),
+            "executions": self._executions,
+            "coalesced": self._coalesced,
+        }
+
+    @staticmethod
+    async def _execute(
+        message: Any, next_handler: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        return await next_handler(message)
+
+    def _land(self, key: Hashable, flight: asyncio.Future[Any]) -> None:
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+        # Evita el aviso de excepción no recuperada si todos los que esperaban
+        # se cancelaron antes de que terminase
+        if not flight.cancelled():
+            flight.exception()
@@ -5,6 +5,9 @@ import grpc
 
 from app.Contexts.Shared.Infrastructure.Grpc.Client.GrpcRequest import GrpcRequest
 from app.Contexts.Shared.Infrastructure.Grpc.Client.GrpcResponse import GrpcResponse
+from app.Contexts.Shared.Infrastructure.Http.Context.DeadlineExceededError import (
+    DeadlineExceededError,
+)
 from app.Contexts.Shared.Infrastructure.Http.Context.RequestContext import (
     RequestContext,
 )
@@ -54,6 +57,16 @@ class GrpcClient:
         # Convertir a lista de tuplas como espera gRPC
         return list(metadata.items())
 
+    def _timeout_for(self, request: GrpcRequest) -> float:
+        """Timeout de la llamada; gRPC lo propaga al servidor como su deadline."""
+        timeout = request.timeout or self._timeout
+        remaining = RequestContext.remaining_time()
+        if remaining is None:
+            return timeout
+
+        RequestContext.check_deadline(f"{request.service_name}.{request.method_name}")
+        return min(timeout, remaining)
+
     def send(self, request: GrpcRequest, stub_class: type[Any]) -> GrpcResponse:
         """
         Envía una petición gRPC síncrona.
@@ -72,8 +85,8 @@ class GrpcClient:
             # Preparar metadatos
             metadata = self._prepare_metadata(request)
 
-            # Obtener timeout
-            timeout = request.timeout or self._timeout
+            # Obtener timeout, acotado por lo que queda del plazo del request
+            timeout = self._timeout_for(request)
 
             # Log de inicio
             self._logger.info(
@@ -99,6 +112,18 @@ class GrpcClient:
                 status_code=grpc.StatusCode.OK,
             )
 
+        except DeadlineExceededError as e:
+            self._logger.warning(
+                f"gRPC call skipped: {request.service_name}.{request.method_name} - {e}"
+            )
+
+            return GrpcResponse(
+                message=None,
+                metadata={},
+                status_code=grpc.StatusCode.DEADLINE_EXCEEDED,
+                details=str(e),
+            )
+
         except grpc.RpcError as e:
             self._logger.error(
                 f"gRPC call failed: {request.service_name}.{request.method_name} - {e.code().name}: {e.details()}",
@@ -136,6 +161,10 @@ class GrpcClient:
             GrpcResponse: La respuesta gRPC recibida
         """
         try:
+            # Obtener timeout, acotado por lo que queda del plazo del request;
+            # antes de abrir el canal para no dejarlo abierto si ya ha vencido
+            timeout = self._timeout_for(request)
+
             channel = grpc.aio.insecure_channel(
                 self._server_address, options=self._channel_options
             )
@@ -145,9 +174,6 @@ class GrpcClient:
             # Preparar metadatos
             metadata = self._prepare_metadata(request)
 
-            # Obtener timeout
-            timeout = request.timeout or self._timeout
-
             # Log de inicio
             self._logger.info(
                 f"Async gRPC call started: {request.service_name}.{request.method_name} to {self._server_address}"
@@ -172,6 +198,18 @@ class GrpcClient:
                 message=response_message, metadata={}, status_code=grpc.StatusCode.OK
             )
 
+        except DeadlineExceededError as e:
+            self._logger.warning(
+                f"gRPC call skipped: {request.service_name}.{request.method_name} - {e}"
+            )
+
+            return GrpcResponse(
+                message=None,
+                metadata={},
+                status_code=grpc.StatusCode.DEADLINE_EXCEEDED,
+                details=str(e),
+            )
+
         except grpc.RpcError as e:
             self._logger.error(
                 f"Async gRPC call failed: {request.service_name}.{request.method_name} - {e.code().name}: {e.details()}",
@@ -0,0 +1,26 @@
+from typing import Any
+
+from fastapi import APIRouter
+from injector import inject
+
+from app.Contexts.Shared.Infrastructure.Bus.BulkheadMiddleware import (
+    BulkheadMiddleware,
+)
+from app.Contexts.Shared.Infrastructure.Http.Controller import Controller
+
+
+class BulkheadMetricsController(Controller):
+    """Expone la ocupación y los rechazos de los bulkheads de los buses"""
+
+    @inject
+    def __init__(self, bulkheads: BulkheadMiddleware) -> None:
+        self._bulkheads = bulkheads
+
+    async def get_metrics(self) -> dict[str, Any]:
+        """GET /bulkheads/metrics"""
+        return self._bulkheads.snapshot()
+
+    def get_router(self) -> APIRouter:
+        router = APIRouter()
+        router.add_api_route("/bulkheads/metrics", self.get_metrics, methods=["GET"])
+        return router
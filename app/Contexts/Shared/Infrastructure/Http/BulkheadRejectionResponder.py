@@ -0,0 +1,31 @@
+from fastapi import Request, status
+from starlette.responses import JSONResponse
+
+from app.Contexts.Shared.Application.Bus.BulkheadRejectedError import (
+    BulkheadRejectedError,
+)
+
+
+class BulkheadRejectionResponder:
+    """
+    Traduce los rechazos de los bulkheads a respuestas HTTP: 429 si la cola
+    estaba llena y 503 si se agotó la espera, ambas con Retry-After
+    """
+
+    # Segundos que se sugiere esperar al cliente antes de reintentar
+    RETRY_AFTER_SECONDS = 1
+
+    @classmethod
+    async def handle(cls, request: Request, exc: Exception) -> JSONResponse:
+        if not isinstance(exc, BulkheadRejectedError):
+            raise exc
+
+        return JSONResponse(
+            status_code=(
+                status.HTTP_429_TOO_MANY_REQUESTS
+                if exc.queue_full
+                else status.HTTP_503_SERVICE_UNAVAILABLE
+            ),
+            content={"error": "Service overloaded", "message": str(exc)},
+            headers={"Retry-After": str(cls.RETRY_AFTER_SECONDS)},
+        )
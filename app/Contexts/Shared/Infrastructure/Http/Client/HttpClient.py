@@ -4,6 +4,12 @@ import httpx
 
 from app.Contexts.Shared.Infrastructure.Http.Client.HttpRequest import HttpRequest
 from app.Contexts.Shared.Infrastructure.Http.Client.HttpResponse import HttpResponse
+from app.Contexts.Shared.Infrastructure.Http.Context.RequestContext import (
+    RequestContext,
+)
+from app.Contexts.Shared.Infrastructure.Http.Middleware.RequestContextMiddleware import (
+    RequestContextMiddleware,
+)
 
 
 class HttpClient:
@@ -24,11 +30,23 @@ class HttpClient:
         Returns:
             HttpResponse: La respuesta HTTP recibida
         """
+        timeout = self._timeout
+        headers = dict(request.headers)
+        remaining = RequestContext.remaining_time()
+        if remaining is not None:
+            # El servicio remoto no debe trabajar más de lo que este cliente
+            # va a esperar: se propaga el timeout ya acotado por el plazo
+            RequestContext.check_deadline(f"{request.method.value} {request.url}")
+            timeout = min(timeout, remaining)
+            headers[RequestContextMiddleware.TIMEOUT_HEADER] = str(
+                int(timeout * 1000)
+            )
+
         try:
             response = self._client.request(
                 method=request.method.value,
                 url=request.url,
-                headers=request.headers,
+                headers=headers,
                 params=request.query_params,
                 json=(
                     request.body if request.content_type == "application/json" else None
@@ -37,6 +55,7 @@ class HttpClient:
                     request.body if request.content_type != "application/json" else None
                 ),
                 files=request.files,
+                timeout=timeout,
             )
 
             return HttpResponse(
@@ -48,7 +67,7 @@ class HttpClient:
 
         except httpx.TimeoutException as e:
             raise TimeoutError(
-                f"La petición ha excedido el tiempo límite de {self._timeout} segundos"
+                f"La petición ha excedido el tiempo límite de {timeout:.3f} segundos"
             ) from e
         except httpx.RequestError as e:
             raise ConnectionError(f"Error al realizar la petición: {str(e)}") from e
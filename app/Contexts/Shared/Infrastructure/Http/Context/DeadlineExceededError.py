@@ -0,0 +1,9 @@
+class DeadlineExceededError(TimeoutError):
+    """
+    El plazo de la petición en curso ha vencido: quien la hizo ya no espera
+    la respuesta y seguir trabajando en ella es desperdicio
+    """
+
+    def __init__(self, operation: str) -> None:
+        super().__init__(f"Plazo de la petición vencido antes de {operation}")
+        self.operation = operation
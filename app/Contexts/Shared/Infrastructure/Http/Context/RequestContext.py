@@ -1,5 +1,11 @@
+import time
+
+from app.Contexts.Shared.Infrastructure.Http.Context.DeadlineExceededError import (
+    DeadlineExceededError,
+)
 from app.Contexts.Shared.Infrastructure.Http.Middleware.RequestContextMiddleware import (
     request_context,
+    request_deadline,
 )
 
 
@@ -34,3 +40,23 @@ class RequestContext:
         """Obtiene la URL del request actual."""
         context = request_context.get({})
         return context.get("url")
+
+    @staticmethod
+    def get_deadline() -> float | None:
+        """Obtiene el instante (time.monotonic) en que vence el request actual."""
+        return request_deadline.get()
+
+    @staticmethod
+    def remaining_time() -> float | None:
+        """Segundos que le quedan al request actual; None si no tiene plazo."""
+        deadline = request_deadline.get()
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+
+    @staticmethod
+    def check_deadline(operation: str) -> None:
+        """Lanza DeadlineExceededError si el plazo del request ya ha vencido."""
+        deadline = request_deadline.get()
+        if deadline is not None and time.monotonic() >= deadline:
+            raise DeadlineExceededError(operation)
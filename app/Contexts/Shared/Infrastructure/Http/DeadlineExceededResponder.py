@@ -0,0 +1,20 @@
+from fastapi import Request, status
+from starlette.responses import JSONResponse
+
+from app.Contexts.Shared.Infrastructure.Http.Context.DeadlineExceededError import (
+    DeadlineExceededError,
+)
+
+
+class DeadlineExceededResponder:
+    """Traduce los plazos vencidos durante una petición a 504"""
+
+    @classmethod
+    async def handle(cls, request: Request, exc: Exception) -> JSONResponse:
+        if not isinstance(exc, DeadlineExceededError):
+            raise exc
+
+        return JSONResponse(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            content={"error": "Deadline exceeded", "message": str(exc)},
+        )
@@ -0,0 +1,26 @@
+from typing import Any
+
+from fastapi import APIRouter
+from injector import inject
+
+from app.Contexts.Shared.Infrastructure.Bus.HandlerProcessPool import (
+    HandlerProcessPool,
+)
+from app.Contexts.Shared.Infrastructure.Http.Controller import Controller
+
+
+class HandlerProcessPoolMetricsController(Controller):
+    """Expone el estado del pool de procesos de los handlers CPU-bound"""
+
+    @inject
+    def __init__(self, process_pool: HandlerProcessPool) -> None:
+        self._process_pool = process_pool
+
+    async def get_metrics(self) -> dict[str, Any]:
+        """GET /process-pool/metrics"""
+        return self._process_pool.metrics()
+
+    def get_router(self) -> APIRouter:
+        router = APIRouter()
+        router.add_api_route("/process-pool/metrics", self.get_metrics, methods=["GET"])
+        return router
@@ -0,0 +1,26 @@
+from typing import Any
+
+from fastapi import APIRouter
+from injector import inject
+
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBusManager import (
+    KafkaEventBusManager,
+)
+from app.Contexts.Shared.Infrastructure.Http.Controller import Controller
+
+
+class KafkaMetricsController(Controller):
+    """Expone el lag y el backpressure del consumer para monitorización y autoscaling"""
+
+    @inject
+    def __init__(self, kafka_manager: KafkaEventBusManager) -> None:
+        self._kafka_manager = kafka_manager
+
+    async def get_metrics(self) -> dict[str, Any]:
+        """GET /kafka/metrics"""
+        return self._kafka_manager.metrics()
+
+    def get_router(self) -> APIRouter:
+        router = APIRouter()
+        router.add_api_route("/kafka/metrics", self.get_metrics, methods=["GET"])
+        return router
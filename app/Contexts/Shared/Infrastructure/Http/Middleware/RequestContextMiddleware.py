@@ -1,21 +1,38 @@
 import logging
+import time
 import uuid
 from collections.abc import Awaitable, Callable
 from contextvars import ContextVar
 
 from fastapi import Request, Response
+from starlette.applications import Starlette
 
 from app.Contexts.Shared.Infrastructure.Http.Middleware.Middleware import Middleware
+from app.Contexts.Shared.Infrastructure.Settings.RequestSettings import (
+    RequestSettings,
+)
 
 # Context variables para el request
 request_context: ContextVar[dict[str, str]] = ContextVar(
     "request_context", default={}  # noqa: B039
 )
+# Instante (time.monotonic) en que vence el plazo del request; None sin plazo
+request_deadline: ContextVar[float | None] = ContextVar(
+    "request_deadline", default=None
+)
 
 
 class RequestContextMiddleware(Middleware):
     _logger: logging.Logger = logging.getLogger(__name__)
 
+    # Presupuesto en milisegundos que le queda al cliente para esperar la
+    # respuesta; los clientes HTTP lo propagan con lo que reste del plazo
+    TIMEOUT_HEADER = "X-Request-Timeout-Ms"
+
+    def __init__(self, app: Starlette, settings: RequestSettings | None = None):
+        super().__init__(app)
+        self._settings = settings or RequestSettings.from_env()
+
     async def dispatch(
         self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
     ) -> Response:
@@ -36,6 +53,7 @@ class RequestContextMiddleware(Middleware):
 
         # Establecer el contexto para este request
         token = request_context.set(context)
+        deadline_token = request_deadline.set(self._deadline(request))
 
         try:
             self._logger.info(f"Request started: {request.method} {request.url}")
@@ -56,3 +74,26 @@ class RequestContextMiddleware(Middleware):
         finally:
             # Limpiar el contexto
             request_context.reset(token)
+            request_deadline.reset(deadline_token)
+
+    def _deadline(self, request: Request) -> float | None:
+        timeout_ms = self._requested_timeout_ms(request)
+        if timeout_ms is None:
+            timeout_ms = self._settings.default_timeout_ms
+            if timeout_ms <= 0:
+                return None
+
+        if self._settings.max_timeout_ms > 0:
+            timeout_ms = min(timeout_ms, self._settings.max_timeout_ms)
+        return time.monotonic() + max(timeout_ms, 0) / 1000
+
+    def _requested_timeout_ms(self, request: Request) -> int | None:
+        header = request.headers.get(self.TIMEOUT_HEADER)
+        if header is None:
+            return None
+
+        try:
+            return int(header)
+        except ValueError:
+            self._logger.warning(f"{self.TIMEOUT_HEADER} no válido: {header!r}")
+            return None
@@ -0,0 +1,44 @@
+from typing import Any
+
+from fastapi import APIRouter
+from injector import inject
+
+from app.Contexts.Shared.Infrastructure.Bus.Query.QueryCache import QueryCache
+from app.Contexts.Shared.Infrastructure.Bus.Query.QuerySingleFlightMiddleware import (
+    QuerySingleFlightMiddleware,
+)
+from app.Contexts.Shared.Infrastructure.Http.Controller import Controller
+from app.Contexts.Shared.Infrastructure.Settings.QueryCacheSettings import (
+    QueryCacheSettings,
+)
+
+
+class QueryCacheMetricsController(Controller):
+    """Expone la tasa de aciertos de la caché de queries y las queries agrupadas"""
+
+    @inject
+    def __init__(
+        self,
+        settings: QueryCacheSettings,
+        cache: QueryCache,
+        single_flight: QuerySingleFlightMiddleware,
+    ) -> None:
+        self._settings = settings
+        self._cache = cache
+        self._single_flight = single_flight
+
+    async def get_metrics(self) -> dict[str, Any]:
+        """GET /query-cache/metrics"""
+        return {
+            "enabled": self._settings.enabled,
+            **self._cache.snapshot(),
+            "single_flight": {
+                "enabled": self._settings.single_flight,
+                **self._single_flight.snapshot(),
+            },
+        }
+
+    def get_router(self) -> APIRouter:
+        router = APIRouter()
+        router.add_api_route("/query-cache/metrics", self.get_metrics, methods=["GET"])
+        return router
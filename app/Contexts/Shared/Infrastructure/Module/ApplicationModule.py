@@ -1,7 +1,9 @@
 import logging
+from typing import Any
 
-from injector import Binder, Module
+from injector import Binder, Module, singleton
 
+from app.Contexts.Shared.Application.Bus.BusMiddleware import BusMiddleware
 from app.Contexts.Shared.Application.Bus.Command.Command import Command
 from app.Contexts.Shared.Application.Bus.Command.CommandBus import CommandBus
 from app.Contexts.Shared.Application.Bus.Command.CommandHandler import CommandHandler
@@ -13,15 +15,29 @@ from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
 from app.Contexts.Shared.Domain.ExceptionHandling.ExceptionHandler import (
     ExceptionHandler,
 )
+from app.Contexts.Shared.Infrastructure.Bus.BulkheadLimits import BulkheadLimits
 from app.Contexts.Shared.Infrastructure.Bus.Command.InMemoryCommandBus import (
     InMemoryCommandBus,
 )
 from app.Contexts.Shared.Infrastructure.Bus.Query.InMemoryQueryBus import (
     InMemoryQueryBus,
 )
+from app.Contexts.Shared.Infrastructure.Bus.Query.QueryCache import CacheTagsResolver
 from app.Contexts.Shared.Infrastructure.ExceptionHandling.SentryExceptionHandler import (
     SentryExceptionHandler,
 )
+from app.Contexts.Shared.Infrastructure.Settings.BulkheadSettings import (
+    BulkheadSettings,
+)
+from app.Contexts.Shared.Infrastructure.Settings.CommandBusSettings import (
+    CommandBusSettings,
+)
+from app.Contexts.Shared.Infrastructure.Settings.ProcessPoolSettings import (
+    ProcessPoolSettings,
+)
+from app.Contexts.Shared.Infrastructure.Settings.QueryCacheSettings import (
+    QueryCacheSettings,
+)
 
 
 class ApplicationModule(Module):
@@ -33,6 +49,16 @@ class ApplicationModule(Module):
         binder.bind(CommandBus, to=InMemoryCommandBus)  # type: ignore
         binder.bind(QueryBus, to=InMemoryQueryBus)  # type: ignore
         binder.bind(ExceptionHandler, to=SentryExceptionHandler)  # type: ignore
+        binder.bind(BulkheadSettings, to=BulkheadSettings.from_env(), scope=singleton)
+        binder.bind(
+            CommandBusSettings, to=CommandBusSettings.from_env(), scope=singleton
+        )
+        binder.bind(
+            ProcessPoolSettings, to=ProcessPoolSettings.from_env(), scope=singleton
+        )
+        binder.bind(
+            QueryCacheSettings, to=QueryCacheSettings.from_env(), scope=singleton
+        )
 
     def map_commands(self) -> list[tuple[type[Command], type[CommandHandler]]]:
         return []
@@ -40,5 +66,19 @@ class ApplicationModule(Module):
     def map_queries(self) -> list[tuple[type[Query], type[QueryHandler]]]:
         return []
 
+    def map_command_middlewares(self) -> list[type[BusMiddleware]]:
+        return []
+
+    def map_query_middlewares(self) -> list[type[BusMiddleware]]:
+        return []
+
+    def map_bulkheads(self) -> list[tuple[type[Any], BulkheadLimits]]:
+        return []
+
+    def map_query_cache_invalidations(
+        self,
+    ) -> list[tuple[type[DomainEvent], CacheTagsResolver]]:
+        return []
+
     def map_events(self) -> list[tuple[type[DomainEvent], type[EventListener]]]:
         return []
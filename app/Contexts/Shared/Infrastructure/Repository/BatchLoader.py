@@ -0,0 +1,61 @@
+import asyncio
+from collections.abc import Callable, Hashable, Mapping
+
+
+class BatchLoader[K: Hashable, V]:
+    """
+    Agrupa en una sola llamada a `batch` las búsquedas por clave pedidas en el
+    mismo tick del event loop.
+
+    La primera búsqueda de un tick programa el lote con `call_soon`, de modo
+    que los handlers que se ejecutan a la vez comparten una consulta múltiple
+    en lugar de hacer una por clave. Las claves repetidas se piden una vez. No
+    se guardan resultados entre lotes, así que nunca se sirven datos de una
+    consulta anterior.
+    """
+
+    def __init__(
+        self, batch: Callable[[list[K]], Mapping[K, V]], max_batch_size: int = 100
+    ) -> None:
+        self._batch = batch
+        self._max_batch_size = max(1, max_batch_size)
+        self._pending: dict[K, asyncio.Future[V | None]] = {}
+
+    async def load(self, key: K) -> V | None:
+        """Devuelve el valor de la clave, o None si no existe"""
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = loop.create_future()
+            future.add_done_callback(self._retrieve)
+            self._pending[key] = future
+
+        # Varias peticiones comparten el futuro de una clave: cancelar una
+        # (cliente desconectado, plazo vencido) no debe cancelar a las demás
+        return await asyncio.shield(future)
+
+    @staticmethod
+    def _retrieve(future: asyncio.Future[V | None]) -> None:
+        # Evita el aviso de excepción no recuperada si todos los que esperaban
+        # se cancelaron antes de que terminase el lote
+        if not future.cancelled():
+            future.exception()
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        keys = list(pending)
+        for start in range(0, len(keys), self._max_batch_size):
+            chunk = keys[start : start + self._max_batch_size]
+            try:
+                found = self._batch(chunk)
+            except Exception as error:
+                for key in chunk:
+                    if not pending[key].done():
+                        pending[key].set_exception(error)
+                continue
+
+            for key in chunk:
+                if not pending[key].done():
+                    pending[key].set_result(found.get(key))
@@ -0,0 +1,37 @@
+import os
+from dataclasses import dataclass, field
+
+from app.Contexts.Shared.Infrastructure.Bus.BulkheadLimits import BulkheadLimits
+
+
+@dataclass
+class BulkheadSettings:
+    """
+    Límites por defecto de los bulkheads de los buses; cada módulo puede
+    ajustarlos por tipo de mensaje con `map_bulkheads()`
+    """
+
+    enabled: bool = True
+    commands: BulkheadLimits = field(
+        default_factory=lambda: BulkheadLimits(128, 256, 2000)
+    )
+    queries: BulkheadLimits = field(
+        default_factory=lambda: BulkheadLimits(64, 128, 1000)
+    )
+
+    @classmethod
+    def from_env(cls) -> "BulkheadSettings":
+        """Crea la configuración desde variables de entorno"""
+        return cls(
+            enabled=os.getenv("BULKHEADS_ENABLED", "true").lower() == "true",
+            commands=BulkheadLimits(
+                max_concurrent=int(os.getenv("BULKHEAD_COMMAND_CONCURRENCY", "128")),
+                max_queued=int(os.getenv("BULKHEAD_COMMAND_QUEUE", "256")),
+                max_wait_ms=int(os.getenv("BULKHEAD_COMMAND_MAX_WAIT_MS", "2000")),
+            ),
+            queries=BulkheadLimits(
+                max_concurrent=int(os.getenv("BULKHEAD_QUERY_CONCURRENCY", "64")),
+                max_queued=int(os.getenv("BULKHEAD_QUERY_QUEUE", "128")),
+                max_wait_ms=int(os.getenv("BULKHEAD_QUERY_MAX_WAIT_MS", "1000")),
+            ),
+        )
@@ -0,0 +1,20 @@
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class CommandBusSettings:
+    """Configuración del despacho de comandos"""
+
+    # Ejecuta en orden los SerializedCommand con la misma clave de buzón
+    mailboxes: bool = True
+    # Comandos de un dispatch_many que se ejecutan a la vez
+    batch_concurrency: int = 16
+
+    @classmethod
+    def from_env(cls) -> "CommandBusSettings":
+        """Crea la configuración desde variables de entorno"""
+        return cls(
+            mailboxes=os.getenv("COMMAND_MAILBOXES_ENABLED", "true").lower() == "true",
+            batch_concurrency=int(os.getenv("COMMAND_BATCH_CONCURRENCY", "16")),
+        )
@@ -0,0 +1,26 @@
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class EventBusSettings:
+    """Configuración del EventBus en memoria, usado cuando Kafka está deshabilitado"""
+
+    # Eventos en cola por listener antes de considerar la cola desbordada
+    queue_size: int = 1000
+    # Workers que vacían la cola de cada listener; con 1 se conserva el orden
+    workers_per_listener: int = 1
+    # Espera máxima con la cola llena antes de descartar el evento (0: no espera)
+    overflow_timeout_ms: int = 0
+    # Tiempo que se espera al parar para procesar los eventos en cola
+    shutdown_timeout_ms: int = 5000
+
+    @classmethod
+    def from_env(cls) -> "EventBusSettings":
+        """Crea la configuración desde variables de entorno"""
+        return cls(
+            queue_size=int(os.getenv("EVENT_BUS_QUEUE_SIZE", "1000")),
+            workers_per_listener=int(os.getenv("EVENT_BUS_WORKERS_PER_LISTENER", "1")),
+            overflow_timeout_ms=int(os.getenv("EVENT_BUS_OVERFLOW_TIMEOUT_MS", "0")),
+            shutdown_timeout_ms=int(os.getenv("EVENT_BUS_SHUTDOWN_TIMEOUT_MS", "5000")),
+        )
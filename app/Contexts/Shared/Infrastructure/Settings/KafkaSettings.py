@@ -7,12 +7,45 @@ class KafkaSettings:
     bootstrap_servers: list[str]
     topics_prefix: str
     consumer_group_id: str
-    enable_auto_commit: bool = True
+    # Los offsets se confirman manualmente tras procesar cada registro
+    enable_auto_commit: bool = False
     auto_offset_reset: str = "earliest"
     max_poll_records: int = 500
     session_timeout_ms: int = 30000
     heartbeat_interval_ms: int = 3000
     enabled: bool = True  # Nueva configuración para habilitar/deshabilitar Kafka
+    # Permite publicar sin consumir, p. ej. en la API cuando hay workers de eventos
+    consumer_enabled: bool = True
+    commit_interval_ms: int = 5000
+    commit_batch_size: int = 100
+    max_retries: int = 3
+    retry_backoff_ms: int = 1000
+    # Registros en cola por partición que pausan (alta) y reanudan (baja) el fetch
+    in_flight_high_watermark: int = 1000
+    in_flight_low_watermark: int = 250
+    # Formato con el que se publican los eventos: "json" o "binary"
+    event_codec: str = "json"
+    # Ventana de ids de eventos procesados para descartar reentregas
+    dedup_capacity: int = 100000
+    dedup_ttl_ms: int = 3600000
+    # Espera para agrupar en un solo rebalanceo los listeners registrados en caliente
+    subscription_debounce_ms: int = 500
+    # "kafka" o "memory": broker en proceso para benchmarks y tests sin red
+    transport: str = "kafka"
+    # "event": un topic por evento; "context": un topic por bounded context
+    topic_strategy: str = "event"
+    # Espera del producer para llenar lotes antes de enviarlos
+    producer_linger_ms: int = 0
+    # Tiempo máximo que una publicación espera al broker antes de ir al spool
+    publish_timeout_ms: int = 2000
+    # Fallos seguidos que abren el circuito y tiempo hasta volver a probar
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout_ms: int = 10000
+    # Fichero donde se guardan los eventos mientras el broker no está disponible
+    spool_path: str = "storage/kafka/spool.jsonl"
+    spool_replay_interval_ms: int = 1000
+    # Intentos de un registro del spool con errores no transitorios antes del dead-letter
+    spool_max_attempts: int = 5
 
     @classmethod
     def from_env(cls) -> "KafkaSettings":
@@ -22,15 +55,64 @@ class KafkaSettings:
             bootstrap_servers=bootstrap_servers.split(","),
             topics_prefix=os.getenv("KAFKA_TOPICS_PREFIX", "yurest"),
             consumer_group_id=os.getenv("KAFKA_CONSUMER_GROUP_ID", "yurest-app"),
-            enable_auto_commit=os.getenv("KAFKA_ENABLE_AUTO_COMMIT", "true").lower()
+            enable_auto_commit=os.getenv("KAFKA_ENABLE_AUTO_COMMIT", "false").lower()
             == "true",
             auto_offset_reset=os.getenv("KAFKA_AUTO_OFFSET_RESET", "earliest"),
             max_poll_records=int(os.getenv("KAFKA_MAX_POLL_RECORDS", "500")),
             session_timeout_ms=int(os.getenv("KAFKA_SESSION_TIMEOUT_MS", "30000")),
             heartbeat_interval_ms=int(os.getenv("KAFKA_HEARTBEAT_INTERVAL_MS", "3000")),
             enabled=os.getenv("KAFKA_ENABLED", "true").lower() == "true",
+            consumer_enabled=os.getenv("KAFKA_CONSUMER_ENABLED", "true").lower()
+            == "true",
+            commit_interval_ms=int(os.getenv("KAFKA_COMMIT_INTERVAL_MS", "5000")),
+            commit_batch_size=int(os.getenv("KAFKA_COMMIT_BATCH_SIZE", "100")),
+            max_retries=int(os.getenv("KAFKA_MAX_RETRIES", "3")),
+            retry_backoff_ms=int(os.getenv("KAFKA_RETRY_BACKOFF_MS", "1000")),
+            in_flight_high_watermark=int(
+                os.getenv("KAFKA_IN_FLIGHT_HIGH_WATERMARK", "1000")
+            ),
+            in_flight_low_watermark=int(
+                os.getenv("KAFKA_IN_FLIGHT_LOW_WATERMARK", "250")
+            ),
+            event_codec=os.getenv("KAFKA_EVENT_CODEC", "json"),
+            dedup_capacity=int(os.getenv("KAFKA_DEDUP_CAPACITY", "100000")),
+            dedup_ttl_ms=int(os.getenv("KAFKA_DEDUP_TTL_MS", "3600000")),
+            subscription_debounce_ms=int(
+                os.getenv("KAFKA_SUBSCRIPTION_DEBOUNCE_MS", "500")
+            ),
+            transport=os.getenv("KAFKA_TRANSPORT", "kafka"),
+            topic_strategy=os.getenv("KAFKA_TOPIC_STRATEGY", "event"),
+            producer_linger_ms=int(os.getenv("KAFKA_PRODUCER_LINGER_MS", "0")),
+            publish_timeout_ms=int(os.getenv("KAFKA_PUBLISH_TIMEOUT_MS", "2000")),
+            circuit_failure_threshold=int(
+                os.getenv("KAFKA_CIRCUIT_FAILURE_THRESHOLD", "5")
+            ),
+            circuit_reset_timeout_ms=int(
+                os.getenv("KAFKA_CIRCUIT_RESET_TIMEOUT_MS", "10000")
+            ),
+            spool_path=os.getenv("KAFKA_SPOOL_PATH", "storage/kafka/spool.jsonl"),
+            spool_replay_interval_ms=int(
+                os.getenv("KAFKA_SPOOL_REPLAY_INTERVAL_MS", "1000")
+            ),
+            spool_max_attempts=int(os.getenv("KAFKA_SPOOL_MAX_ATTEMPTS", "5")),
         )
 
     def get_topic_name(self, event_name: str) -> str:
         """Genera el nombre del topic basado en el prefijo y el nombre del evento"""
         return f"{self.topics_prefix}.{event_name.replace('.', '_')}"
+
+    def get_context_topic_name(self, context: str) -> str:
+        """Topic compartido por todos los eventos de un bounded context"""
+        return f"{self.topics_prefix}.{context.lower()}"
+
+    def get_retry_topic_name(self, topic: str, attempt: int) -> str:
+        """Topic de retraso para el intento indicado de un topic principal"""
+        return f"{topic}.retry.{attempt}"
+
+    def get_dead_letter_topic_name(self, topic: str) -> str:
+        """Topic de mensajes fallidos definitivamente (dead-letter queue)"""
+        return f"{topic}.dlq"
+
+    def get_retry_delay_ms(self, attempt: int) -> int:
+        """Retraso con backoff exponencial para el intento indicado"""
+        return int(self.retry_backoff_ms * 2 ** (attempt - 1))
@@ -0,0 +1,26 @@
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class ProcessPoolSettings:
+    """Configuración del pool de procesos de los handlers CPU-bound"""
+
+    # Procesos worker; cada uno ocupa un núcleo mientras calcula
+    workers: int = 2
+    # "spawn" o "forkserver": hacer fork de un proceso con event loop e
+    # hilos en marcha no es seguro
+    start_method: str = "spawn"
+    # Tiempo que se espera al parar a que terminen los cálculos en curso
+    shutdown_timeout_ms: int = 10000
+
+    @classmethod
+    def from_env(cls) -> "ProcessPoolSettings":
+        """Crea la configuración desde variables de entorno"""
+        return cls(
+            workers=int(os.getenv("HANDLER_PROCESS_POOL_WORKERS", "2")),
+            start_method=os.getenv("HANDLER_PROCESS_POOL_START_METHOD", "spawn"),
+            shutdown_timeout_ms=int(
+                os.getenv("HANDLER_PROCESS_POOL_SHUTDOWN_TIMEOUT_MS", "10000")
+            ),
+        )
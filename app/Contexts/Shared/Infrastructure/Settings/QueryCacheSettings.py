@@ -0,0 +1,28 @@
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class QueryCacheSettings:
+    """Configuración de la caché de resultados y el single-flight del QueryBus"""
+
+    enabled: bool = False
+    # Entradas máximas; al superarlas se descartan las menos usadas
+    max_entries: int = 10000
+    # Caducidad por defecto. Las escrituras de este proceso invalidan al
+    # publicar sus eventos; en las demás réplicas, que no siempre reciben el
+    # evento, es el tiempo máximo que un resultado puede estar desactualizado
+    ttl_ms: int = 30000
+    # Agrupa las queries cacheables idénticas que se ejecutan a la vez
+    single_flight: bool = True
+
+    @classmethod
+    def from_env(cls) -> "QueryCacheSettings":
+        """Crea la configuración desde variables de entorno"""
+        return cls(
+            enabled=os.getenv("QUERY_CACHE_ENABLED", "false").lower() == "true",
+            max_entries=int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "10000")),
+            ttl_ms=int(os.getenv("QUERY_CACHE_TTL_MS", "30000")),
+            single_flight=os.getenv("QUERY_SINGLE_FLIGHT_ENABLED", "true").lower()
+            == "true",
+        )
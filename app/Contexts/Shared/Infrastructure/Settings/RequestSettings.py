@@ -0,0 +1,20 @@
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class RequestSettings:
+    """Configuración del presupuesto de tiempo de las peticiones HTTP"""
+
+    # Plazo de una petición que no trae X-Request-Timeout-Ms (0: sin plazo)
+    default_timeout_ms: int = 30000
+    # Tope del plazo que puede pedir un cliente con la cabecera
+    max_timeout_ms: int = 120000
+
+    @classmethod
+    def from_env(cls) -> "RequestSettings":
+        """Crea la configuración desde variables de entorno"""
+        return cls(
+            default_timeout_ms=int(os.getenv("REQUEST_TIMEOUT_MS", "30000")),
+            max_timeout_ms=int(os.getenv("REQUEST_MAX_TIMEOUT_MS", "120000")),
+        )
@@ -0,0 +1,113 @@
+"""
+Microbenchmark del coste de despacho de InMemoryCommandBus e InMemoryQueryBus.
+
+Mide el despacho de un comando y una query con handlers vacíos antes y después
+de freeze(), para handlers singleton y sin scope:
+
+    python scripts/benchmark_buses.py --iterations 200000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from injector import Binder, Injector, singleton  # noqa: E402
+
+from app.Contexts.Shared.Application.Bus.Command.Command import Command  # noqa: E402
+from app.Contexts.Shared.Application.Bus.Command.CommandHandler import (  # noqa: E402
+    CommandHandler,
+)
+from app.Contexts.Shared.Application.Bus.Query.Query import Query  # noqa: E402
+from app.Contexts.Shared.Application.Bus.Query.QueryHandler import (  # noqa: E402
+    QueryHandler,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Command.InMemoryCommandBus import (  # noqa: E402
+    InMemoryCommandBus,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Query.InMemoryQueryBus import (  # noqa: E402
+    InMemoryQueryBus,
+)
+
+
+class NoopCommand(Command):
+    pass
+
+
+class NoopQuery(Query):
+    pass
+
+
+class NoopCommandHandler(CommandHandler):
+    async def handle(self, command: Command) -> None:  # type: ignore[override]
+        pass
+
+
+class NoopQueryHandler(QueryHandler):
+    def handle(self, query: Query) -> Any:
+        return None
+
+
+def build_buses(scoped: bool) -> tuple[InMemoryCommandBus, InMemoryQueryBus]:
+    def configure(binder: Binder) -> None:
+        scope = singleton if scoped else None
+        binder.bind(NoopCommandHandler, scope=scope)
+        binder.bind(NoopQueryHandler, scope=scope)
+
+    injector = Injector([configure])
+    command_bus = injector.get(InMemoryCommandBus)
+    query_bus = injector.get(InMemoryQueryBus)
+    command_bus.register(NoopCommand, NoopCommandHandler)
+    query_bus.register(NoopQuery, NoopQueryHandler)
+    return command_bus, query_bus
+
+
+async def measure(
+    command_bus: InMemoryCommandBus, query_bus: InMemoryQueryBus, iterations: int
+) -> tuple[float, float]:
+    command, query = NoopCommand(), NoopQuery()
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await command_bus.dispatch(command)
+    command_ns = (time.perf_counter() - started) / iterations * 1e9
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        query_bus.ask(query)
+    query_ns = (time.perf_counter() - started) / iterations * 1e9
+
+    return command_ns, query_ns
+
+
+async def run(iterations: int) -> None:
+    print(f"iteraciones: {iterations}")
+    print(f"{'handler':<12}{'tabla':<12}{'comando ns':>12}{'query ns':>12}")
+    for scoped in (True, False):
+        command_bus, query_bus = build_buses(scoped)
+        before = await measure(command_bus, query_bus, iterations)
+        command_bus.freeze()
+        query_bus.freeze()
+        after = await measure(command_bus, query_bus, iterations)
+
+        handler = "singleton" if scoped else "sin scope"
+        for table, (command_ns, query_ns) in (
+            ("injector", before),
+            ("congelada", after),
+        ):
+            print(f"{handler:<12}{table:<12}{command_ns:>12,.0f}{query_ns:>12,.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=100000)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark de throughput del KafkaEventBus contra el broker en memoria.
+
+Publica N eventos y mide cuánto tarda el consumer en procesarlos todos, sin
+necesidad del stack de Kafka de docker-compose:
+
+    python scripts/benchmark_kafka_event_bus.py --events 20000 --codec binary
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+from unittest.mock import Mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.Contexts.Chat.Message.Domain.MessageCreatedEvent import (  # noqa: E402
+    MessageCreatedEvent,
+)
+from app.Contexts.Shared.Application.Bus.Event.EventListener import (  # noqa: E402
+    EventListener,
+)
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent  # noqa: E402
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaBroker import (  # noqa: E402
+    InMemoryKafkaBroker,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaClientFactory import (  # noqa: E402
+    InMemoryKafkaClientFactory,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBus import (  # noqa: E402
+    KafkaEventBus,
+)
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import (  # noqa: E402
+    KafkaSettings,
+)
+
+
+class CountingListener(EventListener):
+    def __init__(self, expected: int) -> None:
+        self.count = 0
+        self.done = asyncio.Event()
+        self._expected = expected
+
+    async def listen(self, event: DomainEvent) -> None:
+        self.count += 1
+        if self.count == self._expected:
+            self.done.set()
+
+
+async def run(events: int, conversations: int, partitions: int, codec: str) -> None:
+    settings = KafkaSettings(
+        bootstrap_servers=["memory"],
+        topics_prefix="benchmark",
+        consumer_group_id="benchmark",
+        event_codec=codec,
+        transport="memory",
+    )
+    broker = InMemoryKafkaBroker(partitions=partitions)
+    bus = KafkaEventBus(settings, Mock(), InMemoryKafkaClientFactory(broker))
+    listener = CountingListener(events)
+    bus.subscribe(MessageCreatedEvent, listener)
+
+    conversation_ids = [str(uuid.uuid4()) for _ in range(conversations)]
+    batch = [
+        MessageCreatedEvent(
+            str(uuid.uuid4()), conversation_ids[index % conversations], "hola"
+        )
+        for index in range(events)
+    ]
+
+    # Los logs por evento del bus distorsionarían la medida
+    KafkaEventBus._logger.disabled = True
+    await bus.start()
+    try:
+        started = time.perf_counter()
+        await bus.publish(batch)
+        published = time.perf_counter()
+        await listener.done.wait()
+        consumed = time.perf_counter()
+    finally:
+        await bus.stop()
+
+    print(f"eventos:     {events} ({codec}, {partitions} particiones)")
+    print(f"publicación: {events / (published - started):,.0f} eventos/s")
+    print(f"extremo a extremo: {events / (consumed - started):,.0f} eventos/s")
+    print(f"métricas:    {bus.metrics()}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--conversations", type=int, default=100)
+    parser.add_argument("--partitions", type=int, default=4)
+    parser.add_argument("--codec", choices=["json", "binary"], default="json")
+    args = parser.parse_args()
+    asyncio.run(run(args.events, args.conversations, args.partitions, args.codec))
+
+
+if __name__ == "__main__":
+    main()
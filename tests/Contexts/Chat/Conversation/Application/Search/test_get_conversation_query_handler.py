@@ -48,7 +48,7 @@ class TestGetConversationQueryHandler:
         existing_conversation = Conversation.create(
             ConversationId("conv-123"), ConversationOwner("user-456")
         )
-        mock_conversation_repo.find_by_id.return_value = existing_conversation
+        mock_conversation_repo.load.return_value = existing_conversation
 
         # Act
         result = await handler.handle(query)
@@ -62,9 +62,7 @@ class TestGetConversationQueryHandler:
 
         # CRITICAL: Verificar que NO se llamó al repositorio de mensajes
         mock_message_repo.assert_not_called()
-        mock_conversation_repo.find_by_id.assert_called_once_with(
-            ConversationId("conv-123")
-        )
+        mock_conversation_repo.load.assert_awaited_once_with(ConversationId("conv-123"))
 
     @pytest.mark.unit
     async def test_returns_none_when_conversation_not_found(
@@ -76,7 +74,7 @@ class TestGetConversationQueryHandler:
         """Test que retorna None cuando la conversación no existe"""
         # Arrange
         query = GetConversationQuery(conversation_id="conv-nonexistent")
-        mock_conversation_repo.find_by_id.return_value = None
+        mock_conversation_repo.load.return_value = None
 
         # Act
         result = await handler.handle(query)
@@ -84,6 +82,6 @@ class TestGetConversationQueryHandler:
         # Assert
         assert result is None
         mock_message_repo.assert_not_called()
-        mock_conversation_repo.find_by_id.assert_called_once_with(
+        mock_conversation_repo.load.assert_awaited_once_with(
             ConversationId("conv-nonexistent")
         )
@@ -75,3 +75,5 @@ class TestConversation:
         assert events[0].name == "conversation.created"
         assert events[0].payload["conversation_id"] == "conv-123"
         assert events[0].payload["owner"] == "user-456"
+        assert events[0].aggregate_id == "conv-123"
+        assert events[0].partition_key == "conv-123"
@@ -1,3 +1,6 @@
+import asyncio
+from unittest.mock import patch
+
 import pytest
 
 from app.Contexts.Chat.Conversation.Domain.ConversationId import ConversationId
@@ -43,6 +46,37 @@ class TestInMemoryMessageRepository:
         assert result is not None
         assert result.id == MessageId("msg-123")
 
+    @pytest.mark.unit
+    def test_find_by_ids_returns_only_existing_messages(
+        self, repository: InMemoryMessageRepository, sample_message: Message
+    ) -> None:
+        """Test that find_by_ids indexes found messages by ID and skips missing ones"""
+        repository.save(sample_message)
+
+        result = repository.find_by_ids([MessageId("msg-123"), MessageId("missing")])
+
+        assert result == {MessageId("msg-123"): sample_message}
+
+    @pytest.mark.unit
+    async def test_load_batches_concurrent_lookups(
+        self, repository: InMemoryMessageRepository, sample_message: Message
+    ) -> None:
+        """Test that lookups issued together resolve with a single find_by_ids"""
+        repository.save(sample_message)
+        with patch.object(
+            repository, "find_by_ids", wraps=repository.find_by_ids
+        ) as find_by_ids:
+            found, missing = await asyncio.gather(
+                repository.load(MessageId("msg-123")),
+                repository.load(MessageId("missing")),
+            )
+
+        assert found == sample_message
+        assert missing is None
+        find_by_ids.assert_called_once_with(
+            [MessageId("msg-123"), MessageId("missing")]
+        )
+
     @pytest.mark.unit
     def test_save_stores_message(
         self, repository: InMemoryMessageRepository, sample_message: Message
@@ -77,8 +77,8 @@ class TestUpsertMessageCommandHandler:
         )
 
         # No existe la conversación ni el mensaje
-        mock_conversation_repo.find_by_id.return_value = None
-        mock_message_repo.find_by_id.return_value = None
+        mock_conversation_repo.load.return_value = None
+        mock_message_repo.load.return_value = None
 
         # Act
         await handler.handle(command)
@@ -128,8 +128,8 @@ class TestUpsertMessageCommandHandler:
             MessageContent("Contenido original"),
         )
 
-        mock_conversation_repo.find_by_id.return_value = existing_conversation
-        mock_message_repo.find_by_id.return_value = existing_message
+        mock_conversation_repo.load.return_value = existing_conversation
+        mock_message_repo.load.return_value = existing_message
 
         # Hay mensajes posteriores que deben ser eliminados
         posterior_messages = [MessageId("msg-789"), MessageId("msg-012")]
@@ -178,8 +178,8 @@ class TestUpsertMessageCommandHandler:
             MessageContent("Mismo contenido"),
         )
 
-        mock_conversation_repo.find_by_id.return_value = existing_conversation
-        mock_message_repo.find_by_id.return_value = existing_message
+        mock_conversation_repo.load.return_value = existing_conversation
+        mock_message_repo.load.return_value = existing_message
         mock_chronology_checker.get_messages_after.return_value = []
 
         # Act
@@ -215,8 +215,8 @@ class TestUpsertMessageCommandHandler:
             MessageContent("Contenido original"),
         )
 
-        mock_conversation_repo.find_by_id.return_value = None
-        mock_message_repo.find_by_id.return_value = existing_message
+        mock_conversation_repo.load.return_value = None
+        mock_message_repo.load.return_value = existing_message
 
         # Act & Assert
         with pytest.raises(ValueError, match="Message ID inmutable"):
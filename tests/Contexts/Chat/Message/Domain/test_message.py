@@ -84,6 +84,8 @@ class TestMessage:
         assert events[0].name == "message.created"
         assert events[0].payload["message_id"] == "msg-123"
         assert events[0].payload["conversation_id"] == "conv-456"
+        assert events[0].aggregate_id == "msg-123"
+        assert events[0].partition_key == "conv-456"
 
     @pytest.mark.unit
     def test_message_events_on_update(self) -> None:
@@ -103,3 +105,4 @@ class TestMessage:
         assert events[0].name == "message.updated"
         assert events[0].payload["message_id"] == "msg-123"
         assert events[0].payload["conversation_id"] == "conv-456"
+        assert events[0].partition_key == "conv-456"
@@ -6,28 +6,29 @@ from fastapi import status
 from app.Contexts.Chat.Message.Application.Create.UpsertMessageCommand import (
     UpsertMessageCommand,
 )
-from app.Contexts.Chat.Message.Application.Create.UpsertMessageCommandHandler import (
-    UpsertMessageCommandHandler,
-)
 from app.Contexts.Chat.Message.Infrastructure.Http.UpsertMessageController import (
     UpsertMessageController,
 )
+from app.Contexts.Shared.Application.Bus.BulkheadRejectedError import (
+    BulkheadRejectedError,
+)
+from app.Contexts.Shared.Application.Bus.Command.CommandBus import CommandBus
 
 
 class TestUpsertMessageController:
     @pytest.fixture
-    def mock_command_handler(self) -> Mock:
-        mock = Mock(spec=UpsertMessageCommandHandler)
-        mock.handle = AsyncMock()
+    def mock_command_bus(self) -> Mock:
+        mock = Mock(spec=CommandBus)
+        mock.dispatch = AsyncMock()
         return mock
 
     @pytest.fixture
-    def controller(self, mock_command_handler: Mock) -> UpsertMessageController:
-        return UpsertMessageController(mock_command_handler)
+    def controller(self, mock_command_bus: Mock) -> UpsertMessageController:
+        return UpsertMessageController(mock_command_bus)
 
     @pytest.mark.unit
     async def test_upsert_message_creates_new_conversation_and_message(
-        self, controller: UpsertMessageController, mock_command_handler: Mock
+        self, controller: UpsertMessageController, mock_command_bus: Mock
     ) -> None:
         """Test AC1: PUT sobre nueva conv.: conversación y mensaje creados, 201"""
         # Arrange
@@ -45,8 +46,8 @@ class TestUpsertMessageController:
         assert response.body == b'{"message": "Message upserted successfully"}'
 
         # Verificar que se llamó al handler con el comando correcto
-        mock_command_handler.handle.assert_called_once()
-        command_arg = mock_command_handler.handle.call_args[0][0]
+        mock_command_bus.dispatch.assert_called_once()
+        command_arg = mock_command_bus.dispatch.call_args[0][0]
         assert isinstance(command_arg, UpsertMessageCommand)
         assert command_arg.conversation_id == conversation_id
         assert command_arg.message_id == message_id
@@ -55,7 +56,7 @@ class TestUpsertMessageController:
 
     @pytest.mark.unit
     async def test_upsert_message_updates_existing_message(
-        self, controller: UpsertMessageController, mock_command_handler: Mock
+        self, controller: UpsertMessageController, mock_command_bus: Mock
     ) -> None:
         """Test AC2: PUT sobre msg existente: mensaje actualizado, 200"""
         # Arrange
@@ -76,11 +77,11 @@ class TestUpsertMessageController:
         assert (
             response.status_code == status.HTTP_201_CREATED
         )  # Mismo código para create/update
-        mock_command_handler.handle.assert_called_once()
+        mock_command_bus.dispatch.assert_called_once()
 
     @pytest.mark.unit
     async def test_upsert_message_validates_payload(
-        self, controller: UpsertMessageController, mock_command_handler: Mock
+        self, controller: UpsertMessageController, mock_command_bus: Mock
     ) -> None:
         """Test AC3: PUT con payload inválido → 400"""
         # Arrange
@@ -102,11 +103,11 @@ class TestUpsertMessageController:
         assert b"MessageContent no puede estar vac" in response.body
 
         # No debe llamar al handler si hay error de validación
-        mock_command_handler.handle.assert_not_called()
+        mock_command_bus.dispatch.assert_not_called()
 
     @pytest.mark.unit
     async def test_upsert_message_validates_id_consistency(
-        self, controller: UpsertMessageController, mock_command_handler: Mock
+        self, controller: UpsertMessageController, mock_command_bus: Mock
     ) -> None:
         """Test AC4: Msg id inmutable: cambiar path id ≠ body id → 400"""
         # Arrange
@@ -129,7 +130,7 @@ class TestUpsertMessageController:
 
     @pytest.mark.unit
     async def test_upsert_message_handles_command_handler_error(
-        self, controller: UpsertMessageController, mock_command_handler: Mock
+        self, controller: UpsertMessageController, mock_command_bus: Mock
     ) -> None:
         """Test manejo de errores del command handler → 500"""
         # Arrange
@@ -138,7 +139,7 @@ class TestUpsertMessageController:
         request_body = {"id": message_id, "content": "Contenido", "owner": "user-789"}
 
         # Simular error en el handler
-        mock_command_handler.handle.side_effect = RuntimeError("Database error")
+        mock_command_bus.dispatch.side_effect = RuntimeError("Database error")
 
         # Act
         response = await controller.upsert_message(
@@ -148,3 +149,19 @@ class TestUpsertMessageController:
         # Assert
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         assert b"Internal server error" in response.body
+
+    @pytest.mark.unit
+    async def test_upsert_message_propagates_bulkhead_rejection(
+        self, controller: UpsertMessageController, mock_command_bus: Mock
+    ) -> None:
+        """Test que un rechazo por sobrecarga no se convierte en un 500"""
+        # Arrange
+        message_id = "msg-456"
+        request_body = {"id": message_id, "content": "Contenido", "owner": "user-789"}
+        mock_command_bus.dispatch.side_effect = BulkheadRejectedError(
+            "UpsertMessageCommand", queue_full=True
+        )
+
+        # Act & Assert
+        with pytest.raises(BulkheadRejectedError):
+            await controller.upsert_message("conv-123", message_id, request_body)
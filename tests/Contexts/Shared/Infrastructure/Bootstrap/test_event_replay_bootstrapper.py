@@ -0,0 +1,41 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.Contexts.Shared.Infrastructure.Bootstrap.EventReplayBootstrapper import (
+    EventReplayBootstrapper,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBusManager import (
+    KafkaEventBusManager,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventReplayer import (
+    KafkaEventReplayer,
+)
+
+
+class TestEventReplayBootstrapper:
+    @pytest.mark.unit
+    async def test_replays_without_starting_the_event_bus(self) -> None:
+        """Test that a replay runs the replayer and leaves the bus stopped"""
+        bootstrapper = EventReplayBootstrapper()
+
+        with (
+            patch.object(
+                KafkaEventReplayer, "run", AsyncMock(return_value={"processed": 3})
+            ) as run,
+            patch.object(KafkaEventBusManager, "start", AsyncMock()) as start,
+        ):
+            progress = await bootstrapper.run(name="rebuild", from_beginning=True)
+
+        assert progress == {"processed": 3}
+        assert run.await_args.kwargs["from_beginning"] is True
+        start.assert_not_awaited()
+
+    @pytest.mark.unit
+    @patch.dict("os.environ", {"KAFKA_ENABLED": "false"})
+    async def test_refuses_to_run_without_kafka(self) -> None:
+        """Test that a replay without Kafka fails fast"""
+        bootstrapper = EventReplayBootstrapper()
+
+        with pytest.raises(RuntimeError):
+            await bootstrapper.run()
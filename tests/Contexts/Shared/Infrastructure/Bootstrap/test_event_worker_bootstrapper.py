@@ -0,0 +1,66 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.Contexts.Shared.Application.Bus.Event.EventBus import EventBus
+from app.Contexts.Shared.Infrastructure.Bootstrap.EventWorkerBootstrapper import (
+    EventWorkerBootstrapper,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBus import KafkaEventBus
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBusManager import (
+    KafkaEventBusManager,
+)
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+
+class TestEventWorkerBootstrapper:
+    @pytest.mark.unit
+    async def test_runs_consumers_until_stopped(self) -> None:
+        """Test that the worker starts the event bus and stops it on shutdown"""
+        bootstrapper = EventWorkerBootstrapper()
+        stop = asyncio.Event()
+        stop.set()
+
+        with (
+            patch.object(KafkaEventBusManager, "start", AsyncMock()) as start,
+            patch.object(KafkaEventBusManager, "stop", AsyncMock()) as stop_bus,
+        ):
+            await bootstrapper.run(stop)
+
+        start.assert_awaited_once()
+        stop_bus.assert_awaited_once()
+
+    @pytest.mark.unit
+    def test_shares_the_application_event_bus(self) -> None:
+        """Test that the worker wires the same event bus implementation as the API"""
+        bootstrapper = EventWorkerBootstrapper()
+
+        assert isinstance(bootstrapper.injector.get(EventBus), KafkaEventBus)  # type: ignore[type-abstract]
+
+    @pytest.mark.unit
+    @patch.dict("os.environ", {"KAFKA_CONSUMER_ENABLED": "false"})
+    async def test_refuses_to_run_without_consumer(self) -> None:
+        """Test that a worker configured not to consume fails fast"""
+        bootstrapper = EventWorkerBootstrapper()
+
+        with pytest.raises(RuntimeError):
+            await bootstrapper.run(asyncio.Event())
+
+
+class TestKafkaEventBusConsumerDisabled:
+    @pytest.mark.unit
+    async def test_does_not_start_consumer(self) -> None:
+        """Test that a publish-only bus never creates a consumer"""
+        settings = KafkaSettings(
+            bootstrap_servers=["localhost:9092"],
+            topics_prefix="test",
+            consumer_group_id="test-group",
+            consumer_enabled=False,
+        )
+        bus = KafkaEventBus(settings, AsyncMock(), Mock())
+        bus._listeners["SomeEvent"] = []
+
+        await bus._ensure_consumer_started()
+
+        assert bus._consumer is None
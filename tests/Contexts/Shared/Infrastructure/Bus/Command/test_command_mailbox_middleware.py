@@ -0,0 +1,135 @@
+import asyncio
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+
+from app.Contexts.Chat.Message.Application.Create.UpsertMessageCommand import (
+    UpsertMessageCommand,
+)
+from app.Contexts.Shared.Application.Bus.Command.Command import Command
+from app.Contexts.Shared.Infrastructure.Bus.Command.CommandMailboxMiddleware import (
+    CommandMailboxMiddleware,
+)
+
+
+def upsert(conversation_id: str, message_id: str) -> UpsertMessageCommand:
+    return UpsertMessageCommand(conversation_id, message_id, "Hola", "owner-1")
+
+
+class RecordingHandler:
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+        self.order: list[str] = []
+
+    async def __call__(self, command: UpsertMessageCommand) -> Any:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.001)
+        self.order.append(command.message_id)
+        self.running -= 1
+
+
+class TestCommandMailboxMiddleware:
+    @pytest.mark.unit
+    async def test_same_conversation_runs_in_order(self) -> None:
+        """Test that commands of one conversation run one at a time, in order"""
+        middleware = CommandMailboxMiddleware()
+        handler = RecordingHandler()
+        ids = [f"msg-{index}" for index in range(10)]
+
+        await asyncio.gather(
+            *(middleware.handle(upsert("conv-1", id), handler) for id in ids)
+        )
+
+        assert handler.max_running == 1
+        assert handler.order == ids
+        assert middleware.snapshot()["queued"] == 9
+
+    @pytest.mark.unit
+    async def test_different_conversations_run_in_parallel(self) -> None:
+        """Test that commands of different conversations do not wait each other"""
+        middleware = CommandMailboxMiddleware()
+        handler = RecordingHandler()
+
+        await asyncio.gather(
+            *(
+                middleware.handle(upsert(f"conv-{index}", "msg"), handler)
+                for index in range(10)
+            )
+        )
+
+        assert handler.max_running == 10
+        assert middleware.snapshot()["queued"] == 0
+
+    @pytest.mark.unit
+    async def test_idle_mailboxes_are_evicted(self) -> None:
+        """Test that a mailbox disappears once its commands have finished"""
+        middleware = CommandMailboxMiddleware()
+        release = asyncio.Event()
+
+        async def blocked(command: Any) -> None:
+            await release.wait()
+
+        task = asyncio.create_task(middleware.handle(upsert("conv-1", "m"), blocked))
+        await asyncio.sleep(0)
+        assert middleware.snapshot()["mailboxes"] == 1
+
+        release.set()
+        await task
+        assert middleware.snapshot()["mailboxes"] == 0
+
+    @pytest.mark.unit
+    async def test_errors_release_the_mailbox(self) -> None:
+        """Test that a failing command lets the next one of its key run"""
+        middleware = CommandMailboxMiddleware()
+        handler = RecordingHandler()
+
+        async def failing(command: Any) -> None:
+            raise RuntimeError("handler error")
+
+        results = await asyncio.gather(
+            middleware.handle(upsert("conv-1", "first"), failing),
+            middleware.handle(upsert("conv-1", "second"), handler),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], RuntimeError)
+        assert handler.order == ["second"]
+        assert middleware.snapshot()["mailboxes"] == 0
+
+    @pytest.mark.unit
+    def test_only_wraps_serialized_commands(self) -> None:
+        """Test that plain commands skip the mailbox"""
+        middleware = CommandMailboxMiddleware()
+
+        assert middleware.applies_to(UpsertMessageCommand)
+        assert not middleware.applies_to(Command)
+
+    @pytest.mark.unit
+    async def test_batches_hold_the_mailbox_of_every_key(self) -> None:
+        """Test that a batch waits for and then blocks every conversation it touches"""
+        middleware = CommandMailboxMiddleware()
+        handler = RecordingHandler()
+        order: list[str] = []
+
+        async def batch_handler(commands: Sequence[UpsertMessageCommand]) -> None:
+            await asyncio.sleep(0.001)
+            order.append("batch")
+
+        async def single(command: UpsertMessageCommand) -> None:
+            await handler(command)
+            order.append(command.message_id)
+
+        await asyncio.gather(
+            middleware.handle(upsert("conv-2", "before"), single),
+            middleware.handle_many(
+                [upsert("conv-1", "a"), upsert("conv-2", "b"), upsert("conv-1", "c")],
+                batch_handler,
+            ),
+            middleware.handle(upsert("conv-1", "after"), single),
+        )
+
+        assert order == ["before", "batch", "after"]
+        assert middleware.snapshot()["mailboxes"] == 0
@@ -0,0 +1,369 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import Any
+
+import pytest
+from injector import Binder, Injector, inject, singleton
+
+from app.Contexts.Shared.Application.Bus.BulkheadRejectedError import (
+    BulkheadRejectedError,
+)
+from app.Contexts.Shared.Application.Bus.BusMiddleware import BusMiddleware
+from app.Contexts.Shared.Application.Bus.Command.BatchCommandHandler import (
+    BatchCommandHandler,
+)
+from app.Contexts.Shared.Application.Bus.Command.Command import Command
+from app.Contexts.Shared.Application.Bus.Command.CommandHandler import CommandHandler
+from app.Contexts.Shared.Application.Bus.Command.SerializedCommand import (
+    SerializedCommand,
+)
+from app.Contexts.Shared.Infrastructure.Bus.BulkheadLimits import BulkheadLimits
+from app.Contexts.Shared.Infrastructure.Bus.BulkheadMiddleware import (
+    BulkheadMiddleware,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Command.InMemoryCommandBus import (
+    InMemoryCommandBus,
+)
+from app.Contexts.Shared.Infrastructure.Bus.DeadlineMiddleware import (
+    DeadlineMiddleware,
+)
+from app.Contexts.Shared.Infrastructure.Http.Context.DeadlineExceededError import (
+    DeadlineExceededError,
+)
+from app.Contexts.Shared.Infrastructure.Http.Middleware.RequestContextMiddleware import (
+    request_deadline,
+)
+from app.Contexts.Shared.Infrastructure.Settings.BulkheadSettings import (
+    BulkheadSettings,
+)
+from app.Contexts.Shared.Infrastructure.Settings.CommandBusSettings import (
+    CommandBusSettings,
+)
+
+
+class SampleCommand(Command):
+    pass
+
+
+class RecordingCommandHandler(CommandHandler):
+    instances = 0
+
+    def __init__(self) -> None:
+        RecordingCommandHandler.instances += 1
+        self.commands: list[Command] = []
+
+    async def handle(self, command: Command) -> None:  # type: ignore[override]
+        self.commands.append(command)
+
+
+def make_bus(scope: object = None) -> tuple[InMemoryCommandBus, Injector]:
+    def configure(binder: Binder) -> None:
+        binder.bind(RecordingCommandHandler, scope=scope)  # type: ignore[arg-type]
+
+    injector = Injector([configure])
+    bus = injector.get(InMemoryCommandBus)
+    bus.register(SampleCommand, RecordingCommandHandler)
+    RecordingCommandHandler.instances = 0
+    return bus, injector
+
+
+class TestInMemoryCommandBus:
+    @pytest.mark.unit
+    async def test_dispatches_before_freeze(self) -> None:
+        """Test that commands are dispatched while registration is still open"""
+        bus, injector = make_bus(singleton)
+
+        await bus.dispatch(SampleCommand())
+
+        assert len(injector.get(RecordingCommandHandler).commands) == 1
+
+    @pytest.mark.unit
+    async def test_frozen_singleton_handler_skips_the_injector(self) -> None:
+        """Test that a frozen bus resolves singleton handlers once"""
+        bus, injector = make_bus(singleton)
+        bus.freeze()
+        bus._injector = None  # type: ignore[assignment]
+
+        for _ in range(3):
+            await bus.dispatch(SampleCommand())
+
+        assert RecordingCommandHandler.instances == 1
+        assert len(injector.get(RecordingCommandHandler).commands) == 3
+
+    @pytest.mark.unit
+    async def test_frozen_unscoped_handler_is_resolved_per_dispatch(self) -> None:
+        """Test that handlers without scope keep getting a fresh instance"""
+        bus, _ = make_bus()
+        bus.freeze()
+
+        await bus.dispatch(SampleCommand())
+        await bus.dispatch(SampleCommand())
+
+        assert RecordingCommandHandler.instances == 2
+
+    @pytest.mark.unit
+    def test_rejects_registration_after_freeze(self) -> None:
+        """Test that a frozen bus does not accept new handlers"""
+        bus, _ = make_bus(singleton)
+        bus.freeze()
+
+        with pytest.raises(RuntimeError):
+            bus.register(SampleCommand, RecordingCommandHandler)
+
+
+class TracingMiddleware(BusMiddleware):
+    def __init__(self, name: str, trace: list[str], only: type | None = None) -> None:
+        self._name = name
+        self._trace = trace
+        self._only = only
+
+    def applies_to(self, message: type[Any]) -> bool:
+        return self._only is None or message is self._only
+
+    async def handle(
+        self, message: Any, next_handler: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        self._trace.append(f"{self._name}:before")
+        result = await next_handler(message)
+        self._trace.append(f"{self._name}:after")
+        return result
+
+
+class TestInMemoryCommandBusMiddlewares:
+    @pytest.mark.unit
+    async def test_runs_middlewares_in_registration_order(self) -> None:
+        """Test that the first middleware added wraps all the others"""
+        bus, injector = make_bus(singleton)
+        trace: list[str] = []
+        bus.use(TracingMiddleware("outer", trace))
+        bus.use(TracingMiddleware("inner", trace))
+        bus.freeze()
+
+        await bus.dispatch(SampleCommand())
+
+        assert trace == ["outer:before", "inner:before", "inner:after", "outer:after"]
+        assert len(injector.get(RecordingCommandHandler).commands) == 1
+
+    @pytest.mark.unit
+    async def test_skips_middlewares_that_do_not_apply(self) -> None:
+        """Test that a middleware scoped to another command is not compiled in"""
+        bus, injector = make_bus(singleton)
+        bus.use(TracingMiddleware("other", [], only=Command))
+        bus.freeze()
+
+        assert (
+            bus._dispatch_table is not None
+            and bus._dispatch_table[SampleCommand]
+            == injector.get(RecordingCommandHandler).handle
+        )
+
+    @pytest.mark.unit
+    async def test_applies_middlewares_before_freeze(self) -> None:
+        """Test that the slow path also runs the middleware chain"""
+        bus, _ = make_bus(singleton)
+        trace: list[str] = []
+        bus.use(TracingMiddleware("only", trace))
+
+        await bus.dispatch(SampleCommand())
+
+        assert trace == ["only:before", "only:after"]
+
+    @pytest.mark.unit
+    def test_rejects_middlewares_after_freeze(self) -> None:
+        """Test that the chain cannot change once compiled"""
+        bus, _ = make_bus(singleton)
+        bus.freeze()
+
+        with pytest.raises(RuntimeError):
+            bus.use(TracingMiddleware("late", []))
+
+
+class KeyedCommand(SerializedCommand):
+    def __init__(self, key: str, index: int) -> None:
+        self.key = key
+        self.index = index
+
+    def mailbox_key(self) -> Hashable:
+        return self.key
+
+
+class SlowKeyedCommandHandler(CommandHandler):
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+        self.done: list[tuple[str, int]] = []
+
+    async def handle(self, command: KeyedCommand) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.001)
+        if command.index < 0:
+            self.running -= 1
+            raise ValueError(command.key)
+        self.done.append((command.key, command.index))
+        self.running -= 1
+
+
+class BatchRecordingCommandHandler(BatchCommandHandler):
+    def __init__(self) -> None:
+        self.batches: list[list[Command]] = []
+
+    async def handle(self, command: Command) -> None:
+        self.batches.append([command])
+
+    async def handle_many(self, commands: Sequence[Command]) -> None:
+        self.batches.append(list(commands))
+
+
+class BatchKeyedCommand(KeyedCommand):
+    pass
+
+
+class KeyedBatchCommandHandler(BatchCommandHandler):
+    """Lotes de comandos con clave; anota en el mismo registro que los demás"""
+
+    @inject
+    def __init__(self, keyed: SlowKeyedCommandHandler) -> None:
+        self._keyed = keyed
+
+    async def handle(self, command: BatchKeyedCommand) -> None:
+        await self.handle_many([command])
+
+    async def handle_many(self, commands: Sequence[BatchKeyedCommand]) -> None:
+        self._keyed.done.extend((command.key, command.index) for command in commands)
+
+
+def make_batch_bus(concurrency: int) -> tuple[InMemoryCommandBus, Injector]:
+    def configure(binder: Binder) -> None:
+        binder.bind(SlowKeyedCommandHandler, scope=singleton)
+        binder.bind(BatchRecordingCommandHandler, scope=singleton)
+        binder.bind(
+            CommandBusSettings, to=CommandBusSettings(batch_concurrency=concurrency)
+        )
+
+    injector = Injector([configure])
+    bus = injector.get(InMemoryCommandBus)
+    bus.register(KeyedCommand, SlowKeyedCommandHandler)
+    bus.register(SampleCommand, BatchRecordingCommandHandler)
+    bus.register(BatchKeyedCommand, KeyedBatchCommandHandler)
+    bus.freeze()
+    return bus, injector
+
+
+class TestInMemoryCommandBusDispatchMany:
+    @pytest.mark.unit
+    async def test_batch_handlers_receive_their_commands_at_once(self) -> None:
+        """Test that a BatchCommandHandler gets one call with its whole group"""
+        bus, injector = make_batch_bus(4)
+        commands = [SampleCommand() for _ in range(5)]
+
+        await bus.dispatch_many([*commands, KeyedCommand("a", 0)])
+
+        handler = injector.get(BatchRecordingCommandHandler)
+        assert handler.batches == [commands]
+        assert injector.get(SlowKeyedCommandHandler).done == [("a", 0)]
+
+    @pytest.mark.unit
+    async def test_keeps_order_per_key_with_bounded_concurrency(self) -> None:
+        """Test that same-key commands run in order and at most N run at once"""
+        bus, injector = make_batch_bus(3)
+        commands = [KeyedCommand(key, index) for index in range(5) for key in "abcdef"]
+
+        await bus.dispatch_many(commands)
+
+        handler = injector.get(SlowKeyedCommandHandler)
+        assert handler.max_running == 3
+        for key in "abcdef":
+            assert [i for k, i in handler.done if k == key] == list(range(5))
+
+    @pytest.mark.unit
+    async def test_failures_are_raised_together_after_the_batch(self) -> None:
+        """Test that a failing command does not stop the rest of the batch"""
+        bus, injector = make_batch_bus(2)
+
+        with pytest.raises(ExceptionGroup) as raised:
+            await bus.dispatch_many(
+                [KeyedCommand("a", -1), KeyedCommand("a", 1), KeyedCommand("b", -1)]
+            )
+
+        assert len(raised.value.exceptions) == 2
+        assert injector.get(SlowKeyedCommandHandler).done == [("a", 1)]
+
+    @pytest.mark.unit
+    async def test_keeps_order_per_key_across_batches_and_lanes(self) -> None:
+        """Test that a key moving between a batch and a lane keeps its order"""
+        bus, injector = make_batch_bus(4)
+
+        await bus.dispatch_many(
+            [
+                KeyedCommand("a", 0),
+                BatchKeyedCommand("a", 1),
+                BatchKeyedCommand("b", 0),
+                KeyedCommand("b", 1),
+                BatchKeyedCommand("a", 2),
+                KeyedCommand("a", 3),
+            ]
+        )
+
+        done = injector.get(SlowKeyedCommandHandler).done
+        for key, count in (("a", 4), ("b", 2)):
+            assert [i for k, i in done if k == key] == list(range(count))
+
+
+class BlockingBatchCommandHandler(BatchRecordingCommandHandler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def handle_many(self, commands: Sequence[Command]) -> None:
+        await self.release.wait()
+        await super().handle_many(commands)
+
+
+def make_guarded_batch_bus() -> tuple[InMemoryCommandBus, Injector]:
+    def configure(binder: Binder) -> None:
+        binder.bind(BlockingBatchCommandHandler, scope=singleton)
+
+    injector = Injector([configure])
+    bus = injector.get(InMemoryCommandBus)
+    bus.register(SampleCommand, BlockingBatchCommandHandler)
+    bus.use(BulkheadMiddleware(BulkheadSettings(commands=BulkheadLimits(1, 0, 1000))))
+    bus.use(DeadlineMiddleware())
+    bus.freeze()
+    return bus, injector
+
+
+class TestInMemoryCommandBusDispatchManyMiddlewares:
+    @pytest.mark.unit
+    async def test_batches_take_a_bulkhead_slot(self) -> None:
+        """Test that a batch holds its command bulkhead while the handler runs"""
+        bus, injector = make_guarded_batch_bus()
+        handler = injector.get(BlockingBatchCommandHandler)
+
+        running = asyncio.create_task(bus.dispatch_many([SampleCommand()] * 3))
+        await asyncio.sleep(0)
+        with pytest.raises(ExceptionGroup) as raised:
+            await bus.dispatch_many([SampleCommand()] * 2)
+        handler.release.set()
+        await running
+
+        assert raised.value.subgroup(BulkheadRejectedError) is not None
+        assert [len(batch) for batch in handler.batches] == [3]
+
+    @pytest.mark.unit
+    async def test_expired_requests_skip_the_batch(self) -> None:
+        """Test that a batch of an expired request never reaches its handler"""
+        bus, injector = make_guarded_batch_bus()
+        handler = injector.get(BlockingBatchCommandHandler)
+        handler.release.set()
+
+        token = request_deadline.set(time.monotonic() - 1)
+        try:
+            with pytest.raises(ExceptionGroup) as raised:
+                await bus.dispatch_many([SampleCommand()] * 2)
+        finally:
+            request_deadline.reset(token)
+
+        assert raised.value.subgroup(DeadlineExceededError) is not None
+        assert handler.batches == []
@@ -0,0 +1,137 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from app.Contexts.Chat.Message.Domain.MessageCreatedEvent import MessageCreatedEvent
+from app.Contexts.Shared.Infrastructure.Bus.Event.Codec.BinaryEventCodec import (
+    BinaryEventCodec,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.Codec.EventSchemaRegistry import (
+    EventSchemaRegistry,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.Codec.JsonEventCodec import (
+    JsonEventCodec,
+)
+
+
+def make_event() -> MessageCreatedEvent:
+    return MessageCreatedEvent(
+        message_id="5b3e4c1a-8f0e-4b8e-9b4a-2f1d3c4e5a6b",
+        conversation_id="9c8d7e6f-5a4b-4c3d-8e2f-1a0b9c8d7e6f",
+        content="Hola, ¿qué tal?",
+    )
+
+
+class TestBinaryEventCodec:
+    @pytest.fixture
+    def registry(self) -> EventSchemaRegistry:
+        return EventSchemaRegistry()
+
+    @pytest.fixture
+    def codec(self, registry: EventSchemaRegistry) -> BinaryEventCodec:
+        return BinaryEventCodec(registry)
+
+    @pytest.mark.unit
+    def test_round_trip(self, codec: BinaryEventCodec) -> None:
+        """Test that a decoded event matches the JSON representation"""
+        event = make_event()
+
+        decoded = codec.decode(codec.encode(event))
+
+        assert decoded == JsonEventCodec().decode(JsonEventCodec().encode(event))
+        assert decoded["event_id"] == event.id
+        assert datetime.fromisoformat(decoded["occurred_on"]) == event.occurred_on
+
+    @pytest.mark.unit
+    def test_is_smaller_than_json(self, codec: BinaryEventCodec) -> None:
+        """Test that the binary encoding is substantially smaller than JSON"""
+        event = make_event()
+
+        binary_size = len(codec.encode(event))
+        json_size = len(JsonEventCodec().encode(event))
+
+        assert binary_size < json_size * 0.6
+
+    @pytest.mark.unit
+    def test_keeps_fields_outside_the_schema(self, codec: BinaryEventCodec) -> None:
+        """Test that payload keys missing from the schema survive the round trip"""
+        event = make_event()
+        event.payload["edited"] = True
+        event.payload["attachments"] = [{"size": 3, "ratio": 0.5}]
+
+        decoded = codec.decode(codec.encode(event))
+
+        assert decoded["payload"]["edited"] is True
+        assert decoded["payload"]["attachments"] == [{"size": 3, "ratio": 0.5}]
+
+    @pytest.mark.unit
+    def test_encodes_typed_values(self, codec: BinaryEventCodec) -> None:
+        """Test that scalar payload values keep their types"""
+        event = make_event()
+        event.payload.update(
+            {"message_id": None, "conversation_id": -(2**40), "content": 1.25}
+        )
+
+        payload = codec.decode(codec.encode(event))["payload"]
+
+        assert payload["message_id"] is None
+        assert payload["conversation_id"] == -(2**40)
+        assert payload["content"] == 1.25
+
+    @pytest.mark.unit
+    def test_decodes_with_the_writer_schema_version(
+        self, codec: BinaryEventCodec, registry: EventSchemaRegistry
+    ) -> None:
+        """Test that records written with another schema version use that schema"""
+        event = make_event()
+        data = codec.encode(event)
+        consumer_registry = EventSchemaRegistry()
+        consumer_registry.register(
+            "MessageCreatedEvent", 1, ("message_id", "conversation_id", "content")
+        )
+
+        decoded = BinaryEventCodec(consumer_registry).decode(data)
+
+        assert decoded["payload"] == event.payload
+
+    @pytest.mark.unit
+    def test_rejects_payloads_missing_schema_fields(
+        self, codec: BinaryEventCodec
+    ) -> None:
+        """Test that a schema field absent from the payload is not decoded as None"""
+        event = make_event()
+        del event.payload["content"]
+        event.payload["edited"] = True
+
+        data = codec.encode(event)
+
+        with pytest.raises(ValueError, match="content"):
+            codec.decode(data)
+
+    @pytest.mark.unit
+    def test_rejects_unknown_schemas(self, codec: BinaryEventCodec) -> None:
+        """Test that decoding fails when the schema version is not registered"""
+        data = codec.encode(make_event())
+
+        with pytest.raises(ValueError):
+            BinaryEventCodec(EventSchemaRegistry()).decode(data)
+
+    @pytest.mark.unit
+    def test_registry_rejects_conflicting_schemas(
+        self, registry: EventSchemaRegistry
+    ) -> None:
+        """Test that a schema version cannot be redefined with other fields"""
+        registry.register("MessageCreatedEvent", 1, ("message_id",))
+
+        with pytest.raises(ValueError):
+            registry.register("MessageCreatedEvent", 1, ("content",))
+
+    @pytest.mark.unit
+    def test_preserves_microsecond_timestamps(self, codec: BinaryEventCodec) -> None:
+        """Test that occurred_on keeps microsecond precision"""
+        event = make_event()
+        event._occurred_on = datetime(2024, 5, 17, 10, 30, 15, 123456, tzinfo=UTC)
+
+        decoded = codec.decode(codec.encode(event))
+
+        assert decoded["occurred_on"] == "2024-05-17T10:30:15.123456+00:00"
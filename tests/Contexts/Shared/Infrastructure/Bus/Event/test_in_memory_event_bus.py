@@ -0,0 +1,200 @@
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+from injector import Injector
+
+from app.Contexts.Shared.Application.Bus.Event.EventBus import EventBus
+from app.Contexts.Shared.Application.Bus.Event.EventListener import EventListener
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Bootstrap.KafkaModule import KafkaModule
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryEventBus import (
+    InMemoryEventBus,
+)
+from app.Contexts.Shared.Infrastructure.Settings.EventBusSettings import (
+    EventBusSettings,
+)
+
+
+class SampleEvent(DomainEvent):
+    @classmethod
+    def event_name(cls) -> str:
+        return "sample.event"
+
+
+class RecordingListener(EventListener):
+    def __init__(self) -> None:
+        self.events: list[DomainEvent] = []
+
+    async def listen(self, event: DomainEvent) -> None:
+        self.events.append(event)
+
+
+class BlockingListener(RecordingListener):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def listen(self, event: DomainEvent) -> None:
+        await self.release.wait()
+        await super().listen(event)
+
+
+class FailingListener(RecordingListener):
+    async def listen(self, event: DomainEvent) -> None:
+        if not self.events:
+            self.events.append(event)
+            raise RuntimeError("listener error")
+        await super().listen(event)
+
+
+def make_bus(**settings: int) -> InMemoryEventBus:
+    injector = Mock()
+    injector.get.side_effect = lambda listener_class: listener_class()
+    return InMemoryEventBus(injector, EventBusSettings(**settings))
+
+
+class TestInMemoryEventBus:
+    @pytest.mark.unit
+    async def test_fans_out_to_every_listener(self) -> None:
+        """Test that each listener of an event receives it"""
+        bus = make_bus()
+        first, second = RecordingListener(), RecordingListener()
+        bus.subscribe(SampleEvent, first)
+        bus.subscribe(SampleEvent, second)
+        events: list[DomainEvent] = [SampleEvent(payload={}), SampleEvent(payload={})]
+
+        await bus.publish(events)
+        await bus.stop()
+
+        assert first.events == events
+        assert second.events == events
+        assert bus.metrics()["processed"] == 4
+
+    @pytest.mark.unit
+    async def test_resolves_registered_listeners_with_the_injector(self) -> None:
+        """Test that listener classes are built once when the bus starts"""
+        bus = make_bus()
+        bus.register(SampleEvent, RecordingListener)
+
+        await bus.publish([SampleEvent(payload={})])
+        await bus.publish([SampleEvent(payload={})])
+        await bus.stop()
+
+        bus._injector.get.assert_called_once_with(RecordingListener)  # type: ignore[attr-defined]
+        assert bus.metrics()["processed"] == 2
+
+    @pytest.mark.unit
+    async def test_slow_listener_does_not_block_publish(self) -> None:
+        """Test that publishing returns while a listener is still busy"""
+        bus = make_bus()
+        slow, fast = BlockingListener(), RecordingListener()
+        bus.subscribe(SampleEvent, slow)
+        bus.subscribe(SampleEvent, fast)
+
+        await asyncio.wait_for(bus.publish([SampleEvent(payload={})]), timeout=1)
+        await asyncio.sleep(0)
+
+        assert len(fast.events) == 1
+        assert slow.events == []
+        slow.release.set()
+        await bus.stop()
+        assert len(slow.events) == 1
+
+    @pytest.mark.unit
+    async def test_local_listeners_run_before_publish_returns(self) -> None:
+        """Test that local listeners see the event even while the queues are busy"""
+        bus = make_bus(queue_size=1)
+        slow = BlockingListener()
+        local = FailingListener()
+        bus.subscribe(SampleEvent, slow)
+        bus.subscribe_local(SampleEvent, local)
+        events = [SampleEvent(payload={}), SampleEvent(payload={})]
+
+        await bus.publish(events)
+
+        assert local.events == events
+        assert slow.events == []
+        slow.release.set()
+        await bus.stop()
+
+    @pytest.mark.unit
+    async def test_drops_events_when_the_queue_is_full(self) -> None:
+        """Test that a full queue drops events and reports it"""
+        bus = make_bus(queue_size=2)
+        slow = BlockingListener()
+        bus.subscribe(SampleEvent, slow)
+
+        await bus.publish([SampleEvent(payload={}) for _ in range(5)])
+        await asyncio.sleep(0)
+        await bus.publish([SampleEvent(payload={})])
+
+        listener_metrics = bus.metrics()["listeners"][0]
+        assert listener_metrics["capacity"] == 2
+        assert listener_metrics["overflows"] == 3
+        assert listener_metrics["dropped"] == 3
+        assert listener_metrics["enqueued"] == 3
+        slow.release.set()
+        await bus.stop()
+
+    @pytest.mark.unit
+    async def test_waits_for_room_before_dropping(self) -> None:
+        """Test that the overflow timeout lets a publish wait for the queue"""
+        bus = make_bus(queue_size=1, overflow_timeout_ms=1000)
+        slow = BlockingListener()
+        bus.subscribe(SampleEvent, slow)
+        await bus.publish([SampleEvent(payload={}), SampleEvent(payload={})])
+
+        publish = asyncio.create_task(bus.publish([SampleEvent(payload={})]))
+        await asyncio.sleep(0.01)
+        slow.release.set()
+        await publish
+        await bus.stop()
+
+        assert len(slow.events) == 3
+        assert bus.metrics()["overflows"] == 2
+        assert bus.metrics()["dropped"] == 0
+
+    @pytest.mark.unit
+    async def test_listener_errors_are_counted(self) -> None:
+        """Test that a failing listener keeps processing later events"""
+        bus = make_bus()
+        listener = FailingListener()
+        bus.subscribe(SampleEvent, listener)
+
+        await bus.publish([SampleEvent(payload={}), SampleEvent(payload={})])
+        await bus.stop()
+
+        assert len(listener.events) == 2
+        assert bus.metrics()["failed"] == 1
+        assert bus.metrics()["processed"] == 1
+
+    @pytest.mark.unit
+    async def test_publish_after_stop_drops_events(self) -> None:
+        """Test that publishing on a stopped bus does not restart its workers"""
+        bus = make_bus()
+        listener = RecordingListener()
+        local = RecordingListener()
+        bus.subscribe(SampleEvent, listener)
+        bus.subscribe_local(SampleEvent, local)
+        await bus.start()
+        await bus.stop()
+
+        event = SampleEvent(payload={})
+        await bus.publish([event])
+        await asyncio.sleep(0)
+
+        assert listener.events == []
+        assert local.events == [event]
+        assert not bus.metrics()["running"]
+        assert bus.metrics()["dropped_after_stop"] == 1
+
+
+class TestKafkaModuleEventBus:
+    @pytest.mark.unit
+    @patch.dict("os.environ", {"KAFKA_ENABLED": "false"})
+    def test_binds_in_memory_bus_when_kafka_is_disabled(self) -> None:
+        """Test that a deployment without Kafka gets the in-process event bus"""
+        injector = Injector([KafkaModule()])
+
+        assert isinstance(injector.get(EventBus), InMemoryEventBus)  # type: ignore[type-abstract]
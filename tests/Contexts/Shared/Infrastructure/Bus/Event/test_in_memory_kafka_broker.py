@@ -0,0 +1,232 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from aiokafka import TopicPartition
+
+from app.Contexts.Shared.Application.Bus.Event.EventListener import EventListener
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaBroker import (
+    InMemoryKafkaBroker,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaClientFactory import (
+    InMemoryKafkaClientFactory,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaConsumer import (
+    InMemoryKafkaConsumer,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaConsumerClient import (
+    KafkaConsumerClient,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBus import KafkaEventBus
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+
+class OrderPlaced(DomainEvent):
+    def __init__(self, order_id: str) -> None:
+        super().__init__({"order_id": order_id}, aggregate_id=order_id)
+
+    @classmethod
+    def event_name(cls) -> str:
+        return "order.placed"
+
+
+class RecordingListener(EventListener):
+    def __init__(self, expected: int) -> None:
+        self.events: list[DomainEvent] = []
+        self.done = asyncio.Event()
+        self._expected = expected
+
+    async def listen(self, event: DomainEvent) -> None:
+        self.events.append(event)
+        if len(self.events) == self._expected:
+            self.done.set()
+
+
+class FailingOnceListener(RecordingListener):
+    async def listen(self, event: DomainEvent) -> None:
+        await super().listen(event)
+        if len(self.events) == 1:
+            raise RuntimeError("boom")
+
+
+class FlakyConsumer(InMemoryKafkaConsumer):
+    """Consumer en memoria cuyos primeros fetch fallan"""
+
+    errors = 2
+
+    async def getmany(self, *args: Any, **kwargs: Any) -> Any:
+        if self.errors:
+            self.errors -= 1
+            raise ConnectionError("broker caído")
+        return await super().getmany(*args, **kwargs)
+
+
+class FlakyConsumerFactory(InMemoryKafkaClientFactory):
+    def create_consumer(self, settings: KafkaSettings) -> KafkaConsumerClient:
+        return FlakyConsumer(
+            self._broker,
+            group_id=settings.consumer_group_id,
+            auto_offset_reset=settings.auto_offset_reset,
+            enable_auto_commit=settings.enable_auto_commit,
+            max_poll_records=settings.max_poll_records,
+        )
+
+
+class TestInMemoryKafkaBroker:
+    @pytest.mark.unit
+    def test_same_key_goes_to_same_partition(self) -> None:
+        """Test that records with the same key share a partition and get offsets in order"""
+        broker = InMemoryKafkaBroker()
+
+        first = broker.produce("orders", b"1", key=b"order-1")
+        second = broker.produce("orders", b"2", key=b"order-1")
+
+        assert first.partition == second.partition
+        assert (first.offset, second.offset) == (0, 1)
+
+    @pytest.mark.unit
+    async def test_group_members_split_partitions(self) -> None:
+        """Test that consumers of one group get disjoint partitions"""
+        broker = InMemoryKafkaBroker(partitions=4)
+        first = InMemoryKafkaConsumer(broker, "group")
+        second = InMemoryKafkaConsumer(broker, "group")
+        for consumer in (first, second):
+            consumer.subscribe(topics=["orders"])
+            await consumer.start()
+
+        await first.getmany()
+        await second.getmany()
+
+        assert len(first.assignment()) == 2
+        assert len(second.assignment()) == 2
+        assert first.assignment().isdisjoint(second.assignment())
+
+    @pytest.mark.unit
+    async def test_resumes_from_committed_offset(self) -> None:
+        """Test that a new member of the group starts after the committed offset"""
+        broker = InMemoryKafkaBroker(partitions=1)
+        for value in (b"a", b"b", b"c"):
+            broker.produce("orders", value)
+        broker.commit("group", {TopicPartition("orders", 0): 2})
+
+        consumer = InMemoryKafkaConsumer(broker, "group", auto_offset_reset="earliest")
+        consumer.subscribe(topics=["orders"])
+        await consumer.start()
+        records = await consumer.getmany()
+
+        assert [record.value for record in records[TopicPartition("orders", 0)]] == [
+            b"c"
+        ]
+
+    @pytest.mark.unit
+    async def test_getmany_wakes_up_on_new_records(self) -> None:
+        """Test that a long poll returns as soon as a record is produced"""
+        broker = InMemoryKafkaBroker(partitions=1)
+        consumer = InMemoryKafkaConsumer(broker, "group")
+        consumer.subscribe(topics=["orders"])
+        await consumer.start()
+        await consumer.getmany()
+
+        poll = asyncio.create_task(consumer.getmany(timeout_ms=10000))
+        await asyncio.sleep(0)
+        broker.produce("orders", b"a")
+
+        records = await asyncio.wait_for(poll, timeout=1)
+        assert sum(len(batch) for batch in records.values()) == 1
+
+
+class TestKafkaEventBusInMemory:
+    @pytest.mark.unit
+    async def test_publishes_and_consumes_end_to_end(self) -> None:
+        """Test that events round-trip through the bus with their identity intact"""
+        settings = KafkaSettings(
+            bootstrap_servers=["localhost:9092"],
+            topics_prefix="test",
+            consumer_group_id="test-group",
+            commit_batch_size=1,
+            transport="memory",
+        )
+        broker = InMemoryKafkaBroker()
+        bus = KafkaEventBus(settings, AsyncMock(), InMemoryKafkaClientFactory(broker))
+        listener = RecordingListener(expected=3)
+        bus.subscribe(OrderPlaced, listener)
+        events = [OrderPlaced(f"order-{index}") for index in range(3)]
+
+        await bus.start()
+        try:
+            await bus.publish(events)
+            await asyncio.wait_for(listener.done.wait(), timeout=5)
+        finally:
+            await bus.stop()
+
+        received = sorted(listener.events, key=lambda event: event.aggregate_id or "")
+        assert [event.id for event in received] == [event.id for event in events]
+        assert [event.occurred_on for event in received] == [
+            event.occurred_on for event in events
+        ]
+        assert all(isinstance(event, OrderPlaced) for event in received)
+        assert sum(
+            broker.committed("test-group", partition) or 0
+            for partition in broker.partitions_for("test.OrderPlaced")
+        ) == len(events)
+
+    @pytest.mark.unit
+    async def test_unrouted_failures_are_read_again(self) -> None:
+        """Test that a record whose failure cannot be rerouted does not stall its partition"""
+        settings = KafkaSettings(
+            bootstrap_servers=["localhost:9092"],
+            topics_prefix="test",
+            consumer_group_id="test-group",
+            commit_batch_size=1,
+            retry_backoff_ms=10,
+            transport="memory",
+        )
+        broker = InMemoryKafkaBroker(partitions=1)
+        bus = KafkaEventBus(settings, AsyncMock(), InMemoryKafkaClientFactory(broker))
+        listener = FailingOnceListener(expected=2)
+        bus.subscribe(OrderPlaced, listener)
+        partition = TopicPartition("test.OrderPlaced", 0)
+
+        await bus.start()
+        try:
+            assert bus._producer is not None
+            # El fallo del listener no se puede reenviar al topic de reintento
+            bus._producer.send_and_wait = AsyncMock(  # type: ignore[method-assign]
+                side_effect=RuntimeError("broker down")
+            )
+            await bus.publish([OrderPlaced("order-1")])
+            await asyncio.wait_for(listener.done.wait(), timeout=5)
+            while broker.committed("test-group", partition) != 1:
+                await asyncio.sleep(0.01)
+        finally:
+            await bus.stop()
+
+        assert listener.events[0].id == listener.events[1].id
+        assert bus._commit_manager.tracked(partition) == 0
+
+    @pytest.mark.unit
+    async def test_consumer_keeps_polling_after_an_error(self) -> None:
+        """Test that a failing poll is retried instead of stopping consumption"""
+        settings = KafkaSettings(
+            bootstrap_servers=["localhost:9092"],
+            topics_prefix="test",
+            consumer_group_id="test-group",
+            commit_batch_size=1,
+            retry_backoff_ms=10,
+            transport="memory",
+        )
+        broker = InMemoryKafkaBroker(partitions=1)
+        bus = KafkaEventBus(settings, AsyncMock(), FlakyConsumerFactory(broker))
+        listener = RecordingListener(expected=1)
+        bus.subscribe(OrderPlaced, listener)
+
+        await bus.start()
+        try:
+            await bus.publish([OrderPlaced("order-1")])
+            await asyncio.wait_for(listener.done.wait(), timeout=5)
+        finally:
+            await bus.stop()
+
+        assert bus.metrics()["consumer_errors"] == 2
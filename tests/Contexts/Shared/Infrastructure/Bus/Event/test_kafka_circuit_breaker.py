@@ -0,0 +1,105 @@
+import pytest
+
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaCircuitBreaker import (
+    KafkaCircuitBreaker,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestKafkaCircuitBreaker:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def breaker(self, clock: FakeClock) -> KafkaCircuitBreaker:
+        return KafkaCircuitBreaker(
+            failure_threshold=3, reset_timeout_ms=1000, clock=clock
+        )
+
+    @pytest.mark.unit
+    def test_opens_after_consecutive_failures(
+        self, breaker: KafkaCircuitBreaker
+    ) -> None:
+        """Test that the circuit opens once the failure threshold is reached"""
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.allow_request() is True
+
+        breaker.record_failure()
+
+        assert breaker.state == KafkaCircuitBreaker.OPEN
+        assert breaker.allow_request() is False
+
+    @pytest.mark.unit
+    def test_success_resets_failure_count(self, breaker: KafkaCircuitBreaker) -> None:
+        """Test that only consecutive failures open the circuit"""
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.is_closed is True
+
+    @pytest.mark.unit
+    def test_half_open_allows_a_single_probe(
+        self, breaker: KafkaCircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test that after the reset timeout exactly one probe goes through"""
+        breaker.trip()
+        clock.now = 1.0
+
+        assert breaker.allow_request() is True
+        assert breaker.state == KafkaCircuitBreaker.HALF_OPEN
+        assert breaker.allow_request() is False
+
+    @pytest.mark.unit
+    def test_failed_probe_reopens_the_circuit(
+        self, breaker: KafkaCircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test that a failed probe waits a full reset timeout again"""
+        breaker.trip()
+        clock.now = 1.0
+        breaker.allow_request()
+
+        breaker.record_failure()
+        clock.now = 1.5
+
+        assert breaker.state == KafkaCircuitBreaker.OPEN
+        assert breaker.allow_request() is False
+        assert breaker.snapshot()["trips"] == 2
+
+    @pytest.mark.unit
+    def test_successful_probe_closes_the_circuit(
+        self, breaker: KafkaCircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test that a successful probe closes the circuit"""
+        breaker.trip()
+        clock.now = 1.0
+        breaker.allow_request()
+
+        breaker.record_success()
+
+        assert breaker.is_closed is True
+
+    @pytest.mark.unit
+    def test_released_probe_can_be_retried(
+        self, breaker: KafkaCircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test that a probe that sent nothing neither closes nor waits another period"""
+        breaker.trip()
+        clock.now = 1.0
+        breaker.allow_request()
+
+        breaker.release_probe()
+
+        assert breaker.state == KafkaCircuitBreaker.OPEN
+        assert breaker.allow_request() is True
+        assert breaker.snapshot()["trips"] == 1
@@ -0,0 +1,119 @@
+from unittest.mock import Mock
+
+import pytest
+from aiokafka import TopicPartition
+
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaConsumerMetrics import (
+    KafkaConsumerMetrics,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaOffsetCommitManager import (
+    KafkaOffsetCommitManager,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaPartitionDispatcher import (
+    KafkaPartitionDispatcher,
+)
+
+PARTITION = TopicPartition("yurest.MessageCreatedEvent", 0)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestKafkaConsumerMetrics:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def commit_manager(self) -> Mock:
+        commit_manager = Mock(spec=KafkaOffsetCommitManager)
+        commit_manager.committed_offset.return_value = None
+        return commit_manager
+
+    @pytest.fixture
+    def consumer(self) -> Mock:
+        consumer = Mock()
+        consumer.assignment.return_value = {PARTITION}
+        consumer.highwater.return_value = 150
+        return consumer
+
+    @pytest.fixture
+    def metrics(
+        self, commit_manager: Mock, consumer: Mock, clock: FakeClock
+    ) -> KafkaConsumerMetrics:
+        dispatcher = Mock(spec=KafkaPartitionDispatcher)
+        dispatcher.queue_size.return_value = 7
+        dispatcher.is_paused.return_value = False
+        dispatcher.in_flight.return_value = 7
+        metrics = KafkaConsumerMetrics(commit_manager, dispatcher, clock)
+        metrics.attach(consumer)
+        return metrics
+
+    @pytest.mark.unit
+    def test_lag_uses_committed_offset(
+        self, metrics: KafkaConsumerMetrics, commit_manager: Mock
+    ) -> None:
+        """Test that lag is end offset minus committed offset"""
+        commit_manager.committed_offset.return_value = 100
+        metrics.record_fetched(PARTITION, 119)
+
+        assert metrics.lag(PARTITION) == 50
+
+    @pytest.mark.unit
+    def test_lag_falls_back_to_position(self, metrics: KafkaConsumerMetrics) -> None:
+        """Test that without commits the fetch position is used"""
+        metrics.record_fetched(PARTITION, 119)
+
+        assert metrics.lag(PARTITION) == 30
+
+    @pytest.mark.unit
+    def test_lag_is_unknown_for_unassigned_partitions(
+        self, metrics: KafkaConsumerMetrics, consumer: Mock
+    ) -> None:
+        """Test that lag is None when the end offset is unknown"""
+        consumer.assignment.return_value = set()
+        metrics.record_fetched(PARTITION, 119)
+
+        assert metrics.lag(PARTITION) is None
+
+    @pytest.mark.unit
+    def test_processing_rate_is_smoothed(
+        self, metrics: KafkaConsumerMetrics, clock: FakeClock
+    ) -> None:
+        """Test that the processing rate is updated once per window"""
+        metrics.record_fetched(PARTITION, 0)
+        for _ in range(9):
+            metrics.record_processed(PARTITION)
+        clock.now = 1.0
+        metrics.record_processed(PARTITION)
+
+        partition = metrics.snapshot()["partitions"]["yurest.MessageCreatedEvent-0"]
+        assert partition["processed"] == 10
+        assert partition["processing_rate"] == 3.0
+
+    @pytest.mark.unit
+    def test_snapshot_reports_totals(self, metrics: KafkaConsumerMetrics) -> None:
+        """Test the aggregated view used for monitoring and autoscaling"""
+        metrics.record_fetched(PARTITION, 119)
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot["total_lag"] == 30
+        assert snapshot["in_flight"] == 7
+        assert snapshot["paused_partitions"] == 0
+        assert (
+            snapshot["partitions"]["yurest.MessageCreatedEvent-0"]["end_offset"] == 150
+        )
+
+    @pytest.mark.unit
+    def test_forget_removes_partition(self, metrics: KafkaConsumerMetrics) -> None:
+        """Test that revoked partitions disappear from the snapshot"""
+        metrics.record_fetched(PARTITION, 1)
+        metrics.forget([PARTITION])
+
+        assert metrics.snapshot()["partitions"] == {}
@@ -0,0 +1,134 @@
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.Contexts.Shared.Application.Bus.Event.EventListener import EventListener
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBus import KafkaEventBus
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+
+class SampleEvent(DomainEvent):
+    @classmethod
+    def event_name(cls) -> str:
+        return "sample.event"
+
+
+class RecordingListener(EventListener):
+    def __init__(self) -> None:
+        self.events: list[DomainEvent] = []
+
+    async def listen(self, event: DomainEvent) -> None:
+        self.events.append(event)
+
+
+class OtherListener(RecordingListener):
+    pass
+
+
+def event_data(event: DomainEvent) -> dict[str, Any]:
+    return {
+        "event_name": "SampleEvent",
+        "event_id": event.id,
+        "aggregate_id": None,
+        "occurred_on": event.occurred_on.isoformat(),
+        "payload": event.payload,
+    }
+
+
+class TestKafkaEventBusDispatch:
+    @pytest.fixture
+    def injector(self) -> Mock:
+        injector = Mock()
+        injector.get.side_effect = lambda listener_class: listener_class()
+        return injector
+
+    @pytest.fixture
+    def bus(self, injector: Mock) -> KafkaEventBus:
+        settings = KafkaSettings(
+            bootstrap_servers=["localhost:9092"],
+            topics_prefix="test",
+            consumer_group_id="test-group",
+        )
+        return KafkaEventBus(settings, injector, Mock())
+
+    @pytest.mark.unit
+    async def test_resolves_listener_classes_once(
+        self, bus: KafkaEventBus, injector: Mock
+    ) -> None:
+        """Test that listener classes are resolved once, not per message"""
+        bus.register(SampleEvent, RecordingListener)
+        bus._warm_dispatch_table()
+
+        for _ in range(3):
+            event = SampleEvent(payload={})
+            assert await bus._dispatch("SampleEvent", event_data(event)) == []
+
+        injector.get.assert_called_once_with(RecordingListener)
+        listener = bus._resolve_listeners("SampleEvent")[0][1]
+        assert isinstance(listener, RecordingListener)
+        assert len(listener.events) == 3
+
+    @pytest.mark.unit
+    async def test_reconstructs_the_event_once_for_all_listeners(
+        self, bus: KafkaEventBus
+    ) -> None:
+        """Test that every listener receives the same decoded event object"""
+        bus.register(SampleEvent, RecordingListener)
+        subscribed = OtherListener()
+        bus.subscribe(SampleEvent, subscribed)
+        event = SampleEvent(payload={"key": "value"})
+
+        with patch.object(
+            bus, "_reconstruct_event", wraps=bus._reconstruct_event
+        ) as reconstruct:
+            await bus._dispatch("SampleEvent", event_data(event))
+
+        reconstruct.assert_called_once()
+        registered = bus._resolve_listeners("SampleEvent")[0][1]
+        assert isinstance(registered, RecordingListener)
+        assert registered.events[0] is subscribed.events[0]
+        assert subscribed.events[0].id == event.id
+
+    @pytest.mark.unit
+    async def test_late_registration_refreshes_dispatch_table(
+        self, bus: KafkaEventBus
+    ) -> None:
+        """Test that a listener registered after warm-up also receives events"""
+        bus.register(SampleEvent, RecordingListener)
+        bus._warm_dispatch_table()
+        late = OtherListener()
+        bus.subscribe(SampleEvent, late)
+
+        await bus._dispatch("SampleEvent", event_data(SampleEvent(payload={})))
+
+        assert len(late.events) == 1
+
+    @pytest.mark.unit
+    async def test_resolution_errors_fail_each_listener(
+        self, bus: KafkaEventBus, injector: Mock
+    ) -> None:
+        """Test that a listener that cannot be built is reported as a failure"""
+        injector.get.side_effect = RuntimeError("no binding")
+        bus.register(SampleEvent, RecordingListener)
+        bus._warm_dispatch_table()
+
+        failures = await bus._dispatch(
+            "SampleEvent", event_data(SampleEvent(payload={}))
+        )
+
+        assert [name for name, _ in failures] == ["RecordingListener"]
+
+    @pytest.mark.unit
+    async def test_local_listeners_run_without_a_broker(
+        self, bus: KafkaEventBus
+    ) -> None:
+        """Test that local listeners receive published events even if nothing is sent"""
+        local = RecordingListener()
+        bus.subscribe_local(SampleEvent, local)
+        event = SampleEvent(payload={})
+
+        await bus.publish([event])
+
+        assert local.events == [event]
@@ -0,0 +1,95 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from app.Contexts.Shared.Application.Bus.Event.EventListener import EventListener
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBus import KafkaEventBus
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+
+class FirstEvent(DomainEvent):
+    @classmethod
+    def event_name(cls) -> str:
+        return "first.event"
+
+
+class SecondEvent(DomainEvent):
+    @classmethod
+    def event_name(cls) -> str:
+        return "second.event"
+
+
+class ThirdEvent(DomainEvent):
+    @classmethod
+    def event_name(cls) -> str:
+        return "third.event"
+
+
+class TestKafkaEventBusSubscription:
+    @pytest.fixture
+    def consumer(self) -> Mock:
+        return Mock()
+
+    @pytest.fixture
+    def bus(self, consumer: Mock) -> KafkaEventBus:
+        settings = KafkaSettings(
+            bootstrap_servers=["localhost:9092"],
+            topics_prefix="test",
+            consumer_group_id="test-group",
+            max_retries=0,
+            subscription_debounce_ms=10,
+        )
+        bus = KafkaEventBus(settings, Mock(), Mock())
+        bus.subscribe(FirstEvent, Mock(spec=EventListener))
+        # Consumer ya iniciado con la suscripción inicial
+        bus._consumer = consumer
+        bus._subscribed_topics = bus._topics()
+        bus._is_running = True
+        return bus
+
+    @pytest.mark.unit
+    async def test_late_listeners_extend_the_running_subscription(
+        self, bus: KafkaEventBus, consumer: Mock
+    ) -> None:
+        """Test that listeners registered at runtime are subscribed in place"""
+        bus.subscribe(SecondEvent, Mock(spec=EventListener))
+        assert bus._subscription_task is not None
+        await bus._subscription_task
+
+        consumer.subscribe.assert_called_once()
+        assert consumer.subscribe.call_args.kwargs["topics"] == [
+            "test.FirstEvent",
+            "test.SecondEvent",
+        ]
+        assert bus._consumer is consumer
+
+    @pytest.mark.unit
+    async def test_registrations_are_batched_into_one_rebalance(
+        self, bus: KafkaEventBus, consumer: Mock
+    ) -> None:
+        """Test that a burst of registrations triggers a single subscribe"""
+        bus.subscribe(SecondEvent, Mock(spec=EventListener))
+        bus.register(ThirdEvent, EventListener)
+        assert bus._subscription_task is not None
+        await bus._subscription_task
+
+        consumer.subscribe.assert_called_once()
+        assert consumer.subscribe.call_args.kwargs["topics"] == [
+            "test.FirstEvent",
+            "test.SecondEvent",
+            "test.ThirdEvent",
+        ]
+
+    @pytest.mark.unit
+    async def test_known_events_do_not_resubscribe(
+        self, bus: KafkaEventBus, consumer: Mock
+    ) -> None:
+        """Test that another listener for a subscribed event causes no rebalance"""
+        bus.subscribe(FirstEvent, Mock(spec=EventListener))
+        if bus._subscription_task is not None:
+            await bus._subscription_task
+        await asyncio.sleep(0)
+
+        consumer.subscribe.assert_not_called()
@@ -0,0 +1,156 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from aiokafka import ConsumerRecord, TopicPartition
+
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBus import KafkaEventBus
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventDeduplicator import (
+    KafkaEventDeduplicator,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventHeaders import (
+    KafkaEventHeaders,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaRetryRouter import (
+    KafkaRetryRouter,
+)
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+PARTITION = TopicPartition("test.SampleEvent", 0)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_record(offset: int, headers: list[tuple[str, bytes]]) -> ConsumerRecord:
+    return ConsumerRecord(
+        topic=PARTITION.topic,
+        partition=PARTITION.partition,
+        offset=offset,
+        timestamp=0,
+        timestamp_type=0,
+        key=None,
+        value=b"{}",
+        checksum=None,
+        serialized_key_size=0,
+        serialized_value_size=2,
+        headers=headers,
+    )
+
+
+class TestKafkaEventDeduplicator:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.mark.unit
+    def test_detects_marked_ids(self, clock: FakeClock) -> None:
+        """Test that only marked ids are reported as seen"""
+        deduplicator = KafkaEventDeduplicator(capacity=10, ttl_ms=1000, clock=clock)
+        deduplicator.mark("event-1")
+
+        assert deduplicator.seen("event-1") is True
+        assert deduplicator.seen("event-2") is False
+
+    @pytest.mark.unit
+    def test_forgets_ids_after_ttl(self, clock: FakeClock) -> None:
+        """Test that ids leave the window once they expire"""
+        deduplicator = KafkaEventDeduplicator(capacity=10, ttl_ms=1000, clock=clock)
+        deduplicator.mark("event-1")
+
+        clock.now = 1.0
+
+        assert deduplicator.seen("event-1") is False
+        assert deduplicator.snapshot()["size"] == 0
+
+    @pytest.mark.unit
+    def test_evicts_oldest_ids_at_capacity(self, clock: FakeClock) -> None:
+        """Test that the window never holds more ids than its capacity"""
+        deduplicator = KafkaEventDeduplicator(capacity=2, ttl_ms=1000, clock=clock)
+        for event_id in ("event-1", "event-2", "event-3"):
+            deduplicator.mark(event_id)
+
+        assert deduplicator.seen("event-1") is False
+        assert deduplicator.seen("event-3") is True
+        assert deduplicator.snapshot()["size"] == 2
+
+    @pytest.mark.unit
+    def test_remarking_extends_the_window(self, clock: FakeClock) -> None:
+        """Test that marking an id again restarts its time to live"""
+        deduplicator = KafkaEventDeduplicator(capacity=10, ttl_ms=1000, clock=clock)
+        deduplicator.mark("event-1")
+        clock.now = 0.5
+        deduplicator.mark("event-1")
+        clock.now = 1.2
+
+        assert deduplicator.seen("event-1") is True
+
+    @pytest.mark.unit
+    def test_reports_hit_rate(self, clock: FakeClock) -> None:
+        """Test the hit rate exposed as a metric"""
+        deduplicator = KafkaEventDeduplicator(capacity=10, ttl_ms=1000, clock=clock)
+        deduplicator.mark("event-1")
+        deduplicator.seen("event-1")
+        deduplicator.seen("event-2")
+
+        assert deduplicator.snapshot() == {
+            "size": 1,
+            "checks": 2,
+            "hits": 1,
+            "hit_rate": 0.5,
+        }
+
+
+class TestKafkaEventBusDeduplication:
+    @pytest.fixture
+    def bus(self) -> KafkaEventBus:
+        settings = KafkaSettings(
+            bootstrap_servers=["localhost:9092"],
+            topics_prefix="test",
+            consumer_group_id="test-group",
+        )
+        bus = KafkaEventBus(settings, Mock(), Mock())
+        bus._process_message = AsyncMock(return_value=True)  # type: ignore[method-assign]
+        return bus
+
+    @pytest.mark.unit
+    async def test_skips_redelivered_events(self, bus: KafkaEventBus) -> None:
+        """Test that listeners do not run twice for the same event id"""
+        headers = [(KafkaEventHeaders.EVENT_ID_HEADER, b"event-1")]
+
+        await bus._handle_message(PARTITION, make_record(0, headers))
+        await bus._handle_message(PARTITION, make_record(1, headers))
+
+        assert bus._process_message.await_count == 1  # type: ignore[attr-defined]
+        assert bus.metrics()["deduplication"]["hits"] == 1
+
+    @pytest.mark.unit
+    async def test_retries_are_not_duplicates_of_the_original(
+        self, bus: KafkaEventBus
+    ) -> None:
+        """Test that a retry of a failed listener still runs"""
+        original = [(KafkaEventHeaders.EVENT_ID_HEADER, b"event-1")]
+        retry = original + [
+            (KafkaRetryRouter.ATTEMPT_HEADER, b"1"),
+            (KafkaRetryRouter.LISTENER_HEADER, b"SomeListener"),
+        ]
+
+        await bus._handle_message(PARTITION, make_record(0, original))
+        await bus._handle_message(PARTITION, make_record(1, retry))
+
+        assert bus._process_message.await_count == 2  # type: ignore[attr-defined]
+
+    @pytest.mark.unit
+    async def test_failed_events_are_not_marked(self, bus: KafkaEventBus) -> None:
+        """Test that an event that could not be processed is delivered again"""
+        headers = [(KafkaEventHeaders.EVENT_ID_HEADER, b"event-1")]
+        bus._process_message.return_value = False  # type: ignore[attr-defined]
+
+        await bus._handle_message(PARTITION, make_record(0, headers))
+        await bus._handle_message(PARTITION, make_record(0, headers))
+
+        assert bus._process_message.await_count == 2  # type: ignore[attr-defined]
@@ -0,0 +1,147 @@
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import orjson
+import pytest
+from aiokafka import ConsumerRecord
+
+from app.Contexts.Chat.Message.Domain.MessageCreatedEvent import MessageCreatedEvent
+from app.Contexts.Shared.Application.Bus.Event.EventListener import EventListener
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBus import KafkaEventBus
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventHeaders import (
+    KafkaEventHeaders,
+)
+from app.Contexts.Shared.Infrastructure.Http.Context.RequestContext import (
+    RequestContext,
+)
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+
+class SampleEvent(DomainEvent):
+    @classmethod
+    def event_name(cls) -> str:
+        return "sample.event"
+
+
+class UnheardEvent(DomainEvent):
+    @classmethod
+    def event_name(cls) -> str:
+        return "unheard.event"
+
+
+def make_record(
+    event: DomainEvent, headers: list[tuple[str, bytes]]
+) -> ConsumerRecord[Any, Any]:
+    value = orjson.dumps({"event_name": type(event).__name__, "payload": {}})
+    return ConsumerRecord(
+        topic="test.SampleEvent",
+        partition=0,
+        offset=0,
+        timestamp=0,
+        timestamp_type=0,
+        key=None,
+        value=value,
+        checksum=None,
+        serialized_key_size=0,
+        serialized_value_size=len(value),
+        headers=headers,
+    )
+
+
+class TestKafkaEventHeaders:
+    @pytest.mark.unit
+    def test_build_and_read_headers(self) -> None:
+        """Test that event metadata round-trips through record headers"""
+        event = SampleEvent(payload={})
+        record = make_record(event, KafkaEventHeaders.build(event, "json", "trace-1"))
+
+        assert KafkaEventHeaders.event_name(record) == "SampleEvent"
+        assert KafkaEventHeaders.event_id(record) == event.id
+        assert KafkaEventHeaders.schema_version(record) == 1
+        assert KafkaEventHeaders.trace_id(record) == "trace-1"
+
+    @pytest.mark.unit
+    def test_trace_id_is_optional(self) -> None:
+        """Test that events published outside a request carry no trace header"""
+        event = SampleEvent(payload={})
+        record = make_record(event, KafkaEventHeaders.build(event, "json"))
+
+        assert KafkaEventHeaders.trace_id(record) is None
+
+
+class TestKafkaEventBusHeaderRouting:
+    @pytest.fixture
+    def bus(self) -> KafkaEventBus:
+        settings = KafkaSettings(
+            bootstrap_servers=["localhost:9092"],
+            topics_prefix="test",
+            consumer_group_id="test-group",
+        )
+        return KafkaEventBus(settings, Mock(), Mock())
+
+    @pytest.mark.unit
+    async def test_skips_payload_of_events_without_listeners(
+        self, bus: KafkaEventBus
+    ) -> None:
+        """Test that records nobody listens to are acknowledged without decoding"""
+        bus.subscribe(SampleEvent, Mock(spec=EventListener))
+        event = UnheardEvent(payload={})
+        record = make_record(event, KafkaEventHeaders.build(event, "json"))
+
+        with patch.object(bus, "_deserialize_event") as deserialize:
+            assert await bus._process_message(record) is True
+
+        deserialize.assert_not_called()
+
+    @pytest.mark.unit
+    async def test_dispatches_with_publisher_trace_id(self, bus: KafkaEventBus) -> None:
+        """Test that listeners run under the trace id carried by the record"""
+        seen: list[str | None] = []
+
+        class TracingListener(EventListener):
+            async def listen(self, event: DomainEvent) -> None:
+                seen.append(RequestContext.get_trace_id())
+
+        bus.subscribe(SampleEvent, TracingListener())
+        event = SampleEvent(payload={})
+        record = make_record(event, KafkaEventHeaders.build(event, "json", "trace-1"))
+
+        with patch.object(bus, "_reconstruct_event", return_value=event):
+            assert await bus._process_message(record) is True
+
+        assert seen == ["trace-1"]
+        assert RequestContext.get_trace_id() is None
+
+    @pytest.mark.unit
+    async def test_falls_back_to_payload_without_headers(
+        self, bus: KafkaEventBus
+    ) -> None:
+        """Test that records published without headers are still routed"""
+        listener = Mock(spec=EventListener)
+        bus.subscribe(SampleEvent, listener)
+        event = SampleEvent(payload={})
+
+        with patch.object(bus, "_reconstruct_event", return_value=event):
+            assert await bus._process_message(make_record(event, [])) is True
+
+        listener.listen.assert_awaited_once_with(event)
+
+    @pytest.mark.unit
+    async def test_publishes_with_partition_key_and_headers(
+        self, bus: KafkaEventBus
+    ) -> None:
+        """Test that records are keyed by partition key and carry event headers"""
+        producer = AsyncMock()
+        producer.send.return_value = Mock()
+        bus._producer = producer
+        event = MessageCreatedEvent("msg-1", "conv-1", "Hola")
+
+        await bus.publish([event])
+
+        kwargs = producer.send.await_args.kwargs
+        assert kwargs["topic"] == "test.MessageCreatedEvent"
+        assert kwargs["key"] == b"conv-1"
+        assert (KafkaEventHeaders.EVENT_ID_HEADER, event.id.encode()) in kwargs[
+            "headers"
+        ]
@@ -0,0 +1,259 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from aiokafka import ConsumerRecord, TopicPartition
+
+from app.Contexts.Shared.Application.Bus.Event.EventListener import EventListener
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Bus.Event.Codec.JsonEventCodec import (
+    JsonEventCodec,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaBroker import (
+    InMemoryKafkaBroker,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaClientFactory import (
+    InMemoryKafkaClientFactory,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaConsumer import (
+    InMemoryKafkaConsumer,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaConsumerClient import (
+    KafkaConsumerClient,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBus import KafkaEventBus
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventHeaders import (
+    KafkaEventHeaders,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventReplayer import (
+    KafkaEventReplayer,
+)
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+TOPIC = "test.ItemAdded"
+
+
+class ItemAdded(DomainEvent):
+    def __init__(self, item_id: str) -> None:
+        super().__init__({"item_id": item_id}, aggregate_id=item_id)
+
+    @classmethod
+    def event_name(cls) -> str:
+        return "item.added"
+
+
+class ItemProjection(EventListener):
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.items: list[str] = []
+        self._fail_on = fail_on
+
+    async def listen(self, event: DomainEvent) -> None:
+        if event.payload["item_id"] == self._fail_on:
+            raise RuntimeError("projection error")
+        self.items.append(event.payload["item_id"])
+
+
+class SlowKafkaConsumer(InMemoryKafkaConsumer):
+    """Consumer cuyos primeros polls vuelven vacíos, como un fetch lento (-1: todos)"""
+
+    empty_polls = 1
+
+    async def getmany(
+        self,
+        *partitions: TopicPartition,
+        timeout_ms: int = 0,
+        max_records: int | None = None,
+    ) -> dict[TopicPartition, list[ConsumerRecord[Any, Any]]]:
+        if self.empty_polls != 0:
+            self.empty_polls -= 1
+            await asyncio.sleep(0.01)
+            return {}
+        return await super().getmany(
+            *partitions, timeout_ms=timeout_ms, max_records=max_records
+        )
+
+
+class SlowKafkaClientFactory(InMemoryKafkaClientFactory):
+    def __init__(self, broker: InMemoryKafkaBroker, empty_polls: int) -> None:
+        super().__init__(broker)
+        self._empty_polls = empty_polls
+
+    def create_consumer(self, settings: KafkaSettings) -> KafkaConsumerClient:
+        consumer = SlowKafkaConsumer(
+            self._broker,
+            group_id=settings.consumer_group_id,
+            auto_offset_reset=settings.auto_offset_reset,
+        )
+        consumer.empty_polls = self._empty_polls
+        return consumer
+
+
+class TestKafkaEventReplayer:
+    @pytest.fixture
+    def settings(self) -> KafkaSettings:
+        return KafkaSettings(
+            bootstrap_servers=["localhost:9092"],
+            topics_prefix="test",
+            consumer_group_id="test-group",
+        )
+
+    @pytest.fixture
+    def broker(self) -> InMemoryKafkaBroker:
+        return InMemoryKafkaBroker(partitions=2)
+
+    def produce(
+        self, broker: InMemoryKafkaBroker, item_ids: list[str], timestamp_ms: int = 0
+    ) -> None:
+        codec = JsonEventCodec()
+        for item_id in item_ids:
+            event = ItemAdded(item_id)
+            broker.produce(
+                TOPIC,
+                codec.encode(event),
+                key=item_id.encode(),
+                timestamp_ms=timestamp_ms,
+                headers=KafkaEventHeaders.build(event, codec.name),
+            )
+
+    def replayer(
+        self,
+        settings: KafkaSettings,
+        broker: InMemoryKafkaBroker,
+        projection: ItemProjection,
+        client_factory: InMemoryKafkaClientFactory | None = None,
+        idle_timeout_ms: int = 30000,
+    ) -> KafkaEventReplayer:
+        bus = KafkaEventBus(settings, AsyncMock(), InMemoryKafkaClientFactory(broker))
+        bus.subscribe(ItemAdded, projection)
+        return KafkaEventReplayer(
+            bus,
+            settings,
+            client_factory or InMemoryKafkaClientFactory(broker),
+            name="items",
+            batch_size=3,
+            checkpoint_interval=2,
+            idle_timeout_ms=idle_timeout_ms,
+        )
+
+    @pytest.mark.unit
+    async def test_replays_every_event_from_the_beginning(
+        self, settings: KafkaSettings, broker: InMemoryKafkaBroker
+    ) -> None:
+        """Test that a replay feeds the whole log to the listeners and checkpoints it"""
+        self.produce(broker, [f"item-{index}" for index in range(10)])
+        projection = ItemProjection()
+        progress_reports: list[dict[str, object]] = []
+
+        progress = await self.replayer(settings, broker, projection).run(
+            from_beginning=True, on_progress=progress_reports.append
+        )
+
+        assert sorted(projection.items) == sorted(f"item-{i}" for i in range(10))
+        assert progress["processed"] == progress["total"] == 10
+        assert progress["group_id"] == "test-group.replay.items"
+        assert progress_reports[-1]["processed"] == 10
+        assert (
+            sum(
+                broker.committed("test-group.replay.items", partition) or 0
+                for partition in broker.partitions_for(TOPIC)
+            )
+            == 10
+        )
+
+    @pytest.mark.unit
+    async def test_resumes_from_checkpoint(
+        self, settings: KafkaSettings, broker: InMemoryKafkaBroker
+    ) -> None:
+        """Test that a second run only replays events published since the first one"""
+        self.produce(broker, ["item-1", "item-2"])
+        await self.replayer(settings, broker, ItemProjection()).run()
+        self.produce(broker, ["item-3"])
+        projection = ItemProjection()
+
+        progress = await self.replayer(settings, broker, projection).run()
+
+        assert projection.items == ["item-3"]
+        assert progress["total"] == 1
+
+    @pytest.mark.unit
+    async def test_replays_from_timestamp(
+        self, settings: KafkaSettings, broker: InMemoryKafkaBroker
+    ) -> None:
+        """Test that a timestamp start skips older events"""
+        self.produce(broker, ["old-1", "old-2"], timestamp_ms=1000)
+        self.produce(broker, ["new-1"], timestamp_ms=5000)
+        projection = ItemProjection()
+
+        await self.replayer(settings, broker, projection).run(from_timestamp_ms=2000)
+
+        assert projection.items == ["new-1"]
+
+    @pytest.mark.unit
+    async def test_replays_from_explicit_offsets(
+        self, settings: KafkaSettings, broker: InMemoryKafkaBroker
+    ) -> None:
+        """Test that explicit offsets override the checkpoint"""
+        self.produce(broker, [f"item-{index}" for index in range(6)])
+        partition = TopicPartition(TOPIC, 0)
+        end = broker.end_offset(partition)
+        projection = ItemProjection()
+
+        progress = await self.replayer(settings, broker, projection).run(
+            from_offsets={partition: end - 1, TopicPartition(TOPIC, 1): 10**6}
+        )
+
+        assert progress["total"] == 1
+        assert len(projection.items) == 1
+
+    @pytest.mark.unit
+    async def test_listener_failures_do_not_stop_the_replay(
+        self, settings: KafkaSettings, broker: InMemoryKafkaBroker
+    ) -> None:
+        """Test that failing events are counted and the rebuild carries on"""
+        self.produce(broker, ["item-1", "broken", "item-2"])
+        projection = ItemProjection(fail_on="broken")
+
+        progress = await self.replayer(settings, broker, projection).run(
+            from_beginning=True
+        )
+
+        assert sorted(projection.items) == ["item-1", "item-2"]
+        assert progress["failures"] == 1
+        assert progress["processed"] == 3
+
+    @pytest.mark.unit
+    async def test_an_empty_poll_does_not_end_the_replay(
+        self, settings: KafkaSettings, broker: InMemoryKafkaBroker
+    ) -> None:
+        """Test that the replay keeps polling until every partition reaches its end"""
+        self.produce(broker, ["item-1", "item-2", "item-3"])
+        projection = ItemProjection()
+
+        progress = await self.replayer(
+            settings, broker, projection, SlowKafkaClientFactory(broker, 2)
+        ).run(from_beginning=True)
+
+        assert sorted(projection.items) == ["item-1", "item-2", "item-3"]
+        assert progress["processed"] == 3
+        assert progress["completed"] is True
+
+    @pytest.mark.unit
+    async def test_a_stalled_replay_is_reported_as_incomplete(
+        self, settings: KafkaSettings, broker: InMemoryKafkaBroker
+    ) -> None:
+        """Test that partitions that stop advancing end the replay as incomplete"""
+        self.produce(broker, ["item-1", "item-2"])
+        replayer = self.replayer(
+            settings,
+            broker,
+            ItemProjection(),
+            SlowKafkaClientFactory(broker, -1),
+            idle_timeout_ms=50,
+        )
+
+        progress = await replayer.run(from_beginning=True)
+
+        assert progress["completed"] is False
+        assert progress["processed"] == 0
+        assert progress["total"] == 2
@@ -0,0 +1,347 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaBroker import (
+    InMemoryKafkaBroker,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaClientFactory import (
+    InMemoryKafkaClientFactory,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaProducer import (
+    InMemoryKafkaProducer,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBus import KafkaEventBus
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventHeaders import (
+    KafkaEventHeaders,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventSpool import (
+    KafkaEventSpool,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaProducerClient import (
+    KafkaProducerClient,
+)
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+
+class SampleEvent(DomainEvent):
+    @classmethod
+    def event_name(cls) -> str:
+        return "sample.event"
+
+
+class FlakyProducer(InMemoryKafkaProducer):
+    """Producer en memoria que simula la caída del broker"""
+
+    down = False
+
+    async def send(self, topic: str, *args: Any, **kwargs: Any) -> Any:
+        if self.down:
+            raise ConnectionError("broker caído")
+        return await super().send(topic, *args, **kwargs)
+
+    async def send_and_wait(self, topic: str, *args: Any, **kwargs: Any) -> Any:
+        if self.down:
+            raise ConnectionError("broker caído")
+        return await super().send_and_wait(topic, *args, **kwargs)
+
+
+class DeferredProducer(InMemoryKafkaProducer):
+    """Producer en memoria cuyas entregas se resuelven a mano"""
+
+    def __init__(self, broker: InMemoryKafkaBroker) -> None:
+        super().__init__(broker)
+        self.deliveries: list[asyncio.Future[Any]] = []
+
+    async def send(self, topic: str, *args: Any, **kwargs: Any) -> Any:
+        delivery: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self.deliveries.append(delivery)
+        return delivery
+
+
+class FlakyClientFactory(InMemoryKafkaClientFactory):
+    def __init__(self, broker: InMemoryKafkaBroker) -> None:
+        super().__init__(broker)
+        self.producer = FlakyProducer(broker)
+
+    def create_producer(self, settings: KafkaSettings) -> KafkaProducerClient:
+        return self.producer
+
+
+class TestKafkaEventSpool:
+    @pytest.fixture
+    def spool(self, tmp_path: Path) -> KafkaEventSpool:
+        return KafkaEventSpool(str(tmp_path / "kafka" / "spool.jsonl"))
+
+    @pytest.mark.unit
+    async def test_replays_records_in_order(self, spool: KafkaEventSpool) -> None:
+        """Test that spooled records are replayed in write order and then cleared"""
+        spool.append("topic", b"\x00first", b"key", [("x-event-id", b"1")])
+        spool.append("topic", b"second")
+        send = AsyncMock()
+
+        assert await spool.replay(send, AsyncMock()) == 2
+
+        assert [call.kwargs for call in send.await_args_list] == [
+            {
+                "topic": "topic",
+                "value": b"\x00first",
+                "key": b"key",
+                "headers": [("x-event-id", b"1")],
+            },
+            {"topic": "topic", "value": b"second", "key": None, "headers": []},
+        ]
+        assert spool.has_pending() is False
+        assert Path(spool.path).stat().st_size == 0
+
+    @pytest.mark.unit
+    async def test_failed_replay_resumes_at_failed_record(
+        self, spool: KafkaEventSpool
+    ) -> None:
+        """Test that a failure leaves the failed record and the rest pending"""
+        for value in (b"a", b"b", b"c"):
+            spool.append("topic", value)
+        send = AsyncMock(side_effect=[None, ConnectionError("down")])
+
+        with pytest.raises(ConnectionError):
+            await spool.replay(send, AsyncMock())
+
+        retry = AsyncMock()
+        assert await spool.replay(retry, AsyncMock()) == 2
+        assert [call.kwargs["value"] for call in retry.await_args_list] == [b"b", b"c"]
+
+    @pytest.mark.unit
+    async def test_ignores_partially_written_record(
+        self, spool: KafkaEventSpool
+    ) -> None:
+        """Test that a record cut short by a crash is not replayed"""
+        spool.append("topic", b"complete")
+        await spool.flush()
+        with open(spool.path, "ab") as file:
+            file.write(b'{"topic": "topic", "va')
+        send = AsyncMock()
+
+        assert await spool.replay(send, AsyncMock()) == 1
+        assert spool.has_pending() is True
+
+    @pytest.mark.unit
+    async def test_poison_record_goes_to_dead_letter(self, tmp_path: Path) -> None:
+        """Test that a record failing for good is set aside after its attempts"""
+        spool = KafkaEventSpool(str(tmp_path / "spool.jsonl"), max_attempts=2)
+        for value in (b"poison", b"next"):
+            spool.append("topic", value)
+        poison = ValueError("record too large")
+
+        async def send(**record: Any) -> None:
+            if record["value"] == b"poison":
+                raise poison
+
+        dead_letter = AsyncMock()
+
+        with pytest.raises(ValueError):
+            await spool.replay(send, dead_letter)
+        assert await spool.replay(send, dead_letter) == 2
+
+        dead_letter.assert_awaited_once()
+        assert dead_letter.await_args is not None
+        assert dead_letter.await_args.kwargs["value"] == b"poison"
+        assert spool.has_pending() is False
+
+    @pytest.mark.unit
+    async def test_transient_errors_never_dead_letter(self, tmp_path: Path) -> None:
+        """Test that a broker outage keeps the head record however long it lasts"""
+        spool = KafkaEventSpool(str(tmp_path / "spool.jsonl"), max_attempts=1)
+        spool.append("topic", b"a")
+        dead_letter = AsyncMock()
+
+        for _ in range(3):
+            with pytest.raises(TimeoutError):
+                await spool.replay(AsyncMock(side_effect=TimeoutError()), dead_letter)
+
+        dead_letter.assert_not_awaited()
+        assert spool.has_pending() is True
+
+    @pytest.mark.unit
+    async def test_unsendable_dead_letters_are_kept_aside(self, tmp_path: Path) -> None:
+        """Test that a poison record is saved to the dead file if the DLQ fails too"""
+        spool = KafkaEventSpool(str(tmp_path / "spool.jsonl"), max_attempts=1)
+        spool.append("topic", b"poison")
+        spool.append("topic", b"next")
+        send = AsyncMock(side_effect=[ValueError("invalid"), None])
+
+        sent = await spool.replay(send, AsyncMock(side_effect=ValueError("invalid")))
+
+        assert sent == 1
+        assert b"cG9pc29u" in (tmp_path / "spool.jsonl.dead").read_bytes()
+        assert spool.has_pending() is False
+
+    @pytest.mark.unit
+    async def test_writes_in_append_order(self, spool: KafkaEventSpool) -> None:
+        """Test that background writes keep the order records were appended in"""
+        for index in range(50):
+            spool.append("topic", str(index).encode())
+        assert spool.has_pending() is True
+        send = AsyncMock()
+
+        assert await spool.replay(send, AsyncMock()) == 50
+        assert [call.kwargs["value"] for call in send.await_args_list] == [
+            str(index).encode() for index in range(50)
+        ]
+
+
+class TestKafkaEventBusSpoolFailover:
+    @pytest.mark.unit
+    async def test_spools_while_broker_is_down_and_replays_in_order(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that publishing survives a broker outage and keeps event order"""
+        settings = KafkaSettings(
+            bootstrap_servers=["localhost:9092"],
+            topics_prefix="test",
+            consumer_group_id="test-group",
+            circuit_failure_threshold=1,
+            circuit_reset_timeout_ms=0,
+            spool_path=str(tmp_path / "spool.jsonl"),
+            spool_replay_interval_ms=10,
+        )
+        broker = InMemoryKafkaBroker(partitions=1)
+        factory = FlakyClientFactory(broker)
+        bus = KafkaEventBus(settings, AsyncMock(), factory)
+        events = [SampleEvent(payload={"index": index}) for index in range(3)]
+
+        await bus.start()
+        try:
+            factory.producer.down = True
+            await bus.publish(events[:2])
+            assert bus.metrics()["producer"]["spool_pending_bytes"] > 0
+
+            factory.producer.down = False
+            await bus.publish(events[2:])
+            for _ in range(100):
+                if not bus._spool.has_pending():
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await bus.stop()
+
+        records = broker.fetch(broker.partitions_for("test.SampleEvent")[0], 0, 10)
+        assert [KafkaEventHeaders.event_id(record) for record in records] == [
+            event.id for event in events
+        ]
+        assert bus.metrics()["producer"]["circuit"]["state"] == "closed"
+
+    def make_bus(
+        self, tmp_path: Path, factory: InMemoryKafkaClientFactory
+    ) -> KafkaEventBus:
+        settings = KafkaSettings(
+            bootstrap_servers=["localhost:9092"],
+            topics_prefix="test",
+            consumer_group_id="test-group",
+            circuit_reset_timeout_ms=0,
+            spool_path=str(tmp_path / "spool.jsonl"),
+        )
+        return KafkaEventBus(settings, AsyncMock(), factory)
+
+    async def spooled_ids(self, bus: KafkaEventBus) -> list[str]:
+        send = AsyncMock()
+        await bus._spool.replay(send, AsyncMock())
+        return [
+            KafkaEventHeaders.event_id(Mock(headers=call.kwargs["headers"]))
+            for call in send.await_args_list
+        ]
+
+    @pytest.mark.unit
+    async def test_spooled_events_are_on_disk_when_publish_returns(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that publish does not return before spooled records are written"""
+        broker = InMemoryKafkaBroker(partitions=1)
+        bus = self.make_bus(tmp_path, InMemoryKafkaClientFactory(broker))
+        bus._producer = InMemoryKafkaProducer(broker)
+        bus._circuit_breaker.trip()
+        event = SampleEvent(payload={"index": 0})
+
+        await bus.publish([event])
+
+        lines = (tmp_path / "spool.jsonl").read_bytes().splitlines(keepends=True)
+        records = [KafkaEventSpool._decode(line) for line in lines]
+        assert [
+            KafkaEventHeaders.event_id(Mock(headers=record["headers"]))
+            for record in records
+        ] == [event.id]
+
+    @pytest.mark.unit
+    async def test_publish_does_not_wait_for_the_previous_ack(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that a record of the same key is sent once the previous is acked"""
+        broker = InMemoryKafkaBroker(partitions=1)
+        bus = self.make_bus(tmp_path, InMemoryKafkaClientFactory(broker))
+        producer = DeferredProducer(broker)
+        bus._producer = producer
+        first, second = (
+            SampleEvent(payload={"index": index}, aggregate_id="agg-1")
+            for index in range(2)
+        )
+
+        await bus.publish([first, second])
+        assert len(producer.deliveries) == 1
+
+        producer.deliveries[0].set_result(None)
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert len(producer.deliveries) == 2
+        producer.deliveries[1].set_result(None)
+        await asyncio.sleep(0)
+        assert bus._pending_deliveries == {}
+        assert not bus._spool.has_pending()
+
+    @pytest.mark.unit
+    async def test_failed_delivery_keeps_its_key_in_order(self, tmp_path: Path) -> None:
+        """Test that a delivery failing after the next publish is spooled first"""
+        broker = InMemoryKafkaBroker(partitions=1)
+        bus = self.make_bus(tmp_path, InMemoryKafkaClientFactory(broker))
+        producer = DeferredProducer(broker)
+        bus._producer = producer
+        first, second, third = (
+            SampleEvent(payload={"index": index}, aggregate_id="agg-1")
+            for index in range(3)
+        )
+
+        await bus.publish([first])
+        await bus.publish([second, third])
+        assert len(producer.deliveries) == 1
+
+        producer.deliveries[0].set_exception(ConnectionError("broker caído"))
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        assert len(producer.deliveries) == 1
+        assert await self.spooled_ids(bus) == [first.id, second.id, third.id]
+        assert bus._pending_deliveries == {}
+
+    @pytest.mark.unit
+    async def test_replay_without_sends_does_not_close_the_circuit(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that a probe finding the spool busy in another process proves nothing"""
+        broker = InMemoryKafkaBroker(partitions=1)
+        bus = self.make_bus(tmp_path, InMemoryKafkaClientFactory(broker))
+        bus._producer = InMemoryKafkaProducer(broker)
+        bus._spool.append("test.SampleEvent", b"{}")
+        bus._circuit_breaker.trip()
+        other_process = KafkaEventSpool(bus._spool.path)
+        lock = other_process._try_lock()
+        assert lock is not None
+
+        try:
+            assert await bus._drain_spool() == 0
+        finally:
+            other_process._unlock(lock)
+
+        assert bus._circuit_breaker.state == "open"
+        assert bus._spool.has_pending() is True
@@ -0,0 +1,158 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from aiokafka import TopicPartition
+
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaOffsetCommitManager import (
+    KafkaOffsetCommitManager,
+)
+
+PARTITION = TopicPartition("yurest.MessageCreatedEvent", 0)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestKafkaOffsetCommitManager:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def consumer(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def manager(
+        self, clock: FakeClock, consumer: AsyncMock
+    ) -> KafkaOffsetCommitManager:
+        manager = KafkaOffsetCommitManager(
+            commit_interval_ms=1000, commit_batch_size=3, clock=clock
+        )
+        manager.attach(consumer)
+        return manager
+
+    @pytest.mark.unit
+    def test_commits_only_highest_contiguous_offset(
+        self, manager: KafkaOffsetCommitManager
+    ) -> None:
+        """Test that an unfinished offset blocks later completed offsets"""
+        for offset in (10, 11, 12):
+            manager.track(PARTITION, offset)
+
+        manager.complete(PARTITION, 11)
+        manager.complete(PARTITION, 12)
+        assert manager.pending_commits() == {}
+
+        manager.complete(PARTITION, 10)
+        assert manager.pending_commits() == {PARTITION: 13}
+
+    @pytest.mark.unit
+    def test_handles_offset_gaps(self, manager: KafkaOffsetCommitManager) -> None:
+        """Test that non consecutive offsets (e.g. compacted topics) still advance"""
+        manager.track(PARTITION, 5)
+        manager.track(PARTITION, 9)
+
+        manager.complete(PARTITION, 5)
+        manager.complete(PARTITION, 9)
+
+        assert manager.pending_commits() == {PARTITION: 10}
+
+    @pytest.mark.unit
+    async def test_commits_when_batch_size_is_reached(
+        self, manager: KafkaOffsetCommitManager, consumer: AsyncMock
+    ) -> None:
+        """Test that the count threshold triggers a commit"""
+        for offset in range(3):
+            manager.track(PARTITION, offset)
+            manager.complete(PARTITION, offset)
+            if offset < 2:
+                assert manager.should_commit() is False
+
+        await manager.maybe_commit()
+
+        consumer.commit.assert_awaited_once_with({PARTITION: 3})
+
+    @pytest.mark.unit
+    async def test_commits_when_interval_elapses(
+        self,
+        manager: KafkaOffsetCommitManager,
+        consumer: AsyncMock,
+        clock: FakeClock,
+    ) -> None:
+        """Test that the timer threshold triggers a commit"""
+        manager.track(PARTITION, 0)
+        manager.complete(PARTITION, 0)
+
+        await manager.maybe_commit()
+        consumer.commit.assert_not_awaited()
+
+        clock.now = 1.5
+        await manager.maybe_commit()
+        consumer.commit.assert_awaited_once_with({PARTITION: 1})
+
+    @pytest.mark.unit
+    async def test_does_not_recommit_same_offset(
+        self, manager: KafkaOffsetCommitManager, consumer: AsyncMock
+    ) -> None:
+        """Test that already committed offsets are not sent again"""
+        manager.track(PARTITION, 0)
+        manager.complete(PARTITION, 0)
+
+        await manager.commit()
+        await manager.commit()
+
+        consumer.commit.assert_awaited_once()
+
+    @pytest.mark.unit
+    async def test_keeps_offsets_pending_when_commit_fails(
+        self, manager: KafkaOffsetCommitManager, consumer: AsyncMock
+    ) -> None:
+        """Test that a failed commit is retried on the next attempt"""
+        consumer.commit.side_effect = [RuntimeError("rebalancing"), None]
+        manager.track(PARTITION, 0)
+        manager.complete(PARTITION, 0)
+
+        await manager.commit()
+        assert manager.pending_commits() == {PARTITION: 1}
+
+        await manager.commit()
+        assert manager.pending_commits() == {}
+
+    @pytest.mark.unit
+    def test_forget_discards_revoked_partitions(
+        self, manager: KafkaOffsetCommitManager
+    ) -> None:
+        """Test that revoked partitions no longer produce commits"""
+        manager.track(PARTITION, 0)
+        manager.complete(PARTITION, 0)
+
+        manager.forget([PARTITION])
+        manager.complete(PARTITION, 1)
+
+        assert manager.pending_commits() == {}
+
+    @pytest.mark.unit
+    def test_rewind_drops_state_from_the_failed_offset(
+        self, manager: KafkaOffsetCommitManager
+    ) -> None:
+        """Test that a rewound partition is tracked again from the failed record"""
+        for offset in (0, 1, 2, 3):
+            manager.track(PARTITION, offset)
+        manager.complete(PARTITION, 0)
+        manager.complete(PARTITION, 2)
+
+        manager.rewind(PARTITION, 1)
+        assert manager.tracked(PARTITION) == 0
+
+        for offset in (1, 2, 3):
+            manager.track(PARTITION, offset)
+            manager.complete(PARTITION, offset)
+
+        assert manager.pending_commits() == {PARTITION: 4}
+        assert manager.tracked(PARTITION) == 0
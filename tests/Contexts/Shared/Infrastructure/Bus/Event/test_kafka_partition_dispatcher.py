@@ -0,0 +1,174 @@
+import asyncio
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from aiokafka import ConsumerRecord, TopicPartition
+
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaPartitionDispatcher import (
+    KafkaPartitionDispatcher,
+)
+
+PARTITION = TopicPartition("yurest.MessageCreatedEvent", 0)
+OTHER_PARTITION = TopicPartition("yurest.MessageCreatedEvent", 1)
+
+
+def make_records(
+    partition: TopicPartition, offsets: range
+) -> list[ConsumerRecord[Any, Any]]:
+    return [
+        ConsumerRecord(
+            topic=partition.topic,
+            partition=partition.partition,
+            offset=offset,
+            timestamp=0,
+            timestamp_type=0,
+            key=None,
+            value=b"{}",
+            checksum=None,
+            serialized_key_size=0,
+            serialized_value_size=2,
+            headers=[],
+        )
+        for offset in offsets
+    ]
+
+
+async def drain() -> None:
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+class TestKafkaPartitionDispatcher:
+    @pytest.fixture
+    def consumer(self) -> Mock:
+        consumer = Mock()
+        consumer.assignment.return_value = {PARTITION, OTHER_PARTITION}
+        return consumer
+
+    @pytest.mark.unit
+    def test_rejects_inverted_watermarks(self) -> None:
+        """Test that the low watermark must be below the high watermark"""
+
+        async def handler(_: TopicPartition, __: ConsumerRecord[Any, Any]) -> None:
+            pass
+
+        with pytest.raises(ValueError):
+            KafkaPartitionDispatcher(handler, high_watermark=2, low_watermark=2)
+
+    @pytest.mark.unit
+    async def test_processes_each_partition_in_order(self, consumer: Mock) -> None:
+        """Test that records of a partition are handled sequentially and in order"""
+        handled: list[tuple[int, int]] = []
+
+        async def handler(
+            partition: TopicPartition, message: ConsumerRecord[Any, Any]
+        ) -> None:
+            handled.append((partition.partition, message.offset))
+
+        dispatcher = KafkaPartitionDispatcher(handler, 100, 10)
+        dispatcher.attach(consumer)
+
+        dispatcher.submit(PARTITION, make_records(PARTITION, range(3)))
+        dispatcher.submit(OTHER_PARTITION, make_records(OTHER_PARTITION, range(2)))
+        await drain()
+        await dispatcher.revoke([PARTITION, OTHER_PARTITION])
+
+        assert [offset for part, offset in handled if part == 0] == [0, 1, 2]
+        assert [offset for part, offset in handled if part == 1] == [0, 1]
+
+    @pytest.mark.unit
+    async def test_pauses_at_high_watermark_and_resumes_at_low(
+        self, consumer: Mock
+    ) -> None:
+        """Test that backpressure pauses and resumes the partition fetch"""
+        release = asyncio.Event()
+
+        async def handler(_: TopicPartition, __: ConsumerRecord[Any, Any]) -> None:
+            await release.wait()
+
+        dispatcher = KafkaPartitionDispatcher(
+            handler, high_watermark=4, low_watermark=1
+        )
+        dispatcher.attach(consumer)
+
+        dispatcher.submit(PARTITION, make_records(PARTITION, range(5)))
+        assert dispatcher.is_paused(PARTITION) is True
+        consumer.pause.assert_called_once_with(PARTITION)
+
+        release.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert dispatcher.is_paused(PARTITION) is False
+        consumer.resume.assert_called_once_with(PARTITION)
+        await dispatcher.stop()
+
+    @pytest.mark.unit
+    async def test_revoke_drops_queued_records(self, consumer: Mock) -> None:
+        """Test that queued records of a revoked partition are not processed"""
+        handled: list[int] = []
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def handler(_: TopicPartition, message: ConsumerRecord[Any, Any]) -> None:
+            started.set()
+            await release.wait()
+            handled.append(message.offset)
+
+        dispatcher = KafkaPartitionDispatcher(handler, 100, 10)
+        dispatcher.attach(consumer)
+        dispatcher.submit(PARTITION, make_records(PARTITION, range(5)))
+        await started.wait()
+
+        revoking = asyncio.create_task(dispatcher.revoke([PARTITION]))
+        await asyncio.sleep(0)
+        release.set()
+        await revoking
+
+        assert handled == [0]
+        assert dispatcher.in_flight() == 0
+
+    @pytest.mark.unit
+    async def test_handler_errors_do_not_stop_the_worker(self, consumer: Mock) -> None:
+        """Test that a failing record does not block the rest of the partition"""
+        handled: list[int] = []
+
+        async def handler(_: TopicPartition, message: ConsumerRecord[Any, Any]) -> None:
+            if message.offset == 0:
+                raise RuntimeError("boom")
+            handled.append(message.offset)
+
+        dispatcher = KafkaPartitionDispatcher(handler, 100, 10)
+        dispatcher.attach(consumer)
+        dispatcher.submit(PARTITION, make_records(PARTITION, range(3)))
+        await drain()
+        await dispatcher.revoke([PARTITION])
+
+        assert handled == [1, 2]
+
+    @pytest.mark.unit
+    async def test_rewind_drops_queued_records_and_seeks_back(
+        self, consumer: Mock
+    ) -> None:
+        """Test that a failed record is read again instead of being skipped"""
+        handled: list[int] = []
+        dispatcher: KafkaPartitionDispatcher
+
+        async def handler(
+            partition: TopicPartition, message: ConsumerRecord[Any, Any]
+        ) -> None:
+            handled.append(message.offset)
+            if message.offset == 1:
+                await dispatcher.rewind(partition, message.offset, backoff_ms=0)
+
+        dispatcher = KafkaPartitionDispatcher(handler, 100, 10)
+        dispatcher.attach(consumer)
+        dispatcher.submit(PARTITION, make_records(PARTITION, range(4)))
+        await drain()
+        await dispatcher.revoke([PARTITION])
+
+        assert handled == [0, 1]
+        consumer.pause.assert_called_once_with(PARTITION)
+        consumer.seek.assert_called_once_with(PARTITION, 1)
+        consumer.resume.assert_called_once_with(PARTITION)
@@ -0,0 +1,239 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from aiokafka import ConsumerRecord, TopicPartition
+
+from app.Contexts.Shared.Application.Bus.Event.EventListener import EventListener
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaBroker import (
+    InMemoryKafkaBroker,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaClientFactory import (
+    InMemoryKafkaClientFactory,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBus import KafkaEventBus
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaRetryRouter import (
+    KafkaRetryRouter,
+)
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+TOPIC = "test.MessageCreatedEvent"
+
+
+def make_record(
+    topic: str = TOPIC, headers: list[tuple[str, bytes]] | None = None
+) -> ConsumerRecord[Any, Any]:
+    return ConsumerRecord(
+        topic=topic,
+        partition=2,
+        offset=42,
+        timestamp=0,
+        timestamp_type=0,
+        key=b"conv-1",
+        value=b"{}",
+        checksum=None,
+        serialized_key_size=6,
+        serialized_value_size=2,
+        headers=headers or [],
+    )
+
+
+class TestKafkaRetryRouter:
+    @pytest.fixture
+    def router(self) -> KafkaRetryRouter:
+        settings = KafkaSettings(
+            bootstrap_servers=["localhost:9092"],
+            topics_prefix="test",
+            consumer_group_id="test-group",
+            max_retries=2,
+            retry_backoff_ms=1000,
+        )
+        return KafkaRetryRouter(settings)
+
+    @pytest.mark.unit
+    def test_retry_topics_per_attempt(self, router: KafkaRetryRouter) -> None:
+        """Test that one delay topic is created per retry attempt"""
+        assert router.retry_topics(TOPIC) == [
+            f"{TOPIC}.retry.1",
+            f"{TOPIC}.retry.2",
+        ]
+
+    @pytest.mark.unit
+    def test_first_failure_goes_to_first_retry_topic(
+        self, router: KafkaRetryRouter
+    ) -> None:
+        """Test that a failure on the main topic is routed to retry.1"""
+        topic, headers = router.route(
+            make_record(), "SendNotificationListener", ValueError("boom"), now_ms=0
+        )
+        values = dict(headers)
+
+        assert topic == f"{TOPIC}.retry.1"
+        assert values[KafkaRetryRouter.ATTEMPT_HEADER] == b"1"
+        assert values[KafkaRetryRouter.NOT_BEFORE_HEADER] == b"1000"
+        assert values[KafkaRetryRouter.LISTENER_HEADER] == b"SendNotificationListener"
+        assert values[KafkaRetryRouter.ORIGINAL_TOPIC_HEADER] == TOPIC.encode()
+        assert values[KafkaRetryRouter.ORIGINAL_OFFSET_HEADER] == b"42"
+        assert values[KafkaRetryRouter.EXCEPTION_TYPE_HEADER] == b"ValueError"
+        assert values[KafkaRetryRouter.EXCEPTION_MESSAGE_HEADER] == b"boom"
+
+    @pytest.mark.unit
+    def test_backoff_grows_exponentially(self, router: KafkaRetryRouter) -> None:
+        """Test that the second retry waits twice as long as the first"""
+        _, first_headers = router.route(
+            make_record(), "Listener", ValueError("boom"), now_ms=0
+        )
+        retry_record = make_record(f"{TOPIC}.retry.1", first_headers)
+
+        topic, headers = router.route(
+            retry_record, "Listener", ValueError("boom"), now_ms=0
+        )
+
+        assert topic == f"{TOPIC}.retry.2"
+        assert dict(headers)[KafkaRetryRouter.NOT_BEFORE_HEADER] == b"2000"
+        assert dict(headers)[KafkaRetryRouter.ORIGINAL_OFFSET_HEADER] == b"42"
+
+    @pytest.mark.unit
+    def test_exhausted_retries_go_to_dead_letter_topic(
+        self, router: KafkaRetryRouter
+    ) -> None:
+        """Test that an event is dead-lettered after max_retries attempts"""
+        record = make_record(
+            f"{TOPIC}.retry.2",
+            [
+                (KafkaRetryRouter.ATTEMPT_HEADER, b"2"),
+                (KafkaRetryRouter.ORIGINAL_TOPIC_HEADER, TOPIC.encode()),
+            ],
+        )
+
+        topic, headers = router.route(record, "Listener", ValueError("boom"), now_ms=0)
+
+        assert topic == f"{TOPIC}.dlq"
+        assert dict(headers)[KafkaRetryRouter.ATTEMPT_HEADER] == b"3"
+        assert KafkaRetryRouter.NOT_BEFORE_HEADER not in dict(headers)
+
+    @pytest.mark.unit
+    def test_dead_letter_flag_skips_retries(self, router: KafkaRetryRouter) -> None:
+        """Test that unrecoverable failures go straight to the dead-letter topic"""
+        topic, _ = router.route(
+            make_record(), "*", ValueError("bad json"), now_ms=0, dead_letter=True
+        )
+
+        assert topic == f"{TOPIC}.dlq"
+
+    @pytest.mark.unit
+    def test_keeps_business_headers(self, router: KafkaRetryRouter) -> None:
+        """Test that non routing headers travel with the retried event"""
+        record = make_record(headers=[("trace_id", b"abc")])
+
+        _, headers = router.route(record, "Listener", ValueError("boom"), now_ms=0)
+
+        assert ("trace_id", b"abc") in headers
+
+    @pytest.mark.unit
+    def test_reads_retry_metadata(self, router: KafkaRetryRouter) -> None:
+        """Test the helpers used by the consumer to handle retried events"""
+        record = make_record(
+            f"{TOPIC}.retry.1",
+            [
+                (KafkaRetryRouter.ATTEMPT_HEADER, b"1"),
+                (KafkaRetryRouter.NOT_BEFORE_HEADER, b"1500"),
+                (KafkaRetryRouter.LISTENER_HEADER, b"Listener"),
+            ],
+        )
+
+        assert router.is_retry(record) is True
+        assert router.is_retry(make_record()) is False
+        assert router.not_before_ms(record) == 1500
+        assert router.target_listener(record) == "Listener"
+
+
+class OrderShipped(DomainEvent):
+    @classmethod
+    def event_name(cls) -> str:
+        return "order.shipped"
+
+
+class FailingListener(EventListener):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def listen(self, event: DomainEvent) -> None:
+        self.calls += 1
+        raise RuntimeError("listener error")
+
+
+async def wait_until(condition: Any) -> None:
+    for _ in range(500):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condición no alcanzada")
+
+
+class TestKafkaEventBusRetryRouting:
+    MAIN = TopicPartition("test.OrderShipped", 0)
+    RETRY = TopicPartition("test.OrderShipped.retry.1", 0)
+
+    def make_bus(
+        self, broker: InMemoryKafkaBroker, retry_backoff_ms: int
+    ) -> KafkaEventBus:
+        settings = KafkaSettings(
+            bootstrap_servers=["localhost:9092"],
+            topics_prefix="test",
+            consumer_group_id="test-group",
+            commit_batch_size=1,
+            max_retries=1,
+            retry_backoff_ms=retry_backoff_ms,
+            transport="memory",
+        )
+        return KafkaEventBus(settings, AsyncMock(), InMemoryKafkaClientFactory(broker))
+
+    @pytest.mark.unit
+    async def test_failed_listener_is_rerouted_and_its_offset_committed(
+        self,
+    ) -> None:
+        """Test that a failure is published to the retry topic before committing"""
+        broker = InMemoryKafkaBroker(partitions=1)
+        bus = self.make_bus(broker, retry_backoff_ms=60000)
+        listener = FailingListener()
+        bus.subscribe(OrderShipped, listener)
+        event = OrderShipped(payload={})
+
+        await bus.start()
+        try:
+            await bus.publish([event])
+            await wait_until(lambda: broker.committed("test-group", self.MAIN) == 1)
+        finally:
+            await bus.stop()
+
+        retried = broker.fetch(self.RETRY, 0, 10)
+        assert len(retried) == 1
+        assert dict(retried[0].headers)["x-event-id"] == event.id.encode()
+        assert listener.calls == 1
+
+    @pytest.mark.unit
+    async def test_offset_is_not_committed_when_rerouting_fails(self) -> None:
+        """Test that a failure that cannot be rerouted is never committed"""
+        broker = InMemoryKafkaBroker(partitions=1)
+        bus = self.make_bus(broker, retry_backoff_ms=10)
+        listener = FailingListener()
+        bus.subscribe(OrderShipped, listener)
+
+        await bus.start()
+        try:
+            assert bus._producer is not None
+            bus._producer.send_and_wait = AsyncMock(  # type: ignore[method-assign]
+                side_effect=ConnectionError("broker caído")
+            )
+            await bus.publish([OrderShipped(payload={})])
+            # El registro se vuelve a leer mientras el reenvío siga fallando
+            await wait_until(lambda: listener.calls >= 3)
+            await bus._commit_manager.commit()
+        finally:
+            await bus.stop()
+
+        assert broker.committed("test-group", self.MAIN) is None
+        assert broker.end_offset(self.RETRY) == 0
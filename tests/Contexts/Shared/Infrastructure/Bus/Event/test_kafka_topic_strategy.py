@@ -0,0 +1,116 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.Contexts.Chat.Conversation.Domain.ConversationCreatedEvent import (
+    ConversationCreatedEvent,
+)
+from app.Contexts.Chat.Message.Domain.MessageCreatedEvent import MessageCreatedEvent
+from app.Contexts.Shared.Application.Bus.Event.EventListener import EventListener
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaBroker import (
+    InMemoryKafkaBroker,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryKafkaClientFactory import (
+    InMemoryKafkaClientFactory,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaEventBus import KafkaEventBus
+from app.Contexts.Shared.Infrastructure.Bus.Event.KafkaTopicStrategy import (
+    KafkaTopicStrategy,
+)
+from app.Contexts.Shared.Infrastructure.Settings.KafkaSettings import KafkaSettings
+
+
+def make_settings(topic_strategy: str) -> KafkaSettings:
+    return KafkaSettings(
+        bootstrap_servers=["localhost:9092"],
+        topics_prefix="test",
+        consumer_group_id="test-group",
+        max_retries=0,
+        topic_strategy=topic_strategy,
+    )
+
+
+class RecordingListener(EventListener):
+    def __init__(self) -> None:
+        self.events: list[DomainEvent] = []
+        self.received = asyncio.Event()
+
+    async def listen(self, event: DomainEvent) -> None:
+        self.events.append(event)
+        self.received.set()
+
+
+class TestKafkaTopicStrategy:
+    @pytest.mark.unit
+    def test_one_topic_per_event_by_default(self) -> None:
+        """Test that the event strategy keeps a topic per event class"""
+        strategy = KafkaTopicStrategy(make_settings("event"))
+
+        assert strategy.topic_for(MessageCreatedEvent) == "test.MessageCreatedEvent"
+
+    @pytest.mark.unit
+    def test_one_topic_per_bounded_context(self) -> None:
+        """Test that events of the same bounded context share a topic"""
+        strategy = KafkaTopicStrategy(make_settings("context"))
+
+        assert strategy.topic_for(MessageCreatedEvent) == "test.chat"
+        assert strategy.topic_for(ConversationCreatedEvent) == "test.chat"
+
+    @pytest.mark.unit
+    def test_events_outside_a_context_keep_their_topic(self) -> None:
+        """Test that events not under app.Contexts fall back to their own topic"""
+        strategy = KafkaTopicStrategy(make_settings("context"))
+        loose_event = type(
+            "LooseEvent",
+            (DomainEvent,),
+            {
+                "__module__": "scripts.fixtures",
+                "event_name": classmethod(lambda cls: "loose.event"),
+            },
+        )
+
+        assert strategy.topic_for(loose_event) == "test.LooseEvent"
+
+    @pytest.mark.unit
+    def test_rejects_unknown_strategy(self) -> None:
+        """Test that a misconfigured strategy fails fast"""
+        with pytest.raises(ValueError):
+            KafkaTopicStrategy(make_settings("per-day"))
+
+
+class TestKafkaEventBusContextTopics:
+    @pytest.mark.unit
+    def test_subscribes_once_to_a_shared_topic(self) -> None:
+        """Test that several events of one context need a single subscription"""
+        bus = KafkaEventBus(make_settings("context"), AsyncMock(), AsyncMock())
+        bus.subscribe(MessageCreatedEvent, RecordingListener())
+        bus.subscribe(ConversationCreatedEvent, RecordingListener())
+
+        assert bus._topics() == ["test.chat"]
+
+    @pytest.mark.unit
+    async def test_routes_shared_topic_by_header(self) -> None:
+        """Test that only the listened event of a shared topic reaches listeners"""
+        broker = InMemoryKafkaBroker()
+        bus = KafkaEventBus(
+            make_settings("context"),
+            AsyncMock(),
+            InMemoryKafkaClientFactory(broker),
+        )
+        listener = RecordingListener()
+        bus.subscribe(MessageCreatedEvent, listener)
+        conversation = ConversationCreatedEvent("conv-1", "owner-1")
+        message = MessageCreatedEvent("msg-1", "conv-1", "Hola")
+
+        await bus.start()
+        try:
+            await bus.publish([conversation, message])
+            await asyncio.wait_for(listener.received.wait(), timeout=5)
+            await asyncio.sleep(0.05)
+        finally:
+            await bus.stop()
+
+        assert [event.id for event in listener.events] == [message.id]
+        assert bus.metrics()["deduplication"]["checks"] == 1
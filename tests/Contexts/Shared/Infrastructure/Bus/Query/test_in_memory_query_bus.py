@@ -0,0 +1,87 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+from injector import Binder, Injector, singleton
+
+from app.Contexts.Shared.Application.Bus.BusMiddleware import BusMiddleware
+from app.Contexts.Shared.Application.Bus.Query.Query import Query
+from app.Contexts.Shared.Application.Bus.Query.QueryHandler import QueryHandler
+from app.Contexts.Shared.Infrastructure.Bus.Query.InMemoryQueryBus import (
+    InMemoryQueryBus,
+)
+
+
+class SampleQuery(Query):
+    pass
+
+
+class CountingQueryHandler(QueryHandler):
+    instances = 0
+
+    def __init__(self) -> None:
+        CountingQueryHandler.instances += 1
+
+    def handle(self, query: Query) -> Any:
+        return CountingQueryHandler.instances
+
+
+def make_bus(scope: object = None) -> InMemoryQueryBus:
+    def configure(binder: Binder) -> None:
+        binder.bind(CountingQueryHandler, scope=scope)  # type: ignore[arg-type]
+
+    bus = Injector([configure]).get(InMemoryQueryBus)
+    bus.register(SampleQuery, CountingQueryHandler)
+    CountingQueryHandler.instances = 0
+    return bus
+
+
+class TestInMemoryQueryBus:
+    @pytest.mark.unit
+    def test_frozen_singleton_handler_is_resolved_once(self) -> None:
+        """Test that a frozen bus answers from the prebuilt singleton handler"""
+        bus = make_bus(singleton)
+        bus.freeze()
+
+        assert [bus.ask(SampleQuery()) for _ in range(3)] == [1, 1, 1]
+
+    @pytest.mark.unit
+    def test_frozen_unscoped_handler_is_resolved_per_query(self) -> None:
+        """Test that handlers without scope keep getting a fresh instance"""
+        bus = make_bus()
+        bus.freeze()
+
+        assert [bus.ask(SampleQuery()) for _ in range(2)] == [1, 2]
+
+    @pytest.mark.unit
+    def test_unknown_query_raises(self) -> None:
+        """Test that asking a query without handler fails as before freezing"""
+        bus = make_bus(singleton)
+        bus.freeze()
+
+        with pytest.raises(KeyError):
+            bus.ask(Query())
+
+
+class DoublingMiddleware(BusMiddleware):
+    async def handle(
+        self, message: Any, next_handler: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        return await next_handler(message) * 2
+
+
+class AsyncQueryHandler(QueryHandler):
+    async def handle(self, query: Query) -> Any:  # type: ignore[override]
+        return 21
+
+
+class TestInMemoryQueryBusMiddlewares:
+    @pytest.mark.unit
+    async def test_middleware_wraps_the_query_result(self) -> None:
+        """Test that a middleware sees and can transform the handler result"""
+        bus = Injector().get(InMemoryQueryBus)
+        bus.register(SampleQuery, AsyncQueryHandler)
+        bus.use(DoublingMiddleware())
+        bus.freeze()
+
+        assert await bus.ask(SampleQuery()) == 42
@@ -0,0 +1,219 @@
+from collections.abc import Hashable
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from injector import Injector
+
+from app.Contexts.Chat.Message.Application.Search.PaginateMessagesQuery import (
+    PaginateMessagesQuery,
+)
+from app.Contexts.Chat.Message.Domain.MessageCreatedEvent import MessageCreatedEvent
+from app.Contexts.Shared.Application.Bus.Query.CacheableQuery import CacheableQuery
+from app.Contexts.Shared.Application.Bus.Query.Query import Query
+from app.Contexts.Shared.Application.Bus.Query.QueryHandler import QueryHandler
+from app.Contexts.Shared.Domain.DomainEvent import DomainEvent
+from app.Contexts.Shared.Infrastructure.Bus.Event.InMemoryEventBus import (
+    InMemoryEventBus,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Query.InMemoryQueryBus import (
+    InMemoryQueryBus,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Query.QueryCache import QueryCache
+from app.Contexts.Shared.Infrastructure.Bus.Query.QueryCacheInvalidator import (
+    QueryCacheInvalidator,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Query.QueryCacheMiddleware import (
+    QueryCacheMiddleware,
+)
+from app.Contexts.Shared.Infrastructure.Settings.EventBusSettings import (
+    EventBusSettings,
+)
+from app.Contexts.Shared.Infrastructure.Settings.QueryCacheSettings import (
+    QueryCacheSettings,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingPaginateHandler(QueryHandler):
+    calls = 0
+
+    async def handle(self, query: PaginateMessagesQuery) -> Any:  # type: ignore[override]
+        CountingPaginateHandler.calls += 1
+        return {"calls": CountingPaginateHandler.calls}
+
+
+class UncachedQuery(CacheableQuery):
+    def cache_key(self) -> Hashable | None:
+        return None
+
+    def cache_tags(self) -> list[str]:
+        return []
+
+
+def conversation_tags(event: DomainEvent) -> list[str]:
+    return [f"conversation:{event.payload['conversation_id']}"]
+
+
+class TestQueryCache:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def cache(self, clock: FakeClock) -> QueryCache:
+        return QueryCache(QueryCacheSettings(max_entries=2, ttl_ms=1000), clock)
+
+    @pytest.mark.unit
+    def test_hits_after_set(self, cache: QueryCache) -> None:
+        """Test that a stored result is returned and counted as a hit"""
+        assert cache.get("a") == (False, None)
+        cache.set("a", 1, ["tag"], cache.generation)
+
+        assert cache.get("a") == (True, 1)
+        assert cache.snapshot()["hit_rate"] == 0.5
+
+    @pytest.mark.unit
+    def test_entries_expire(self, cache: QueryCache, clock: FakeClock) -> None:
+        """Test that entries are not served past their TTL"""
+        cache.set("a", 1, [], cache.generation)
+        cache.set("b", 2, [], cache.generation, ttl_ms=5000)
+        clock.now = 2.0
+
+        assert cache.get("a") == (False, None)
+        assert cache.get("b") == (True, 2)
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used(self, cache: QueryCache) -> None:
+        """Test that the cache never holds more than max_entries"""
+        cache.set("a", 1, [], cache.generation)
+        cache.set("b", 2, [], cache.generation)
+        cache.get("a")
+        cache.set("c", 3, [], cache.generation)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.snapshot()["evictions"] == 1
+
+    @pytest.mark.unit
+    def test_invalidates_by_event(self, cache: QueryCache) -> None:
+        """Test that an event removes the entries tagged with its aggregate"""
+        cache.invalidate_on(MessageCreatedEvent, conversation_tags)
+        cache.set("conv-1", 1, ["conversation:conv-1"], cache.generation)
+        cache.set("conv-2", 2, ["conversation:conv-2"], cache.generation)
+
+        cache.invalidate_event(MessageCreatedEvent("msg-1", "conv-1", "Hola"))
+
+        assert cache.get("conv-1") == (False, None)
+        assert cache.get("conv-2") == (True, 2)
+
+    @pytest.mark.unit
+    def test_discards_results_computed_during_invalidation(
+        self, cache: QueryCache
+    ) -> None:
+        """Test that a result read before an invalidation is not stored"""
+        generation = cache.generation
+        cache.invalidate_tags(["conversation:conv-1"])
+        cache.set("conv-1", "stale", ["conversation:conv-1"], generation)
+
+        assert cache.get("conv-1") == (False, None)
+
+
+class TestQueryCacheMiddleware:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def injector(self, clock: FakeClock) -> Injector:
+        injector = Injector()
+        settings = QueryCacheSettings(ttl_ms=1000)
+        injector.binder.bind(QueryCacheSettings, to=settings)
+        injector.binder.bind(QueryCache, to=QueryCache(settings, clock))
+        return injector
+
+    @pytest.fixture
+    def bus(self, injector: Injector) -> InMemoryQueryBus:
+        bus = injector.get(InMemoryQueryBus)
+        bus.use(injector.get(QueryCacheMiddleware))
+        bus.register(PaginateMessagesQuery, CountingPaginateHandler)
+        bus.freeze()
+        CountingPaginateHandler.calls = 0
+        return bus
+
+    @pytest.mark.unit
+    async def test_serves_first_page_from_cache(self, bus: InMemoryQueryBus) -> None:
+        """Test that repeated first-page queries reach the handler once"""
+        first = await bus.ask(PaginateMessagesQuery("conv-1"))
+        second = await bus.ask(PaginateMessagesQuery("conv-1"))
+
+        assert first == second == {"calls": 1}
+
+    @pytest.mark.unit
+    async def test_does_not_cache_later_pages(self, bus: InMemoryQueryBus) -> None:
+        """Test that queries without cache key always reach the handler"""
+        await bus.ask(PaginateMessagesQuery("conv-1", cursor="msg-9"))
+        result = await bus.ask(PaginateMessagesQuery("conv-1", cursor="msg-9"))
+
+        assert result == {"calls": 2}
+
+    @pytest.mark.unit
+    async def test_invalidator_refreshes_after_event(
+        self, bus: InMemoryQueryBus, injector: Injector
+    ) -> None:
+        """Test that a domain event makes the next query recompute the page"""
+        cache = injector.get(QueryCache)
+        cache.invalidate_on(MessageCreatedEvent, conversation_tags)
+        await bus.ask(PaginateMessagesQuery("conv-1"))
+
+        await injector.get(QueryCacheInvalidator).listen(
+            MessageCreatedEvent("msg-1", "conv-1", "Hola")
+        )
+
+        assert await bus.ask(PaginateMessagesQuery("conv-1")) == {"calls": 2}
+        assert cache.snapshot()["invalidations"] == 1
+
+    @pytest.mark.unit
+    def test_applies_only_to_cacheable_queries(self, injector: Injector) -> None:
+        """Test that plain queries do not get the cache in their chain"""
+        middleware = injector.get(QueryCacheMiddleware)
+
+        assert middleware.applies_to(UncachedQuery)
+        assert not middleware.applies_to(Query)
+
+    @pytest.mark.unit
+    async def test_local_publish_invalidates_before_returning(
+        self, bus: InMemoryQueryBus, injector: Injector
+    ) -> None:
+        """Test that a write reads its own result right after publishing its event"""
+        injector.get(QueryCache).invalidate_on(MessageCreatedEvent, conversation_tags)
+        event_bus = InMemoryEventBus(Mock(), EventBusSettings())
+        event_bus.subscribe_local(
+            MessageCreatedEvent, injector.get(QueryCacheInvalidator)
+        )
+        await bus.ask(PaginateMessagesQuery("conv-1"))
+
+        await event_bus.publish([MessageCreatedEvent("msg-1", "conv-1", "Hola")])
+        try:
+            assert await bus.ask(PaginateMessagesQuery("conv-1")) == {"calls": 2}
+        finally:
+            await event_bus.stop()
+
+    @pytest.mark.unit
+    async def test_missed_invalidations_are_bounded_by_the_ttl(
+        self, bus: InMemoryQueryBus, clock: FakeClock
+    ) -> None:
+        """Test that a replica that never sees the event refreshes after the TTL"""
+        await bus.ask(PaginateMessagesQuery("conv-1"))
+
+        clock.now = 0.999
+        assert await bus.ask(PaginateMessagesQuery("conv-1")) == {"calls": 1}
+        clock.now = 1.0
+        assert await bus.ask(PaginateMessagesQuery("conv-1")) == {"calls": 2}
@@ -0,0 +1,147 @@
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from app.Contexts.Chat.Message.Application.Search.PaginateMessagesQuery import (
+    PaginateMessagesQuery,
+)
+from app.Contexts.Shared.Infrastructure.Bus.DeadlineMiddleware import (
+    DeadlineMiddleware,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Query.QuerySingleFlightMiddleware import (
+    QuerySingleFlightMiddleware,
+)
+from app.Contexts.Shared.Infrastructure.Http.Context.DeadlineExceededError import (
+    DeadlineExceededError,
+)
+from app.Contexts.Shared.Infrastructure.Http.Middleware.RequestContextMiddleware import (
+    request_deadline,
+)
+
+
+class SlowBackend:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self._error = error
+
+    async def __call__(self, query: PaginateMessagesQuery) -> Any:
+        self.calls += 1
+        await self.release.wait()
+        if self._error:
+            raise self._error
+        return {"conversation_id": query.conversation_id}
+
+
+class TestQuerySingleFlightMiddleware:
+    @pytest.mark.unit
+    async def test_identical_queries_share_one_execution(self) -> None:
+        """Test that concurrent identical queries reach the handler once"""
+        middleware = QuerySingleFlightMiddleware()
+        backend = SlowBackend()
+
+        waiters = [
+            asyncio.create_task(
+                middleware.handle(PaginateMessagesQuery("conv-1"), backend)
+            )
+            for _ in range(50)
+        ]
+        await asyncio.sleep(0)
+        backend.release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert backend.calls == 1
+        assert all(result == {"conversation_id": "conv-1"} for result in results)
+        assert middleware.snapshot() == {
+            "in_flight": 0,
+            "executions": 1,
+            "coalesced": 49,
+        }
+
+    @pytest.mark.unit
+    async def test_different_queries_run_independently(self) -> None:
+        """Test that queries with different parameters are not coalesced"""
+        middleware = QuerySingleFlightMiddleware()
+        backend = SlowBackend()
+        backend.release.set()
+
+        await asyncio.gather(
+            middleware.handle(PaginateMessagesQuery("conv-1"), backend),
+            middleware.handle(PaginateMessagesQuery("conv-2"), backend),
+            middleware.handle(PaginateMessagesQuery("conv-1", cursor="m"), backend),
+            middleware.handle(PaginateMessagesQuery("conv-1", cursor="m"), backend),
+        )
+
+        assert backend.calls == 4
+
+    @pytest.mark.unit
+    async def test_errors_reach_every_waiter(self) -> None:
+        """Test that a failing execution fails all coalesced callers"""
+        middleware = QuerySingleFlightMiddleware()
+        backend = SlowBackend(error=RuntimeError("backend down"))
+
+        waiters = [
+            asyncio.create_task(
+                middleware.handle(PaginateMessagesQuery("conv-1"), backend)
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        backend.release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert backend.calls == 1
+
+    @pytest.mark.unit
+    async def test_cancelling_the_leader_does_not_cancel_the_others(self) -> None:
+        """Test that followers still get the result if the first caller goes away"""
+        middleware = QuerySingleFlightMiddleware()
+        backend = SlowBackend()
+        leader = asyncio.create_task(
+            middleware.handle(PaginateMessagesQuery("conv-1"), backend)
+        )
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(
+            middleware.handle(PaginateMessagesQuery("conv-1"), backend)
+        )
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        backend.release.set()
+
+        assert await follower == {"conversation_id": "conv-1"}
+        assert leader.cancelled()
+
+    @pytest.mark.unit
+    async def test_leader_deadline_does_not_fail_followers(self) -> None:
+        """Test that a short-deadline leader times out alone"""
+        middleware = QuerySingleFlightMiddleware()
+        deadline = DeadlineMiddleware()
+        backend = SlowBackend()
+
+        async def next_handler(query: PaginateMessagesQuery) -> Any:
+            await asyncio.sleep(0.05)
+            return await deadline.handle(query, backend)
+
+        async def lead() -> Any:
+            request_deadline.set(time.monotonic() + 0.02)
+            return await middleware.handle(
+                PaginateMessagesQuery("conv-1"), next_handler
+            )
+
+        leader = asyncio.create_task(lead())
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(
+            middleware.handle(PaginateMessagesQuery("conv-1"), next_handler)
+        )
+
+        with pytest.raises(DeadlineExceededError):
+            await leader
+        backend.release.set()
+
+        assert await follower == {"conversation_id": "conv-1"}
+        assert backend.calls == 1
+        assert deadline.snapshot() == {"skipped": 0}
@@ -0,0 +1,133 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from app.Contexts.Chat.Message.Application.Create.UpsertMessageCommand import (
+    UpsertMessageCommand,
+)
+from app.Contexts.Chat.Message.Application.Search.PaginateMessagesQuery import (
+    PaginateMessagesQuery,
+)
+from app.Contexts.Shared.Application.Bus.BulkheadRejectedError import (
+    BulkheadRejectedError,
+)
+from app.Contexts.Shared.Infrastructure.Bus.BulkheadLimits import BulkheadLimits
+from app.Contexts.Shared.Infrastructure.Bus.BulkheadMiddleware import (
+    BulkheadMiddleware,
+)
+from app.Contexts.Shared.Infrastructure.Settings.BulkheadSettings import (
+    BulkheadSettings,
+)
+
+
+class BlockedHandler:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, message: Any) -> str:
+        self.calls += 1
+        await self.release.wait()
+        return "done"
+
+
+def make_middleware(queries: BulkheadLimits) -> BulkheadMiddleware:
+    middleware = BulkheadMiddleware(BulkheadSettings(queries=queries))
+    middleware.prepare([PaginateMessagesQuery, UpsertMessageCommand])
+    return middleware
+
+
+class TestBulkheadMiddleware:
+    @pytest.mark.unit
+    async def test_rejects_at_once_when_the_queue_is_full(self) -> None:
+        """Test that work beyond concurrency plus queue fails fast as queue full"""
+        middleware = make_middleware(BulkheadLimits(2, 1, 1000))
+        handler = BlockedHandler()
+
+        admitted = [
+            asyncio.create_task(
+                middleware.handle(PaginateMessagesQuery("conv-1"), handler)
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        with pytest.raises(BulkheadRejectedError) as rejected:
+            await middleware.handle(PaginateMessagesQuery("conv-1"), handler)
+
+        assert rejected.value.queue_full
+        handler.release.set()
+        assert await asyncio.gather(*admitted) == ["done"] * 3
+        stats = middleware.snapshot()["bulkheads"]["PaginateMessagesQuery"]
+        assert stats["admitted"] == 3
+        assert stats["rejected_full"] == 1
+        assert stats["active"] == 0
+
+    @pytest.mark.unit
+    async def test_rejects_when_the_wait_times_out(self) -> None:
+        """Test that a queued request gives up after max_wait_ms"""
+        middleware = make_middleware(BulkheadLimits(1, 5, 10))
+        handler = BlockedHandler()
+        running = asyncio.create_task(
+            middleware.handle(PaginateMessagesQuery("conv-1"), handler)
+        )
+        await asyncio.sleep(0)
+
+        with pytest.raises(BulkheadRejectedError) as rejected:
+            await middleware.handle(PaginateMessagesQuery("conv-1"), handler)
+
+        assert not rejected.value.queue_full
+        assert handler.calls == 1
+        handler.release.set()
+        await running
+
+    @pytest.mark.unit
+    async def test_saturated_queries_do_not_block_commands(self) -> None:
+        """Test that each message type has its own bulkhead"""
+        middleware = make_middleware(BulkheadLimits(1, 0, 10))
+        reads = BlockedHandler()
+        reading = asyncio.create_task(
+            middleware.handle(PaginateMessagesQuery("conv-1"), reads)
+        )
+        await asyncio.sleep(0)
+
+        async def write(command: Any) -> str:
+            return "written"
+
+        command = UpsertMessageCommand("conv-1", "msg-1", "Hola", "owner-1")
+        assert await middleware.handle(command, write) == "written"
+        with pytest.raises(BulkheadRejectedError):
+            await middleware.handle(PaginateMessagesQuery("conv-1"), reads)
+        reads.release.set()
+        await reading
+
+    @pytest.mark.unit
+    def test_module_limits_override_defaults(self) -> None:
+        """Test that a configured message type uses its own limits"""
+        middleware = BulkheadMiddleware(BulkheadSettings())
+        middleware.configure(PaginateMessagesQuery, BulkheadLimits(3, 4, 5))
+        middleware.prepare([PaginateMessagesQuery, UpsertMessageCommand])
+
+        bulkheads = middleware.snapshot()["bulkheads"]
+        assert bulkheads["PaginateMessagesQuery"]["max_concurrent"] == 3
+        assert bulkheads["UpsertMessageCommand"]["max_concurrent"] == 128
+
+    @pytest.mark.unit
+    def test_applies_to_does_not_create_bulkheads(self) -> None:
+        """Test that compiling the chain leaves the bulkheads untouched"""
+        middleware = BulkheadMiddleware(BulkheadSettings())
+
+        assert middleware.applies_to(PaginateMessagesQuery)
+        assert middleware.snapshot()["bulkheads"] == {}
+
+    @pytest.mark.unit
+    async def test_creates_the_bulkhead_of_an_unprepared_message(self) -> None:
+        """Test that a message missing from prepare still gets its bulkhead"""
+        middleware = BulkheadMiddleware(BulkheadSettings())
+
+        async def read(query: Any) -> str:
+            return "read"
+
+        assert await middleware.handle(PaginateMessagesQuery("conv-1"), read) == "read"
+        stats = middleware.snapshot()["bulkheads"]["PaginateMessagesQuery"]
+        assert stats["admitted"] == 1
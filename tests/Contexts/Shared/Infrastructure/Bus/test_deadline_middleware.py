@@ -0,0 +1,55 @@
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.Contexts.Shared.Application.Bus.Query.Query import Query
+from app.Contexts.Shared.Infrastructure.Bus.DeadlineMiddleware import (
+    DeadlineMiddleware,
+)
+from app.Contexts.Shared.Infrastructure.Http.Context.DeadlineExceededError import (
+    DeadlineExceededError,
+)
+from app.Contexts.Shared.Infrastructure.Http.Middleware.RequestContextMiddleware import (
+    request_deadline,
+)
+
+
+class SampleQuery(Query):
+    pass
+
+
+class TestDeadlineMiddleware:
+    @pytest.mark.unit
+    async def test_skips_work_of_expired_requests(self) -> None:
+        """Test that the handler is not called once the deadline has passed"""
+        middleware = DeadlineMiddleware()
+        handler = AsyncMock()
+        token = request_deadline.set(time.monotonic() - 1)
+        try:
+            with pytest.raises(DeadlineExceededError, match="SampleQuery"):
+                await middleware.handle(SampleQuery(), handler)
+        finally:
+            request_deadline.reset(token)
+
+        handler.assert_not_awaited()
+        assert middleware.snapshot() == {"skipped": 1}
+
+    @pytest.mark.unit
+    async def test_runs_work_within_the_deadline(self) -> None:
+        """Test that requests with budget left reach the handler"""
+        middleware = DeadlineMiddleware()
+        handler = AsyncMock(return_value="result")
+        token = request_deadline.set(time.monotonic() + 10)
+        try:
+            assert await middleware.handle(SampleQuery(), handler) == "result"
+        finally:
+            request_deadline.reset(token)
+
+    @pytest.mark.unit
+    async def test_runs_work_without_deadline(self) -> None:
+        """Test that work outside an HTTP request is never skipped"""
+        middleware = DeadlineMiddleware()
+        handler = AsyncMock(return_value="result")
+
+        assert await middleware.handle(SampleQuery(), handler) == "result"
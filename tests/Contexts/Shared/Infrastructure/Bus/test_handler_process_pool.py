@@ -0,0 +1,114 @@
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterator
+from unittest.mock import Mock
+
+import pytest
+from injector import Injector, InstanceProvider
+
+from app.Contexts.Shared.Application.Bus.CpuBoundHandler import CpuBoundHandler
+from app.Contexts.Shared.Application.Bus.Query.Query import Query
+from app.Contexts.Shared.Application.Bus.Query.QueryHandler import QueryHandler
+from app.Contexts.Shared.Infrastructure.Bus.HandlerProcessPool import (
+    HandlerProcessPool,
+)
+from app.Contexts.Shared.Infrastructure.Bus.Query.InMemoryQueryBus import (
+    InMemoryQueryBus,
+)
+from app.Contexts.Shared.Infrastructure.Settings.ProcessPoolSettings import (
+    ProcessPoolSettings,
+)
+
+
+class CountWordsQuery(Query):
+    def __init__(self, text: str, delay_s: float = 0) -> None:
+        self.text = text
+        self.delay_s = delay_s
+
+
+class CountWordsQueryHandler(CpuBoundHandler, QueryHandler):
+    @classmethod
+    def compute(cls, message: CountWordsQuery) -> dict[str, int]:
+        # time.sleep bloquea igual que un cálculo largo
+        time.sleep(message.delay_s)
+        return {"words": len(message.text.split()), "pid": os.getpid()}
+
+
+class FailingQueryHandler(CpuBoundHandler, QueryHandler):
+    @classmethod
+    def compute(cls, message: CountWordsQuery) -> None:
+        raise ValueError(message.text)
+
+
+@pytest.fixture
+async def pool() -> AsyncIterator[HandlerProcessPool]:
+    pool = HandlerProcessPool(ProcessPoolSettings(workers=1))
+    pool.register(CountWordsQueryHandler)
+    yield pool
+    await pool.stop()
+
+
+class TestHandlerProcessPool:
+    @pytest.mark.unit
+    async def test_runs_compute_in_another_process(
+        self, pool: HandlerProcessPool
+    ) -> None:
+        """Test that compute runs in a warm worker, not in the event loop process"""
+        await pool.start()
+
+        result = await pool.run(
+            CountWordsQueryHandler.compute, CountWordsQuery("uno dos tres")
+        )
+
+        assert result["words"] == 3
+        assert result["pid"] != os.getpid()
+        assert pool.metrics()["completed"] == 1
+
+    @pytest.mark.unit
+    async def test_event_loop_stays_responsive(self, pool: HandlerProcessPool) -> None:
+        """Test that the loop keeps ticking while a slow computation runs"""
+        await pool.start()
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        await pool.run(CountWordsQueryHandler.compute, CountWordsQuery("a", 0.3))
+        ticker.cancel()
+
+        assert ticks >= 10
+
+    @pytest.mark.unit
+    async def test_errors_reach_the_caller(self, pool: HandlerProcessPool) -> None:
+        """Test that an exception raised in the worker is raised by run"""
+        with pytest.raises(ValueError, match="boom"):
+            await pool.run(FailingQueryHandler.compute, CountWordsQuery("boom"))
+
+        assert pool.metrics()["failed"] == 1
+
+    @pytest.mark.unit
+    async def test_bus_offloads_cpu_bound_handlers(self) -> None:
+        """Test that the query bus sends CpuBoundHandler queries to the pool"""
+        injector = Injector()
+        pool = Mock(spec=HandlerProcessPool)
+        pool.run.return_value = {"words": 2}
+        injector.binder.bind(HandlerProcessPool, to=InstanceProvider(pool))
+        bus = InMemoryQueryBus(injector)
+        bus.register(CountWordsQuery, CountWordsQueryHandler)
+        bus.freeze()
+
+        assert await bus.ask(CountWordsQuery("hola mundo")) == {"words": 2}
+        pool.register.assert_called_once_with(CountWordsQueryHandler)
+        assert pool.run.call_args.args[0] == CountWordsQueryHandler.compute
+
+    @pytest.mark.unit
+    async def test_handle_computes_outside_the_bus(self) -> None:
+        """Test that calling handle directly still returns the computed result"""
+        result = await CountWordsQueryHandler().handle(CountWordsQuery("a b"))
+
+        assert result["words"] == 2
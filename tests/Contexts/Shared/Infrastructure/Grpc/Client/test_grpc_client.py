@@ -0,0 +1,50 @@
+import time
+from unittest.mock import Mock
+
+import grpc
+import pytest
+from google.protobuf.empty_pb2 import Empty
+
+from app.Contexts.Shared.Infrastructure.Grpc.Client.BaseGrpcRequest import (
+    BaseGrpcRequest,
+)
+from app.Contexts.Shared.Infrastructure.Grpc.Client.GrpcClient import GrpcClient
+from app.Contexts.Shared.Infrastructure.Http.Middleware.RequestContextMiddleware import (
+    request_deadline,
+)
+
+
+def make_request() -> BaseGrpcRequest:
+    return BaseGrpcRequest("Pinger", "Ping", Empty(), timeout=10)
+
+
+class TestGrpcClientDeadline:
+    @pytest.mark.unit
+    def test_timeout_is_bounded_by_the_remaining_budget(self) -> None:
+        """Test that the call timeout shrinks to what is left of the deadline"""
+        stub = Mock()
+        token = request_deadline.set(time.monotonic() + 2)
+        try:
+            response = GrpcClient("localhost:0").send(
+                make_request(), Mock(return_value=stub)
+            )
+        finally:
+            request_deadline.reset(token)
+
+        assert response.status_code == grpc.StatusCode.OK
+        assert stub.Ping.call_args.kwargs["timeout"] <= 2
+
+    @pytest.mark.unit
+    async def test_expired_calls_are_not_sent(self) -> None:
+        """Test that an expired request answers DEADLINE_EXCEEDED without calling"""
+        stub_class = Mock()
+        token = request_deadline.set(time.monotonic() - 1)
+        try:
+            response = await GrpcClient("localhost:0").send_async(
+                make_request(), stub_class
+            )
+        finally:
+            request_deadline.reset(token)
+
+        assert response.status_code == grpc.StatusCode.DEADLINE_EXCEEDED
+        stub_class.assert_not_called()
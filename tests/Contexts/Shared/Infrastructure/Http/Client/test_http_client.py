@@ -0,0 +1,107 @@
+import time
+
+import httpx
+import pytest
+
+from app.Contexts.Shared.Infrastructure.Http.Client.HttpClient import HttpClient
+from app.Contexts.Shared.Infrastructure.Http.Client.HttpMethod import HttpMethod
+from app.Contexts.Shared.Infrastructure.Http.Client.HttpRequest import HttpRequest
+from app.Contexts.Shared.Infrastructure.Http.Context.DeadlineExceededError import (
+    DeadlineExceededError,
+)
+from app.Contexts.Shared.Infrastructure.Http.Middleware.RequestContextMiddleware import (
+    request_deadline,
+)
+
+
+class PingRequest(HttpRequest):
+    @property
+    def method(self) -> HttpMethod:
+        return HttpMethod.GET
+
+    @property
+    def url(self) -> str:
+        return "/ping"
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {}
+
+    @property
+    def body(self) -> dict[str, str]:
+        return {}
+
+    @property
+    def query_params(self) -> dict[str, str]:
+        return {}
+
+    @property
+    def content_type(self) -> str:
+        return "application/json"
+
+    @property
+    def files(self) -> dict[str, bytes]:
+        return {}
+
+
+def make_client(sent: list[httpx.Request], timeout: float = 30.0) -> HttpClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200, json={})
+
+    client = HttpClient("http://remote", timeout=timeout)
+    client._client = httpx.Client(
+        base_url="http://remote", transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+class TestHttpClientDeadline:
+    @pytest.mark.unit
+    def test_timeout_is_bounded_by_the_remaining_budget(self) -> None:
+        """Test that the request uses and forwards what is left of the deadline"""
+        sent: list[httpx.Request] = []
+        token = request_deadline.set(time.monotonic() + 2)
+        try:
+            make_client(sent).send(PingRequest())
+        finally:
+            request_deadline.reset(token)
+
+        assert sent[0].extensions["timeout"]["read"] <= 2
+        assert 1500 < int(sent[0].headers["X-Request-Timeout-Ms"]) <= 2000
+
+    @pytest.mark.unit
+    def test_forwards_the_client_timeout_when_it_is_shorter(self) -> None:
+        """Test that the remote service is not told to wait longer than the client"""
+        sent: list[httpx.Request] = []
+        token = request_deadline.set(time.monotonic() + 30)
+        try:
+            make_client(sent, timeout=5.0).send(PingRequest())
+        finally:
+            request_deadline.reset(token)
+
+        assert sent[0].extensions["timeout"]["read"] == 5.0
+        assert sent[0].headers["X-Request-Timeout-Ms"] == "5000"
+
+    @pytest.mark.unit
+    def test_expired_requests_are_not_sent(self) -> None:
+        """Test that no call leaves the process once the deadline has passed"""
+        sent: list[httpx.Request] = []
+        token = request_deadline.set(time.monotonic() - 1)
+        try:
+            with pytest.raises(DeadlineExceededError):
+                make_client(sent).send(PingRequest())
+        finally:
+            request_deadline.reset(token)
+
+        assert sent == []
+
+    @pytest.mark.unit
+    def test_keeps_its_timeout_outside_a_request(self) -> None:
+        """Test that calls without deadline use the client timeout"""
+        sent: list[httpx.Request] = []
+
+        make_client(sent).send(PingRequest())
+
+        assert sent[0].extensions["timeout"]["read"] == 30.0
+        assert "X-Request-Timeout-Ms" not in sent[0].headers
@@ -0,0 +1,63 @@
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.Contexts.Shared.Infrastructure.Http.Context.RequestContext import (
+    RequestContext,
+)
+from app.Contexts.Shared.Infrastructure.Http.Middleware.RequestContextMiddleware import (
+    RequestContextMiddleware,
+)
+from app.Contexts.Shared.Infrastructure.Settings.RequestSettings import (
+    RequestSettings,
+)
+
+
+def make_client(settings: RequestSettings) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware, settings=settings)
+
+    async def budget() -> dict[str, Any]:
+        return {"remaining": RequestContext.remaining_time()}
+
+    app.add_api_route("/budget", budget, methods=["GET"])
+    return TestClient(app)
+
+
+class TestRequestContextMiddlewareDeadline:
+    @pytest.mark.unit
+    def test_uses_the_timeout_header(self) -> None:
+        """Test that the client budget header sets the request deadline"""
+        client = make_client(RequestSettings(default_timeout_ms=30000))
+
+        response = client.get("/budget", headers={"X-Request-Timeout-Ms": "2000"})
+
+        assert 1.5 < response.json()["remaining"] <= 2
+
+    @pytest.mark.unit
+    def test_falls_back_to_the_default_timeout(self) -> None:
+        """Test that requests without the header get the configured budget"""
+        client = make_client(RequestSettings(default_timeout_ms=5000))
+
+        response = client.get("/budget")
+
+        assert 4.5 < response.json()["remaining"] <= 5
+
+    @pytest.mark.unit
+    def test_caps_the_requested_timeout(self) -> None:
+        """Test that a client cannot ask for more than max_timeout_ms"""
+        client = make_client(RequestSettings(max_timeout_ms=1000))
+
+        response = client.get("/budget", headers={"X-Request-Timeout-Ms": "60000"})
+
+        assert response.json()["remaining"] <= 1
+
+    @pytest.mark.unit
+    def test_no_deadline_when_disabled(self) -> None:
+        """Test that a zero default leaves header-less requests without deadline"""
+        client = make_client(RequestSettings(default_timeout_ms=0))
+
+        assert client.get("/budget").json()["remaining"] is None
+        assert RequestContext.remaining_time() is None
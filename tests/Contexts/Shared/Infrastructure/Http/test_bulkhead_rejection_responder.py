@@ -0,0 +1,43 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.Contexts.Shared.Application.Bus.BulkheadRejectedError import (
+    BulkheadRejectedError,
+)
+from app.Contexts.Shared.Infrastructure.Http.BulkheadRejectionResponder import (
+    BulkheadRejectionResponder,
+)
+
+
+def make_client(error: BulkheadRejectedError) -> TestClient:
+    app = FastAPI()
+    app.add_exception_handler(BulkheadRejectedError, BulkheadRejectionResponder.handle)
+
+    async def overloaded() -> None:
+        raise error
+
+    app.add_api_route("/overloaded", overloaded, methods=["GET"])
+    return TestClient(app)
+
+
+class TestBulkheadRejectionResponder:
+    @pytest.mark.unit
+    def test_full_queue_is_too_many_requests(self) -> None:
+        """Test that a full bulkhead queue answers 429 with Retry-After"""
+        client = make_client(BulkheadRejectedError("SampleQuery", queue_full=True))
+
+        response = client.get("/overloaded")
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+
+    @pytest.mark.unit
+    def test_wait_timeout_is_service_unavailable(self) -> None:
+        """Test that a request that could not get a turn answers 503"""
+        client = make_client(BulkheadRejectedError("SampleQuery", queue_full=False))
+
+        response = client.get("/overloaded")
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
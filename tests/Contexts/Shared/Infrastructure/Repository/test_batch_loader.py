@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from app.Contexts.Shared.Infrastructure.Repository.BatchLoader import BatchLoader
+
+
+class RecordingStore:
+    def __init__(self, values: dict[str, int]) -> None:
+        self.values = values
+        self.batches: list[list[str]] = []
+
+    def find_many(self, keys: list[str]) -> dict[str, int]:
+        self.batches.append(keys)
+        return {key: self.values[key] for key in keys if key in self.values}
+
+
+class TestBatchLoader:
+    @pytest.mark.unit
+    async def test_groups_lookups_of_the_same_tick(self) -> None:
+        """Test that concurrent loads become one multi-get with unique keys"""
+        store = RecordingStore({"a": 1, "b": 2})
+        loader = BatchLoader(store.find_many)
+
+        results = await asyncio.gather(
+            loader.load("a"), loader.load("b"), loader.load("a"), loader.load("c")
+        )
+
+        assert results == [1, 2, 1, None]
+        assert store.batches == [["a", "b", "c"]]
+
+    @pytest.mark.unit
+    async def test_does_not_keep_results_between_ticks(self) -> None:
+        """Test that a later load sees values stored after the previous batch"""
+        store = RecordingStore({"a": 1})
+        loader = BatchLoader(store.find_many)
+
+        assert await loader.load("a") == 1
+        store.values["a"] = 2
+        assert await loader.load("a") == 2
+        assert len(store.batches) == 2
+
+    @pytest.mark.unit
+    async def test_splits_large_batches(self) -> None:
+        """Test that a batch never exceeds max_batch_size keys"""
+        store = RecordingStore({})
+        loader = BatchLoader(store.find_many, max_batch_size=2)
+
+        await asyncio.gather(*(loader.load(str(index)) for index in range(5)))
+
+        assert [len(batch) for batch in store.batches] == [2, 2, 1]
+
+    @pytest.mark.unit
+    async def test_batch_errors_reach_every_caller(self) -> None:
+        """Test that a failing multi-get fails all the loads of its batch"""
+
+        def failing(keys: list[str]) -> dict[str, int]:
+            raise RuntimeError("database down")
+
+        loader: BatchLoader[str, int] = BatchLoader(failing)
+
+        results = await asyncio.gather(
+            loader.load("a"), loader.load("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.unit
+    async def test_cancelled_caller_does_not_cancel_the_others(self) -> None:
+        """Test that cancelling one load leaves other loads of the key intact"""
+        store = RecordingStore({"a": 1})
+        loader = BatchLoader(store.find_many)
+
+        cancelled = asyncio.create_task(loader.load("a"))
+        survivor = asyncio.create_task(loader.load("a"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await survivor == 1
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert store.batches == [["a"]]
@@ -21,9 +21,16 @@ class TestKafkaSettings:
         assert settings.consumer_group_id == "test-group"
 
         # Check default values
-        assert settings.enable_auto_commit is True
+        assert settings.enable_auto_commit is False
         assert settings.auto_offset_reset == "earliest"
         assert settings.max_poll_records == 500
+        assert settings.commit_interval_ms == 5000
+        assert settings.commit_batch_size == 100
+        assert settings.event_codec == "json"
+        assert settings.dedup_capacity == 100000
+        assert settings.dedup_ttl_ms == 3600000
+        assert settings.subscription_debounce_ms == 500
+        assert settings.consumer_enabled is True
 
     @pytest.mark.unit
     @patch.dict(
@@ -33,8 +40,13 @@ class TestKafkaSettings:
             "KAFKA_TOPICS_PREFIX": "custom",
             "KAFKA_CONSUMER_GROUP_ID": "custom-group",
             "KAFKA_AUTO_OFFSET_RESET": "latest",
-            "KAFKA_ENABLE_AUTO_COMMIT": "false",
+            "KAFKA_ENABLE_AUTO_COMMIT": "true",
             "KAFKA_MAX_POLL_RECORDS": "100",
+            "KAFKA_COMMIT_INTERVAL_MS": "1000",
+            "KAFKA_COMMIT_BATCH_SIZE": "50",
+            "KAFKA_EVENT_CODEC": "binary",
+            "KAFKA_SPOOL_PATH": "/var/spool/events.jsonl",
+            "KAFKA_CIRCUIT_FAILURE_THRESHOLD": "2",
         },
     )
     def test_kafka_settings_from_env(self) -> None:
@@ -46,8 +58,13 @@ class TestKafkaSettings:
         assert settings.topics_prefix == "custom"
         assert settings.consumer_group_id == "custom-group"
         assert settings.auto_offset_reset == "latest"
-        assert settings.enable_auto_commit is False
+        assert settings.enable_auto_commit is True
         assert settings.max_poll_records == 100
+        assert settings.commit_interval_ms == 1000
+        assert settings.commit_batch_size == 50
+        assert settings.event_codec == "binary"
+        assert settings.spool_path == "/var/spool/events.jsonl"
+        assert settings.circuit_failure_threshold == 2
 
     @pytest.mark.unit
     def test_kafka_settings_from_env_default_values(self) -> None:
@@ -59,7 +76,7 @@ class TestKafkaSettings:
         assert settings.topics_prefix == "yurest"
         assert settings.consumer_group_id == "yurest-app"
         assert settings.auto_offset_reset == "earliest"
-        assert settings.enable_auto_commit is True
+        assert settings.enable_auto_commit is False
         assert settings.max_poll_records == 500
 
     @pytest.mark.unit
@@ -78,3 +95,34 @@ class TestKafkaSettings:
         # Test with different event name
         topic_name = settings.get_topic_name("order.payment.processed")
         assert topic_name == "test.order_payment_processed"
+
+    @pytest.mark.unit
+    def test_kafka_settings_get_context_topic_name(self) -> None:
+        """Test KafkaSettings.get_context_topic_name() method"""
+        settings = KafkaSettings(
+            bootstrap_servers=["localhost:9092"],
+            topics_prefix="test",
+            consumer_group_id="test-group",
+        )
+
+        assert settings.topic_strategy == "event"
+        assert settings.get_context_topic_name("Chat") == "test.chat"
+
+    @pytest.mark.unit
+    def test_kafka_settings_retry_topics_and_backoff(self) -> None:
+        """Test retry/dead-letter topic naming and exponential backoff"""
+        settings = KafkaSettings(
+            bootstrap_servers=["localhost:9092"],
+            topics_prefix="test",
+            consumer_group_id="test-group",
+            retry_backoff_ms=500,
+        )
+
+        assert settings.get_retry_topic_name("test.user_created", 2) == (
+            "test.user_created.retry.2"
+        )
+        assert settings.get_dead_letter_topic_name("test.user_created") == (
+            "test.user_created.dlq"
+        )
+        assert settings.get_retry_delay_ms(1) == 500
+        assert settings.get_retry_delay_ms(3) == 2000
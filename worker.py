@@ -0,0 +1,46 @@
+import asyncio
+import multiprocessing
+import os
+import signal
+from types import FrameType
+
+from app.Contexts.Shared.Infrastructure.Bootstrap.EventWorkerBootstrapper import (
+    EventWorkerBootstrapper,
+)
+
+
+def run_worker() -> None:
+    asyncio.run(EventWorkerBootstrapper().run())
+
+
+def main() -> None:
+    processes = int(os.environ.get("EVENT_WORKER_PROCESSES", "1"))
+    if processes <= 1:
+        run_worker()
+        return
+
+    # Cada proceso tiene su propio consumer dentro del mismo consumer group
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(target=run_worker, name=f"event-worker-{index}")
+        for index in range(processes)
+    ]
+
+    def terminate(signum: int, frame: FrameType | None) -> None:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+
+    for worker in workers:
+        worker.start()
+
+    signal.signal(signal.SIGTERM, terminate)
+    # Ctrl+C llega a todo el grupo de procesos: cada worker se detiene por su cuenta
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    for worker in workers:
+        worker.join()
+
+
+if __name__ == "__main__":
+    main()